@@ -3,12 +3,15 @@ Congress.gov API client with rate limiting and error handling
 """
 import time
 import socket
-from typing import Dict, Any, Optional, Generator, Union
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, Generator, Union, List, Tuple, Callable
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from api.rate_limiter import RateLimiter
+from api.rate_limiter import create_rate_limiter
+from api.response_cache import ResponseCache
 from utils.circuit_breaker import CircuitBreaker, CircuitBreakerError
 from config.settings import settings
 from config.logging_config import get_logger
@@ -25,13 +28,16 @@ logger.info(f"Set global socket timeout to {_SOCKET_TIMEOUT} seconds")
 class CongressAPIClient:
     """Client for Congress.gov API v3 with rate limiting"""
 
-    def __init__(self, api_key: Optional[str] = None, rate_limit: int = 5000):
+    def __init__(self, api_key: Optional[str] = None, rate_limit: int = 5000,
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize API client
 
         Args:
             api_key: API key for Congress.gov (defaults to settings)
             rate_limit: Requests per hour limit
+            response_cache: Response cache (defaults to an on-disk cache when
+                            RESPONSE_CACHE_PATH is set, otherwise no caching)
         """
         # EMERGENCY BYPASS: Read directly from environment if not provided
         import os
@@ -41,7 +47,10 @@ class CongressAPIClient:
 
         self.api_key = api_key or settings.api_key
         self.base_url = settings.api_base_url
-        self.rate_limiter = RateLimiter(max_requests=rate_limit)
+        self.rate_limiter = create_rate_limiter(
+            max_requests=rate_limit,
+            state_path=settings.rate_limit_state_path
+        )
 
         # Validate API key
         if self.api_key:
@@ -77,7 +86,11 @@ class CongressAPIClient:
             backoff_factor=settings.retry_backoff_factor,
             raise_on_status=False  # Don't raise exception on retry exhaustion
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Size the connection pool so concurrent detail workers reuse connections
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_maxsize=max(10, settings.detail_fetch_concurrency)
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
@@ -90,14 +103,36 @@ class CongressAPIClient:
         # Track retry statistics
         self.retry_count = 0
         self.last_retry_time = None
+        self._stats_lock = threading.Lock()
 
-    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        # Response cache for repeated list/detail requests
+        self.response_cache = response_cache
+        if self.response_cache is None and settings.response_cache_path:
+            try:
+                self.response_cache = ResponseCache(
+                    settings.response_cache_path,
+                    max_bytes=settings.response_cache_max_mb * 1024 * 1024
+                )
+            except Exception as e:
+                logger.warning(f"Response cache disabled, could not open {settings.response_cache_path}: {e}")
+
+        # Track cache statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_revalidations = 0
+
+    def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> Dict[str, Any]:
         """
         Make GET request to API endpoint with circuit breaker protection
 
+        Fresh cached responses are returned without touching the network or
+        the rate limit. Stale entries are revalidated with If-None-Match /
+        If-Modified-Since when the server supplied validators.
+
         Args:
             endpoint: API endpoint (without base URL)
             params: Query parameters
+            use_cache: Set False to bypass the response cache
 
         Returns:
             JSON response as dictionary
@@ -106,6 +141,17 @@ class CongressAPIClient:
             CircuitBreakerError: If circuit breaker is open
             requests.RequestException: On API error
         """
+        cache = self.response_cache if use_cache else None
+        cached = None
+        if cache:
+            cache_params = dict(params or {})
+            cached = cache.lookup(endpoint, cache_params)
+            if cached and cached['fresh']:
+                with self._stats_lock:
+                    self.cache_hits += 1
+                logger.debug(f"Cache hit for {endpoint}")
+                return cached['data']
+
         # Define the actual request logic
         def _make_request():
             # Apply rate limiting
@@ -113,7 +159,8 @@ class CongressAPIClient:
 
             # Prepare request
             url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
-            request_params = params or {}
+            # Copy so callers sharing a params dict across threads are not mutated
+            request_params = dict(params or {})
             request_params['api_key'] = self.api_key
             request_params['format'] = 'json'
 
@@ -127,9 +174,19 @@ class CongressAPIClient:
                 # Use tuple timeout: (connect_timeout, read_timeout)
                 # This prevents hanging on unresponsive servers
                 timeout = (settings.connect_timeout, settings.read_timeout)
+
+                # Conditional request headers for stale cache entries
+                headers = {}
+                if cached:
+                    if cached.get('etag'):
+                        headers['If-None-Match'] = cached['etag']
+                    if cached.get('last_modified'):
+                        headers['If-Modified-Since'] = cached['last_modified']
+
                 response = self.session.get(
                     url,
                     params=request_params,
+                    headers=headers or None,
                     timeout=timeout
                 )
 
@@ -141,14 +198,35 @@ class CongressAPIClient:
                 if hasattr(response.raw, 'retries') and response.raw.retries:
                     retry_count = response.raw.retries.total
                     if retry_count > 0:
-                        self.retry_count += retry_count
-                        self.last_retry_time = time.time()
+                        with self._stats_lock:
+                            self.retry_count += retry_count
+                            self.last_retry_time = time.time()
                         logger.warning(f"Request to {endpoint} required {retry_count} retries")
 
+                if cached and response.status_code == 304:
+                    cache.refresh(endpoint, cache_params)
+                    with self._stats_lock:
+                        self.cache_revalidations += 1
+                    logger.debug(f"Cache revalidated for {endpoint} (304 Not Modified)")
+                    return cached['data']
+
                 response.raise_for_status()
 
                 data = response.json()
                 logger.debug(f"Response: {len(data)} bytes")
+
+                if cache:
+                    with self._stats_lock:
+                        self.cache_misses += 1
+                    try:
+                        cache.store(
+                            endpoint, cache_params, data,
+                            etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified')
+                        )
+                    except Exception as e:
+                        logger.warning(f"Failed to cache response for {endpoint}: {e}")
+
                 return data
 
             except socket.timeout as e:
@@ -179,6 +257,52 @@ class CongressAPIClient:
             logger.error(f"API request failed after retries: {e}")
             raise
 
+    def get_many(self, endpoints: List[str], params: Optional[Dict[str, Any]] = None,
+                 max_workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Make GET requests to several endpoints using a bounded worker pool
+
+        Every worker goes through get(), so all requests share this client's
+        rate limiter, circuit breaker, timeouts and retry strategy.
+
+        Args:
+            endpoints: API endpoints (without base URL)
+            params: Query parameters applied to every request
+            max_workers: Concurrent requests (defaults to settings.detail_fetch_concurrency)
+            progress_callback: Optional callable(completed, total) invoked as requests finish
+
+        Returns:
+            Responses in input order; failed requests are returned as their exception
+        """
+        total = len(endpoints)
+        if total == 0:
+            return []
+
+        max_workers = max(1, min(max_workers or settings.detail_fetch_concurrency, total))
+        results: List[Union[Dict[str, Any], Exception, None]] = [None] * total
+
+        logger.debug(f"Fetching {total} endpoints with {max_workers} workers")
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='congress-api') as executor:
+            futures = {
+                executor.submit(self.get, endpoint, params): index
+                for index, endpoint in enumerate(endpoints)
+            }
+
+            for completed, future in enumerate(as_completed(futures), 1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    logger.warning(f"Request to {endpoints[index]} failed: {type(e).__name__}: {e}")
+                    results[index] = e
+
+                if progress_callback:
+                    progress_callback(completed, total)
+
+        return results
+
     def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Generator[Dict[str, Any], None, None]:
         """
         Paginate through all results for an endpoint
@@ -244,15 +368,22 @@ class CongressAPIClient:
 
     def get_retry_stats(self) -> Dict[str, Any]:
         """
-        Get retry statistics
+        Get retry and response cache statistics
 
         Returns:
-            Dictionary with retry_count and last_retry_time
+            Dictionary with retry_count, last_retry_time and cache hit/miss counters
         """
-        return {
+        stats = {
             'total_retries': self.retry_count,
-            'last_retry_time': self.last_retry_time
+            'last_retry_time': self.last_retry_time,
+            'cache_enabled': self.response_cache is not None,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cache_revalidations': self.cache_revalidations
         }
+        if self.response_cache and hasattr(self.response_cache, 'get_stats'):
+            stats['cache'] = self.response_cache.get_stats()
+        return stats
 
     def get_circuit_breaker_stats(self) -> Optional[Dict[str, Any]]:
         """
@@ -280,6 +411,27 @@ class CongressAPIClient:
         endpoint = f"committee-meeting/{congress}/{chamber}/{event_id}"
         return self.get(endpoint)
 
+    def get_hearing_details_many(self, congress: int, hearings: List[Tuple[str, str]],
+                                 max_workers: Optional[int] = None,
+                                 progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Get detailed hearing information for many hearings concurrently
+
+        Args:
+            congress: Congress number
+            hearings: List of (chamber, event_id) pairs
+            max_workers: Concurrent requests (defaults to settings.detail_fetch_concurrency)
+            progress_callback: Optional callable(completed, total)
+
+        Returns:
+            Responses in input order; failed requests are returned as their exception
+        """
+        endpoints = [
+            f"committee-meeting/{congress}/{chamber}/{event_id}"
+            for chamber, event_id in hearings
+        ]
+        return self.get_many(endpoints, max_workers=max_workers, progress_callback=progress_callback)
+
     def get_bill_details(self, congress: int, bill_type: str, bill_number: int) -> Dict[str, Any]:
         """Get detailed bill information"""
         endpoint = f"bill/{congress}/{bill_type}/{bill_number}"
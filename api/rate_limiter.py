@@ -1,8 +1,24 @@
 """
 Rate limiter for Congress.gov API
+
+Two backends implement the same sliding-window interface:
+
+- RateLimiter: in-process limiter backed by a bounded deque (O(1) per request)
+- SharedRateLimiter: SQLite-backed ring buffer so every process on a host
+  (cron job, batch workers, CLI) draws from one Congress.gov quota
+
+Use create_rate_limiter() to pick the backend from configuration.
+
+HostRateLimiter instead spaces request starts per host, for the concurrent
+page fetchers (CRS content, policy library ingesters).
 """
+import sqlite3
 import time
-from typing import List
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Optional
+from urllib.parse import urlparse
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -21,35 +37,250 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: List[float] = []
+
+        # Timestamps of requests in the current window, oldest first.
+        # Never holds more than max_requests entries.
+        self.requests: Deque[float] = deque(maxlen=max_requests)
+
+        # Shared by all worker threads of a client so they draw from one budget
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        """Drop timestamps that have left the window (amortized O(1))"""
+        while self.requests and now - self.requests[0] >= self.time_window:
+            self.requests.popleft()
 
     def wait_if_needed(self) -> None:
         """Wait if rate limit would be exceeded"""
-        now = time.time()
+        while True:
+            with self._lock:
+                now = time.time()
+                self._expire(now)
+
+                if len(self.requests) < self.max_requests:
+                    self.requests.append(now)
+                    return
 
-        # Remove requests older than time_window
-        self.requests = [req for req in self.requests
-                        if now - req < self.time_window]
+                # Wait only until the oldest request leaves the window
+                wait_time = self.time_window - (now - self.requests[0])
 
-        if len(self.requests) >= self.max_requests:
-            # Calculate wait time
-            oldest = self.requests[0]
-            wait_time = self.time_window - (now - oldest) + 1
+            # Sleep outside the lock so status checks stay responsive
             logger.warning(f"Rate limit reached. Waiting {wait_time:.1f} seconds...")
-            time.sleep(wait_time)
-            self.requests = []
+            time.sleep(max(0.0, wait_time))
+
+    def get_remaining_requests(self) -> int:
+        """Get number of requests remaining in current window"""
+        with self._lock:
+            self._expire(time.time())
+            return max(0, self.max_requests - len(self.requests))
+
+    def get_reset_time(self) -> float:
+        """Get time when rate limit resets (Unix timestamp)"""
+        with self._lock:
+            if not self.requests:
+                return time.time()
+            return self.requests[0] + self.time_window
+
+
+class SharedRateLimiter:
+    """
+    Rate limiter whose window is shared between processes through SQLite
+
+    The window is stored as a ring buffer of max_requests slots. The slot
+    under the head pointer holds the oldest of the last max_requests
+    requests, so admitting a request is one read and two writes inside a
+    BEGIN IMMEDIATE transaction, regardless of the window size.
+    """
+
+    def __init__(self, state_path: str, max_requests: int = 5000, time_window: int = 3600,
+                 name: str = 'congress_api'):
+        """
+        Initialize shared rate limiter
+
+        Args:
+            state_path: Path to the SQLite file holding the shared window
+            max_requests: Maximum requests allowed in time window
+            time_window: Time window in seconds (default 1 hour)
+            name: Limiter name, so several quotas can share one state file
+        """
+        self.state_path = state_path
+        self.max_requests = max_requests
+        self.time_window = time_window
+        self.name = name
+
+        Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection per limiter, serialized by the thread lock;
+        # cross-process exclusion is provided by SQLite's write lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(state_path, timeout=30, isolation_level=None,
+                                     check_same_thread=False)
+        self._init_schema()
+
+        logger.info(f"Shared rate limiter '{name}' using {state_path} "
+                    f"({max_requests} requests / {time_window}s)")
 
-        self.requests.append(now)
+    def _init_schema(self) -> None:
+        """Create state tables if needed"""
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS rate_limit_state (
+                    name TEXT PRIMARY KEY,
+                    head INTEGER NOT NULL,
+                    max_requests INTEGER NOT NULL
+                )
+            ''')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS rate_limit_slots (
+                    name TEXT NOT NULL,
+                    slot INTEGER NOT NULL,
+                    ts REAL NOT NULL,
+                    PRIMARY KEY (name, slot)
+                )
+            ''')
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT max_requests FROM rate_limit_state WHERE name = ?', (self.name,)
+                ).fetchone()
+                if row is None or row[0] != self.max_requests:
+                    # New limiter or resized quota: start a fresh ring
+                    self._conn.execute('DELETE FROM rate_limit_slots WHERE name = ?', (self.name,))
+                    self._conn.execute(
+                        'INSERT OR REPLACE INTO rate_limit_state (name, head, max_requests) VALUES (?, 0, ?)',
+                        (self.name, self.max_requests)
+                    )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def _try_acquire(self) -> float:
+        """
+        Try to record a request in the shared window
+
+        Returns:
+            0 if the request was admitted, otherwise seconds to wait before retrying
+        """
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                head = self._conn.execute(
+                    'SELECT head FROM rate_limit_state WHERE name = ?', (self.name,)
+                ).fetchone()[0]
+                oldest = self._conn.execute(
+                    'SELECT ts FROM rate_limit_slots WHERE name = ? AND slot = ?', (self.name, head)
+                ).fetchone()
+
+                if oldest and now - oldest[0] < self.time_window:
+                    self._conn.execute('COMMIT')
+                    return self.time_window - (now - oldest[0])
+
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO rate_limit_slots (name, slot, ts) VALUES (?, ?, ?)',
+                    (self.name, head, now)
+                )
+                self._conn.execute(
+                    'UPDATE rate_limit_state SET head = ? WHERE name = ?',
+                    ((head + 1) % self.max_requests, self.name)
+                )
+                self._conn.execute('COMMIT')
+                return 0.0
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def wait_if_needed(self) -> None:
+        """Wait if rate limit would be exceeded"""
+        while True:
+            wait_time = self._try_acquire()
+            if wait_time <= 0:
+                return
+            logger.warning(f"Shared rate limit reached. Waiting {wait_time:.1f} seconds...")
+            time.sleep(wait_time)
 
     def get_remaining_requests(self) -> int:
         """Get number of requests remaining in current window"""
-        now = time.time()
-        self.requests = [req for req in self.requests
-                        if now - req < self.time_window]
-        return max(0, self.max_requests - len(self.requests))
+        with self._lock:
+            used = self._conn.execute(
+                'SELECT COUNT(*) FROM rate_limit_slots WHERE name = ? AND ts > ?',
+                (self.name, time.time() - self.time_window)
+            ).fetchone()[0]
+        return max(0, self.max_requests - used)
 
     def get_reset_time(self) -> float:
         """Get time when rate limit resets (Unix timestamp)"""
-        if not self.requests:
+        with self._lock:
+            oldest = self._conn.execute(
+                'SELECT MIN(ts) FROM rate_limit_slots WHERE name = ? AND ts > ?',
+                (self.name, time.time() - self.time_window)
+            ).fetchone()[0]
+        if oldest is None:
             return time.time()
-        return self.requests[0] + self.time_window
\ No newline at end of file
+        return oldest + self.time_window
+
+    def close(self) -> None:
+        """Close the state database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+def create_rate_limiter(max_requests: int = 5000, time_window: int = 3600,
+                        state_path: Optional[str] = None):
+    """
+    Create a rate limiter for the configured backend
+
+    Args:
+        max_requests: Maximum requests allowed in time window
+        time_window: Time window in seconds
+        state_path: SQLite file for a shared limiter (in-process limiter when unset)
+
+    Returns:
+        SharedRateLimiter if a state path is configured, otherwise RateLimiter
+    """
+    if state_path:
+        try:
+            return SharedRateLimiter(state_path, max_requests=max_requests, time_window=time_window)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not open shared rate limit state at {state_path}: {e}. "
+                           f"Falling back to in-process limiter")
+
+    return RateLimiter(max_requests=max_requests, time_window=time_window)
+
+
+class HostRateLimiter:
+    """
+    Thread-safe minimum spacing between requests to the same host
+
+    Each caller reserves the next free slot for its host and sleeps outside
+    the lock, so requests to different hosts never wait on each other.
+    """
+
+    def __init__(self, delay: float):
+        """
+        Initialize limiter
+
+        Args:
+            delay: Minimum seconds between request starts per host
+        """
+        self.delay = delay
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: Optional[str] = None) -> None:
+        """
+        Block until a request to url's host may start
+
+        Args:
+            url: Request URL; None shares one slot for all such calls
+        """
+        host = urlparse(url).netloc.lower() if url else ''
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.delay
+        if slot > now:
+            logger.debug(f"Rate limiting {host or 'requests'}: sleeping {slot - now:.2f}s")
+            time.sleep(slot - now)
@@ -0,0 +1,272 @@
+"""
+On-disk response cache for Congress.gov API
+
+Responses are stored zlib-compressed in a SQLite file, keyed by endpoint and
+query parameters (the api_key is never part of the key). Entries keep the
+ETag/Last-Modified validators returned by the server so stale entries can be
+revalidated with a conditional GET, and the store is evicted
+least-recently-used once it grows past its size budget.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Tuple
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# (endpoint regex, TTL seconds); first match wins
+DEFAULT_TTL_RULES: List[Tuple[str, int]] = [
+    # Individual meeting details rarely change once published
+    (r'^committee-meeting/\d+/[a-z]+/[^/]+$', 6 * 3600),
+    # Meeting list pages drive incremental discovery, so keep them short
+    (r'^committee-meeting/', 15 * 60),
+    (r'^hearing/', 24 * 3600),
+    (r'^committee/', 24 * 3600),
+    (r'^member/', 24 * 3600),
+    (r'^bill/', 24 * 3600),
+]
+DEFAULT_TTL = 3600
+
+# Request parameters that never affect the response body
+EXCLUDED_PARAMS = {'api_key', 'format'}
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of API JSON responses
+
+    Any object with the same lookup/store/refresh interface can be passed to
+    CongressAPIClient instead, e.g. an in-memory stub in tests.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 256 * 1024 * 1024,
+                 ttl_rules: Optional[List[Tuple[str, int]]] = None,
+                 default_ttl: int = DEFAULT_TTL):
+        """
+        Initialize response cache
+
+        Args:
+            path: Path to the SQLite cache file
+            max_bytes: Size budget for compressed bodies before LRU eviction
+            ttl_rules: (endpoint regex, TTL seconds) pairs, first match wins
+            default_ttl: TTL for endpoints that match no rule
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_rules = [(re.compile(pattern), ttl)
+                          for pattern, ttl in (ttl_rules if ttl_rules is not None else DEFAULT_TTL_RULES)]
+
+        self.evictions = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared by the client's worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._init_schema()
+        self._total_bytes = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()[0]
+
+        logger.info(f"Response cache at {path} ({self._total_bytes / 1024 / 1024:.1f} MB used, "
+                    f"{max_bytes / 1024 / 1024:.0f} MB budget)")
+
+    def _init_schema(self) -> None:
+        """Create cache tables if needed"""
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    endpoint TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+            ''')
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_responses_last_accessed ON responses(last_accessed)'
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build cache key from endpoint and query parameters
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters (api_key and format are ignored)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        relevant = {k: v for k, v in (params or {}).items() if k not in EXCLUDED_PARAMS}
+        raw = endpoint.strip('/') + '?' + json.dumps(relevant, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Get TTL in seconds for an endpoint"""
+        endpoint = endpoint.strip('/')
+        for pattern, ttl in self.ttl_rules:
+            if pattern.search(endpoint):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Dict with data, etag, last_modified and fresh flag, or None if not cached
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, expires_at FROM responses WHERE cache_key = ?',
+                (key,)
+            ).fetchone()
+            if not row:
+                return None
+
+            self._conn.execute('UPDATE responses SET last_accessed = ? WHERE cache_key = ?', (now, key))
+            self._conn.commit()
+
+        body, etag, last_modified, expires_at = row
+        try:
+            data = json.loads(zlib.decompress(body))
+        except (zlib.error, ValueError) as e:
+            logger.warning(f"Discarding corrupt cache entry for {endpoint}: {e}")
+            self.invalidate(endpoint, params)
+            return None
+
+        return {
+            'data': data,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': now < expires_at
+        }
+
+    def store(self, endpoint: str, params: Optional[Dict[str, Any]], data: Dict[str, Any],
+              etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """
+        Store a response, evicting least-recently-used entries if over budget
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            data: Decoded JSON response
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        key = self.make_key(endpoint, params)
+        body = zlib.compress(json.dumps(data).encode('utf-8'))
+        now = time.time()
+
+        with self._lock:
+            previous = self._conn.execute(
+                'SELECT size FROM responses WHERE cache_key = ?', (key,)
+            ).fetchone()
+            self._conn.execute('''
+                INSERT OR REPLACE INTO responses
+                (cache_key, endpoint, body, size, etag, last_modified, fetched_at, expires_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (key, endpoint.strip('/'), body, len(body), etag, last_modified,
+                  now, now + self.ttl_for(endpoint), now))
+            self._conn.commit()
+
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a stale entry fresh again after a 304 Not Modified"""
+        key = self.make_key(endpoint, params)
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                'UPDATE responses SET fetched_at = ?, expires_at = ?, last_accessed = ? WHERE cache_key = ?',
+                (now, now + self.ttl_for(endpoint), now, key)
+            )
+            self._conn.commit()
+
+    def invalidate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Remove a single cached response"""
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            self._conn.execute('DELETE FROM responses WHERE cache_key = ?', (key,))
+            self._conn.commit()
+            self._total_bytes = self._conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM responses'
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def _evict(self) -> None:
+        """Evict least-recently-used entries down to 90% of the budget (lock held)"""
+        # Other processes may share the file, so resync before deciding
+        self._total_bytes = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()[0]
+        target = int(self.max_bytes * 0.9)
+        if self._total_bytes <= target:
+            return
+
+        removed = 0
+        cursor = self._conn.execute('SELECT cache_key, size FROM responses ORDER BY last_accessed ASC')
+        victims = []
+        for cache_key, size in cursor:
+            if self._total_bytes <= target:
+                break
+            victims.append((cache_key,))
+            self._total_bytes -= size
+            removed += 1
+
+        self._conn.executemany('DELETE FROM responses WHERE cache_key = ?', victims)
+        self._conn.commit()
+        self.evictions += removed
+        logger.debug(f"Evicted {removed} cached responses ({self._total_bytes / 1024 / 1024:.1f} MB remaining)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache storage statistics
+
+        Returns:
+            Dictionary with entry count, size and eviction count
+        """
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        return {
+            'entries': entries,
+            'size_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+            'evictions': self.evictions
+        }
+
+    def close(self) -> None:
+        """Close the cache database connection"""
+        with self._lock:
+            self._conn.close()
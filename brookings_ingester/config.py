@@ -32,7 +32,15 @@ class Config:
 
     # Ingestion parameters
     RATE_LIMIT_DELAY = float(os.getenv('RATE_LIMIT_DELAY', '1.5'))  # seconds
-    MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', '5'))
+    MAX_CONCURRENT_REQUESTS = int(os.getenv('MAX_CONCURRENT_REQUESTS', '5'))  # fetch threads (1 = sequential)
+    PARSE_PROCESSES = int(os.getenv('PARSE_PROCESSES', '2'))  # 0 parses in the fetch threads
+    WRITE_BATCH_SIZE = int(os.getenv('WRITE_BATCH_SIZE', '25'))  # parsed documents per store batch
+    PDF_EXTRACT_PROCESSES = int(os.getenv('PDF_EXTRACT_PROCESSES', '2'))  # 0 extracts large PDFs in-process
+    PDF_MAX_TEXT_CHARS = int(os.getenv('PDF_MAX_TEXT_CHARS', '20000000'))  # text kept in memory per PDF
+    # Extracted PDF text by file checksum ('' disables)
+    PDF_TEXT_CACHE_PATH = os.getenv('PDF_TEXT_CACHE_PATH', str(STORAGE_PATH / 'cache' / 'pdf_text'))
+    PDF_TEXT_CACHE_MAX_MB = int(os.getenv('PDF_TEXT_CACHE_MAX_MB', '1024'))  # least recently used evicted beyond
+    FILE_COMPRESSION = os.getenv('FILE_COMPRESSION', 'none')  # stored text/HTML: none, gzip or zstd
     START_DATE = '2025-01-01'  # Only ingest content from 2025 onward
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
@@ -8,19 +8,79 @@ import os
 import json
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 from sqlalchemy.exc import IntegrityError
 
 from brookings_ingester.models.database import session_scope, init_database
 from brookings_ingester.models.document import (
     Source, Document, DocumentVersion, Author,
-    DocumentAuthor, Subject, DocumentSubject
+    DocumentAuthor, Subject, DocumentSubject, SyncState
 )
+from brookings_ingester.storage.batch_writer import resolve_authors, resolve_subjects
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Products whose documents, authors and subjects are looked up together
+# (also the chunk committed per step by sync_incremental)
+SYNC_BATCH_SIZE = 200
+
+# SyncState row holding the incremental sync watermark
+WATERMARK_NAME = 'crs_products'
+
+# Watermark before the first incremental sync
+EPOCH = datetime(1970, 1, 1)
+
+# products.updated_at and product_versions.ingested_at are stamped with the
+# start time of the writing transaction, so a CRS update that commits after a
+# sync can carry stamps older than the watermark that sync stored. Each run
+# therefore re-reads the changes of this window before the watermark too;
+# re-read products whose fields did not change are skipped. Writes that take
+# longer than the window to commit are picked up only by a full sync.
+WATERMARK_OVERLAP = timedelta(minutes=30)
+
+# Active products whose row changed or that got a new content version since
+# the watermark (or within the overlap before it), in (changed_at, product_id)
+# order so a run can resume after the last committed product
+CHANGED_PRODUCTS_QUERY = """
+    WITH changes AS (
+        SELECT product_id, updated_at AS changed_at
+        FROM products
+        WHERE updated_at >= %(lookback)s
+        UNION ALL
+        SELECT product_id, ingested_at AS changed_at
+        FROM product_versions
+        WHERE ingested_at >= %(lookback)s
+    ),
+    latest AS (
+        SELECT product_id, MAX(changed_at) AS changed_at
+        FROM changes
+        GROUP BY product_id
+    )
+    SELECT
+        p.product_id,
+        p.title,
+        p.product_type,
+        p.status,
+        p.publication_date,
+        p.summary,
+        p.authors,
+        p.topics,
+        p.url_html,
+        p.url_pdf,
+        p.raw_json,
+        l.changed_at,
+        (SELECT MAX(v.version_number) FROM product_versions v
+         WHERE v.product_id = p.product_id) AS version_number
+    FROM latest l
+    JOIN products p ON p.product_id = l.product_id
+    WHERE p.status = 'Active'
+      AND (l.changed_at < %(since)s
+           OR (l.changed_at, p.product_id) > (%(since)s, %(after_key)s))
+    ORDER BY l.changed_at, p.product_id
+"""
+
 
 class CRSPolicyLibrarySync:
     """
@@ -52,6 +112,11 @@ class CRSPolicyLibrarySync:
         else:
             init_database()  # Use default from config
 
+        # Ids resolved for the batch being synced (see _prefetch_batch)
+        self._existing_docs: Dict[str, Document] = {}
+        self._author_ids: Dict[str, int] = {}
+        self._subject_ids: Dict[str, int] = {}
+
         logger.info(f"CRS sync initialized (CRS DB: {self.crs_db_url[:30]}...)")
 
     def get_crs_connection(self):
@@ -142,6 +207,39 @@ class CRSPolicyLibrarySync:
             logger.debug(f"Created subject: {subject_name}")
         return subject
 
+    def _prefetch_batch(self, session, source: Source, products: List[Dict[str, Any]]):
+        """
+        Look up documents, authors and subjects for a batch of products at once
+
+        Replaces a SELECT (and often an INSERT) per product, author and topic
+        with one query per kind plus one bulk insert of new names.
+        """
+        product_ids = [p['product_id'] for p in products]
+        self._existing_docs = {
+            doc.document_identifier: doc
+            for doc in session.query(Document).filter(
+                Document.source_id == source.source_id,
+                Document.document_identifier.in_(product_ids)
+            )
+        }
+
+        author_names, topic_names = [], []
+        for product in products:
+            author_names.extend(name.strip() for name in self._json_list(product.get('authors')) if name and name.strip())
+            topic_names.extend(name.strip() for name in self._json_list(product.get('topics')) if name and name.strip())
+
+        self._author_ids = resolve_authors(session, author_names)
+        self._subject_ids = resolve_subjects(session, topic_names, source_vocabulary='CRS')
+
+    @staticmethod
+    def _json_list(value) -> List[str]:
+        """Decode a JSONB array column (may arrive as text)"""
+        if not value:
+            return []
+        if isinstance(value, str):
+            value = json.loads(value)
+        return value
+
     def fetch_crs_products(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch all CRS products from CRS database
@@ -199,10 +297,13 @@ class CRSPolicyLibrarySync:
         product_id = product['product_id']
 
         # Check if document already exists
-        existing_doc = session.query(Document).filter_by(
-            source_id=source.source_id,
-            document_identifier=product_id
-        ).first()
+        if product_id in self._existing_docs:
+            existing_doc = self._existing_docs[product_id]
+        else:
+            existing_doc = session.query(Document).filter_by(
+                source_id=source.source_id,
+                document_identifier=product_id
+            ).first()
 
         # Prepare metadata JSON with CRS-specific fields
         # Use raw_json from CRS database as base metadata
@@ -277,9 +378,7 @@ class CRSPolicyLibrarySync:
             ).delete()
 
             # Parse authors JSONB array
-            authors_data = product['authors']
-            if isinstance(authors_data, str):
-                authors_data = json.loads(authors_data)
+            authors_data = self._json_list(product['authors'])
 
             # Track seen author IDs to avoid duplicates within the same document
             seen_author_ids = set()
@@ -287,17 +386,19 @@ class CRSPolicyLibrarySync:
 
             for author_name in authors_data:
                 if author_name and author_name.strip():
-                    author = self.get_or_create_author(session, author_name.strip())
+                    author_id = self._author_ids.get(author_name.strip())
+                    if author_id is None:
+                        author_id = self.get_or_create_author(session, author_name.strip()).author_id
 
                     # Skip if we've already added this author to this document
-                    if author.author_id in seen_author_ids:
+                    if author_id in seen_author_ids:
                         logger.debug(f"Skipping duplicate author {author_name} for product {product_id}")
                         continue
 
-                    seen_author_ids.add(author.author_id)
+                    seen_author_ids.add(author_id)
                     doc_author = DocumentAuthor(
                         document_id=document.document_id,
-                        author_id=author.author_id,
+                        author_id=author_id,
                         author_order=author_order
                     )
                     session.add(doc_author)
@@ -311,26 +412,26 @@ class CRSPolicyLibrarySync:
             ).delete()
 
             # Parse topics JSONB array
-            topics_data = product['topics']
-            if isinstance(topics_data, str):
-                topics_data = json.loads(topics_data)
+            topics_data = self._json_list(product['topics'])
 
             # Track seen subject IDs to avoid duplicates within the same document
             seen_subject_ids = set()
 
             for topic_name in topics_data:
                 if topic_name and topic_name.strip():
-                    subject = self.get_or_create_subject(session, topic_name.strip())
+                    subject_id = self._subject_ids.get(topic_name.strip())
+                    if subject_id is None:
+                        subject_id = self.get_or_create_subject(session, topic_name.strip()).subject_id
 
                     # Skip if we've already added this subject to this document
-                    if subject.subject_id in seen_subject_ids:
+                    if subject_id in seen_subject_ids:
                         logger.debug(f"Skipping duplicate subject {topic_name} for product {product_id}")
                         continue
 
-                    seen_subject_ids.add(subject.subject_id)
+                    seen_subject_ids.add(subject_id)
                     doc_subject = DocumentSubject(
                         document_id=document.document_id,
-                        subject_id=subject.subject_id
+                        subject_id=subject_id
                     )
                     session.add(doc_subject)
 
@@ -366,21 +467,8 @@ class CRSPolicyLibrarySync:
             with session_scope() as session:
                 source = self.get_or_create_crs_source(session)
 
-                for product in products:
-                    try:
-                        result = self.sync_product_to_policy_library(session, source, product)
-                        if result:
-                            # Check if it was created or updated
-                            if session.is_modified(result):
-                                stats['documents_updated'] += 1
-                            else:
-                                stats['documents_created'] += 1
-                        else:
-                            stats['documents_skipped'] += 1
-                    except Exception as e:
-                        stats['errors'] += 1
-                        logger.error(f"Error syncing product {product.get('product_id')}: {e}")
-                        # Continue with next product
+                for start in range(0, len(products), SYNC_BATCH_SIZE):
+                    self._sync_batch(session, source, products[start:start + SYNC_BATCH_SIZE], stats)
 
             logger.info(f"✓ CRS sync completed: {stats['documents_created']} created, "
                        f"{stats['documents_updated']} updated, {stats['documents_skipped']} skipped")
@@ -391,6 +479,166 @@ class CRSPolicyLibrarySync:
 
         return stats
 
+    def _sync_batch(self, session, source: Source, products: List[Dict[str, Any]],
+                    stats: Dict[str, int]) -> Optional[int]:
+        """
+        Sync a batch of products within session, counting results in stats
+
+        Each product runs in a savepoint, so a failed product is rolled back
+        on its own and the rest of the batch still syncs.
+
+        Returns:
+            Index of the first product that failed, or None
+        """
+        self._prefetch_batch(session, source, products)
+        first_failure = None
+
+        for index, product in enumerate(products):
+            try:
+                with session.begin_nested():
+                    result = self.sync_product_to_policy_library(session, source, product)
+                    # Check if it was created or updated (before the savepoint flushes it)
+                    updated = result is not None and session.is_modified(result)
+                if result:
+                    if updated:
+                        stats['documents_updated'] += 1
+                    else:
+                        stats['documents_created'] += 1
+                else:
+                    stats['documents_skipped'] += 1
+            except Exception as e:
+                stats['errors'] += 1
+                logger.error(f"Error syncing product {product.get('product_id')}: {e}")
+                if first_failure is None:
+                    first_failure = index
+                # Continue with next product
+
+        return first_failure
+
+    def get_watermark(self) -> Dict[str, Any]:
+        """
+        Last committed position of the incremental sync
+
+        Returns:
+            {'at': datetime, 'key': product_id, 'version': int or None}
+            (EPOCH and '' before the first run)
+        """
+        with session_scope() as session:
+            state = session.get(SyncState, WATERMARK_NAME)
+            if not state or not state.watermark_at:
+                return {'at': EPOCH, 'key': '', 'version': None}
+            return {'at': state.watermark_at, 'key': state.watermark_key or '',
+                    'version': state.watermark_version}
+
+    def reset_watermark(self):
+        """Forget the watermark so the next incremental sync re-reads every product"""
+        with session_scope() as session:
+            state = session.get(SyncState, WATERMARK_NAME)
+            if state:
+                session.delete(state)
+        logger.info("CRS sync watermark reset")
+
+    def iter_changed_products(self, since: datetime, after_key: str = '',
+                              chunk_size: int = SYNC_BATCH_SIZE, overlap: timedelta = WATERMARK_OVERLAP):
+        """
+        Stream products changed after a watermark, chunk by chunk
+
+        Uses a server-side cursor, so memory is bounded by chunk_size rather
+        than by the number of changed products.
+
+        Args:
+            since: Watermark change time
+            after_key: Watermark product_id (products at exactly `since`
+                sort after it only if their id is greater)
+            chunk_size: Products per yielded chunk
+            overlap: Also re-read changes this long before `since` (see WATERMARK_OVERLAP)
+
+        Yields:
+            Lists of product dictionaries with changed_at and version_number
+        """
+        conn = self.get_crs_connection()
+        try:
+            with conn.cursor(name='crs_policy_library_sync') as cur:
+                cur.itersize = chunk_size
+                cur.execute(CHANGED_PRODUCTS_QUERY, {'since': since, 'after_key': after_key,
+                                                     'lookback': since - overlap})
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    def sync_incremental(self, chunk_size: int = SYNC_BATCH_SIZE, full: bool = False) -> Dict[str, int]:
+        """
+        Sync only products changed since the last run
+
+        Each chunk is committed together with the advanced watermark, so an
+        interrupted run resumes after the last committed chunk. The watermark
+        never moves past a product that failed: the run stops there and the
+        next one retries from that product. It never moves back either, when
+        a chunk holds only products re-read from the overlap window (CRS
+        changes can show up here up to WATERMARK_OVERLAP late, see there).
+
+        Args:
+            chunk_size: Products per chunk (and per transaction)
+            full: Start from the beginning instead of the stored watermark
+
+        Returns:
+            Dictionary with sync statistics (as sync_all_products)
+        """
+        stats = {
+            'products_checked': 0,
+            'documents_created': 0,
+            'documents_updated': 0,
+            'documents_skipped': 0,
+            'errors': 0
+        }
+
+        if full:
+            self.reset_watermark()
+        watermark = self.get_watermark()
+        logger.info(f"Starting incremental CRS sync after {watermark['at']} ({watermark['key'] or 'start'})...")
+
+        try:
+            for chunk in self.iter_changed_products(watermark['at'], watermark['key'], chunk_size):
+                with session_scope() as session:
+                    source = self.get_or_create_crs_source(session)
+                    failed = self._sync_batch(session, source, chunk, stats)
+
+                    # Products up to the first failure are done
+                    synced = chunk if failed is None else chunk[:failed]
+                    if synced:
+                        last = synced[-1]
+                        state = session.get(SyncState, WATERMARK_NAME)
+                        if not state:
+                            state = SyncState(sync_name=WATERMARK_NAME, rows_synced=0)
+                            session.add(state)
+                        if (last['changed_at'], last['product_id']) > (state.watermark_at or EPOCH,
+                                                                        state.watermark_key or ''):
+                            state.watermark_at = last['changed_at']
+                            state.watermark_key = last['product_id']
+                            state.watermark_version = last.get('version_number')
+                        state.rows_synced = (state.rows_synced or 0) + len(synced)
+
+                stats['products_checked'] += len(chunk)
+                if failed is not None:
+                    logger.warning(f"Stopping at failed product {chunk[failed]['product_id']} "
+                                   f"- the next run retries from there")
+                    break
+                logger.info(f"  Synced {stats['products_checked']} changed products "
+                           f"(through {last['changed_at']}, {last['product_id']})")
+
+            logger.info(f"✓ Incremental CRS sync completed: {stats['documents_created']} created, "
+                       f"{stats['documents_updated']} updated, {stats['documents_skipped']} skipped")
+
+        except Exception as e:
+            logger.error(f"Incremental CRS sync failed (resumes from last committed chunk): {e}")
+            stats['errors'] += 1
+
+        return stats
+
     def sync_single_product(self, product_id: str) -> bool:
         """
         Sync a single CRS product by ID
@@ -420,6 +668,7 @@ class CRSPolicyLibrarySync:
 
             with session_scope() as session:
                 source = self.get_or_create_crs_source(session)
+                self._prefetch_batch(session, source, [dict(product)])
                 self.sync_product_to_policy_library(session, source, dict(product))
 
             logger.info(f"✓ Synced CRS product {product_id} to policy library")
@@ -430,17 +679,20 @@ class CRSPolicyLibrarySync:
             return False
 
 
-def sync_crs_to_policy_library(limit: Optional[int] = None) -> Dict[str, int]:
+def sync_crs_to_policy_library(limit: Optional[int] = None, incremental: bool = False) -> Dict[str, int]:
     """
     Convenience function to sync CRS products to policy library
 
     Args:
-        limit: Optional limit on number of products
+        limit: Optional limit on number of products (full sync only)
+        incremental: Sync only products changed since the last incremental run
 
     Returns:
         Sync statistics dictionary
     """
     sync = CRSPolicyLibrarySync()
+    if incremental:
+        return sync.sync_incremental()
     return sync.sync_all_products(limit=limit)
 
 
@@ -448,12 +700,16 @@ if __name__ == '__main__':
     # Run sync when executed directly
     import sys
 
+    incremental = '--incremental' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
     limit = None
-    if len(sys.argv) > 1:
-        limit = int(sys.argv[1])
+    if args:
+        limit = int(args[0])
 
-    print(f"Syncing CRS products to Policy Library{f' (limit: {limit})' if limit else ''}...")
-    stats = sync_crs_to_policy_library(limit=limit)
+    print(f"Syncing {'changed ' if incremental else ''}CRS products to Policy Library"
+          f"{f' (limit: {limit})' if limit else ''}...")
+    stats = sync_crs_to_policy_library(limit=limit, incremental=incremental)
     print(f"\nSync Results:")
     print(f"  Products checked: {stats['products_checked']}")
     print(f"  Documents created: {stats['documents_created']}")
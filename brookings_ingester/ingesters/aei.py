@@ -10,11 +10,9 @@ Generated: 2025-10-17
 Based on: brookings_ingester/docs/sources/aei_analysis.md
 """
 import logging
-import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from urllib.parse import urlparse
-from playwright.sync_api import sync_playwright
 
 from .base import BaseIngester
 from .utils.aei_parser import AeiHTMLParser
@@ -44,14 +42,15 @@ class AeiIngester(BaseIngester):
         "https://www.aei.org/research-products/speeches/",
     ]
 
-    def __init__(self, rate_limit_delay: float = None):
+    def __init__(self, rate_limit_delay: float = None, renderer=None):
         """
         Initialize AEI ingester
 
         Args:
             rate_limit_delay: Delay between requests (default: 1.5s)
+            renderer: Renderer for browser fetches (default: shared browser)
         """
-        super().__init__(source_code='AEI', rate_limit_delay=rate_limit_delay or 1.5)
+        super().__init__(source_code='AEI', rate_limit_delay=rate_limit_delay or 1.5, renderer=renderer)
 
         # AEI-specific components
         self.html_parser = AeiHTMLParser()
@@ -225,67 +224,17 @@ class AeiIngester(BaseIngester):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
-    def _fetch_with_browser(self, url: str, headless: bool = True) -> Optional[str]:
+    def _fetch_with_browser(self, url: str) -> Optional[str]:
         """
-        Fetch HTML content using Playwright browser (sync pattern)
+        Fetch HTML content using the browser renderer
 
         Args:
             url: URL to fetch
-            headless: Run browser in headless mode
 
         Returns:
             HTML content as string or None if fetch failed
         """
-        try:
-            self._rate_limit()
-
-            start_time = time.time()
-            logger.debug(f"Fetching with browser: {url}")
-
-            with sync_playwright() as playwright:
-                # Launch browser with stealth mode to bypass Cloudflare
-                browser = playwright.chromium.launch(
-                    headless=headless,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox'
-                    ]
-                )
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='en-US',
-                    timezone_id='America/New_York'
-                )
-                page = context.new_page()
-
-                # Navigate to page with longer timeout for Cloudflare
-                # Options: 'domcontentloaded', 'load', 'networkidle'
-                page.goto(url, wait_until='networkidle', timeout=90000)
-
-                # TODO: Adjust wait strategy based on analysis
-                # If site uses JavaScript to render content:
-                # page.wait_for_selector('article, main p', timeout=15000)
-
-                # Additional wait if needed
-                time.sleep(2)
-
-                # Get HTML content
-                html_content = page.content()
-
-                # Close browser
-                browser.close()
-
-            fetch_time = (time.time() - start_time) * 1000
-            size_bytes = len(html_content.encode('utf-8'))
-
-            logger.info(f"✓ Fetched: {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
-            return html_content
-
-        except Exception as e:
-            logger.error(f"✗ Browser fetch failed for {url}: {e}")
-            return None
+        return self._render(url, timeout=90)
 
     def parse(self, document_meta: Dict[str, Any], fetched_content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -6,6 +6,7 @@ Defines the common pattern for all ingesters (CRS, Brookings, GAO, etc.)
 from abc import ABC, abstractmethod
 import time
 import logging
+import threading
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import requests
@@ -14,9 +15,16 @@ from tqdm import tqdm
 from brookings_ingester.config import config
 from brookings_ingester.models import get_session, Source, Document, IngestionLog, IngestionError
 from brookings_ingester.storage import FileManager, PDFExtractor
+from brookings_ingester.storage.batch_writer import DocumentBatchWriter, author_name, document_row, resolve_authors
+from api.rate_limiter import HostRateLimiter
+from brookings_ingester.ingesters.pipeline import IngestionPipeline
+from fetchers.browser_renderer import Renderer, get_renderer
 
 logger = logging.getLogger(__name__)
 
+# Identifiers per existence query when classifying discovered documents
+EXISTENCE_CHUNK_SIZE = 500
+
 
 class BaseIngester(ABC):
     """
@@ -29,25 +37,28 @@ class BaseIngester(ABC):
     4. store() - Save to database and files
     """
 
-    def __init__(self, source_code: str, rate_limit_delay: float = None):
+    # Components used by parse() whose stats are sent back from parse worker processes
+    PARSE_COMPONENTS = ('pdf_extractor',)
+
+    def __init__(self, source_code: str, rate_limit_delay: float = None, renderer: Renderer = None):
         """
         Initialize ingester
 
         Args:
             source_code: Source identifier ('CRS', 'BROOKINGS', 'GAO')
             rate_limit_delay: Delay between requests in seconds
+            renderer: Renderer for browser fetches (default: shared process-wide browser)
         """
         self.source_code = source_code
+        self._renderer = renderer
         self.rate_limit_delay = rate_limit_delay or config.RATE_LIMIT_DELAY
         self.last_request_time = 0
+        self._host_limiter = HostRateLimiter(self.rate_limit_delay)
 
         # Initialize components
         self.file_manager = FileManager()
         self.pdf_extractor = PDFExtractor()
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.USER_AGENT
-        })
+        self.session = self._create_session()
 
         # Get source from database
         db_session = get_session()
@@ -56,7 +67,8 @@ class BaseIngester(ABC):
             raise ValueError(f"Source '{source_code}' not found in database. Please seed sources table.")
         db_session.close()
 
-        # Statistics
+        # Statistics (fetch and parse threads update them concurrently)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'documents_checked': 0,
             'documents_fetched': 0,
@@ -68,6 +80,30 @@ class BaseIngester(ABC):
             'errors': []
         }
 
+    def _create_session(self) -> requests.Session:
+        """HTTP session with the configured user agent"""
+        session = requests.Session()
+        session.headers.update({
+            'User-Agent': config.USER_AGENT
+        })
+        return session
+
+    def __getstate__(self):
+        """Picklable state for parse worker processes (no session, limiter, lock or renderer)"""
+        state = self.__dict__.copy()
+        state.pop('session', None)
+        state.pop('_host_limiter', None)
+        state.pop('_stats_lock', None)
+        # Workers only parse; they never render pages
+        state['_renderer'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.session = self._create_session()
+        self._host_limiter = HostRateLimiter(self.rate_limit_delay)
+        self._stats_lock = threading.Lock()
+
     @abstractmethod
     def discover(self, limit: int = None, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -185,9 +221,13 @@ class BaseIngester(ABC):
                 # Check if content has changed
                 if existing_doc.checksum == checksum:
                     logger.debug(f"Document {parsed_data['document_identifier']} unchanged, skipping")
+                    # Record the check so classify_documents does not treat it as changed again
+                    document_id = existing_doc.document_id
+                    existing_doc.updated_at = datetime.utcnow()
+                    db_session.commit()
                     db_session.close()
-                    self.stats['documents_skipped'] += 1
-                    return existing_doc.document_id
+                    self._count('documents_skipped')
+                    return document_id
 
                 # Update existing document
                 existing_doc.title = parsed_data.get('title')
@@ -204,7 +244,7 @@ class BaseIngester(ABC):
                 existing_doc.updated_at = datetime.utcnow()
 
                 document = existing_doc
-                self.stats['documents_updated'] += 1
+                self._count('documents_updated')
                 logger.info(f"✓ Updated document: {parsed_data['document_identifier']}")
 
             else:
@@ -228,78 +268,30 @@ class BaseIngester(ABC):
                 db_session.add(document)
                 db_session.flush()  # Get document_id
 
-                self.stats['documents_fetched'] += 1
+                self._count('documents_fetched')
                 logger.info(f"✓ Created document: {parsed_data['document_identifier']}")
 
             # Save authors and subjects
-            from brookings_ingester.models.document import Author, DocumentAuthor, Subject, DocumentSubject
+            from brookings_ingester.models.document import DocumentAuthor, Subject, DocumentSubject
 
             # Clear existing associations if updating
             if existing_doc:
                 db_session.query(DocumentAuthor).filter_by(document_id=document.document_id).delete()
                 db_session.query(DocumentSubject).filter_by(document_id=document.document_id).delete()
 
-            # Add authors (supports both dict with metadata and legacy string format)
-            for idx, author_data in enumerate(parsed_data.get('authors', [])):
-                # Handle both dict (new format) and string (legacy format)
-                if isinstance(author_data, dict):
-                    author_name = author_data.get('name', '').strip()
-                    author_title = author_data.get('title')
-                    author_affiliation = author_data.get('affiliation')
-                    author_profile_url = author_data.get('profile_url')
-                    author_linkedin_url = author_data.get('linkedin_url')
-                elif isinstance(author_data, str):
-                    # Legacy format: just author name
-                    author_name = author_data.strip()
-                    author_title = None
-                    author_affiliation = None
-                    author_profile_url = None
-                    author_linkedin_url = None
-                else:
-                    continue
-
-                if not author_name:
-                    continue
-
-                # Find or create author
-                author = db_session.query(Author).filter_by(full_name=author_name).first()
-                if not author:
-                    # Create new author with all metadata
-                    author = Author(
-                        full_name=author_name,
-                        job_title=author_title,
-                        affiliation_text=author_affiliation,
-                        profile_url=author_profile_url,
-                        linkedin_url=author_linkedin_url
-                    )
-                    db_session.add(author)
-                    db_session.flush()  # Get author_id
-                    logger.debug(f"Created new author: {author_name} ({author_title or 'N/A'})")
-                else:
-                    # Update existing author if we have new metadata
-                    updated = False
-                    if author_title and not author.job_title:
-                        author.job_title = author_title
-                        updated = True
-                    if author_affiliation and not author.affiliation_text:
-                        author.affiliation_text = author_affiliation
-                        updated = True
-                    if author_profile_url and not author.profile_url:
-                        author.profile_url = author_profile_url
-                        updated = True
-                    if author_linkedin_url and not author.linkedin_url:
-                        author.linkedin_url = author_linkedin_url
-                        updated = True
-                    if updated:
-                        logger.debug(f"Updated author metadata: {author_name}")
-
-                # Create association with author order
-                doc_author = DocumentAuthor(
-                    document_id=document.document_id,
-                    author_id=author.author_id,
-                    author_order=idx + 1  # 1-indexed order
-                )
-                db_session.add(doc_author)
+            # Add authors (dicts with metadata or legacy name strings), resolved as in store_batch()
+            authors = parsed_data.get('authors', [])
+            author_ids = resolve_authors(db_session, authors)
+            linked = []
+            for author_data in authors:
+                author_id = author_ids.get(author_name(author_data))
+                if author_id and author_id not in linked:
+                    linked.append(author_id)
+                    db_session.add(DocumentAuthor(
+                        document_id=document.document_id,
+                        author_id=author_id,
+                        author_order=len(linked)  # 1-indexed order
+                    ))
 
             # Add subjects
             for subject_name in parsed_data.get('subjects', []):
@@ -321,24 +313,7 @@ class BaseIngester(ABC):
                 db_session.add(doc_subject)
 
             # Save files if available
-            if parsed_data.get('pdf_bytes'):
-                pdf_info = self.file_manager.save_pdf(
-                    parsed_data['document_identifier'],
-                    parsed_data['pdf_bytes']
-                )
-                self.stats['total_size_bytes'] += pdf_info['file_size']
-
-            if parsed_data.get('text_content'):
-                self.file_manager.save_text(
-                    parsed_data['document_identifier'],
-                    parsed_data['text_content']
-                )
-
-            if parsed_data.get('html_content'):
-                self.file_manager.save_html(
-                    parsed_data['document_identifier'],
-                    parsed_data['html_content']
-                )
+            self._save_files(parsed_data)
 
             db_session.commit()
             document_id = document.document_id
@@ -351,18 +326,90 @@ class BaseIngester(ABC):
             if db_session:
                 db_session.rollback()
                 db_session.close()
-            self.stats['errors_count'] += 1
+            self._count('errors_count')
             return None
 
+    def _save_files(self, parsed_data: Dict[str, Any]):
+        """Save PDF, text and HTML content of a stored document"""
+        if parsed_data.get('pdf_bytes'):
+            pdf_info = self.file_manager.save_pdf(
+                parsed_data['document_identifier'],
+                parsed_data['pdf_bytes']
+            )
+            self._count('total_size_bytes', pdf_info['file_size'])
+
+        if parsed_data.get('text_content'):
+            self.file_manager.save_text(
+                parsed_data['document_identifier'],
+                parsed_data['text_content']
+            )
+
+        if parsed_data.get('html_content'):
+            self.file_manager.save_html(
+                parsed_data['document_identifier'],
+                parsed_data['html_content']
+            )
+
+    def store_batch(self, parsed_list: List[Dict[str, Any]]) -> List[Optional[int]]:
+        """
+        Store several parsed documents in one transaction
+
+        Documents, authors and subjects are written with set-based statements
+        (see DocumentBatchWriter). If the batch fails, each document is
+        retried with store() so one bad document does not fail the others.
+
+        Args:
+            parsed_list: Parsed document data
+
+        Returns:
+            document_id (or None on failure) for each document, in order
+        """
+        if not parsed_list:
+            return []
+
+        rows = [
+            document_row(
+                parsed,
+                self._calculate_checksum(parsed.get('full_text') or ''),
+                self._parse_date_string(parsed.get('publication_date'))
+            )
+            for parsed in parsed_list
+        ]
+
+        db_session = get_session()
+        try:
+            results = DocumentBatchWriter(db_session, self.source.source_id).write(rows)
+            for parsed, (_, action) in zip(parsed_list, results):
+                if action != 'unchanged':
+                    self._save_files(parsed)
+            db_session.commit()
+        except Exception as e:
+            db_session.rollback()
+            logger.warning(f"Batch store of {len(parsed_list)} documents failed ({e}); storing one by one")
+            return [self.store(parsed) for parsed in parsed_list]
+        finally:
+            db_session.close()
+
+        counters = {'created': 'documents_fetched', 'updated': 'documents_updated', 'unchanged': 'documents_skipped'}
+        for parsed, (_, action) in zip(parsed_list, results):
+            self._count(counters[action])
+            if action != 'unchanged':
+                logger.info(f"✓ {action.capitalize()} document: {parsed['document_identifier']}")
+
+        return [document_id for document_id, _ in results]
+
     def run_ingestion(self, limit: int = None, skip_existing: bool = True,
-                     run_type: str = 'manual', **kwargs) -> Dict[str, Any]:
+                     run_type: str = 'manual', workers: int = None, **kwargs) -> Dict[str, Any]:
         """
         Run full ingestion pipeline
 
         Args:
             limit: Maximum number of documents to process
-            skip_existing: Skip documents that already exist
+            skip_existing: Skip documents already stored, unless their lastmod
+                is newer than the stored copy
             run_type: 'backfill', 'update', or 'manual'
+            workers: Concurrent fetches (default config.MAX_CONCURRENT_REQUESTS;
+                1 processes documents one at a time)
             **kwargs: Source-specific parameters
 
         Returns:
@@ -391,42 +438,28 @@ class BaseIngester(ABC):
 
             self.stats['documents_checked'] = len(documents)
 
-            # Step 2: Process each document
+            # Step 2: Drop documents already stored and unchanged since (one query per chunk)
+            if skip_existing:
+                classified = self.classify_documents(documents)
+                logger.info(f"{len(classified['new'])} new, {len(classified['changed'])} changed, "
+                            f"{len(classified['unchanged'])} unchanged")
+                pending = classified['new'] + classified['changed']
+                self._count('documents_skipped', len(documents) - len(pending))
+                documents = pending
+
+            # Step 3: Process each document
+            workers = config.MAX_CONCURRENT_REQUESTS if workers is None else workers
             with tqdm(total=len(documents), desc=f"Ingesting {self.source_code}") as pbar:
-                for doc_meta in documents:
-                    try:
-                        # Check if document exists and should skip
-                        if skip_existing and self.document_exists(doc_meta['document_identifier']):
-                            logger.debug(f"Skipping existing: {doc_meta['document_identifier']}")
-                            self.stats['documents_skipped'] += 1
-                            pbar.update(1)
-                            continue
-
-                        # Fetch content
-                        fetched = self.fetch(doc_meta)
-                        if not fetched:
-                            self._log_error(log_id, doc_meta, 'fetch_error', 'Failed to fetch content')
-                            pbar.update(1)
-                            continue
-
-                        # Parse content
-                        parsed = self.parse(doc_meta, fetched)
-                        if not parsed:
-                            self._log_error(log_id, doc_meta, 'parse_error', 'Failed to parse content')
-                            pbar.update(1)
-                            continue
-
-                        # Store document
-                        document_id = self.store(parsed)
-                        if not document_id:
-                            self._log_error(log_id, doc_meta, 'storage_error', 'Failed to store document')
-
-                        pbar.update(1)
-
-                    except Exception as e:
-                        logger.error(f"Error processing {doc_meta.get('document_identifier')}: {e}")
-                        self._log_error(log_id, doc_meta, 'unexpected_error', str(e))
-                        pbar.update(1)
+                if workers > 1:
+                    pipeline = IngestionPipeline(
+                        self, log_id,
+                        fetch_workers=workers,
+                        parse_processes=config.PARSE_PROCESSES,
+                        batch_size=config.WRITE_BATCH_SIZE
+                    )
+                    pipeline.run(documents, progress=pbar)
+                else:
+                    self._process_sequentially(documents, log_id, pbar)
 
             # Calculate metrics
             duration = time.time() - start_time
@@ -482,6 +515,90 @@ class BaseIngester(ABC):
                 'error': str(e),
                 'stats': self.stats.copy()
             }
+        finally:
+            # Worker processes for large PDFs
+            self.pdf_extractor.close()
+
+    def _process_sequentially(self, documents: List[Dict[str, Any]], log_id: int, pbar) -> None:
+        """Fetch, parse and store documents one at a time"""
+        for doc_meta in documents:
+            try:
+                # Fetch content
+                fetched = self.fetch(doc_meta)
+                if not fetched:
+                    self._log_error(log_id, doc_meta, 'fetch_error', 'Failed to fetch content')
+                    pbar.update(1)
+                    continue
+
+                # Parse content
+                parsed = self.parse(doc_meta, fetched)
+                if not parsed:
+                    self._log_error(log_id, doc_meta, 'parse_error', 'Failed to parse content')
+                    pbar.update(1)
+                    continue
+
+                # Store document
+                document_id = self.store(parsed)
+                if not document_id:
+                    self._log_error(log_id, doc_meta, 'storage_error', 'Failed to store document')
+
+                pbar.update(1)
+
+            except Exception as e:
+                logger.error(f"Error processing {doc_meta.get('document_identifier')}: {e}")
+                self._log_error(log_id, doc_meta, 'unexpected_error', str(e))
+                pbar.update(1)
+
+    def classify_documents(self, documents: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Split discovered documents by what the database already holds
+
+        Looks identifiers up in chunks of EXISTENCE_CHUNK_SIZE instead of one
+        query per document. Repeated identifiers are kept once.
+
+        Args:
+            documents: Document metadata from discover(); an optional
+                'lastmod' (YYYY-MM-DD) marks when the source last changed it
+
+        Returns:
+            {'new': [...], 'changed': [...], 'unchanged': [...]} where changed
+            documents are stored but have a lastmod after their stored copy
+        """
+        identifiers = list(dict.fromkeys(d['document_identifier'] for d in documents))
+        stored = {}
+
+        db_session = get_session()
+        try:
+            for start in range(0, len(identifiers), EXISTENCE_CHUNK_SIZE):
+                chunk = identifiers[start:start + EXISTENCE_CHUNK_SIZE]
+                rows = db_session.query(Document.document_identifier, Document.updated_at).filter(
+                    Document.source_id == self.source.source_id,
+                    Document.document_identifier.in_(chunk)
+                ).all()
+                stored.update((identifier, updated_at) for identifier, updated_at in rows)
+        finally:
+            db_session.close()
+
+        classified = {'new': [], 'changed': [], 'unchanged': []}
+        seen = set()
+        for doc_meta in documents:
+            identifier = doc_meta['document_identifier']
+            if identifier in seen:
+                continue
+            seen.add(identifier)
+
+            if identifier not in stored:
+                classified['new'].append(doc_meta)
+                continue
+
+            updated_at = stored[identifier]
+            lastmod = doc_meta.get('lastmod')
+            if lastmod and updated_at and str(lastmod)[:10] > updated_at.date().isoformat():
+                classified['changed'].append(doc_meta)
+            else:
+                classified['unchanged'].append(doc_meta)
+
+        return classified
 
     def document_exists(self, document_identifier: str) -> bool:
         """Check if document already exists in database"""
@@ -493,14 +610,54 @@ class BaseIngester(ABC):
         db_session.close()
         return exists
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests"""
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            time.sleep(sleep_time)
+    def _rate_limit(self, url: str = None):
+        """
+        Enforce rate limiting between requests
+
+        Requests to the same host are spaced by rate_limit_delay, also across
+        concurrent fetch threads. Calls without a url share one slot.
+        """
+        self._host_limiter.wait(url)
         self.last_request_time = time.time()
 
+    @property
+    def renderer(self) -> Renderer:
+        """Renderer used by _render"""
+        if self._renderer is None:
+            self._renderer = get_renderer()
+        return self._renderer
+
+    def _render(self, url: str, wait_for: str = None, timeout: float = 60, scroll: bool = False) -> Optional[str]:
+        """
+        Fetch HTML content through the renderer (headless browser by default)
+
+        Args:
+            url: URL to fetch
+            wait_for: CSS selector marking the content as loaded (best effort)
+            timeout: Navigation timeout in seconds
+            scroll: Scroll to the bottom to load lazy-loaded content
+
+        Returns:
+            HTML content as string or None if fetch failed
+        """
+        try:
+            self._rate_limit(url)
+
+            start_time = time.time()
+            logger.debug(f"Fetching with browser: {url}")
+
+            html_content = self.renderer.render(url, wait_for=wait_for, timeout=timeout, scroll=scroll)
+
+            fetch_time = (time.time() - start_time) * 1000
+            size_bytes = len(html_content.encode('utf-8'))
+
+            logger.info(f"✓ Fetched with browser: {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
+            return html_content
+
+        except Exception as e:
+            logger.error(f"✗ Browser fetch failed for {url}: {e}")
+            return None
+
     def _calculate_checksum(self, text: str) -> str:
         """Calculate SHA256 checksum of text"""
         import hashlib
@@ -521,12 +678,13 @@ class BaseIngester(ABC):
             db_session.commit()
             db_session.close()
 
-            self.stats['errors_count'] += 1
-            self.stats['errors'].append({
-                'document': doc_meta.get('document_identifier'),
-                'type': error_type,
-                'message': error_message
-            })
+            with self._stats_lock:
+                self.stats['errors_count'] += 1
+                self.stats['errors'].append({
+                    'document': doc_meta.get('document_identifier'),
+                    'type': error_type,
+                    'message': error_message
+                })
 
         except Exception as e:
             logger.error(f"Failed to log error: {e}")
@@ -545,9 +703,29 @@ class BaseIngester(ABC):
             logger.info(f"  Total size: {self.stats['total_size_bytes'] / 1024 / 1024:.1f} MB")
         logger.info("=" * 70)
 
+    def _count(self, key: str, amount: int = 1):
+        """Add to a stats counter (safe from fetch and parse threads)"""
+        with self._stats_lock:
+            self.stats[key] += amount
+
     def get_stats(self) -> Dict[str, Any]:
         """Get ingestion statistics"""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
+
+    def parse_stats(self) -> Dict[str, Dict[str, int]]:
+        """Stats of the parse-side components (PARSE_COMPONENTS), by attribute name"""
+        return {name: getattr(self, name).get_stats() for name in self.PARSE_COMPONENTS}
+
+    def reset_parse_stats(self):
+        """Reset the parse-side component stats (parse workers report per document)"""
+        for name in self.PARSE_COMPONENTS:
+            getattr(self, name).reset_stats()
+
+    def merge_parse_stats(self, stats: Dict[str, Dict[str, int]]):
+        """Add parse-side stats reported by a parse worker process"""
+        for name, counters in stats.items():
+            getattr(self, name).merge_stats(counters)
 
     def reset_stats(self):
         """Reset statistics"""
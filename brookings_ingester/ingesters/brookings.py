@@ -8,12 +8,10 @@ Fetches research content from Brookings Institution using:
 4. Playwright browser for Cloudflare bypass
 """
 import logging
-import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlparse
 import xml.etree.ElementTree as ET
-from playwright.sync_api import sync_playwright
 
 from .base import BaseIngester
 from .utils.html_parser import BrookingsHTMLParser
@@ -30,14 +28,15 @@ class BrookingsIngester(BaseIngester):
     and stores in database with full-text search support.
     """
 
-    def __init__(self, rate_limit_delay: float = None):
+    def __init__(self, rate_limit_delay: float = None, renderer=None):
         """
         Initialize Brookings ingester
 
         Args:
             rate_limit_delay: Delay between requests (default: 1.5s)
+            renderer: Renderer for browser fetches (default: shared browser)
         """
-        super().__init__(source_code='BROOKINGS', rate_limit_delay=rate_limit_delay)
+        super().__init__(source_code='BROOKINGS', rate_limit_delay=rate_limit_delay, renderer=renderer)
 
         # Brookings-specific components
         self.html_parser = BrookingsHTMLParser()
@@ -120,7 +119,7 @@ class BrookingsIngester(BaseIngester):
                     'after': f"{since_date}T00:00:00",  # ISO 8601 format
                     'orderby': 'date',
                     'order': 'desc',
-                    '_fields': 'id,title,link,date,excerpt,content,categories,tags'
+                    '_fields': 'id,title,link,date,modified,excerpt,content,categories,tags'
                 }
 
                 # Use posts endpoint (WordPress default)
@@ -143,6 +142,7 @@ class BrookingsIngester(BaseIngester):
                         'url': post['link'],
                         'title': self._clean_html_text(post['title'].get('rendered', '')),
                         'publication_date': post['date'][:10] if post.get('date') else None,
+                        'lastmod': post['modified'][:10] if post.get('modified') else None,
                         'summary': self._clean_html_text(post['excerpt'].get('rendered', ''))[:500],
                         'api_id': post['id']
                     }
@@ -244,7 +244,8 @@ class BrookingsIngester(BaseIngester):
                                 'document_identifier': self._extract_slug(url),
                                 'url': url,
                                 'title': None,  # Will be extracted from HTML
-                                'publication_date': lastmod.text[:10] if lastmod is not None else None
+                                'publication_date': lastmod.text[:10] if lastmod is not None else None,
+                                'lastmod': lastmod.text[:10] if lastmod is not None else None
                             }
                             documents.append(doc)
 
@@ -270,7 +271,8 @@ class BrookingsIngester(BaseIngester):
                             'document_identifier': self._extract_slug(url),
                             'url': url,
                             'title': None,  # Will be extracted from HTML
-                            'publication_date': lastmod.text[:10] if lastmod is not None else None
+                            'publication_date': lastmod.text[:10] if lastmod is not None else None,
+                            'lastmod': lastmod.text[:10] if lastmod is not None else None
                         }
                         documents.append(doc)
 
@@ -327,7 +329,7 @@ class BrookingsIngester(BaseIngester):
 
             if pdf_url:
                 try:
-                    self._rate_limit()
+                    self._rate_limit(pdf_url)
 
                     logger.debug(f"Downloading PDF: {pdf_url}")
                     pdf_response = self.session.get(pdf_url, timeout=config.REQUEST_TIMEOUT)
@@ -352,64 +354,18 @@ class BrookingsIngester(BaseIngester):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
-    def _fetch_with_browser(self, url: str, headless: bool = True) -> Optional[str]:
+    def _fetch_with_browser(self, url: str) -> Optional[str]:
         """
-        Fetch HTML content using Playwright browser (bypasses Cloudflare)
+        Fetch HTML content using the browser renderer (bypasses Cloudflare)
 
         Args:
             url: URL to fetch
-            headless: Run browser in headless mode
 
         Returns:
             HTML content as string or None if fetch failed
         """
-        try:
-            self._rate_limit()
-
-            start_time = time.time()
-            logger.debug(f"Fetching with browser: {url}")
-
-            with sync_playwright() as playwright:
-                # Launch browser
-                browser = playwright.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
-
-                # Navigate to page
-                page.goto(url, wait_until='networkidle', timeout=60000)
-
-                # Wait for main content to load (Brookings uses React/JS rendering)
-                try:
-                    # Wait for article content or main paragraph
-                    page.wait_for_selector('article, main p, .article-content, .post-content', timeout=15000)
-                except:
-                    logger.warning("Timeout waiting for content selectors, proceeding anyway")
-
-                # Additional wait for dynamic content and Cloudflare
-                time.sleep(3)
-
-                # Scroll to load lazy-loaded content
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(1)
-
-                # Get HTML content
-                html_content = page.content()
-
-                # Close browser
-                browser.close()
-
-            fetch_time = (time.time() - start_time) * 1000
-            size_bytes = len(html_content.encode('utf-8'))
-
-            logger.info(f"✓ Fetched with browser: {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
-            return html_content
-
-        except Exception as e:
-            logger.error(f"✗ Browser fetch failed for {url}: {e}")
-            return None
+        # Brookings uses React/JS rendering: wait for article content or main paragraph
+        return self._render(url, wait_for='article, main p, .article-content, .post-content', timeout=60, scroll=True)
 
     def parse(self, document_meta: Dict[str, Any], fetched_content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
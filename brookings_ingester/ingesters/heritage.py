@@ -7,12 +7,10 @@ Fetches research content from Heritage Foundation using:
 3. Playwright browser for JS-rendered content
 """
 import logging
-import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import xml.etree.ElementTree as ET
-from playwright.sync_api import sync_playwright
 
 from .base import BaseIngester
 from .utils.heritage_parser import HeritageHTMLParser
@@ -33,14 +31,15 @@ class HeritageIngester(BaseIngester):
     HERITAGE_BASE = "https://www.heritage.org"
     HERITAGE_SITEMAP = "https://www.heritage.org/sitemap.xml"
 
-    def __init__(self, rate_limit_delay: float = None):
+    def __init__(self, rate_limit_delay: float = None, renderer=None):
         """
         Initialize Heritage ingester
 
         Args:
             rate_limit_delay: Delay between requests (default: 1.5s)
+            renderer: Renderer for browser fetches (default: shared browser)
         """
-        super().__init__(source_code='HERITAGE', rate_limit_delay=rate_limit_delay)
+        super().__init__(source_code='HERITAGE', rate_limit_delay=rate_limit_delay, renderer=renderer)
 
         # Heritage-specific components
         self.html_parser = HeritageHTMLParser()
@@ -145,7 +144,8 @@ class HeritageIngester(BaseIngester):
                                 'document_identifier': self._extract_slug(url),
                                 'url': url,
                                 'title': None,  # Will be extracted from HTML
-                                'publication_date': lastmod.text[:10] if lastmod is not None else None
+                                'publication_date': lastmod.text[:10] if lastmod is not None else None,
+                                'lastmod': lastmod.text[:10] if lastmod is not None else None
                             }
                             documents.append(doc)
 
@@ -175,7 +175,8 @@ class HeritageIngester(BaseIngester):
                             'document_identifier': self._extract_slug(url),
                             'url': url,
                             'title': None,  # Will be extracted from HTML
-                            'publication_date': lastmod.text[:10] if lastmod is not None else None
+                            'publication_date': lastmod.text[:10] if lastmod is not None else None,
+                            'lastmod': lastmod.text[:10] if lastmod is not None else None
                         }
                         documents.append(doc)
 
@@ -265,64 +266,17 @@ class HeritageIngester(BaseIngester):
             logger.error(f"Error fetching {url}: {e}")
             return None
 
-    def _fetch_with_browser(self, url: str, headless: bool = True) -> Optional[str]:
+    def _fetch_with_browser(self, url: str) -> Optional[str]:
         """
-        Fetch HTML content using Playwright browser
+        Fetch HTML content using the browser renderer
 
         Args:
             url: URL to fetch
-            headless: Run browser in headless mode
 
         Returns:
             HTML content as string or None if fetch failed
         """
-        try:
-            self._rate_limit()
-
-            start_time = time.time()
-            logger.debug(f"Fetching with browser: {url}")
-
-            with sync_playwright() as playwright:
-                # Launch browser
-                browser = playwright.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
-
-                # Navigate to page
-                page.goto(url, wait_until='networkidle', timeout=60000)
-
-                # Wait for main content to load
-                try:
-                    # Wait for article content
-                    page.wait_for_selector('article, main p, .article-body, .node-title', timeout=15000)
-                except:
-                    logger.warning("Timeout waiting for content selectors, proceeding anyway")
-
-                # Additional wait for dynamic content
-                time.sleep(2)
-
-                # Scroll to load lazy-loaded content
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(1)
-
-                # Get HTML content
-                html_content = page.content()
-
-                # Close browser
-                browser.close()
-
-            fetch_time = (time.time() - start_time) * 1000
-            size_bytes = len(html_content.encode('utf-8'))
-
-            logger.info(f"✓ Fetched with browser: {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
-            return html_content
-
-        except Exception as e:
-            logger.error(f"✗ Browser fetch failed for {url}: {e}")
-            return None
+        return self._render(url, wait_for='article, main p, .article-body, .node-title', timeout=60, scroll=True)
 
     def parse(self, document_meta: Dict[str, Any], fetched_content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,193 @@
+"""
+Pipelined ingestion runner
+
+Overlaps the stages of BaseIngester.run_ingestion instead of running
+fetch -> parse -> store one document at a time:
+
+- fetch: bounded thread pool; requests to the same host stay spaced by the
+  ingester's rate_limit_delay (api.rate_limiter.HostRateLimiter), different hosts
+  run in parallel
+- parse: process pool (BeautifulSoup parsing is CPU bound), or threads when the
+  ingester cannot be sent to another process
+- store: the coordinating thread is the single writer and stores parsed
+  documents in batches while fetches and parses keep running
+
+Works with any BaseIngester subclass; errors are logged to the run's
+IngestionLog exactly as in the sequential runner. Parse worker processes
+send the stats of the ingester's parse-side components (e.g. the PDF
+extractor) back with each result, and they are merged into the ingester.
+"""
+import logging
+import multiprocessing
+import pickle
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Ingester copy used by parse worker processes (set by _init_parse_worker)
+_worker_ingester = None
+
+
+def _init_parse_worker(ingester) -> None:
+    """Process pool initializer: keep one unpickled ingester per worker"""
+    global _worker_ingester
+    _worker_ingester = ingester
+
+
+class ParseWorkerError(Exception):
+    """parse() failed in a worker process; carries the parse-side stats up to the failure"""
+
+    def __init__(self, message: str, stats: Dict[str, Dict[str, int]]):
+        super().__init__(message, stats)
+        self.message = message
+        self.stats = stats
+
+    def __str__(self):
+        return self.message
+
+
+def _parse_in_worker(document_meta: Dict[str, Any],
+                     fetched: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Dict[str, Dict[str, int]]]:
+    """Parse a fetched document in a worker process; returns (parsed, parse-side stats)"""
+    _worker_ingester.reset_parse_stats()
+    try:
+        return _worker_ingester.parse(document_meta, fetched), _worker_ingester.parse_stats()
+    except Exception as e:
+        # Keep the counters of a failed parse too
+        raise ParseWorkerError(str(e), _worker_ingester.parse_stats()) from e
+
+
+class IngestionPipeline:
+    """Runs discovered documents through fetch, parse and store concurrently"""
+
+    def __init__(self, ingester, log_id: int, fetch_workers: int, parse_processes: int = 0,
+                 batch_size: int = 25):
+        """
+        Initialize pipeline
+
+        Args:
+            ingester: BaseIngester subclass instance
+            log_id: IngestionLog id for error records
+            fetch_workers: Concurrent fetch threads
+            parse_processes: Parse worker processes (0 parses in threads)
+            batch_size: Parsed documents per store batch
+        """
+        self.ingester = ingester
+        self.log_id = log_id
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_processes = max(0, parse_processes)
+        self.batch_size = max(1, batch_size)
+
+        # Enough queued work to keep every stage busy while bounding memory
+        self.max_in_flight = self.fetch_workers * 2 + self.parse_processes
+
+    def _create_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for parsing, or None to parse in threads"""
+        if not self.parse_processes:
+            return None
+        try:
+            pickle.dumps(self.ingester)
+        except Exception as e:
+            logger.warning(f"{type(self.ingester).__name__} cannot be sent to parse processes ({e}); "
+                           f"parsing in threads")
+            return None
+
+        # spawn: fetch threads are already running, and fork would copy their locks
+        return ProcessPoolExecutor(
+            max_workers=self.parse_processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_parse_worker,
+            initargs=(self.ingester,)
+        )
+
+    def run(self, documents: Iterable[Dict[str, Any]], progress=None) -> None:
+        """
+        Process documents until all are stored or logged as errors
+
+        Args:
+            documents: Document metadata to ingest (already filtered by
+                BaseIngester.classify_documents when skipping existing)
+            progress: Optional tqdm-style progress bar (update(n))
+        """
+        ingester = self.ingester
+        remaining = iter(documents)
+        pending: Dict[Any, Tuple[str, Dict[str, Any]]] = {}
+        batch: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
+        def advance():
+            if progress is not None:
+                progress.update(1)
+
+        def fail(doc_meta, error_type, message):
+            ingester._log_error(self.log_id, doc_meta, error_type, message)
+            advance()
+
+        fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='ingest-fetch')
+        parse_pool = self._create_parse_pool()
+
+        def submit_parse(doc_meta, fetched):
+            if parse_pool is not None:
+                return parse_pool.submit(_parse_in_worker, doc_meta, fetched)
+            return fetch_pool.submit(ingester.parse, doc_meta, fetched)
+
+        def top_up():
+            while len(pending) < self.max_in_flight:
+                doc_meta = next(remaining, None)
+                if doc_meta is None:
+                    return
+                pending[fetch_pool.submit(ingester.fetch, doc_meta)] = ('fetch', doc_meta)
+
+        try:
+            top_up()
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, doc_meta = pending.pop(future)
+                    try:
+                        result = future.result()
+                        if stage == 'parse' and parse_pool is not None:
+                            result, parse_stats = result
+                            ingester.merge_parse_stats(parse_stats)
+                    except ParseWorkerError as e:
+                        ingester.merge_parse_stats(e.stats)
+                        logger.error(f"Error processing {doc_meta.get('document_identifier')}: {e}")
+                        fail(doc_meta, 'unexpected_error', str(e))
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error processing {doc_meta.get('document_identifier')}: {e}")
+                        fail(doc_meta, 'unexpected_error', str(e))
+                        continue
+
+                    if stage == 'fetch':
+                        if not result:
+                            fail(doc_meta, 'fetch_error', 'Failed to fetch content')
+                            continue
+                        pending[submit_parse(doc_meta, result)] = ('parse', doc_meta)
+                    elif not result:
+                        fail(doc_meta, 'parse_error', 'Failed to parse content')
+                    else:
+                        batch.append((doc_meta, result))
+
+                # Queue more fetches before writing so the network stays busy
+                top_up()
+                while len(batch) >= self.batch_size or (batch and not pending):
+                    self._write(batch[:self.batch_size], advance)
+                    batch = batch[self.batch_size:]
+        finally:
+            fetch_pool.shutdown(wait=True, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=True, cancel_futures=True)
+
+    def _write(self, batch: List[Tuple[Dict[str, Any], Dict[str, Any]]], advance) -> None:
+        """Store a batch of parsed documents and log the ones that failed"""
+        try:
+            document_ids = self.ingester.store_batch([parsed for _, parsed in batch])
+        except Exception as e:
+            logger.error(f"Error storing batch of {len(batch)} documents: {e}")
+            document_ids = [None] * len(batch)
+
+        for (doc_meta, _), document_id in zip(batch, document_ids):
+            if not document_id:
+                self.ingester._log_error(self.log_id, doc_meta, 'storage_error', 'Failed to store document')
+            advance()
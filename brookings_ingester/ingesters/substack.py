@@ -85,7 +85,7 @@ class SubstackIngester(BaseIngester):
             feed_url = self._build_feed_url(publication)
 
             try:
-                self._rate_limit()
+                self._rate_limit(feed_url)
 
                 # Parse RSS feed
                 logger.debug(f"Fetching RSS feed: {feed_url}")
@@ -262,7 +262,7 @@ class SubstackIngester(BaseIngester):
         url = document_meta['url']
 
         try:
-            self._rate_limit()
+            self._rate_limit(url)
 
             logger.debug(f"Fetching HTML: {url}")
             response = self.session.get(url, timeout=config.REQUEST_TIMEOUT)
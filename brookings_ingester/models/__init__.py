@@ -13,7 +13,8 @@ from .document import (
     DocumentSubject,
     Organization,
     IngestionLog,
-    IngestionError
+    IngestionError,
+    SyncState
 )
 
 __all__ = [
@@ -31,4 +32,5 @@ __all__ = [
     'Organization',
     'IngestionLog',
     'IngestionError',
+    'SyncState',
 ]
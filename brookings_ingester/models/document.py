@@ -7,12 +7,13 @@ Compatible with both SQLite and PostgreSQL.
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, Date, DateTime, Boolean,
-    ForeignKey, CheckConstraint, UniqueConstraint, Float
+    ForeignKey, CheckConstraint, UniqueConstraint, Float, Index, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.hybrid import hybrid_property
 import json
 
+from database.pagination import NULL_DATE
 from .database import Base
 
 
@@ -69,6 +70,8 @@ class Document(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('source_id', 'document_identifier', name='uq_source_document'),
+        # Browse order of the policy library (newest first, undated last) and its keyset cursor
+        Index('idx_documents_browse', text(f"COALESCE(publication_date, '{NULL_DATE}')"), 'document_id'),
     )
 
     @hybrid_property
@@ -330,3 +333,18 @@ class IngestionError(Base):
 
     def __repr__(self):
         return f"<IngestionError(id={self.error_id}, type='{self.error_type}')>"
+
+
+class SyncState(Base):
+    """High-water marks of incremental syncs into the policy library"""
+    __tablename__ = 'sync_state'
+
+    sync_name = Column(String(50), primary_key=True)  # 'crs_products'
+    watermark_at = Column(DateTime)  # Change time of the last synced row
+    watermark_key = Column(String(100))  # Its key (tie-breaker for equal times)
+    watermark_version = Column(Integer)  # Its content version when synced
+    rows_synced = Column(Integer, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SyncState(name='{self.sync_name}', at={self.watermark_at}, key='{self.watermark_key}')>"
@@ -32,11 +32,9 @@ Generated: {date}
 Based on: brookings_ingester/docs/sources/{source_name}_analysis.md
 """
 import logging
-import time
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from urllib.parse import urlparse
-from playwright.sync_api import sync_playwright
 
 from .base import BaseIngester
 from .utils.{source_name}_parser import {class_name}HTMLParser
@@ -180,59 +178,20 @@ class {class_name}Ingester(BaseIngester):
             logger.error(f"Error fetching {{url}}: {{e}}")
             return None
 
-    def _fetch_with_browser(self, url: str, headless: bool = True) -> Optional[str]:
+    def _fetch_with_browser(self, url: str) -> Optional[str]:
         """
-        Fetch HTML content using Playwright browser (sync pattern)
+        Fetch HTML content using the browser renderer
 
         Args:
             url: URL to fetch
-            headless: Run browser in headless mode
 
         Returns:
             HTML content as string or None if fetch failed
         """
-        try:
-            self._rate_limit()
-
-            start_time = time.time()
-            logger.debug(f"Fetching with browser: {{url}}")
-
-            with sync_playwright() as playwright:
-                # Launch browser
-                browser = playwright.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-                    viewport={{'width': 1920, 'height': 1080}}
-                )
-                page = context.new_page()
-
-                # Navigate to page
-                # TODO: Adjust wait_until based on your site needs
-                # Options: 'domcontentloaded', 'load', 'networkidle'
-                page.goto(url, wait_until='domcontentloaded', timeout=60000)
-
-                # TODO: Adjust wait strategy based on analysis
-                # If site uses JavaScript to render content:
-                # page.wait_for_selector('article, main p', timeout=15000)
-
-                # Additional wait if needed
-                time.sleep(2)
-
-                # Get HTML content
-                html_content = page.content()
-
-                # Close browser
-                browser.close()
-
-            fetch_time = (time.time() - start_time) * 1000
-            size_bytes = len(html_content.encode('utf-8'))
-
-            logger.info(f"✓ Fetched: {{url}} ({{size_bytes:,}} bytes, {{fetch_time:.0f}}ms)")
-            return html_content
-
-        except Exception as e:
-            logger.error(f"✗ Browser fetch failed for {{url}}: {{e}}")
-            return None
+        # TODO: Adjust wait strategy based on analysis
+        # If site uses JavaScript to render content, pass wait_for='article, main p'
+        # If content is lazy-loaded, pass scroll=True
+        return self._render(url, timeout=60)
 
     def parse(self, document_meta: Dict[str, Any], fetched_content: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Migrate File Store - Move existing document files into the object store
+
+Files saved before the content-addressed store are plain copies under
+data/{pdfs,text,html}/brookings. This script stores each of them once by
+checksum (compressed if FILE_COMPRESSION is set), replaces the document
+file with a hard link to the object and then removes unreferenced objects.
+Document paths recorded in the database keep working.
+
+Usage:
+    python brookings_ingester/scripts/migrate_file_store.py [--base-path data] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from brookings_ingester.storage.file_manager import FileManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Move existing document files into the object store')
+    parser.add_argument('--base-path', type=Path, help='Storage directory (default: config.STORAGE_PATH)')
+    parser.add_argument('--dry-run', action='store_true', help='Only count the files to migrate')
+    args = parser.parse_args()
+
+    file_manager = FileManager(base_path=args.base_path)
+    result = file_manager.migrate_existing(dry_run=args.dry_run)
+
+    if args.dry_run:
+        print(f"{result['files_migrated']} files would be migrated")
+        return 0
+
+    garbage = file_manager.collect_garbage()
+    print(f"✓ Migrated {result['files_migrated']} files "
+          f"({result['files_deduplicated']} duplicates, {result['bytes_deduplicated']:,} bytes saved)")
+    print(f"✓ Removed {garbage['objects_removed']} unreferenced objects ({garbage['bytes_freed']:,} bytes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,373 @@
+"""
+Batched document writes for the policy library
+
+Stores many parsed documents in one transaction instead of one session and
+a handful of queries per document and per author/subject:
+
+- documents: one lookup of the batch's existing rows, then one
+  INSERT ... ON CONFLICT (source_id, document_identifier) DO UPDATE
+  (the uq_source_document constraint) for new and changed documents
+- authors and subjects: one lookup query for every name in the batch plus
+  one bulk INSERT for the names not seen before (BaseIngester.store() uses
+  the same author resolution, so both paths write the same author fields)
+- author/subject links: one DELETE and one bulk INSERT per batch
+
+Works on PostgreSQL and SQLite (3.35+ for RETURNING).
+"""
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import func, inspect, text
+
+from brookings_ingester.models.document import (
+    Author, Document, DocumentAuthor, DocumentSubject, Subject
+)
+
+logger = logging.getLogger(__name__)
+
+# Names or identifiers per IN (...) lookup
+LOOKUP_CHUNK_SIZE = 500
+
+# Parsed author fields and the authors columns storing them. The columns are
+# added by migrations/add_author_metadata.py and are not mapped on Author,
+# so they are written only where the migration has run.
+AUTHOR_METADATA = (
+    ('title', 'job_title'),
+    ('affiliation', 'affiliation_text'),
+    ('profile_url', 'profile_url'),
+    ('linkedin_url', 'linkedin_url'),
+)
+
+# pg_advisory_xact_lock key serializing author creation (authors.full_name is not unique)
+AUTHORS_LOCK_KEY = 0x617574686f7273
+
+# Document columns written from parsed data (updated on conflict)
+DOCUMENT_COLUMNS = (
+    'title', 'document_type', 'publication_date', 'summary', 'full_text', 'url', 'pdf_url',
+    'page_count', 'word_count', 'checksum', 'metadata_json', 'updated_at'
+)
+
+
+def _insert(session, model):
+    """
+    Dialect-specific INSERT supporting ON CONFLICT
+
+    Built on the table rather than the mapped class: the executemany then runs
+    as a plain Core statement instead of an ORM bulk insert.
+    """
+    if session.get_bind().dialect.name == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(model.__table__)
+
+
+def _chunks(values: List[Any]) -> Iterable[List[Any]]:
+    for start in range(0, len(values), LOOKUP_CHUNK_SIZE):
+        yield values[start:start + LOOKUP_CHUNK_SIZE]
+
+
+def split_author_name(full_name: str) -> Tuple[str, str]:
+    """Split 'First Middle Last' into ('First Middle', 'Last')"""
+    parts = full_name.strip().rsplit(' ', 1)
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return full_name, ''
+
+
+# Metadata columns present per database URL
+_author_columns: Dict[str, Tuple[str, ...]] = {}
+
+
+def author_metadata_columns(session) -> Tuple[str, ...]:
+    """AUTHOR_METADATA columns that exist in the session's authors table"""
+    url = str(session.get_bind().url)
+    if url not in _author_columns:
+        existing = {column['name'] for column in inspect(session.connection()).get_columns('authors')}
+        _author_columns[url] = tuple(column for _, column in AUTHOR_METADATA if column in existing)
+    return _author_columns[url]
+
+
+def _lookup_authors(session, names: List[str]) -> Dict[str, int]:
+    """{full_name: oldest author_id} for stored authors"""
+    author_ids = {}
+    for chunk in _chunks(names):
+        rows = session.query(Author.full_name, func.min(Author.author_id)).filter(
+            Author.full_name.in_(chunk)
+        ).group_by(Author.full_name).all()
+        author_ids.update(rows)
+    return author_ids
+
+
+def resolve_authors(session, authors: Iterable[Union[str, Dict[str, Any]]]) -> Dict[str, int]:
+    """
+    Map author names to author ids, creating missing authors
+
+    Authors are created under a transaction-scoped advisory lock on
+    PostgreSQL, so concurrent writers never create the same name twice.
+    (SQLite has a single writer.) Metadata from author dicts (title,
+    affiliation, profile_url, linkedin_url) fills columns that are still
+    empty, on new and existing authors alike.
+
+    Args:
+        session: SQLAlchemy session (changes are left uncommitted)
+        authors: Full author names, or author dicts with 'name' and optional
+            metadata (duplicates allowed)
+
+    Returns:
+        {full_name: author_id}; the oldest author wins when names repeat
+    """
+    metadata: Dict[str, Dict[str, Any]] = {}
+    for author in authors:
+        name = author_name(author)
+        if not name:
+            continue
+        values = metadata.setdefault(name, {})
+        if isinstance(author, dict):
+            for field, column in AUTHOR_METADATA:
+                if author.get(field) and not values.get(column):
+                    values[column] = author[field]
+
+    wanted = list(metadata)
+    author_ids = _lookup_authors(session, wanted)
+
+    missing = [name for name in wanted if name not in author_ids]
+    if missing:
+        if session.get_bind().dialect.name == 'postgresql':
+            session.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': AUTHORS_LOCK_KEY})
+            # Created by another writer while we waited
+            author_ids.update(_lookup_authors(session, missing))
+            missing = [name for name in missing if name not in author_ids]
+
+    if missing:
+        rows = []
+        for name in missing:
+            first_name, last_name = split_author_name(name)
+            rows.append({'full_name': name, 'first_name': first_name, 'last_name': last_name})
+        created = session.execute(
+            _insert(session, Author).returning(Author.full_name, Author.author_id), rows
+        ).all()
+        author_ids.update((name, author_id) for name, author_id in created)
+        logger.debug(f"Created {len(created)} authors")
+
+    _fill_author_metadata(session, {author_ids[name]: values for name, values in metadata.items() if values})
+    return author_ids
+
+
+def _fill_author_metadata(session, metadata: Dict[int, Dict[str, Any]]) -> None:
+    """Set empty metadata columns of authors ({author_id: {column: value}})"""
+    columns = author_metadata_columns(session)
+    if not metadata or not columns:
+        return
+    assignments = ', '.join(f"{column} = COALESCE(NULLIF({column}, ''), :{column})" for column in columns)
+    session.execute(
+        text(f'UPDATE authors SET {assignments} WHERE author_id = :author_id'),
+        [dict({column: values.get(column) for column in columns}, author_id=author_id)
+         for author_id, values in metadata.items()]
+    )
+
+
+def resolve_subjects(session, names: Iterable[str], source_vocabulary: Optional[str] = None) -> Dict[str, int]:
+    """
+    Map subject names to subject ids, creating missing subjects
+
+    Args:
+        session: SQLAlchemy session (changes are left uncommitted)
+        names: Subject names (stripped, duplicates allowed)
+        source_vocabulary: Vocabulary recorded on new subjects ('CRS', ...)
+
+    Returns:
+        {name: subject_id}
+    """
+    wanted = list(dict.fromkeys(name for name in names if name))
+    subject_ids: Dict[str, int] = {}
+
+    for chunk in _chunks(wanted):
+        rows = session.query(Subject.name, Subject.subject_id).filter(Subject.name.in_(chunk)).all()
+        subject_ids.update(rows)
+
+    missing = [name for name in wanted if name not in subject_ids]
+    if missing:
+        statement = _insert(session, Subject).on_conflict_do_nothing(index_elements=['name'])
+        created = session.execute(
+            statement.returning(Subject.name, Subject.subject_id),
+            [{'name': name, 'source_vocabulary': source_vocabulary} for name in missing]
+        ).all()
+        subject_ids.update((name, subject_id) for name, subject_id in created)
+
+        # Created concurrently by another writer (skipped by ON CONFLICT)
+        raced = [name for name in missing if name not in subject_ids]
+        if raced:
+            rows = session.query(Subject.name, Subject.subject_id).filter(Subject.name.in_(raced)).all()
+            subject_ids.update(rows)
+        logger.debug(f"Created {len(created)} subjects")
+
+    return subject_ids
+
+
+def author_name(author_data: Any) -> Optional[str]:
+    """Author name from the dict or legacy string format"""
+    if isinstance(author_data, dict):
+        return (author_data.get('name') or '').strip() or None
+    if isinstance(author_data, str):
+        return author_data.strip() or None
+    return None
+
+
+class DocumentBatchWriter:
+    """
+    Writes batches of parsed documents for one source
+
+    Usage:
+        with session_scope() as session:
+            results = DocumentBatchWriter(session, source_id).write(parsed_list)
+    """
+
+    def __init__(self, session, source_id: int, source_vocabulary: Optional[str] = None):
+        """
+        Initialize writer
+
+        Args:
+            session: SQLAlchemy session; the caller commits
+            source_id: Source the documents belong to
+            source_vocabulary: Vocabulary recorded on new subjects
+        """
+        self.session = session
+        self.source_id = source_id
+        self.source_vocabulary = source_vocabulary
+
+    def existing_checksums(self, identifiers: List[str]) -> Dict[str, Tuple[int, Optional[str]]]:
+        """{document_identifier: (document_id, checksum)} for stored documents"""
+        existing = {}
+        for chunk in _chunks(identifiers):
+            rows = self.session.query(
+                Document.document_identifier, Document.document_id, Document.checksum
+            ).filter(
+                Document.source_id == self.source_id,
+                Document.document_identifier.in_(chunk)
+            ).all()
+            existing.update((identifier, (document_id, checksum)) for identifier, document_id, checksum in rows)
+        return existing
+
+    def write(self, documents: List[Dict[str, Any]]) -> List[Tuple[int, str]]:
+        """
+        Insert or update documents with their author and subject links
+
+        Args:
+            documents: Parsed documents with 'document_identifier', 'checksum'
+                and the DOCUMENT_COLUMNS values, plus optional 'authors' and
+                'subjects' lists
+
+        Returns:
+            (document_id, action) per document, in order; action is
+            'created', 'updated' or 'unchanged'
+        """
+        # Later duplicates of an identifier win, as they would when stored one by one
+        latest = {doc['document_identifier']: doc for doc in documents}
+        existing = self.existing_checksums(list(latest))
+        now = datetime.utcnow()
+
+        changed = [doc for identifier, doc in latest.items()
+                   if identifier not in existing or existing[identifier][1] != doc.get('checksum')]
+        changed_identifiers = {doc['document_identifier'] for doc in changed}
+        unchanged_ids = [existing[identifier][0] for identifier in latest if identifier not in changed_identifiers]
+
+        document_ids = {identifier: existing[identifier][0] for identifier in latest if identifier in existing}
+
+        if changed:
+            rows = []
+            for doc in changed:
+                row = {column: doc.get(column) for column in DOCUMENT_COLUMNS}
+                row.update(source_id=self.source_id, document_identifier=doc['document_identifier'],
+                           created_at=now, updated_at=now)
+                rows.append(row)
+
+            statement = _insert(self.session, Document)
+            statement = statement.on_conflict_do_update(
+                index_elements=['source_id', 'document_identifier'],
+                set_={column: statement.excluded[column] for column in DOCUMENT_COLUMNS}
+            ).returning(Document.document_identifier, Document.document_id)
+            document_ids.update(self.session.execute(statement, rows).all())
+
+            self._replace_links(changed, document_ids)
+
+        if unchanged_ids:
+            # Record the check (see BaseIngester.classify_documents)
+            for chunk in _chunks(unchanged_ids):
+                self.session.query(Document).filter(Document.document_id.in_(chunk)).update(
+                    {Document.updated_at: now}, synchronize_session=False
+                )
+
+        results = []
+        for doc in documents:
+            identifier = doc['document_identifier']
+            if identifier not in changed_identifiers:
+                action = 'unchanged'
+            elif identifier in existing:
+                action = 'updated'
+            else:
+                action = 'created'
+            results.append((document_ids[identifier], action))
+        return results
+
+    def _replace_links(self, documents: List[Dict[str, Any]], document_ids: Dict[str, int]) -> None:
+        """Replace author and subject links of written documents"""
+        ids = [document_ids[doc['document_identifier']] for doc in documents]
+        for chunk in _chunks(ids):
+            self.session.query(DocumentAuthor).filter(DocumentAuthor.document_id.in_(chunk)).delete(
+                synchronize_session=False)
+            self.session.query(DocumentSubject).filter(DocumentSubject.document_id.in_(chunk)).delete(
+                synchronize_session=False)
+
+        author_names = {id(doc): [author_name(a) for a in doc.get('authors') or []] for doc in documents}
+        subject_names = {id(doc): [(s or '').strip() for s in doc.get('subjects') or []] for doc in documents}
+
+        author_ids = resolve_authors(self.session, (a for doc in documents for a in doc.get('authors') or []))
+        subject_ids = resolve_subjects(self.session, (n for names in subject_names.values() for n in names),
+                                       self.source_vocabulary)
+
+        author_links, subject_links = [], []
+        for doc in documents:
+            document_id = document_ids[doc['document_identifier']]
+
+            linked = set()
+            for name in author_names[id(doc)]:
+                author_id = author_ids.get(name)
+                if author_id and author_id not in linked:
+                    linked.add(author_id)
+                    author_links.append({'document_id': document_id, 'author_id': author_id,
+                                         'author_order': len(linked)})
+
+            linked = set()
+            for name in subject_names[id(doc)]:
+                subject_id = subject_ids.get(name)
+                if subject_id and subject_id not in linked:
+                    linked.add(subject_id)
+                    subject_links.append({'document_id': document_id, 'subject_id': subject_id})
+
+        if author_links:
+            self.session.execute(_insert(self.session, DocumentAuthor), author_links)
+        if subject_links:
+            self.session.execute(_insert(self.session, DocumentSubject), subject_links)
+
+
+def document_row(parsed_data: Dict[str, Any], checksum: str, publication_date) -> Dict[str, Any]:
+    """Writer input for a document parsed by a BaseIngester"""
+    return {
+        'document_identifier': parsed_data['document_identifier'],
+        'title': parsed_data.get('title'),
+        'document_type': parsed_data.get('document_type'),
+        'publication_date': publication_date,
+        'summary': parsed_data.get('summary'),
+        'full_text': parsed_data.get('full_text'),
+        'url': parsed_data.get('url'),
+        'pdf_url': parsed_data.get('pdf_url'),
+        'page_count': parsed_data.get('page_count'),
+        'word_count': parsed_data.get('word_count'),
+        'checksum': checksum,
+        'metadata_json': json.dumps(parsed_data.get('metadata') or {}, default=str),
+        'authors': parsed_data.get('authors', []),
+        'subjects': parsed_data.get('subjects', []),
+    }
@@ -1,31 +1,145 @@
 """
 PDF text extraction utilities
+
+Large PDFs are split into page ranges extracted by a process pool (PyPDF2
+text extraction is CPU bound) and their text is collected page by page in
+order. Only a bounded number of ranges is in flight, and the text kept in
+memory per document is capped. iter_pages() and extract_to_text_file()
+stream the pages instead (the latter straight into FileManager.save_text),
+so the full text of a document is never held in memory.
+
+Scanned PDFs (no page references a font, so there is no text to find) skip
+the text pass. Results are cached on disk by file checksum; the cache is
+kept under a size cap by evicting the least recently used entries.
 """
 import PyPDF2
+import gzip
+import json
 import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Union
 import hashlib
 
+from brookings_ingester.config import config
+
 logger = logging.getLogger(__name__)
 
+# Pages per worker task
+PAGES_PER_TASK = 8
+
+# PDFs with fewer pages are extracted in-process
+PARALLEL_MIN_PAGES = 24
+
+# Cache writes between cache size checks
+CACHE_PRUNE_INTERVAL = 100
+
+# Documents with less text than this (in characters) are reported as scanned
+SCANNED_TEXT_THRESHOLD = 100
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """Extract text of pages [start, end) in a worker process"""
+    reader = PyPDF2.PdfReader(pdf_path)
+    return [_page_text(reader, page_num, pdf_path) for page_num in range(start, end)]
+
+
+def _page_has_text(page) -> bool:
+    """False only if the page cannot contain text (no fonts, no form XObjects)"""
+    try:
+        resources = page.get('/Resources')
+        if resources is None:
+            return True
+        resources = resources.get_object()
+        if '/Font' in resources:
+            return True
+        xobjects = resources.get('/XObject')
+        xobjects = xobjects.get_object() if xobjects is not None else {}
+        # Forms carry their own resources; images cannot hold text
+        return any(xobject.get_object().get('/Subtype') == '/Form' for xobject in xobjects.values())
+    except Exception:
+        return True
+
+
+def _page_text(reader: PyPDF2.PdfReader, page_num: int, name: str = '') -> str:
+    """Text of one page ('' if it has none or cannot be read)"""
+    try:
+        return reader.pages[page_num].extract_text() or ''
+    except Exception as e:
+        logger.warning(f"Error extracting page {page_num + 1} from {name}: {e}")
+        return ''
+
 
 class PDFExtractor:
     """
     Extract text and metadata from PDF files
 
     Uses PyPDF2 for extraction. For scanned PDFs (images), OCR would be needed
-    but is not implemented here (future enhancement with pytesseract/ocrmypdf).
+    but is not implemented here (future enhancement with pytesseract/ocrmypdf);
+    they are reported with 'scanned': True and little or no text.
+
+    Use as a context manager (or call close()) to shut down the worker processes.
     """
 
-    def __init__(self):
-        """Initialize PDF extractor"""
+    def __init__(self, processes: int = None, cache_path: Union[str, Path, None] = None,
+                 max_text_chars: int = None, parallel_min_pages: int = PARALLEL_MIN_PAGES,
+                 pages_per_task: int = PAGES_PER_TASK, cache_max_bytes: int = None):
+        """
+        Initialize PDF extractor
+
+        Args:
+            processes: Worker processes for large PDFs (default config.PDF_EXTRACT_PROCESSES; 0 = in-process)
+            cache_path: Directory caching results by checksum (default config.PDF_TEXT_CACHE_PATH)
+            max_text_chars: Text kept per document by extract_* (default config.PDF_MAX_TEXT_CHARS)
+            parallel_min_pages: Page count from which the process pool is used
+            pages_per_task: Pages extracted per worker task
+            cache_max_bytes: Cache size cap (default config.PDF_TEXT_CACHE_MAX_MB)
+        """
+        self.processes = config.PDF_EXTRACT_PROCESSES if processes is None else max(0, processes)
+        cache_path = config.PDF_TEXT_CACHE_PATH if cache_path is None else cache_path
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_text_chars = max_text_chars or config.PDF_MAX_TEXT_CHARS
+        self.parallel_min_pages = parallel_min_pages
+        self.pages_per_task = max(1, pages_per_task)
+        self.cache_max_bytes = (config.PDF_TEXT_CACHE_MAX_MB * 1024 * 1024
+                                if cache_max_bytes is None else cache_max_bytes)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._cache_writes = 0
+
+        # Parse threads of the ingestion pipeline share one extractor
+        self._stats_lock = threading.Lock()
         self.stats = {
             'files_processed': 0,
             'total_pages': 0,
-            'extraction_errors': 0
+            'extraction_errors': 0,
+            'cache_hits': 0,
+            'scanned_skipped': 0
         }
 
+    def __getstate__(self):
+        """Picklable state for parse worker processes (no pool or lock)"""
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        # Parse workers already run in parallel, and nothing would shut a pool of theirs down
+        state['processes'] = 0
+        state.pop('_stats_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def extract_from_file(self, pdf_path: Path) -> Optional[Dict[str, Any]]:
         """
         Extract text and metadata from PDF file
@@ -36,12 +150,14 @@ class PDFExtractor:
         Returns:
             Dictionary with extracted content:
             {
-                'text': str,           # Extracted text
+                'text': str,           # Extracted text ('' for scanned PDFs)
                 'page_count': int,
                 'word_count': int,
                 'metadata': dict,      # PDF metadata (title, author, etc.)
                 'checksum': str,       # SHA256 of file
-                'file_size': int       # Bytes
+                'file_size': int,      # Bytes
+                'scanned': bool,       # Little or no text in the whole document
+                'truncated': bool      # Text cut at max_text_chars
             }
             Returns None if extraction fails
         """
@@ -54,64 +170,28 @@ class PDFExtractor:
             checksum = self._calculate_checksum(pdf_path)
             file_size = pdf_path.stat().st_size
 
-            # Open PDF
-            with open(pdf_path, 'rb') as f:
-                reader = PyPDF2.PdfReader(f)
-
-                # Get page count
-                page_count = len(reader.pages)
-
-                # Extract text from all pages
-                text_parts = []
-                for page_num in range(page_count):
-                    try:
-                        page = reader.pages[page_num]
-                        text = page.extract_text()
-                        if text:
-                            text_parts.append(text)
-                    except Exception as e:
-                        logger.warning(f"Error extracting page {page_num + 1} from {pdf_path.name}: {e}")
-
-                # Combine text
-                full_text = '\n\n'.join(text_parts)
-                word_count = len(full_text.split())
-
-                # Extract metadata
-                metadata = {}
-                if reader.metadata:
-                    for key, value in reader.metadata.items():
-                        # Remove leading '/' from metadata keys
-                        clean_key = key.lstrip('/')
-                        metadata[clean_key] = str(value)
-
-                self.stats['files_processed'] += 1
-                self.stats['total_pages'] += page_count
-
-                logger.info(f"✓ Extracted {page_count} pages, {word_count:,} words from {pdf_path.name}")
-
-                return {
-                    'text': full_text,
-                    'page_count': page_count,
-                    'word_count': word_count,
-                    'metadata': metadata,
-                    'checksum': checksum,
-                    'file_size': file_size
-                }
+            result = self._extract(pdf_path, checksum, file_size, pdf_path.name)
+            logger.info(f"✓ Extracted {result['page_count']} pages, {result['word_count']:,} words "
+                        f"from {pdf_path.name}")
+            return result
 
         except PyPDF2.errors.PdfReadError as e:
             logger.error(f"PDF read error for {pdf_path.name}: {e}")
-            self.stats['extraction_errors'] += 1
+            self._count('extraction_errors')
             return None
 
         except Exception as e:
             logger.error(f"Unexpected error extracting PDF {pdf_path.name}: {e}")
-            self.stats['extraction_errors'] += 1
+            self._count('extraction_errors')
             return None
 
     def extract_from_bytes(self, pdf_bytes: bytes) -> Optional[Dict[str, Any]]:
         """
         Extract text from PDF bytes (in-memory)
 
+        Large PDFs are spilled to a temporary file so worker processes can
+        read their page ranges.
+
         Args:
             pdf_bytes: PDF file as bytes
 
@@ -119,57 +199,298 @@ class PDFExtractor:
             Same format as extract_from_file()
         """
         try:
-            from io import BytesIO
-
             # Calculate checksum
             checksum = hashlib.sha256(pdf_bytes).hexdigest()
-            file_size = len(pdf_bytes)
+            return self._extract(pdf_bytes, checksum, len(pdf_bytes), 'PDF bytes')
 
-            # Open PDF from bytes
-            pdf_file = BytesIO(pdf_bytes)
-            reader = PyPDF2.PdfReader(pdf_file)
+        except Exception as e:
+            logger.error(f"Error extracting PDF from bytes: {e}")
+            self._count('extraction_errors')
+            return None
 
-            # Get page count
-            page_count = len(reader.pages)
+    def extract_to_text_file(self, pdf_path: Path, file_manager, document_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Stream a PDF's text straight to the text store, without holding it in memory
 
-            # Extract text
-            text_parts = []
-            for page_num in range(page_count):
-                try:
-                    page = reader.pages[page_num]
-                    text = page.extract_text()
-                    if text:
-                        text_parts.append(text)
-                except Exception as e:
-                    logger.warning(f"Error extracting page {page_num + 1}: {e}")
-
-            full_text = '\n\n'.join(text_parts)
-            word_count = len(full_text.split())
-
-            # Extract metadata
-            metadata = {}
-            if reader.metadata:
-                for key, value in reader.metadata.items():
-                    clean_key = key.lstrip('/')
-                    metadata[clean_key] = str(value)
-
-            self.stats['files_processed'] += 1
-            self.stats['total_pages'] += page_count
+        The text is not cut at max_text_chars.
+
+        Args:
+            pdf_path: Path to PDF file
+            file_manager: FileManager whose save_text receives the pages
+            document_id: Document identifier for the text file
+
+        Returns:
+            extract_from_file() format without 'text' and 'truncated', plus 'text_file'
+            (save_text result, None for PDFs without fonts), or None if extraction fails
+        """
+        try:
+            reader = PyPDF2.PdfReader(str(pdf_path))
+            page_count = len(reader.pages)
+            counts = {'chars': 0, 'words': 0}
+
+            def pages():
+                first = True
+                for text in self._pages(pdf_path, reader, page_count, pdf_path.name):
+                    if not text:
+                        continue
+                    counts['chars'] += len(text.strip())
+                    counts['words'] += len(text.split())
+                    yield text if first else '\n\n' + text
+                    first = False
+
+            if any(_page_has_text(page) for page in reader.pages):
+                text_file = file_manager.save_text(document_id, pages())
+            else:
+                self._count('scanned_skipped')
+                logger.info(f"{pdf_path.name} looks scanned (no fonts on any page), skipping text extraction")
+                text_file = None
+
+            self._count('files_processed')
+            self._count('total_pages', page_count)
 
             return {
-                'text': full_text,
+                'text_file': text_file,
                 'page_count': page_count,
-                'word_count': word_count,
-                'metadata': metadata,
-                'checksum': checksum,
-                'file_size': file_size
+                'word_count': counts['words'],
+                'metadata': self._metadata(reader),
+                'checksum': self._calculate_checksum(pdf_path),
+                'file_size': pdf_path.stat().st_size,
+                'scanned': counts['chars'] < SCANNED_TEXT_THRESHOLD
             }
 
         except Exception as e:
-            logger.error(f"Error extracting PDF from bytes: {e}")
-            self.stats['extraction_errors'] += 1
+            logger.error(f"Error extracting PDF {pdf_path.name} to text file: {e}")
+            self._count('extraction_errors')
             return None
 
+    def iter_pages(self, pdf_path: Path) -> Iterator[str]:
+        """
+        Yield the text of each page in order ('' for pages without text)
+
+        Large PDFs are extracted by the process pool in page ranges, with at
+        most two ranges per worker in flight. Closing the generator early
+        cancels the outstanding ranges.
+
+        Args:
+            pdf_path: Path to PDF file
+        """
+        reader = PyPDF2.PdfReader(str(pdf_path))
+        yield from self._pages(Path(pdf_path), reader, len(reader.pages), Path(pdf_path).name)
+
+    def _iter_pool_pages(self, pdf_path: Path, page_count: int) -> Iterator[str]:
+        """
+        Yield the text of each page in order, extracted by the process pool in page ranges
+
+        At most two ranges per worker are in flight.
+        """
+        pool = self._get_pool()
+        ranges = iter(range(0, page_count, self.pages_per_task))
+        pending = []
+        try:
+            while True:
+                while len(pending) < self.processes * 2:
+                    range_start = next(ranges, None)
+                    if range_start is None:
+                        break
+                    range_end = min(range_start + self.pages_per_task, page_count)
+                    pending.append(pool.submit(_extract_page_range, str(pdf_path), range_start, range_end))
+                if not pending:
+                    return
+                yield from pending.pop(0).result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _extract(self, source: Union[Path, bytes], checksum: str, file_size: int, name: str) -> Dict[str, Any]:
+        """Extract (or load from cache) the text of a PDF given as path or bytes"""
+        cached = self._cache_get(checksum)
+        if cached:
+            self._count('cache_hits')
+            return dict(cached, checksum=checksum, file_size=file_size)
+
+        reader = PyPDF2.PdfReader(BytesIO(source) if isinstance(source, bytes) else str(source))
+        page_count = len(reader.pages)
+
+        # Scanned PDFs have no fonts on any page: skip the text pass
+        if not any(_page_has_text(page) for page in reader.pages):
+            self._count('scanned_skipped')
+            logger.info(f"{name} looks scanned (no fonts on any page), skipping text extraction")
+            text_parts, truncated = [], False
+        else:
+            text_parts, truncated = self._collect(self._pages(source, reader, page_count, name))
+        scanned = not truncated and self._looks_scanned(text_parts)
+
+        full_text = '\n\n'.join(text_parts)
+        if truncated:
+            logger.warning(f"Text of {name} truncated at {self.max_text_chars:,} characters")
+
+        self._count('files_processed')
+        self._count('total_pages', page_count)
+
+        result = {
+            'text': full_text,
+            'page_count': page_count,
+            'word_count': len(full_text.split()),
+            'metadata': self._metadata(reader),
+            'scanned': scanned,
+            'truncated': truncated
+        }
+        self._cache_put(checksum, result)
+        return dict(result, checksum=checksum, file_size=file_size)
+
+    def _pages(self, source: Union[Path, bytes], reader: PyPDF2.PdfReader, page_count: int,
+               name: str) -> Iterator[str]:
+        """Page texts in order, through the pool when the PDF is large"""
+        if not self.processes or page_count < self.parallel_min_pages:
+            for page_num in range(page_count):
+                yield _page_text(reader, page_num, name)
+            return
+
+        if not isinstance(source, bytes):
+            yield from self._iter_pool_pages(source, page_count)
+            return
+
+        # Workers read page ranges from disk
+        spill = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        try:
+            with spill:
+                spill.write(source)
+            yield from self._iter_pool_pages(Path(spill.name), page_count)
+        finally:
+            os.unlink(spill.name)
+
+    def _collect(self, pages: Iterator[str]):
+        """Page texts whose joined text fits max_text_chars; returns (text_parts, truncated)"""
+        text_parts = []
+        size = 0
+        for text in pages:
+            if not text:
+                continue
+            separator = 2 if text_parts else 0
+            if size + separator + len(text) > self.max_text_chars:
+                room = self.max_text_chars - size - separator
+                if room > 0:
+                    text_parts.append(text[:room])
+                # Closing the generator stops outstanding page ranges
+                pages.close()
+                return text_parts, True
+            text_parts.append(text)
+            size += separator + len(text)
+        return text_parts, False
+
+    @staticmethod
+    def _looks_scanned(texts: List[str], text_threshold: int = SCANNED_TEXT_THRESHOLD) -> bool:
+        """True if the page texts have fewer than text_threshold characters of text"""
+        return sum(len(text.strip()) for text in texts) < text_threshold
+
+    @staticmethod
+    def _metadata(reader: PyPDF2.PdfReader) -> Dict[str, str]:
+        """PDF metadata with leading '/' removed from keys"""
+        metadata = {}
+        if reader.metadata:
+            for key, value in reader.metadata.items():
+                metadata[key.lstrip('/')] = str(value)
+        return metadata
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: the ingestion pipeline's threads are already running
+            self._pool = ProcessPoolExecutor(max_workers=self.processes,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def _cache_file(self, checksum: str) -> Path:
+        return self.cache_path / checksum[:2] / f"{checksum}.json.gz"
+
+    def _cache_get(self, checksum: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached result for a checksum, if any
+
+        A truncated result is only reused with the text limit it was cut at,
+        and a complete one only while it fits the current limit.
+        """
+        if not self.cache_path:
+            return None
+        path = self._cache_file(checksum)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable PDF text cache entry {checksum}: {e}")
+            return None
+
+        max_text_chars = cached.pop('max_text_chars', None)
+        if cached.get('truncated'):
+            if max_text_chars != self.max_text_chars:
+                return None
+        elif len(cached.get('text', '')) > self.max_text_chars:
+            return None
+
+        try:
+            os.utime(path)  # Recently used entries are evicted last
+        except OSError:
+            pass
+        return cached
+
+    def _cache_put(self, checksum: str, result: Dict[str, Any]):
+        """Cache a result by checksum (written atomically)"""
+        if not self.cache_path:
+            return
+        path = self._cache_file(checksum)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(dict(result, max_text_chars=self.max_text_chars), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to cache PDF text {checksum}: {e}")
+            return
+
+        self._cache_writes += 1
+        if self._cache_writes % CACHE_PRUNE_INTERVAL == 1:
+            self.prune_cache()
+
+    def prune_cache(self, max_bytes: int = None) -> int:
+        """
+        Evict least recently used cache entries until the cache fits max_bytes
+
+        Args:
+            max_bytes: Size cap (default cache_max_bytes)
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_path or not self.cache_path.exists():
+            return 0
+        max_bytes = self.cache_max_bytes if max_bytes is None else max_bytes
+
+        entries = []
+        for path in self.cache_path.glob('*/*.json.gz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, str(path)))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            total -= size
+
+        if removed:
+            logger.info(f"Evicted {removed} PDF text cache entries")
+        return removed
+
     def _calculate_checksum(self, file_path: Path) -> str:
         """
         Calculate SHA256 checksum of file
@@ -187,10 +508,13 @@ class PDFExtractor:
                 sha256.update(chunk)
         return sha256.hexdigest()
 
-    def is_scanned_pdf(self, pdf_path: Path, text_threshold: int = 100) -> bool:
+    def is_scanned_pdf(self, pdf_path: Path, text_threshold: int = SCANNED_TEXT_THRESHOLD) -> bool:
         """
         Heuristic check if PDF is scanned (image-based)
 
+        Checks the whole document: a PDF whose pages reference no fonts is
+        scanned without extracting any text.
+
         Args:
             pdf_path: Path to PDF
             text_threshold: Minimum characters to consider text-based
@@ -198,22 +522,44 @@ class PDFExtractor:
         Returns:
             True if likely scanned (needs OCR)
         """
-        result = self.extract_from_file(pdf_path)
-        if not result:
+        try:
+            reader = PyPDF2.PdfReader(str(pdf_path))
+            if not any(_page_has_text(page) for page in reader.pages):
+                return True
+            texts = [_page_text(reader, page_num, pdf_path.name) for page_num in range(len(reader.pages))]
+        except Exception:
             return True  # Assume scanned if can't extract
 
         # If very little text extracted, likely scanned
-        text_length = len(result['text'].strip())
-        return text_length < text_threshold
+        return self._looks_scanned(texts, text_threshold)
+
+    def close(self):
+        """Shut down the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def _count(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
 
     def get_stats(self) -> Dict[str, int]:
         """Get extraction statistics"""
-        return self.stats.copy()
+        with self._stats_lock:
+            return self.stats.copy()
+
+    def merge_stats(self, stats: Dict[str, int]):
+        """Add counters reported by another extractor (e.g. in a parse worker process)"""
+        with self._stats_lock:
+            for key, value in stats.items():
+                self.stats[key] = self.stats.get(key, 0) + value
 
     def reset_stats(self):
         """Reset statistics counters"""
         self.stats = {
             'files_processed': 0,
             'total_pages': 0,
-            'extraction_errors': 0
+            'extraction_errors': 0,
+            'cache_hits': 0,
+            'scanned_skipped': 0
         }
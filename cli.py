@@ -310,7 +310,9 @@ def update():
 @click.option('--dry-run', is_flag=True, help='Preview changes without modifying database')
 @click.option('--quiet', is_flag=True, help='Reduce output for cron jobs')
 @click.option('--json-progress', is_flag=True, help='Output progress as JSON for admin dashboard')
-def incremental(congress, lookback_days, mode, components, dry_run, quiet, json_progress):
+@click.option('--concurrency', default=settings.detail_fetch_concurrency,
+              help='Concurrent hearing detail requests (all share the API rate limit)')
+def incremental(congress, lookback_days, mode, components, dry_run, quiet, json_progress, concurrency):
     """Run incremental daily update (equivalent to daily_update.py)"""
     import json
     from datetime import datetime
@@ -340,7 +342,8 @@ def incremental(congress, lookback_days, mode, components, dry_run, quiet, json_
             congress=congress,
             lookback_days=lookback_days,
             update_mode=mode,
-            components=components_list
+            components=components_list,
+            detail_concurrency=concurrency
         )
 
         if json_progress:
@@ -591,6 +594,46 @@ def witnesses(congress, lookback_days):
         sys.exit(1)
 
 
+@update.command('snapshots')
+@click.option('--limit', default=20, help='Number of recent runs to show')
+def list_snapshots(limit):
+    """List update snapshots (interrupted runs can be restored)"""
+    logger = get_logger(__name__)
+
+    try:
+        from database.unified_manager import UnifiedDatabaseManager
+        from database.update_snapshots import UpdateSnapshots
+
+        snapshots = UpdateSnapshots(UnifiedDatabaseManager(prefer_postgres=True), mode='none')
+        for run in snapshots.list_runs(limit=limit):
+            click.echo(f"{run['run_id']:>6}  {run['kind']:<8} {run['status']:<12} {run['created_at']}")
+
+    except Exception as e:
+        logger.error(f"Could not list snapshots: {e}")
+        sys.exit(1)
+
+
+@update.command('restore-snapshot')
+@click.argument('run_id', type=int)
+@click.option('--force', is_flag=True, help='Restore even if later runs exist (their changes may be lost)')
+@click.confirmation_option(prompt='Undo every change recorded since this snapshot?')
+def restore_snapshot(run_id, force):
+    """Revert the changes of an update run, e.g. one whose process crashed"""
+    logger = get_logger(__name__)
+
+    try:
+        from database.unified_manager import UnifiedDatabaseManager
+        from database.update_snapshots import UpdateSnapshots
+
+        snapshots = UpdateSnapshots(UnifiedDatabaseManager(prefer_postgres=True), mode='none')
+        restored = snapshots.restore(run_id, force=force)
+        logger.info(f"Snapshot run {run_id} restored ({restored} rows)")
+
+    except Exception as e:
+        logger.error(f"Snapshot restore failed: {e}")
+        sys.exit(1)
+
+
 @cli.group()
 def database():
     """Database management operations"""
@@ -640,6 +683,58 @@ def clean():
         sys.exit(1)
 
 
+@database.command('backfill-witness-names')
+def backfill_witness_names():
+    """Populate witnesses.normalized_name and create the witness identity index"""
+    logger = get_logger(__name__)
+
+    try:
+        db = DatabaseManager()
+        result = db.backfill_witness_normalized_names()
+
+        click.echo(f"Witnesses scanned: {result['total']:,}")
+        click.echo(f"Rows updated:      {result['updated']:,}")
+        if result['duplicates']:
+            click.echo(f"Duplicates left without normalized_name: {result['duplicates']:,} "
+                       f"(merge with scripts/cleanup_duplicate_witnesses_oct8.py)")
+
+    except Exception as e:
+        logger.error(f"Witness name backfill failed: {e}")
+        sys.exit(1)
+
+
+@database.command('build-search-index')
+def build_search_index():
+    """Create or refresh the full-text search index used by the search pages"""
+    logger = get_logger(__name__)
+
+    try:
+        from database.search_index import SearchIndex
+
+        SearchIndex(DatabaseManager()).build()
+        click.echo("Search index built for hearings, committees, members and witnesses")
+
+    except Exception as e:
+        logger.error(f"Search index build failed: {e}")
+        sys.exit(1)
+
+
+@database.command('build-hearing-listing')
+def build_hearing_listing():
+    """Create or rebuild the denormalized hearing listing used by the hearings page"""
+    logger = get_logger(__name__)
+
+    try:
+        from database.hearing_listing import HearingListing
+
+        total = HearingListing(DatabaseManager()).build()
+        click.echo(f"Hearing listing built with {total} hearings")
+
+    except Exception as e:
+        logger.error(f"Hearing listing build failed: {e}")
+        sys.exit(1)
+
+
 @database.command()
 def status():
     """Show database status and record counts"""
@@ -798,7 +893,9 @@ def crs_content():
 @click.option('--limit', default=None, type=int, help='Limit number of products to backfill')
 @click.option('--product-id', help='Backfill specific product only')
 @click.option('--skip-existing', is_flag=True, default=True, help='Skip products with existing content')
-def backfill(limit, product_id, skip_existing):
+@click.option('--defer-fts-index', is_flag=True, default=False,
+              help='Drop the content search index during the backfill and build it once at the end')
+def backfill(limit, product_id, skip_existing, defer_fts_index):
     """
     Initial backfill of CRS HTML content for all products
 
@@ -809,7 +906,7 @@ def backfill(limit, product_id, skip_existing):
 
     try:
         from fetchers.crs_content_fetcher import CRSContentFetcher
-        from parsers.crs_html_parser import CRSHTMLParser
+        from fetchers.crs_content_pipeline import CRSContentPipeline
         from database.crs_content_manager import CRSContentManager
         from database.postgres_config import get_connection
         from psycopg2.extras import RealDictCursor
@@ -818,7 +915,6 @@ def backfill(limit, product_id, skip_existing):
 
         # Initialize components
         fetcher = CRSContentFetcher(rate_limit_delay=1.0)  # Slower for backfill
-        parser = CRSHTMLParser()
         manager = CRSContentManager()
 
         # Start ingestion log
@@ -861,57 +957,81 @@ def backfill(limit, product_id, skip_existing):
         skip_count = 0
         errors = []
 
-        for i, product in enumerate(products, 1):
+        work = []
+        for product in products:
             product_id = product['product_id']
             version_number = product.get('version', 1)
             html_url = product.get('url_html')
 
             if not html_url:
-                logger.warning(f"[{i}/{total}] Skipping {product_id}: No HTML URL")
+                logger.warning(f"Skipping {product_id}: No HTML URL")
                 skip_count += 1
                 continue
 
-            try:
-                logger.info(f"[{i}/{total}] Processing {product_id} v{version_number}...")
-
-                # Check if needs update
-                if skip_existing and not manager.needs_update(product_id, version_number, html_url):
-                    logger.info(f"  Skipping {product_id}: Already have current version")
-                    skip_count += 1
-                    continue
+            # Check if needs update
+            if skip_existing and not manager.needs_update(product_id, version_number, html_url):
+                logger.info(f"  Skipping {product_id}: Already have current version")
+                skip_count += 1
+                continue
 
-                # Fetch HTML with browser
-                result = fetcher.fetch_html_with_browser(html_url)
-                if not result:
-                    raise Exception("Failed to fetch HTML")
-
-                html_content, metadata = result
-
-                # Parse HTML
-                parsed = parser.parse(html_content, product_id)
-                if not parsed:
-                    raise Exception("Failed to parse HTML")
-
-                # Store in database
-                version_id = manager.upsert_version(
-                    product_id=product_id,
-                    version_number=version_number,
-                    html_content=parsed.html_content,
-                    text_content=parsed.text_content,
-                    structure_json=parsed.structure_json,
-                    content_hash=parsed.content_hash,
-                    word_count=parsed.word_count,
-                    html_url=html_url
-                )
+            work.append({'product_id': product_id, 'version_number': version_number, 'html_url': html_url})
+
+        def store(content_manager, conn, item, parsed, blob_url):
+            return content_manager.upsert_version(
+                product_id=item['product_id'],
+                version_number=item['version_number'],
+                html_content=parsed.html_content,
+                text_content=parsed.text_content,
+                structure_json=parsed.structure_json,
+                content_hash=parsed.content_hash,
+                word_count=parsed.word_count,
+                html_url=item['html_url'],
+                blob_url=blob_url,
+                conn=conn,
+                source_hash=item.get('source_hash'),
+                defer_fts=True
+            )
 
+        def on_result(item, status, detail):
+            nonlocal success_count, error_count, skip_count
+            done = success_count + error_count + 1
+            if status == 'unchanged':
+                skip_count += 1
+                logger.info(f"  Skipping {item['product_id']}: Content unchanged")
+            elif status == 'stored':
                 success_count += 1
-                logger.info(f"  ✓ Success: {parsed.word_count:,} words, {len(parsed.structure_json['headings'])} headings")
-
-            except Exception as e:
+                _, parsed = detail
+                logger.info(f"[{done}/{len(work)}] ✓ {item['product_id']} v{item['version_number']}: "
+                            f"{parsed.word_count:,} words, {len(parsed.structure_json['headings'])} headings")
+            else:
                 error_count += 1
-                error_msg = f"{product_id}: {str(e)}"
-                errors.append(error_msg)
-                logger.error(f"  ✗ Error: {e}")
+                errors.append(f"{item['product_id']}: {detail}")
+                logger.error(f"[{done}/{len(work)}] ✗ {item['product_id']} ({status}): {detail}")
+
+        # Fetch, parse, upload to R2 and store concurrently
+        logger.info(f"Processing {len(work)} products ({settings.crs_fetch_workers} fetch workers, "
+                    f"{settings.crs_parse_processes} parse processes)")
+        pipeline = CRSContentPipeline(
+            fetcher,
+            manager,
+            store=store,
+            use_browser=True,
+            fetch_workers=settings.crs_fetch_workers,
+            parse_processes=settings.crs_parse_processes,
+            upload_workers=settings.crs_upload_workers,
+            batch_size=settings.crs_write_batch_size
+        )
+        if defer_fts_index:
+            logger.info("Dropping content search index until the backfill is done")
+            with get_connection() as conn:
+                manager.fts_indexer.drop_search_index(conn)
+        try:
+            pipeline.run(work, on_result=on_result)
+        finally:
+            if defer_fts_index:
+                logger.info("Building content search index...")
+                with get_connection() as conn:
+                    manager.fts_indexer.create_search_index(conn)
 
         # Update log
         manager.update_ingestion_log(
@@ -945,7 +1065,7 @@ def backfill(limit, product_id, skip_existing):
                 logger.info("\nSyncing CRS products to Policy Library...")
                 from brookings_ingester.crs_sync import sync_crs_to_policy_library
 
-                sync_stats = sync_crs_to_policy_library()
+                sync_stats = sync_crs_to_policy_library(incremental=True)
                 logger.info(f"✓ Policy Library sync complete: {sync_stats['documents_created']} created, "
                            f"{sync_stats['documents_updated']} updated, {sync_stats['documents_skipped']} skipped")
             except Exception as sync_error:
@@ -1059,7 +1179,7 @@ def update(days):
                 logger.info("Syncing CRS products to Policy Library...")
                 from brookings_ingester.crs_sync import sync_crs_to_policy_library
 
-                sync_stats = sync_crs_to_policy_library()
+                sync_stats = sync_crs_to_policy_library(incremental=True)
                 logger.info(f"✓ Policy Library sync complete: {sync_stats['documents_created']} created, "
                            f"{sync_stats['documents_updated']} updated, {sync_stats['documents_skipped']} skipped")
             except Exception as sync_error:
@@ -1071,6 +1191,31 @@ def update(days):
         sys.exit(1)
 
 
+@crs_content.command(name='rebuild-fts')
+def rebuild_fts():
+    """
+    Rebuild the CRS content full-text index offline
+
+    Refreshes titles and search vectors of every product_content_fts row with
+    the GIN index dropped, then builds the index once.
+    """
+    logger = get_logger(__name__)
+
+    try:
+        from database.crs_content_manager import CRSContentManager
+        from database.postgres_config import get_connection
+
+        manager = CRSContentManager()
+        with get_connection() as conn:
+            rows = manager.fts_indexer.rebuild(conn)
+
+        logger.info(f"Rebuilt full-text index for {rows:,} content rows")
+
+    except Exception as e:
+        logger.error(f"FTS rebuild failed: {e}")
+        sys.exit(1)
+
+
 @crs_content.command()
 def stats():
     """Show CRS content ingestion statistics"""
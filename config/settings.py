@@ -14,6 +14,9 @@ class Settings(BaseSettings):
     api_key: Optional[str] = Field(default=None, env='CONGRESS_API_KEY')
     api_base_url: str = Field(default='https://api.congress.gov/v3', env='API_BASE_URL')
     rate_limit: int = Field(default=5000, env='RATE_LIMIT')
+    # SQLite file shared by every process on the host (cron, batch workers, CLI)
+    # so they draw from one quota. Unset keeps the limiter in-process.
+    rate_limit_state_path: Optional[str] = Field(default=None, env='RATE_LIMIT_STATE_PATH')
 
     # Timeout Configuration (separate connect and read timeouts)
     # Connect timeout: How long to wait for TCP connection establishment
@@ -29,9 +32,42 @@ class Settings(BaseSettings):
     circuit_breaker_threshold: int = Field(default=5, env='CIRCUIT_BREAKER_THRESHOLD')
     circuit_breaker_timeout: int = Field(default=60, env='CIRCUIT_BREAKER_TIMEOUT')
 
+    # Response Cache Configuration
+    # SQLite file caching API responses between runs. Unset disables caching.
+    response_cache_path: Optional[str] = Field(default=None, env='RESPONSE_CACHE_PATH')
+    response_cache_max_mb: int = Field(default=256, env='RESPONSE_CACHE_MAX_MB')
+
+    # Blob Content Cache Configuration (CRS HTML on detail pages)
+    # SQLite file shared by web workers on the host. Unset keeps the cache in memory only.
+    blob_cache_path: Optional[str] = Field(default=None, env='BLOB_CACHE_PATH')
+    blob_cache_max_mb: int = Field(default=512, env='BLOB_CACHE_MAX_MB')
+    blob_cache_memory_mb: int = Field(default=64, env='BLOB_CACHE_MEMORY_MB')
+    blob_cache_ttl: int = Field(default=3600, env='BLOB_CACHE_TTL')  # Seconds, for blobs without a content hash
+
+    # Concurrent Fetch Configuration
+    # Number of worker threads used for committee-meeting detail requests.
+    # All workers share the client's rate limiter, so this only hides latency.
+    detail_fetch_concurrency: int = Field(default=4, env='DETAIL_FETCH_CONCURRENCY')
+
+    # CRS Content Pipeline Configuration (crs-content backfill, CRSUpdater)
+    crs_fetch_workers: int = Field(default=4, env='CRS_FETCH_WORKERS')
+    crs_parse_processes: int = Field(default=2, env='CRS_PARSE_PROCESSES')  # 0 parses in threads
+    crs_upload_workers: int = Field(default=4, env='CRS_UPLOAD_WORKERS')
+    crs_write_batch_size: int = Field(default=25, env='CRS_WRITE_BATCH_SIZE')
+    crs_parser_engine: str = Field(default='lxml', env='CRS_PARSER_ENGINE')  # 'lxml' or 'bs4'
+
+    # Page Renderer Configuration (browser fetches for CRS content and think-tank ingesters)
+    browser_renderer: str = Field(default='playwright', env='BROWSER_RENDERER')  # 'playwright' or 'http'
+    browser_pool_size: int = Field(default=4, env='BROWSER_POOL_SIZE')  # Pages rendering at once
+
     # Database Configuration
     database_path: str = Field(default='database.db', env='DATABASE_PATH')
 
+    # PostgreSQL Connection Pool (one pool per process per database URL)
+    db_pool_size: int = Field(default=5, env='DB_POOL_SIZE')
+    db_pool_max_overflow: int = Field(default=10, env='DB_POOL_MAX_OVERFLOW')
+    db_pool_recycle: int = Field(default=300, env='DB_POOL_RECYCLE')  # Max connection lifetime (seconds)
+
     def __init__(self, **kwargs):
         """Initialize settings with Vercel-specific configuration"""
         super().__init__(**kwargs)
@@ -55,6 +91,8 @@ class Settings(BaseSettings):
     # Update Configuration
     update_window_days: int = Field(default=30, env='UPDATE_WINDOW_DAYS')
     update_schedule_hour: int = Field(default=2, env='UPDATE_SCHEDULE_HOUR')
+    snapshot_mode: str = Field(default='journal', env='SNAPSHOT_MODE')  # journal, backup (SQLite only), none
+    snapshot_retention_days: int = Field(default=7, env='SNAPSHOT_RETENTION_DAYS')
 
     # Logging Configuration
     log_level: str = Field(default='INFO', env='LOG_LEVEL')
@@ -0,0 +1,267 @@
+"""
+Content cache for blob-stored HTML (CRS product and document detail pages)
+
+Detail pages used to download their HTML from R2/Blob storage on every view
+with a fresh connection. BlobContentCache puts two tiers in front of it:
+
+- an in-process LRU of decoded HTML, bounded by size
+- an optional on-disk store (ResponseCache: zlib-compressed SQLite, LRU
+  evicted), shared by every worker process on the host
+
+Entries are keyed by blob URL and content hash. A blob whose content hash
+is known never changes under that key, so it is served without touching the
+network. Entries without a hash expire after a TTL; a stale entry is still
+served immediately while a background conditional GET (If-None-Match /
+If-Modified-Since) refreshes it, and keeps being served if the blob store
+cannot be reached.
+
+Downloads share one requests.Session so connections are reused.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from api.response_cache import ResponseCache
+from config.logging_config import get_logger
+from config.settings import settings
+
+logger = get_logger(__name__)
+
+# Seconds before an entry without a content hash is revalidated
+DEFAULT_TTL = 3600
+
+# Background revalidation threads per process
+REVALIDATE_WORKERS = 2
+
+
+class BlobContentCache:
+    """Memory + disk cache of blob HTML with stale-while-revalidate"""
+
+    def __init__(self, path: Optional[str] = None, max_bytes: int = 512 * 1024 * 1024,
+                 memory_bytes: int = 64 * 1024 * 1024, ttl: int = DEFAULT_TTL,
+                 timeout: float = 10, session: Optional[requests.Session] = None):
+        """
+        Initialize blob cache
+
+        Args:
+            path: SQLite file for the disk tier (None keeps the cache in memory only)
+            max_bytes: Disk budget for compressed bodies
+            memory_bytes: Memory budget for decoded HTML
+            ttl: Seconds before an unhashed entry is revalidated
+            timeout: Download timeout in seconds
+            session: HTTP session (defaults to a pooled session)
+        """
+        self.memory_bytes = memory_bytes
+        self.ttl = ttl
+        self.timeout = timeout
+
+        self.disk = None
+        if path:
+            try:
+                self.disk = ResponseCache(path, max_bytes=max_bytes, ttl_rules=[], default_ttl=ttl)
+            except Exception as e:
+                logger.warning(f"Blob disk cache disabled, could not open {path}: {e}")
+
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=10)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+
+        # key -> entry dict (html, etag, last_modified, expires_at, size)
+        self._memory: 'OrderedDict[Tuple[str, str], Dict[str, Any]]' = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+        self._revalidator = ThreadPoolExecutor(max_workers=REVALIDATE_WORKERS,
+                                               thread_name_prefix='blob-revalidate')
+        self._revalidating = set()
+
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'stale_served': 0,
+                      'revalidated': 0, 'errors': 0}
+
+    def get(self, blob_url: str, content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        HTML of a blob, from cache when possible
+
+        Args:
+            blob_url: URL of the blob
+            content_hash: Hash of the stored content, if known (pins the entry)
+
+        Returns:
+            HTML string, or None if the blob could not be fetched and was never cached
+        """
+        key = (blob_url, content_hash or '')
+        entry = self._memory_get(key)
+        tier = 'memory_hits'
+        if entry is None:
+            entry = self._disk_get(key)
+            tier = 'disk_hits'
+
+        if entry is not None:
+            if content_hash or entry['expires_at'] > time.time():
+                self._count(tier)
+                return entry['html']
+
+            # Serve stale now, refresh for the next view
+            self._count('stale_served')
+            self._schedule_revalidation(key, entry)
+            return entry['html']
+
+        self._count('misses')
+        entry = self._fetch(key)
+        return entry['html'] if entry else None
+
+    def _fetch(self, key: Tuple[str, str], stale: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Download a blob (conditionally when a stale entry exists) and cache it"""
+        blob_url = key[0]
+        headers = {}
+        if stale:
+            if stale.get('etag'):
+                headers['If-None-Match'] = stale['etag']
+            if stale.get('last_modified'):
+                headers['If-Modified-Since'] = stale['last_modified']
+
+        try:
+            response = self.session.get(blob_url, headers=headers or None, timeout=self.timeout)
+        except requests.RequestException as e:
+            self._count('errors')
+            logger.warning(f"Error fetching blob from {blob_url}: {e}")
+            return None
+
+        if stale and response.status_code == 304:
+            entry = dict(stale, expires_at=time.time() + self.ttl)
+            self._memory_put(key, entry)
+            if self.disk:
+                self.disk.refresh(blob_url, {'content_hash': key[1]})
+            self._count('revalidated')
+            return entry
+
+        if response.status_code != 200:
+            self._count('errors')
+            logger.warning(f"Error fetching blob {blob_url}: {response.status_code}")
+            return None
+
+        entry = {
+            'html': response.text,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'expires_at': time.time() + self.ttl,
+        }
+        self._memory_put(key, entry)
+        if self.disk:
+            try:
+                self.disk.store(blob_url, {'content_hash': key[1]}, {'html': entry['html']},
+                                etag=entry['etag'], last_modified=entry['last_modified'])
+            except Exception as e:
+                logger.warning(f"Failed to cache blob {blob_url} on disk: {e}")
+        return entry
+
+    def _schedule_revalidation(self, key: Tuple[str, str], entry: Dict[str, Any]) -> None:
+        """Revalidate a stale entry in the background, once per key at a time"""
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def revalidate():
+            try:
+                self._fetch(key, stale=entry)
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        self._revalidator.submit(revalidate)
+
+    def _memory_get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: Tuple[str, str], entry: Dict[str, Any]) -> None:
+        entry['size'] = len(entry['html'])
+        if entry['size'] > self.memory_bytes:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous:
+                self._memory_size -= previous['size']
+            self._memory[key] = entry
+            self._memory_size += entry['size']
+            while self._memory_size > self.memory_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_size -= evicted['size']
+
+    def _disk_get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Load an entry from the disk tier into memory"""
+        if not self.disk:
+            return None
+        try:
+            cached = self.disk.lookup(key[0], {'content_hash': key[1]})
+        except Exception as e:
+            logger.warning(f"Blob disk cache lookup failed for {key[0]}: {e}")
+            return None
+        if not cached:
+            return None
+
+        entry = {
+            'html': cached['data']['html'],
+            'etag': cached['etag'],
+            'last_modified': cached['last_modified'],
+            # Disk freshness is tracked by the store itself
+            'expires_at': time.time() + self.ttl if cached['fresh'] else 0,
+        }
+        self._memory_put(key, entry)
+        return entry
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/miss counters and tier sizes
+        """
+        with self._lock:
+            stats = dict(self.stats, memory_entries=len(self._memory), memory_bytes=self._memory_size)
+        if self.disk:
+            stats['disk'] = self.disk.get_stats()
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached blobs"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        if self.disk:
+            self.disk.clear()
+
+
+_blob_cache = None
+_blob_cache_lock = threading.Lock()
+
+
+def get_blob_cache() -> BlobContentCache:
+    """Process-wide blob cache configured from settings"""
+    global _blob_cache
+    if _blob_cache is None:
+        with _blob_cache_lock:
+            if _blob_cache is None:
+                _blob_cache = BlobContentCache(
+                    path=settings.blob_cache_path,
+                    max_bytes=settings.blob_cache_max_mb * 1024 * 1024,
+                    memory_bytes=settings.blob_cache_memory_mb * 1024 * 1024,
+                    ttl=settings.blob_cache_ttl
+                )
+    return _blob_cache
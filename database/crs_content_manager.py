@@ -5,16 +5,20 @@ import json
 import os
 import boto3
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from pathlib import Path
 from contextlib import contextmanager
 from config.logging_config import get_logger
+from database.crs_fts_indexer import CRSFTSIndexer
 from database.postgres_config import get_connection
 from psycopg2.extras import RealDictCursor
 
 logger = get_logger(__name__)
 
+# Product ids per fingerprint lookup query
+HASH_LOOKUP_CHUNK_SIZE = 500
+
 
 class CRSContentManager:
     """
@@ -34,6 +38,8 @@ class CRSContentManager:
         Uses PostgreSQL connection from DATABASE_URL or CRS_DATABASE_URL environment variable
         """
         self._init_r2_client()
+        # FTS rows queued by upsert_version(defer_fts=True), see flush_fts_index
+        self.fts_indexer = CRSFTSIndexer()
 
     def _init_r2_client(self):
         """Initialize Cloudflare R2 client for blob storage"""
@@ -106,21 +112,85 @@ class CRSContentManager:
             logger.error(f"R2 upload failed for {product_id}: {e}")
             return None
 
+    def upload_content(self, product_id: str, version_number: int, html_content: str) -> Optional[str]:
+        """
+        Upload a version's HTML to R2 ahead of upsert_version
+
+        Returns:
+            Public blob URL, or None when R2 is not configured
+
+        Raises:
+            Exception: If R2 is enabled but the upload failed
+        """
+        blob_url = self._upload_to_r2(product_id, version_number, html_content)
+        if not blob_url:
+            logger.warning(f"R2 upload failed for {product_id} v{version_number} - skipping ingestion")
+            # If R2 is enabled but upload failed, don't proceed
+            if self.r2_enabled:
+                raise Exception(f"R2 upload failed for {product_id} v{version_number}")
+        return blob_url
+
     @contextmanager
-    def get_db_connection(self):
-        """Get PostgreSQL database connection"""
+    def get_db_connection(self, conn=None):
+        """Get PostgreSQL database connection (or reuse the caller's, who then commits)"""
+        if conn is not None:
+            yield conn
+            return
         with get_connection() as conn:
             yield conn
 
+    def get_version_hashes(self, keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """
+        Stored fingerprints for many versions in one query per chunk
+
+        Args:
+            keys: (product_id, version_number) pairs
+
+        Returns:
+            {(product_id, version_number): {'version_id', 'source_hash', 'content_hash', 'ingested_at'}}
+            for the versions that exist
+        """
+        wanted = set(keys)
+        product_ids = sorted({product_id for product_id, _ in wanted})
+        hashes = {}
+        with self.get_db_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                for start in range(0, len(product_ids), HASH_LOOKUP_CHUNK_SIZE):
+                    cur.execute("""
+                        SELECT product_id, version_number, version_id, source_hash, content_hash, ingested_at
+                        FROM product_versions
+                        WHERE product_id = ANY(%s)
+                    """, (product_ids[start:start + HASH_LOOKUP_CHUNK_SIZE],))
+                    for row in cur.fetchall():
+                        key = (row['product_id'], row['version_number'])
+                        if key in wanted:
+                            hashes[key] = {'version_id': row['version_id'], 'source_hash': row['source_hash'],
+                                           'content_hash': row['content_hash'], 'ingested_at': row['ingested_at']}
+        return hashes
+
+    def record_source_hash(self, version_id: int, source_hash: str, conn=None):
+        """Remember the raw HTML fingerprint of an unchanged version"""
+        with self.get_db_connection(conn) as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE product_versions SET source_hash = %s
+                    WHERE version_id = %s AND source_hash IS DISTINCT FROM %s
+                """, (source_hash, version_id, source_hash))
+
     def upsert_version(self, product_id: str, version_number: int,
                       html_content: str, text_content: str, structure_json: Dict,
-                      content_hash: str, word_count: int, html_url: str) -> int:
+                      content_hash: str, word_count: int, html_url: str,
+                      blob_url: Optional[str] = None, conn=None, source_hash: Optional[str] = None,
+                      defer_fts: bool = False) -> int:
         """
         Insert or update a product version
 
         Marks all previous versions as not current
         Uploads HTML content to R2 if enabled
 
+        Unchanged content (same content_hash) returns before any R2 or FTS
+        work; only the raw HTML fingerprint is recorded.
+
         Args:
             product_id: CRS product ID
             version_number: Version number
@@ -130,45 +200,49 @@ class CRSContentManager:
             content_hash: SHA256 hash
             word_count: Word count
             html_url: Source URL
+            blob_url: Already uploaded blob (see upload_content); uploads when None
+            conn: Connection to write on; the caller commits (default: own transaction)
+            source_hash: Fingerprint of the raw fetched HTML (see source_fingerprint)
+            defer_fts: Queue the FTS row for flush_fts_index instead of writing it now
 
         Returns:
             version_id of inserted/updated version
         """
-        # Upload HTML content to R2 if enabled
-        blob_url = self._upload_to_r2(product_id, version_number, html_content)
-        if not blob_url:
-            logger.warning(f"R2 upload failed for {product_id} v{version_number} - skipping ingestion")
-            # If R2 is enabled but upload failed, don't proceed
-            if self.r2_enabled:
-                raise Exception(f"R2 upload failed for {product_id} v{version_number}")
-
-        with self.get_db_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Check if this version already exists
+        # Check if this version already exists (connection released before uploading)
+        with self.get_db_connection(conn) as lookup_conn:
+            with lookup_conn.cursor(cursor_factory=RealDictCursor) as cur:
                 cur.execute("""
-                    SELECT version_id, content_hash
+                    SELECT version_id, content_hash, source_hash
                     FROM product_versions
                     WHERE product_id = %s AND version_number = %s
                 """, (product_id, version_number))
                 existing = cur.fetchone()
 
-                if existing:
-                    # Check if content has changed
-                    if existing['content_hash'] == content_hash:
-                        logger.debug(f"Version {version_number} of {product_id} unchanged, skipping update")
-                        return existing['version_id']
+        if existing and existing['content_hash'] == content_hash:
+            logger.debug(f"Version {version_number} of {product_id} unchanged, skipping update")
+            if source_hash and existing['source_hash'] != source_hash:
+                self.record_source_hash(existing['version_id'], source_hash, conn=conn)
+            return existing['version_id']
+
+        # Upload HTML content to R2 if enabled
+        if blob_url is None:
+            blob_url = self.upload_content(product_id, version_number, html_content)
 
+        with self.get_db_connection(conn) as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                if existing:
                     # Content changed, update it
                     cur.execute("""
                         UPDATE product_versions
                         SET structure_json = %s,
                             content_hash = %s,
+                            source_hash = %s,
                             word_count = %s,
                             html_url = %s,
                             blob_url = %s,
                             ingested_at = CURRENT_TIMESTAMP
                         WHERE version_id = %s
-                    """, (json.dumps(structure_json), content_hash, word_count,
+                    """, (json.dumps(structure_json), content_hash, source_hash, word_count,
                          html_url, blob_url, existing['version_id']))
 
                     version_id = existing['version_id']
@@ -179,11 +253,11 @@ class CRSContentManager:
                     cur.execute("""
                         INSERT INTO product_versions
                         (product_id, version_number, structure_json,
-                         content_hash, word_count, html_url, blob_url, is_current)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, FALSE)
+                         content_hash, source_hash, word_count, html_url, blob_url, is_current)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, FALSE)
                         RETURNING version_id
                     """, (product_id, version_number, json.dumps(structure_json),
-                         content_hash, word_count, html_url, blob_url))
+                         content_hash, source_hash, word_count, html_url, blob_url))
 
                     version_id = cur.fetchone()['version_id']
                     logger.info(f"✓ Inserted version {version_number} of {product_id}")
@@ -202,41 +276,41 @@ class CRSContentManager:
                 """, (version_id,))
 
                 # Update FTS index
-                self._update_fts_index(cur, version_id, product_id, structure_json, text_content)
+                self._update_fts_index(conn, version_id, product_id, structure_json, text_content, defer_fts)
 
                 return version_id
 
-    def _update_fts_index(self, cur, version_id: int,
-                         product_id: str, structure_json: Dict, text_content: str):
+    def _update_fts_index(self, conn, version_id: int, product_id: str,
+                          structure_json: Dict, text_content: str, defer: bool = False):
         """
         Update full-text search index for a version
 
         Args:
-            cur: Database cursor
+            conn: Database connection
             version_id: Version ID
             product_id: Product ID
             structure_json: Document structure
             text_content: Plain text content
+            defer: Queue the row for flush_fts_index instead of writing it now
         """
-        # Get product title from products table
-        cur.execute("""
-            SELECT title FROM products WHERE product_id = %s
-        """, (product_id,))
-        product = cur.fetchone()
-
-        title = product['title'] if product else ''
         headings = ' '.join(structure_json.get('headings', []))
+        if defer:
+            self.fts_indexer.queue(version_id, product_id, headings, text_content)
+        else:
+            self.fts_indexer.write(conn, [(version_id, product_id, headings, text_content)])
+
+    def flush_fts_index(self, conn=None) -> int:
+        """
+        Write FTS rows queued by upsert_version(defer_fts=True) in bulk
 
-        # Delete existing FTS entry for this version
-        cur.execute("""
-            DELETE FROM product_content_fts WHERE version_id = %s
-        """, (version_id,))
+        Args:
+            conn: Connection the versions were written on (default: own transaction)
 
-        # Insert new FTS entry
-        cur.execute("""
-            INSERT INTO product_content_fts (product_id, version_id, title, headings, text_content)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (product_id, version_id, title, headings, text_content))
+        Returns:
+            Number of FTS rows written
+        """
+        with self.get_db_connection(conn) as conn:
+            return self.fts_indexer.flush(conn)
 
     def get_current_version(self, product_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -7,16 +7,20 @@ import json
 import os
 import boto3
 from botocore.exceptions import ClientError
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timedelta
 from contextlib import contextmanager
 from config.logging_config import get_logger
+from database.crs_fts_indexer import CRSFTSIndexer
 from database.postgres_config import get_connection
 import psycopg2
 from psycopg2.extras import RealDictCursor
 
 logger = get_logger(__name__)
 
+# Product ids per fingerprint lookup query
+HASH_LOOKUP_CHUNK_SIZE = 500
+
 
 class CRSContentManager:
     """
@@ -32,6 +36,8 @@ class CRSContentManager:
     def __init__(self):
         """Initialize CRS content manager with PostgreSQL"""
         self._init_r2_client()
+        # FTS rows queued by upsert_version(defer_fts=True), see flush_fts_index
+        self.fts_indexer = CRSFTSIndexer()
 
     def _init_r2_client(self):
         """Initialize Cloudflare R2 client for blob storage"""
@@ -104,22 +110,94 @@ class CRSContentManager:
             logger.error(f"R2 upload failed for {product_id}: {e}")
             return None
 
+    def upload_content(self, product_id: str, version_number: int, html_content: str) -> Optional[str]:
+        """
+        Upload a version's HTML to R2 ahead of upsert_version
+
+        Returns:
+            Public blob URL, or None when R2 is not configured
+
+        Raises:
+            Exception: If R2 is enabled but the upload failed
+        """
+        blob_url = self._upload_to_r2(product_id, version_number, html_content)
+        if not blob_url:
+            logger.warning(f"R2 upload failed for {product_id} v{version_number} - skipping ingestion")
+            # If R2 is enabled but upload failed, don't proceed
+            if self.r2_enabled:
+                raise Exception(f"R2 upload failed for {product_id} v{version_number}")
+        return blob_url
+
+    @contextmanager
+    def _connection(self, conn=None):
+        """Use the caller's connection (caller commits) or a new pooled one"""
+        if conn is not None:
+            yield conn
+        else:
+            with get_connection() as conn:
+                yield conn
+
+    def get_version_hashes(self, keys: List[Tuple[str, int]]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+        """
+        Stored fingerprints for many versions in one query per chunk
+
+        Args:
+            keys: (product_id, version_number) pairs
+
+        Returns:
+            {(product_id, version_number): {'version_id', 'source_hash', 'content_hash', 'ingested_at'}}
+            for the versions that exist
+        """
+        wanted = set(keys)
+        product_ids = sorted({product_id for product_id, _ in wanted})
+        hashes = {}
+        with get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+            for start in range(0, len(product_ids), HASH_LOOKUP_CHUNK_SIZE):
+                cursor.execute("""
+                    SELECT product_id, version_number, version_id, source_hash, content_hash, ingested_at
+                    FROM product_versions
+                    WHERE product_id = ANY(%s)
+                """, (product_ids[start:start + HASH_LOOKUP_CHUNK_SIZE],))
+                for row in cursor.fetchall():
+                    key = (row['product_id'], row['version_number'])
+                    if key in wanted:
+                        hashes[key] = {'version_id': row['version_id'], 'source_hash': row['source_hash'],
+                                       'content_hash': row['content_hash'], 'ingested_at': row['ingested_at']}
+        return hashes
+
+    def record_source_hash(self, version_id: int, source_hash: str, conn=None):
+        """Remember the raw HTML fingerprint of an unchanged version"""
+        with self._connection(conn) as conn:
+            conn.cursor().execute("""
+                UPDATE product_versions SET source_hash = %s
+                WHERE version_id = %s AND source_hash IS DISTINCT FROM %s
+            """, (source_hash, version_id, source_hash))
+
     def upsert_version(self, product_id: str, version_number: int,
-                      parsed_content, html_url: str) -> bool:
+                      parsed_content, html_url: str, blob_url: Optional[str] = None, conn=None,
+                      source_hash: Optional[str] = None, defer_fts: bool = False) -> bool:
         """
         Insert or update a product version
 
         Marks all previous versions as not current
         Uploads HTML content to R2 if enabled
 
+        Unchanged content (same content_hash) returns before any R2 or FTS
+        work; only the raw HTML fingerprint is recorded.
+
         Args:
             product_id: CRS product ID
             version_number: Version number
             parsed_content: ParsedContent object from parser
             html_url: Source URL
+            blob_url: Already uploaded blob (see upload_content); uploads when None
+            conn: Connection to write on; the caller commits (default: own transaction)
+            source_hash: Fingerprint of the raw fetched HTML (see source_fingerprint)
+            defer_fts: Queue the FTS row for flush_fts_index instead of writing it now
 
         Returns:
-            True if new version was added, False if updated
+            True if new version was added, False if updated or unchanged
         """
         # Extract fields from ParsedContent
         html_content = parsed_content.html_content
@@ -128,44 +206,44 @@ class CRSContentManager:
         content_hash = parsed_content.content_hash
         word_count = parsed_content.word_count
 
-        # Upload HTML content to R2 if enabled
-        blob_url = self._upload_to_r2(product_id, version_number, html_content)
-        if not blob_url:
-            logger.warning(f"R2 upload failed for {product_id} v{version_number} - skipping ingestion")
-            # If R2 is enabled but upload failed, don't proceed
-            if self.r2_enabled:
-                raise Exception(f"R2 upload failed for {product_id} v{version_number}")
-
-        with get_connection() as conn:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Check if this version already exists
+        # Check if this version already exists (connection released before uploading)
+        with self._connection(conn) as lookup_conn:
+            cursor = lookup_conn.cursor(cursor_factory=RealDictCursor)
             cursor.execute("""
-                SELECT version_id, content_hash
+                SELECT version_id, content_hash, source_hash
                 FROM product_versions
                 WHERE product_id = %s AND version_number = %s
             """, (product_id, version_number))
             existing = cursor.fetchone()
 
+        if existing and existing['content_hash'] == content_hash:
+            logger.debug(f"Version {version_number} of {product_id} unchanged, skipping update")
+            if source_hash and existing['source_hash'] != source_hash:
+                self.record_source_hash(existing['version_id'], source_hash, conn=conn)
+            return False
+
+        # Upload HTML content to R2 if enabled
+        if blob_url is None:
+            blob_url = self.upload_content(product_id, version_number, html_content)
+
+        with self._connection(conn) as conn:
+            cursor = conn.cursor(cursor_factory=RealDictCursor)
+
             is_new = False
 
             if existing:
-                # Check if content has changed
-                if existing['content_hash'] == content_hash:
-                    logger.debug(f"Version {version_number} of {product_id} unchanged, skipping update")
-                    return False
-
                 # Content changed, update it
                 cursor.execute("""
                     UPDATE product_versions
                     SET structure_json = %s,
                         content_hash = %s,
+                        source_hash = %s,
                         word_count = %s,
                         html_url = %s,
                         blob_url = %s,
                         ingested_at = NOW()
                     WHERE version_id = %s
-                """, (json.dumps(structure_json), content_hash, word_count,
+                """, (json.dumps(structure_json), content_hash, source_hash, word_count,
                      html_url, blob_url, existing['version_id']))
 
                 version_id = existing['version_id']
@@ -176,11 +254,11 @@ class CRSContentManager:
                 cursor.execute("""
                     INSERT INTO product_versions
                     (product_id, version_number, structure_json,
-                     content_hash, word_count, html_url, blob_url, is_current)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, false)
+                     content_hash, source_hash, word_count, html_url, blob_url, is_current)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, false)
                     RETURNING version_id
                 """, (product_id, version_number, json.dumps(structure_json),
-                     content_hash, word_count, html_url, blob_url))
+                     content_hash, source_hash, word_count, html_url, blob_url))
 
                 version_id = cursor.fetchone()['version_id']
                 is_new = True
@@ -200,14 +278,14 @@ class CRSContentManager:
             """, (version_id,))
 
             # Update FTS index
-            self._update_fts_index(conn, version_id, product_id, structure_json, text_content)
+            self._update_fts_index(conn, version_id, product_id, structure_json, text_content, defer_fts)
 
             return is_new
 
-    def _update_fts_index(self, conn, version_id: int,
-                         product_id: str, structure_json: Dict, text_content: str):
+    def _update_fts_index(self, conn, version_id: int, product_id: str,
+                          structure_json: Dict, text_content: str, defer: bool = False):
         """
-        Update full-text search index for a version (PostgreSQL ts_vector)
+        Update full-text search index for a version
 
         Args:
             conn: Database connection
@@ -215,31 +293,26 @@ class CRSContentManager:
             product_id: Product ID
             structure_json: Document structure
             text_content: Plain text content
+            defer: Queue the row for flush_fts_index instead of writing it now
         """
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        headings = ' '.join(structure_json.get('headings', []))
+        if defer:
+            self.fts_indexer.queue(version_id, product_id, headings, text_content)
+        else:
+            self.fts_indexer.write(conn, [(version_id, product_id, headings, text_content)])
 
-        # Get product title from products table
-        cursor.execute("""
-            SELECT title FROM products WHERE product_id = %s
-        """, (product_id,))
-        product = cursor.fetchone()
+    def flush_fts_index(self, conn=None) -> int:
+        """
+        Write FTS rows queued by upsert_version(defer_fts=True) in bulk
 
-        title = product['title'] if product else ''
-        headings = ' '.join(structure_json.get('headings', []))
+        Args:
+            conn: Connection the versions were written on (default: own transaction)
 
-        # Delete existing FTS entry for this version
-        cursor.execute("""
-            DELETE FROM product_content_fts WHERE version_id = %s
-        """, (version_id,))
-
-        # Insert new FTS entry with ts_vector
-        cursor.execute("""
-            INSERT INTO product_content_fts (product_id, version_id, title, headings, text_content, search_vector)
-            VALUES (%s, %s, %s, %s, %s,
-                    setweight(to_tsvector('english', %s), 'A') ||
-                    setweight(to_tsvector('english', %s), 'B') ||
-                    setweight(to_tsvector('english', %s), 'C'))
-        """, (product_id, version_id, title, headings, text_content, title, headings, text_content))
+        Returns:
+            Number of FTS rows written
+        """
+        with self._connection(conn) as conn:
+            return self.fts_indexer.flush(conn)
 
     def get_current_version(self, product_id: str) -> Optional[Dict[str, Any]]:
         """
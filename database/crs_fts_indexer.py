@@ -0,0 +1,147 @@
+"""
+CRS FTS Indexer - Batched maintenance of product_content_fts
+
+upsert_version used to look up the title, DELETE and INSERT the FTS row of
+each version on its own, inside the per-product transaction. The indexer
+instead queues changed versions and writes them with one
+INSERT ... ON CONFLICT per batch; search_vector is filled by
+content_search_vector_trigger as before.
+
+For bulk loads the GIN index can be dropped first and built once at the end
+(drop_search_index / create_search_index), and rebuild() recomputes every
+row offline the same way.
+"""
+from typing import Dict, List, Tuple
+
+import psycopg2.extras
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Rows per INSERT statement
+FTS_PAGE_SIZE = 200
+
+# Memory for building the GIN index in one pass
+INDEX_BUILD_MEMORY = '256MB'
+
+SEARCH_INDEX_NAME = 'idx_content_search_vector'
+
+# (version_id, product_id, headings, text_content)
+FTSEntry = Tuple[int, str, str, str]
+
+
+class CRSFTSIndexer:
+    """
+    Queue of versions whose FTS rows need rewriting
+
+    Used by the single writer of a content run (not thread-safe). Entries
+    queued inside a savepoint are dropped again with rollback_to() when
+    that savepoint is rolled back, so flush() never indexes a version whose
+    row was not written.
+    """
+
+    def __init__(self):
+        self._pending: List[FTSEntry] = []
+
+    def queue(self, version_id: int, product_id: str, headings: str, text_content: str):
+        """Queue a version for the next flush (a later entry for the same version wins)"""
+        self._pending.append((version_id, product_id, headings, text_content))
+
+    def mark(self) -> int:
+        """Position to roll the queue back to (see rollback_to)"""
+        return len(self._pending)
+
+    def rollback_to(self, mark: int):
+        """Drop entries queued after mark"""
+        del self._pending[mark:]
+
+    def discard(self):
+        """Drop all queued entries (their transaction was rolled back)"""
+        self._pending = []
+
+    def take(self) -> List[FTSEntry]:
+        """Remove and return queued entries, one per version"""
+        latest: Dict[int, FTSEntry] = {}
+        for entry in self._pending:
+            latest[entry[0]] = entry
+        self._pending = []
+        return list(latest.values())
+
+    def flush(self, conn) -> int:
+        """
+        Write all queued entries on conn (the caller commits)
+
+        Returns:
+            Number of FTS rows written
+        """
+        return self.write(conn, self.take())
+
+    @staticmethod
+    def write(conn, entries: List[FTSEntry]) -> int:
+        """
+        Upsert FTS rows for entries in bulk
+
+        Titles are read from products in the same statement.
+
+        Returns:
+            Number of FTS rows written
+        """
+        if not entries:
+            return 0
+
+        cursor = conn.cursor()
+        psycopg2.extras.execute_values(cursor, """
+            INSERT INTO product_content_fts (product_id, version_id, title, headings, text_content)
+            SELECT v.product_id, v.version_id,
+                   COALESCE((SELECT p.title FROM products p WHERE p.product_id = v.product_id), ''),
+                   v.headings, v.text_content
+            FROM (VALUES %s) AS v(version_id, product_id, headings, text_content)
+            ON CONFLICT (product_id, version_id) DO UPDATE
+            SET title = EXCLUDED.title,
+                headings = EXCLUDED.headings,
+                text_content = EXCLUDED.text_content
+        """, entries, template='(%s::integer, %s, %s, %s)', page_size=FTS_PAGE_SIZE)
+
+        logger.debug(f"Indexed {len(entries)} versions in product_content_fts")
+        return len(entries)
+
+    @staticmethod
+    def drop_search_index(conn):
+        """Drop the GIN index ahead of a bulk load"""
+        conn.cursor().execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX_NAME}")
+
+    @staticmethod
+    def create_search_index(conn):
+        """Build the GIN index (no-op if it exists)"""
+        cursor = conn.cursor()
+        cursor.execute(f"SET LOCAL maintenance_work_mem = '{INDEX_BUILD_MEMORY}'")
+        cursor.execute(f"""
+            CREATE INDEX IF NOT EXISTS {SEARCH_INDEX_NAME}
+            ON product_content_fts USING GIN(search_vector)
+        """)
+        cursor.execute("ANALYZE product_content_fts")
+
+    def rebuild(self, conn) -> int:
+        """
+        Recompute every FTS row offline: refresh titles and search vectors
+        with the GIN index dropped, then build the index once
+
+        Returns:
+            Number of FTS rows rebuilt
+        """
+        self.drop_search_index(conn)
+
+        cursor = conn.cursor()
+        # The trigger recomputes search_vector for every updated row
+        cursor.execute("""
+            UPDATE product_content_fts c
+            SET title = COALESCE(p.title, '')
+            FROM products p
+            WHERE p.product_id = c.product_id
+        """)
+        rows = cursor.rowcount
+
+        self.create_search_index(conn)
+        logger.info(f"✓ Rebuilt {rows:,} product_content_fts rows and {SEARCH_INDEX_NAME}")
+        return rows
@@ -0,0 +1,187 @@
+"""
+Streaming exports for the browse pages
+
+Export endpoints used to fetch every row, build the whole file in memory and
+only then respond. These helpers keep memory constant instead:
+
+- rows are read in FETCH_SIZE batches through a named (server-side) cursor,
+  or SQLAlchemy yield_per for ORM queries
+- rows are encoded to CSV or NDJSON as they arrive and handed to the web
+  server in ~FLUSH_BYTES pieces (wrap with Flask's stream_with_context)
+- gzip is applied on the fly when requested
+
+Usage:
+
+    body = start_stream(export_stream(columns, rows(), fmt, compress))
+    Response(stream_with_context(body), mimetype=..., headers=...)
+
+where rows() is a generator that opens the connection and yields from
+iter_named_cursor(conn, sql, params).
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+# Rows fetched from the database per round trip
+FETCH_SIZE = 2000
+
+# Bytes collected before handing a piece to the web server
+FLUSH_BYTES = 64 * 1024
+
+# format -> (mimetype, file extension)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+def iter_named_cursor(conn, sql: str, params: Sequence[Any] = (), fetch_size: int = FETCH_SIZE,
+                      name: str = 'export_cursor') -> Iterator[Any]:
+    """
+    Stream query results through a PostgreSQL server-side cursor
+
+    Args:
+        conn: psycopg2 connection (inside a transaction; not autocommit)
+        sql: Query to stream
+        params: Query parameters
+        fetch_size: Rows per round trip
+        name: Cursor name (unique per connection)
+
+    Yields:
+        Rows as produced by the connection's cursor factory
+    """
+    with conn.cursor(name=name) as cursor:
+        cursor.itersize = fetch_size
+        cursor.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield from rows
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoding for database values"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return str(value)
+
+
+def _csv_pieces(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= FLUSH_BYTES:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_pieces(columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> Iterator[str]:
+    lines, size = [], 0
+    for row in rows:
+        line = json.dumps(dict(zip(columns, row)), default=_json_default, ensure_ascii=False)
+        lines.append(line)
+        size += len(line) + 1
+        if size >= FLUSH_BYTES:
+            yield '\n'.join(lines) + '\n'
+            lines, size = [], 0
+    if lines:
+        yield '\n'.join(lines) + '\n'
+
+
+def gzip_stream(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream into a single gzip member, piece by piece"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for piece in pieces:
+        compressed = compressor.compress(piece)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def export_stream(columns: Sequence[str], rows: Iterable[Sequence[Any]], fmt: str = 'csv',
+                  compress: bool = False) -> Iterator[bytes]:
+    """
+    Encode rows as an export file, incrementally
+
+    Args:
+        columns: Column names (CSV header / NDJSON keys)
+        rows: Value sequences in column order
+        fmt: 'csv' or 'ndjson'
+        compress: gzip the output
+
+    Yields:
+        Encoded pieces of the file
+    """
+    pieces = _ndjson_pieces(columns, rows) if fmt == 'ndjson' else _csv_pieces(columns, rows)
+    encoded = (piece.encode('utf-8') for piece in pieces if piece)
+    return gzip_stream(encoded) if compress else encoded
+
+
+def start_stream(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Run a stream up to its first piece, then hand back the whole stream
+
+    Connection and query errors then raise in the view, which can still
+    answer with an error status; once the response has started they can
+    only truncate the download.
+    """
+    pieces = iter(pieces)
+    first = next(pieces, b'')
+
+    def stream():
+        try:
+            yield first
+            yield from pieces
+        finally:
+            # Release the cursor/connection even if the client disconnects
+            close = getattr(pieces, 'close', None)
+            if close:
+                close()
+
+    return stream()
+
+
+def export_format(args) -> Tuple[str, bool]:
+    """Requested (format, gzip) from request args ?format=csv|ndjson&gzip=1"""
+    fmt = (args.get('format') or 'csv').lower()
+    if fmt not in EXPORT_FORMATS:
+        fmt = 'csv'
+    return fmt, str(args.get('gzip', '')).lower() in ('1', 'true', 'yes')
+
+
+def export_response_headers(basename: str, fmt: str, compress: bool) -> Tuple[str, Dict[str, str]]:
+    """
+    Mimetype and headers for a streamed export download
+
+    Returns:
+        (mimetype, headers)
+    """
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    filename = f'{basename}.{extension}'
+    if compress:
+        mimetype, filename = 'application/gzip', filename + '.gz'
+    return mimetype, {
+        'Content-Disposition': f'attachment; filename={filename}',
+        # Stop proxies from buffering the whole body
+        'X-Accel-Buffering': 'no',
+    }
+
+
+def limit_arg(args, name: str = 'limit') -> Optional[int]:
+    """Optional positive row limit from request args"""
+    try:
+        value = int(args.get(name, 0))
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
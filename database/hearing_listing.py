@@ -0,0 +1,208 @@
+"""
+Denormalized hearing listing for the /hearings browse page
+
+Resolving the display committee of a hearing (primary link preferred, any
+link otherwise, shown as its parent when it is a subcommittee) takes several
+joins and a correlated subquery per row. hearing_listing stores the result
+once per hearing so the browse page becomes a single indexed range scan.
+
+Missing dates, times and update stamps are stored as the pagination
+sentinels (NULL_DATE, NULL_TIME, NULL_TIMESTAMP), so the default browse order
+is served by idx_hearing_listing_sort as is, without COALESCE in the query;
+the browse page turns them back into NULL for display.
+
+Rows are refreshed by event_id whenever an importer or updater writes
+hearings or their committee links. Build or rebuild the whole table with
+'python cli.py database build-hearing-listing'. Until the table exists,
+source() returns the same resolution as a subquery so the page keeps working.
+"""
+import time
+from typing import Iterable, List, Optional
+
+from config.logging_config import get_logger
+from database.pagination import NULL_DATE, NULL_TIME, NULL_TIMESTAMP
+
+logger = get_logger(__name__)
+
+# Event ids per refresh statement
+REFRESH_CHUNK_SIZE = 500
+
+# Seconds between re-checks while the table is missing
+AVAILABILITY_RECHECK = 300
+
+LISTING_COLUMNS = (
+    'hearing_id', 'event_id', 'congress', 'chamber', 'title', 'hearing_type', 'status',
+    'hearing_date_only', 'hearing_time', 'committee_id', 'committee_name', 'subcommittee_id',
+    'updated_at'
+)
+
+# Index serving the default browse order and its keyset predicate
+SORT_INDEX = 'idx_hearing_listing_sort'
+
+# One row per hearing. The linked committee is the primary one (lowest id on
+# ties), else the lowest linked committee; subcommittees are shown under
+# their parent and kept in subcommittee_id for filtering and search.
+LISTING_SELECT = f'''
+    SELECT h.hearing_id, h.event_id, h.congress, h.chamber, h.title, h.hearing_type, h.status,
+           COALESCE(h.hearing_date_only, '{NULL_DATE}') AS hearing_date_only,
+           COALESCE(h.hearing_time, '{NULL_TIME}') AS hearing_time,
+           COALESCE(parent.committee_id, c.committee_id) AS committee_id,
+           COALESCE(parent.name, c.name) AS committee_name,
+           CASE WHEN parent.committee_id IS NOT NULL THEN c.committee_id END AS subcommittee_id,
+           COALESCE(h.updated_at, '{NULL_TIMESTAMP}') AS updated_at
+    FROM hearings h
+    LEFT JOIN committees c ON c.committee_id = (
+        SELECT hc.committee_id FROM hearing_committees hc
+        WHERE hc.hearing_id = h.hearing_id
+        ORDER BY CASE WHEN hc.is_primary THEN 0 ELSE 1 END, hc.committee_id
+        LIMIT 1
+    )
+    LEFT JOIN committees parent ON parent.committee_id = c.parent_committee_id
+'''
+
+LISTING_DDL = [
+    '''
+    CREATE TABLE IF NOT EXISTS hearing_listing (
+        hearing_id INTEGER PRIMARY KEY,
+        event_id TEXT NOT NULL UNIQUE,
+        congress INTEGER NOT NULL,
+        chamber TEXT NOT NULL,
+        title TEXT NOT NULL,
+        hearing_type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        hearing_date_only DATE NOT NULL,
+        hearing_time TIME NOT NULL,
+        committee_id INTEGER,
+        committee_name TEXT,
+        subcommittee_id INTEGER,
+        updated_at TIMESTAMP NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_hearing_listing_browse ON hearing_listing(hearing_date_only, chamber, committee_id)',
+    'CREATE INDEX IF NOT EXISTS idx_hearing_listing_committee ON hearing_listing(committee_id, hearing_date_only)',
+    f'CREATE INDEX IF NOT EXISTS {SORT_INDEX} '
+    f'ON hearing_listing(hearing_date_only, hearing_time, updated_at, hearing_id)',
+]
+
+
+class HearingListing:
+    """
+    Maintains and serves the hearing_listing table
+
+    Works with DatabaseManager and UnifiedDatabaseManager.
+    """
+
+    def __init__(self, db):
+        """
+        Initialize hearing listing
+
+        Args:
+            db: DatabaseManager or UnifiedDatabaseManager instance
+        """
+        self.db = db
+        self.is_postgres = getattr(db, 'is_postgres', None) or getattr(db, 'db_type', 'sqlite') == 'postgres'
+        self._available = False
+        self._checked_at = 0.0
+
+    def build(self) -> int:
+        """
+        Create the table and indexes if needed and repopulate every row
+
+        Returns:
+            Number of hearings listed
+        """
+        with self.db.transaction() as conn:
+            for statement in LISTING_DDL:
+                conn.execute(statement)
+            conn.execute('DELETE FROM hearing_listing')
+            conn.execute(f"INSERT INTO hearing_listing ({', '.join(LISTING_COLUMNS)}) {LISTING_SELECT}")
+            row = conn.execute('SELECT COUNT(*) FROM hearing_listing').fetchone()
+
+        self._available = True
+        total = list(row.values())[0] if isinstance(row, dict) else row[0]
+        logger.info(f"Hearing listing built with {total} hearings")
+        return total
+
+    def is_available(self) -> bool:
+        """
+        Check whether the table is built (missing results are re-checked periodically)
+
+        Tables built before the sentinels were stored lack SORT_INDEX and
+        count as missing until the next build.
+        """
+        if self._available or time.time() - self._checked_at < AVAILABILITY_RECHECK:
+            return self._available
+
+        self._checked_at = time.time()
+        try:
+            if self.is_postgres:
+                row = self.db.fetch_one(
+                    "SELECT 1 AS present FROM pg_indexes WHERE tablename = 'hearing_listing' AND indexname = ?",
+                    (SORT_INDEX,)
+                )
+            else:
+                row = self.db.fetch_one(
+                    "SELECT 1 AS present FROM sqlite_master WHERE type = 'index' AND name = ?", (SORT_INDEX,)
+                )
+            self._available = bool(row)
+        except Exception as e:
+            logger.warning(f"Could not check hearing listing: {e}")
+            self._available = False
+
+        if not self._available:
+            logger.warning("Hearing listing not built - resolving committees per request. "
+                           "Run 'python cli.py database build-hearing-listing'")
+        return self._available
+
+    def refresh(self, event_ids: Iterable[str], conn=None) -> int:
+        """
+        Recompute the listing rows of specific hearings
+
+        Hearings that no longer exist are removed from the listing.
+
+        Args:
+            event_ids: API event ids of hearings whose data or committee links changed
+            conn: Open connection to refresh within (a new transaction otherwise)
+
+        Returns:
+            Number of event ids refreshed
+        """
+        ids = sorted({str(event_id) for event_id in event_ids if event_id})
+        if not ids or not self.is_available():
+            return 0
+
+        if conn is None:
+            with self.db.transaction() as conn:
+                self._refresh_rows(conn, ids)
+        else:
+            self._refresh_rows(conn, ids)
+
+        logger.debug(f"Refreshed hearing listing for {len(ids)} hearings")
+        return len(ids)
+
+    def _refresh_rows(self, conn, event_ids: List[str]) -> None:
+        """Replace listing rows for event ids, in chunks"""
+        columns = ', '.join(LISTING_COLUMNS)
+        for start in range(0, len(event_ids), REFRESH_CHUNK_SIZE):
+            chunk = event_ids[start:start + REFRESH_CHUNK_SIZE]
+            placeholders = ', '.join('?' * len(chunk))
+            conn.execute(f'DELETE FROM hearing_listing WHERE event_id IN ({placeholders})', chunk)
+            conn.execute(f'INSERT INTO hearing_listing ({columns}) {LISTING_SELECT} '
+                         f'WHERE h.event_id IN ({placeholders})', chunk)
+
+    def source(self) -> str:
+        """
+        FROM-clause source for browse queries
+
+        Returns:
+            'hearing_listing', or an equivalent subquery while the table is missing
+        """
+        if self.is_available():
+            return 'hearing_listing'
+        return f'({LISTING_SELECT})'
+
+    def refresh_all_if_available(self) -> Optional[int]:
+        """Rebuild every row if the table exists (after bulk imports or committee changes)"""
+        if not self.is_available():
+            return None
+        return self.build()
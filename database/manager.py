@@ -11,6 +11,7 @@ from pathlib import Path
 
 from config.settings import settings
 from config.logging_config import get_logger
+from database.witness_identity import WitnessIdentityMixin, witness_key, WITNESS_IDENTITY_INDEX_SQL
 
 logger = get_logger(__name__)
 
@@ -18,13 +19,24 @@ logger = get_logger(__name__)
 try:
     import psycopg2
     import psycopg2.extras
+    from database.postgres_config import get_pooled_connection
     POSTGRES_AVAILABLE = True
 except ImportError:
     POSTGRES_AVAILABLE = False
     logger.warning("psycopg2 not installed - PostgreSQL support disabled")
 
+# Rows per multi-row statement and values per IN (...) lookup in bulk writes
+BULK_CHUNK_SIZE = 500
 
-class DatabaseManager:
+# Hearing columns written by bulk_upsert_hearings (event_id must stay first)
+BULK_HEARING_COLUMNS = (
+    'event_id', 'congress', 'chamber', 'title', 'hearing_type', 'status', 'hearing_date',
+    'hearing_date_only', 'hearing_time', 'location', 'jacket_number', 'url', 'congress_gov_url',
+    'video_url', 'youtube_video_id', 'video_type', 'update_date'
+)
+
+
+class DatabaseManager(WitnessIdentityMixin):
     """Manages database operations with transaction support for SQLite and PostgreSQL"""
 
     def __init__(self, db_path: Optional[str] = None, postgres_url: Optional[str] = None):
@@ -40,6 +52,9 @@ class DatabaseManager:
         self.postgres_url = postgres_url or os.getenv('POSTGRES_URL') or os.getenv('DATABASE_URL')
         self.db_path = db_path or settings.database_path
 
+        # Witness identity resolution (see WitnessIdentityMixin)
+        self._init_witness_identity()
+
         # Set database type
         self.is_postgres = bool(self.postgres_url and POSTGRES_AVAILABLE)
 
@@ -58,9 +73,8 @@ class DatabaseManager:
     def get_connection(self):
         """Get database connection with row factory"""
         if self.is_postgres:
-            conn = psycopg2.connect(self.postgres_url)
-            # Use RealDictCursor for dict-like row access
-            return conn
+            # Shared process-wide pool; close() returns the connection
+            return get_pooled_connection(self.postgres_url)
         else:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
@@ -475,25 +489,22 @@ class DatabaseManager:
         return self.fetch_one(query, (bioguide_id,))
 
     # Hearing operations
-    def upsert_hearing(self, hearing_data: Dict[str, Any]) -> int:
+    @staticmethod
+    def _split_hearing_date(date_value: Any) -> Tuple[Optional[str], Optional[str]]:
         """
-        Insert or update hearing record using proper UPDATE to avoid foreign key violations
+        Split a hearing date into ISO date and time strings
 
         Args:
-            hearing_data: Hearing data dictionary
+            date_value: datetime, date or ISO string
 
         Returns:
-            Hearing ID
+            Tuple of (date, time); time is None for date-only values
         """
-        event_id = hearing_data.get('event_id')
-
-        # Parse hearing_date into separate date and time fields
         hearing_date_only = None
         hearing_time = None
-        if hearing_data.get('hearing_date'):
+        if date_value:
             try:
-                from datetime import datetime, date as dt_date, time as dt_time
-                date_value = hearing_data['hearing_date']
+                from datetime import datetime, date as dt_date
 
                 # Handle datetime objects (already parsed)
                 if isinstance(date_value, datetime):
@@ -516,7 +527,24 @@ class DatabaseManager:
                     hearing_date_only = dt.date().isoformat()
                     hearing_time = dt.time().isoformat()
             except Exception as e:
-                logger.warning(f"Failed to parse hearing_date '{hearing_data.get('hearing_date')}': {e}")
+                logger.warning(f"Failed to parse hearing_date '{date_value}': {e}")
+
+        return hearing_date_only, hearing_time
+
+    def upsert_hearing(self, hearing_data: Dict[str, Any]) -> int:
+        """
+        Insert or update hearing record using proper UPDATE to avoid foreign key violations
+
+        Args:
+            hearing_data: Hearing data dictionary
+
+        Returns:
+            Hearing ID
+        """
+        event_id = hearing_data.get('event_id')
+
+        # Parse hearing_date into separate date and time fields
+        hearing_date_only, hearing_time = self._split_hearing_date(hearing_data.get('hearing_date'))
 
         # Check if hearing exists
         existing = self.get_hearing_by_event_id(event_id)
@@ -604,145 +632,61 @@ class DatabaseManager:
         query = "SELECT * FROM hearings WHERE event_id = ?"
         return self.fetch_one(query, (event_id,))
 
-    # Witness operations
-    @staticmethod
-    def _normalize_witness_name(full_name: str) -> str:
+    # Witness operations (get_or_create_witness: see WitnessIdentityMixin)
+    def backfill_witness_normalized_names(self) -> Dict[str, int]:
         """
-        Normalize witness name by removing titles and honorifics.
-
-        This ensures witnesses are deduplicated even when names have different prefixes
-        (e.g., "The Honorable John Smith" == "John Smith" == "Mr. John Smith")
-
-        Args:
-            full_name: Original full name from API
-
-        Returns:
-            Normalized name without titles
-        """
-        if not full_name:
-            return ''
-
-        # Remove common titles and honorifics
-        normalized = full_name
-        titles = [
-            'The Honorable ',
-            'The Hon. ',
-            'Honorable ',
-            'Hon. ',
-            'Mr. ',
-            'Ms. ',
-            'Mrs. ',
-            'Miss ',
-            'Dr. ',
-            'Prof. ',
-            'Professor ',
-            'Sen. ',
-            'Senator ',
-            'Rep. ',
-            'Representative ',
-            'Gov. ',
-            'Governor ',
-            'Lt. Gov. ',
-            'Lieutenant Governor ',
-            'Atty. Gen. ',
-            'Attorney General ',
-            'Sec. ',
-            'Secretary ',
-            'Director ',
-            'Administrator ',
-            'Commissioner ',
-            'Chief ',
-            'Gen. ',
-            'General ',
-            'Admiral ',
-            'Colonel ',
-            'Major ',
-            'Captain ',
-            'Lieutenant ',
-            'Sergeant '
-        ]
-
-        for title in titles:
-            if normalized.startswith(title):
-                normalized = normalized[len(title):]
-                break  # Only remove first matching title
-
-        return normalized.strip()
-
-    def get_or_create_witness(self, witness_data: Dict[str, Any]) -> int:
-        """
-        Get existing witness or create new one, with name normalization to prevent duplicates.
-
-        Matches witnesses by:
-        1. Normalized name + organization (primary method - handles title variations)
-        2. Exact last name + first name + organization (fallback)
-
-        This prevents duplicates like:
-        - "John Smith" vs "The Honorable John Smith"
-        - "Jane Doe" vs "Dr. Jane Doe"
+        Add and populate witnesses.normalized_name, then create the identity index
 
-        Args:
-            witness_data: Witness data dictionary
+        Safe to re-run. When several existing witnesses share one identity key,
+        the oldest keeps it and the others are left NULL (and reported) so the
+        unique index can be built; merge them with the duplicate cleanup script.
 
         Returns:
-            Witness ID
+            Dictionary with total, updated and duplicates counts
         """
-        full_name = witness_data.get('full_name', '')
-        last_name = witness_data.get('last_name', '')
-        first_name = witness_data.get('first_name', '')
-        organization = witness_data.get('organization', '')
+        with self.transaction() as conn:
+            if not self._has_witness_identity_column():
+                conn.execute("ALTER TABLE witnesses ADD COLUMN normalized_name TEXT")
+                logger.info("Added witnesses.normalized_name column")
+
+            rows = conn.execute(
+                "SELECT witness_id, full_name, organization, normalized_name FROM witnesses ORDER BY witness_id"
+            ).fetchall()
+
+            claimed = set()
+            clear, assign = [], []
+            duplicates = 0
+            for witness_id, full_name, organization, current in (tuple(r) for r in rows):
+                key = witness_key(full_name, organization)
+                if key in claimed:
+                    duplicates += 1
+                    if current is not None:
+                        clear.append((None, witness_id))
+                    continue
+                claimed.add(key)
+                if current != key[0]:
+                    assign.append((key[0], witness_id))
+
+            # Release keys held by duplicates before handing them to canonical rows
+            update_query = self._convert_query("UPDATE witnesses SET normalized_name = ? WHERE witness_id = ?")
+            for updates in (clear, assign):
+                if not updates:
+                    continue
+                if self.is_postgres:
+                    psycopg2.extras.execute_batch(conn._conn.cursor(), update_query, updates, page_size=BULK_CHUNK_SIZE)
+                else:
+                    conn._conn.executemany(update_query, updates)
 
-        # Normalize the name for matching
-        normalized_name = self._normalize_witness_name(full_name)
+            conn.execute(WITNESS_IDENTITY_INDEX_SQL)
 
-        # Try to find existing witness by normalized name and organization
-        # This query checks if any existing witness has the same normalized name
-        query = """
-        SELECT witness_id, full_name FROM witnesses
-        WHERE COALESCE(organization, '') = COALESCE(?, '')
-        """
-
-        params = [organization]
-        candidates = self.fetch_all(query, tuple(params))
-
-        # Check each candidate for normalized name match
-        for candidate in candidates:
-            candidate_normalized = self._normalize_witness_name(candidate['full_name'])
-            if candidate_normalized == normalized_name:
-                logger.debug(f"Found existing witness {candidate['witness_id']}: '{candidate['full_name']}' matches '{full_name}'")
-                return candidate['witness_id']
-
-        # Fallback: Try matching by exact last_name + first_name + organization
-        # This catches cases where the names are structured differently
-        if last_name and first_name:
-            fallback_query = """
-            SELECT witness_id FROM witnesses
-            WHERE last_name = ? AND first_name = ?
-            AND COALESCE(organization, '') = COALESCE(?, '')
-            """
+        self._witness_identity_available = True
+        self._witness_cache.clear()
 
-            existing = self.fetch_one(fallback_query, (last_name, first_name, organization))
-            if existing:
-                logger.debug(f"Found existing witness {existing['witness_id']} by last/first name match")
-                return existing['witness_id']
+        if duplicates:
+            logger.warning(f"{duplicates} witnesses share a normalized name and organization with an older "
+                           f"record and were left without normalized_name")
 
-        # No match found - create new witness
-        insert_query = """
-        INSERT INTO witnesses (first_name, last_name, full_name, title, organization)
-        VALUES (?, ?, ?, ?, ?)
-        """
-
-        params = (
-            first_name,
-            last_name,
-            full_name,  # Store original full name with titles
-            witness_data.get('title'),
-            organization
-        )
-
-        witness_id = self.execute_insert(insert_query, params, 'witness_id')
-        logger.debug(f"Created new witness {witness_id}: '{full_name}'")
-        return witness_id
+        return {'total': len(rows), 'updated': len(assign) + len(clear), 'duplicates': duplicates}
 
     # Bill operations
     def upsert_bill(self, bill_data: Dict[str, Any]) -> int:
@@ -897,6 +841,302 @@ class DatabaseManager:
             """
             return self.execute_insert(query, params, 'appearance_id')
 
+    # Bulk operations
+    def bulk_upsert_hearings(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Upsert a batch of hearings with their committee, bill and witness links
+
+        The whole batch is written in one transaction with multi-row statements
+        (execute_values on PostgreSQL, executemany on SQLite), so the number of
+        statements depends on the number of tables touched, not on the number
+        of hearings.
+
+        Args:
+            records: List of dictionaries with keys:
+                hearing: Parsed hearing data (event_id and congress required)
+                committees: Optional list of {'system_code', 'is_primary'} references
+                bills: Optional list of bill references (congress, bill_type, bill_number, ...)
+                witnesses: Optional list of (witness_data, appearance_data) pairs
+
+        Returns:
+            Mapping of event_id to hearing_id for every hearing in the batch
+        """
+        records = [r for r in records if r.get('hearing') and r['hearing'].get('event_id')]
+        if not records:
+            return {}
+
+        # Resolve schema capabilities before opening the write transaction
+        self._has_witness_identity_column()
+
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            hearing_ids = self._bulk_write_hearings(cursor, records)
+            self._bulk_write_committee_links(cursor, records, hearing_ids)
+            self._bulk_write_bill_links(cursor, records, hearing_ids)
+            self._bulk_write_witness_appearances(cursor, records, hearing_ids)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        logger.debug(f"Bulk upserted {len(hearing_ids)} hearings")
+        return hearing_ids
+
+    def _bulk_execute(self, cursor, query: str, rows: List[Tuple], template: str) -> None:
+        """
+        Run a multi-row write
+
+        Args:
+            cursor: Open cursor
+            query: Statement with a single 'VALUES %s' slot
+            rows: Parameter tuples
+            template: Row template using %s placeholders, e.g. '(%s, %s, CURRENT_TIMESTAMP)'
+        """
+        if not rows:
+            return
+
+        if self.is_postgres:
+            psycopg2.extras.execute_values(cursor, query, rows, template=template, page_size=BULK_CHUNK_SIZE)
+        else:
+            cursor.executemany(query.replace('VALUES %s', 'VALUES ' + template.replace('%s', '?')), rows)
+
+    def _bulk_select(self, cursor, query: str, values: List[Any], params: Tuple = ()) -> List[Tuple]:
+        """
+        Run a lookup query in chunks of IN (...) values
+
+        Args:
+            cursor: Open cursor
+            query: Statement with an 'IN ({})' slot for the chunk placeholders and
+                   ? placeholders for params
+            values: Values to look up
+            params: Extra parameters that precede the IN values
+
+        Returns:
+            All matching rows as tuples
+        """
+        query = self._convert_query(query)
+        placeholder = '%s' if self.is_postgres else '?'
+        values = list(dict.fromkeys(values))
+        rows = []
+
+        for start in range(0, len(values), BULK_CHUNK_SIZE):
+            chunk = values[start:start + BULK_CHUNK_SIZE]
+            cursor.execute(query.format(', '.join(placeholder for _ in chunk)), tuple(params) + tuple(chunk))
+            rows.extend(tuple(row) for row in cursor.fetchall())
+
+        return rows
+
+    def _bulk_write_hearings(self, cursor, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Upsert hearing rows and return the event_id to hearing_id map"""
+        # Last occurrence wins; ON CONFLICT cannot touch the same row twice in one statement
+        rows_by_event = {}
+        for record in records:
+            hearing_data = record['hearing']
+            hearing_date_only, hearing_time = self._split_hearing_date(hearing_data.get('hearing_date'))
+            rows_by_event[hearing_data['event_id']] = tuple(
+                hearing_date_only if column == 'hearing_date_only'
+                else hearing_time if column == 'hearing_time'
+                else hearing_data.get(column)
+                for column in BULK_HEARING_COLUMNS
+            )
+
+        columns = ', '.join(BULK_HEARING_COLUMNS)
+        assignments = ', '.join(f"{column} = excluded.{column}" for column in BULK_HEARING_COLUMNS[1:])
+        query = f"""
+        INSERT INTO hearings ({columns}, updated_at)
+        VALUES %s
+        ON CONFLICT (event_id) DO UPDATE SET {assignments}, updated_at = CURRENT_TIMESTAMP
+        """
+        template = '(' + ', '.join('%s' for _ in BULK_HEARING_COLUMNS) + ', CURRENT_TIMESTAMP)'
+        self._bulk_execute(cursor, query, list(rows_by_event.values()), template)
+
+        rows = self._bulk_select(
+            cursor, "SELECT event_id, hearing_id FROM hearings WHERE event_id IN ({})", list(rows_by_event)
+        )
+        return {event_id: hearing_id for event_id, hearing_id in rows}
+
+    def _bulk_write_committee_links(self, cursor, records: List[Dict[str, Any]], hearing_ids: Dict[str, int]) -> None:
+        """Link hearings to committees referenced by system code"""
+        system_codes = [ref['system_code'] for record in records
+                        for ref in record.get('committees') or [] if ref.get('system_code')]
+        if not system_codes:
+            return
+
+        committee_ids = dict(self._bulk_select(
+            cursor, "SELECT system_code, committee_id FROM committees WHERE system_code IN ({})", system_codes
+        ))
+
+        links = {}
+        for record in records:
+            hearing_id = hearing_ids.get(record['hearing']['event_id'])
+            for ref in record.get('committees') or []:
+                committee_id = committee_ids.get(ref.get('system_code'))
+                if hearing_id and committee_id:
+                    links[(hearing_id, committee_id)] = bool(ref.get('is_primary', True))
+
+        self._bulk_execute(cursor, """
+        INSERT INTO hearing_committees (hearing_id, committee_id, is_primary)
+        VALUES %s
+        ON CONFLICT (hearing_id, committee_id) DO UPDATE SET is_primary = excluded.is_primary
+        """, [(hid, cid, is_primary) for (hid, cid), is_primary in links.items()], '(%s, %s, %s)')
+
+    def _bulk_write_bill_links(self, cursor, records: List[Dict[str, Any]], hearing_ids: Dict[str, int]) -> None:
+        """Upsert referenced bills and link them to hearings"""
+        bills = {}
+        for record in records:
+            for ref in record.get('bills') or []:
+                if ref.get('congress') and ref.get('bill_type') and ref.get('bill_number'):
+                    bills[(ref['congress'], ref['bill_type'], ref['bill_number'])] = ref
+        if not bills:
+            return
+
+        # Keep titles already filled in by import_bills_from_hearings
+        self._bulk_execute(cursor, """
+        INSERT INTO bills (congress, bill_type, bill_number, title, url, introduced_date, updated_at)
+        VALUES %s
+        ON CONFLICT (congress, bill_type, bill_number) DO UPDATE SET
+            title = COALESCE(excluded.title, bills.title),
+            url = COALESCE(excluded.url, bills.url),
+            introduced_date = COALESCE(excluded.introduced_date, bills.introduced_date),
+            updated_at = CURRENT_TIMESTAMP
+        """, [
+            (congress, bill_type, bill_number, ref.get('title'), ref.get('url'), ref.get('introduced_date'))
+            for (congress, bill_type, bill_number), ref in bills.items()
+        ], '(%s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)')
+
+        bill_ids = {}
+        for congress in {key[0] for key in bills}:
+            rows = self._bulk_select(
+                cursor,
+                "SELECT bill_type, bill_number, bill_id FROM bills WHERE congress = ? AND bill_number IN ({})",
+                [key[2] for key in bills if key[0] == congress],
+                params=(congress,)
+            )
+            for bill_type, bill_number, bill_id in rows:
+                bill_ids[(congress, bill_type, bill_number)] = bill_id
+
+        links = {}
+        for record in records:
+            hearing_id = hearing_ids.get(record['hearing']['event_id'])
+            for ref in record.get('bills') or []:
+                bill_id = bill_ids.get((ref.get('congress'), ref.get('bill_type'), ref.get('bill_number')))
+                if hearing_id and bill_id:
+                    links[(hearing_id, bill_id)] = ref.get('relationship_type', 'mentioned')
+
+        self._bulk_execute(cursor, """
+        INSERT INTO hearing_bills (hearing_id, bill_id, relationship_type)
+        VALUES %s
+        ON CONFLICT (hearing_id, bill_id) DO UPDATE SET relationship_type = excluded.relationship_type
+        """, [(hid, bid, relationship) for (hid, bid), relationship in links.items()], '(%s, %s, %s)')
+
+    def _bulk_resolve_witnesses(self, cursor, witnesses: List[Dict[str, Any]]) -> Tuple[Dict[Tuple, int], Dict[Tuple, int]]:
+        """
+        Load existing witnesses that could match a set of incoming witnesses
+
+        Returns:
+            (by identity key, by (organization, last name, first name)) maps
+        """
+        by_key, by_first_last = {}, {}
+
+        if self._has_witness_identity_column():
+            rows = self._bulk_select(cursor, """
+            SELECT witness_id, normalized_name, COALESCE(organization, '') FROM witnesses
+            WHERE normalized_name IN ({})
+            """, [witness_key(w.get('full_name', ''), w.get('organization'))[0] for w in witnesses])
+            for witness_id, normalized_name, organization in rows:
+                by_key[(normalized_name, organization)] = witness_id
+        else:
+            rows = self._bulk_select(cursor, """
+            SELECT witness_id, full_name, COALESCE(organization, '') FROM witnesses
+            WHERE COALESCE(organization, '') IN ({})
+            ORDER BY witness_id
+            """, [w.get('organization') or '' for w in witnesses])
+            for witness_id, full_name, organization in rows:
+                by_key.setdefault(witness_key(full_name, organization), witness_id)
+
+        last_names = [w['last_name'] for w in witnesses if w.get('last_name') and w.get('first_name')]
+        if last_names:
+            rows = self._bulk_select(cursor, """
+            SELECT witness_id, COALESCE(organization, ''), last_name, first_name FROM witnesses
+            WHERE last_name IN ({})
+            ORDER BY witness_id
+            """, last_names)
+            for witness_id, organization, last_name, first_name in rows:
+                by_first_last.setdefault((organization, last_name, first_name), witness_id)
+
+        return by_key, by_first_last
+
+    def _bulk_write_witness_appearances(self, cursor, records: List[Dict[str, Any]],
+                                        hearing_ids: Dict[str, int]) -> None:
+        """Get or create witnesses (same matching rules as get_or_create_witness) and link appearances"""
+        pairs = [(record['hearing']['event_id'], witness_data, appearance_data)
+                 for record in records
+                 for witness_data, appearance_data in record.get('witnesses') or []]
+        if not pairs:
+            return
+
+        def match(witness_data, by_key, by_first_last):
+            organization = witness_data.get('organization') or ''
+            witness_id = by_key.get(witness_key(witness_data.get('full_name', ''), organization))
+            if witness_id is None and witness_data.get('last_name') and witness_data.get('first_name'):
+                witness_id = by_first_last.get((organization, witness_data['last_name'], witness_data['first_name']))
+            return witness_id
+
+        by_key, by_first_last = self._bulk_resolve_witnesses(cursor, [w for _, w, _ in pairs])
+
+        # Insert each unmatched witness once, then reload to pick up the new IDs
+        new_witnesses = {}
+        for _, witness_data, _ in pairs:
+            if match(witness_data, by_key, by_first_last) is None:
+                key = witness_key(witness_data.get('full_name', ''), witness_data.get('organization'))
+                new_witnesses.setdefault(key, witness_data)
+
+        if new_witnesses:
+            rows = [
+                (w.get('first_name', ''), w.get('last_name', ''), w.get('full_name', ''),
+                 w.get('title'), w.get('organization', ''))
+                for w in new_witnesses.values()
+            ]
+            if self._has_witness_identity_column():
+                self._bulk_execute(cursor, """
+                INSERT INTO witnesses (first_name, last_name, full_name, title, organization, normalized_name)
+                VALUES %s
+                """, [row + (key[0],) for row, key in zip(rows, new_witnesses)], '(%s, %s, %s, %s, %s, %s)')
+            else:
+                self._bulk_execute(cursor, """
+                INSERT INTO witnesses (first_name, last_name, full_name, title, organization)
+                VALUES %s
+                """, rows, '(%s, %s, %s, %s, %s)')
+
+            new_by_key, new_by_first_last = self._bulk_resolve_witnesses(cursor, list(new_witnesses.values()))
+            by_key.update(new_by_key)
+            for key, witness_id in new_by_first_last.items():
+                by_first_last.setdefault(key, witness_id)
+            logger.debug(f"Created {len(new_witnesses)} new witnesses")
+
+        appearances = {}
+        for event_id, witness_data, appearance_data in pairs:
+            hearing_id = hearing_ids.get(event_id)
+            witness_id = match(witness_data, by_key, by_first_last)
+            if hearing_id and witness_id:
+                appearances[(witness_id, hearing_id)] = (
+                    appearance_data.get('position'),
+                    appearance_data.get('witness_type'),
+                    appearance_data.get('appearance_order')
+                )
+
+        self._bulk_execute(cursor, """
+        INSERT INTO witness_appearances (witness_id, hearing_id, position, witness_type, appearance_order)
+        VALUES %s
+        ON CONFLICT (witness_id, hearing_id) DO UPDATE SET
+            position = excluded.position,
+            witness_type = excluded.witness_type,
+            appearance_order = excluded.appearance_order
+        """, [key + values for key, values in appearances.items()], '(%s, %s, %s, %s, %s)')
+
     # Sync tracking
     def record_sync(self, entity_type: str, status: str, records_processed: int = 0, errors_count: int = 0, notes: str = None) -> None:
         """Record sync operation status"""
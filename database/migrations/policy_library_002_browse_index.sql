@@ -0,0 +1,9 @@
+-- PostgreSQL Migration: Policy library browse index
+-- Date: 2026-10-16
+-- Description: Serve the policy library browse order and keyset cursor
+--              (COALESCE(publication_date, NULL_DATE) DESC, document_id DESC) from one index
+--
+-- Apply with: psql DATABASE_URL -f database/migrations/policy_library_002_browse_index.sql
+
+CREATE INDEX IF NOT EXISTS idx_documents_browse
+    ON documents ((COALESCE(publication_date, '0001-01-01')), document_id);
@@ -0,0 +1,12 @@
+-- PostgreSQL Migration: Incremental CRS -> Policy Library sync
+-- Date: 2026-10-16
+-- Description: Index the change timestamps read by CRSPolicyLibrarySync.sync_incremental
+--
+-- Apply with: psql DATABASE_URL -f database/migrations/postgres_004_crs_sync_watermark.sql
+
+-- Products changed since the sync watermark
+CREATE INDEX IF NOT EXISTS idx_products_updated_at ON products(updated_at, product_id);
+
+-- Versions ingested since the sync watermark (idx_versions_ingested already covers
+-- ingested_at; kept here so the migration is self-contained on older databases)
+CREATE INDEX IF NOT EXISTS idx_versions_ingested ON product_versions(ingested_at);
@@ -0,0 +1,9 @@
+-- PostgreSQL Migration: CRS raw HTML fingerprint
+-- Date: 2026-10-16
+-- Description: Store the fingerprint of each version's fetched HTML so unchanged
+--              pages are skipped before parsing, R2 upload and FTS indexing
+--
+-- Apply with: psql DATABASE_URL -f database/migrations/postgres_005_crs_source_hash.sql
+
+-- SHA256 of the raw fetched HTML (see fetchers.crs_content_fetcher.source_fingerprint)
+ALTER TABLE product_versions ADD COLUMN IF NOT EXISTS source_hash VARCHAR(64);
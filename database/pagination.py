@@ -0,0 +1,399 @@
+"""
+Keyset pagination and cached counts for browse pages
+
+LIMIT/OFFSET pagination reads and discards every row before the requested
+page, and a COUNT(*) over the filtered query rescans the whole result on
+each request. Browse pages instead:
+
+- page with a cursor: the sort key values of the last (or first) row shown,
+  so the next page starts with an indexed comparison rather than an offset.
+  Previous/Next links carry the cursor. Jumping straight to a numbered page
+  still uses OFFSET.
+- cache counts per filter combination for COUNT_TTL seconds, and use the
+  PostgreSQL planner estimate (pg_class.reltuples) for large unfiltered views.
+
+Sort keys must never be NULL (store a sentinel, or wrap nullable columns in
+COALESCE with one) and the last key must be unique, e.g. the primary key.
+When every key sorts the same way the cursor predicate is a row-value
+comparison, so an index on the key columns serves both the order and the
+predicate; COALESCE keys need a matching expression index for that.
+"""
+import base64
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Seconds a filtered count is reused
+COUNT_TTL = 60
+
+# Maximum number of cached counts (least recently used are dropped)
+COUNT_CACHE_SIZE = 1024
+
+# Tables smaller than this are counted exactly even when unfiltered
+ESTIMATE_MIN_ROWS = 10000
+
+# Sort key sentinels for nullable columns (sort below every real value)
+NULL_DATE = '0001-01-01'
+NULL_TIMESTAMP = '0001-01-01 00:00:00'
+NULL_TIME = '00:00:00'
+NULL_TEXT = ''
+
+PLACEHOLDERS = {
+    'qmark': lambda i: '?',
+    'format': lambda i: '%s',
+    'named': lambda i: f':k{i}',
+}
+
+
+def fetch_scalar(conn, sql: str, params: Sequence[Any] = ()) -> Any:
+    """
+    Run a query and return the first column of its first row
+
+    Works with sqlite3 connections, the database manager wrappers (execute
+    returns a cursor) and DB-API cursors (execute returns None).
+    """
+    cursor = conn.execute(sql, params)
+    if cursor is None:
+        cursor = conn
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return list(row.values())[0] if isinstance(row, dict) else row[0]
+
+
+class CountCache:
+    """Thread-safe TTL cache of result counts keyed by page and filters"""
+
+    def __init__(self, ttl: int = COUNT_TTL, max_entries: int = COUNT_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Tuple[float, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], int]) -> int:
+        """
+        Return a cached count, computing and storing it if missing or expired
+
+        Args:
+            key: Page name plus every filter value that affects the count
+            compute: Callable returning the exact count
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        count = compute()
+
+        with self._lock:
+            self._entries[key] = (now + self.ttl, count)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return count
+
+    def clear(self) -> None:
+        """Drop all cached counts"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every blueprint in the process
+count_cache = CountCache()
+
+
+def estimated_count(conn, table: str, paramstyle: str = 'qmark') -> Optional[int]:
+    """
+    PostgreSQL planner estimate of a table's row count
+
+    Args:
+        conn: Connection or cursor on a PostgreSQL database
+        table: Table name
+        paramstyle: 'qmark' or 'format', matching conn
+
+    Returns:
+        Estimated rows, or None when the table is small or never analyzed
+    """
+    placeholder = PLACEHOLDERS[paramstyle](0)
+    try:
+        estimate = fetch_scalar(conn, f'SELECT reltuples FROM pg_class WHERE oid = to_regclass({placeholder})',
+                                (table,))
+    except Exception as e:
+        logger.debug(f"Row estimate unavailable for {table}: {e}")
+        return None
+
+    if estimate is None or estimate < ESTIMATE_MIN_ROWS:
+        return None
+    return int(estimate)
+
+
+def cached_count(conn, key: Hashable, count_sql: str, params: Sequence[Any] = (),
+                 estimate_table: Optional[str] = None, paramstyle: str = 'qmark') -> int:
+    """
+    Count a filtered result, reusing recent counts for the same filters
+
+    Args:
+        conn: Connection or cursor to count with
+        key: Page name plus every filter value that affects the count
+        count_sql: Query returning the exact count
+        params: Parameters for count_sql
+        estimate_table: Table whose planner estimate may stand in for the
+            count (pass only when the view is unfiltered, PostgreSQL only)
+        paramstyle: Placeholder style of conn
+    """
+    def compute() -> int:
+        if estimate_table:
+            estimate = estimated_count(conn, estimate_table, paramstyle)
+            if estimate is not None:
+                return estimate
+        return fetch_scalar(conn, count_sql, params) or 0
+
+    return count_cache.get_or_compute(key, compute)
+
+
+class KeysetPager:
+    """
+    Keyset pagination state for one request
+
+    Usage with raw SQL:
+
+        pager = KeysetPager(keys, per_page, request.args, signature=f'{sort_by}:{sort_order}')
+        sql, params = pager.wrap(base_sql, params)
+        rows = pager.finish(conn.execute(sql, params).fetchall())
+
+    then link Next with page=page + 1, after=pager.next_cursor and Previous
+    with page=page - 1, before=pager.prev_cursor.
+    """
+
+    def __init__(self, keys: List[Tuple[str, str]], per_page: int, args: Dict[str, Any],
+                 signature: str = '', paramstyle: str = 'qmark'):
+        """
+        Initialize pager from request arguments
+
+        Args:
+            keys: (SQL expression, 'ASC' or 'DESC') sort keys; the last must be unique
+            per_page: Rows per page
+            args: Request arguments (page, after, before)
+            signature: Identifies the sort; cursors from another sort are ignored
+            paramstyle: 'qmark' (?), 'format' (%s) or 'named' (:k0)
+        """
+        self.keys = keys
+        self.per_page = per_page
+        self.signature = signature
+        self.paramstyle = paramstyle
+
+        try:
+            self.page = max(int(args.get('page', 1)), 1)
+        except (TypeError, ValueError):
+            self.page = 1
+
+        self.cursor_values = None
+        self.backward = False
+        for name, backward in (('after', False), ('before', True)):
+            values = self.decode_cursor(args.get(name))
+            if values is not None:
+                self.cursor_values, self.backward = values, backward
+                break
+
+        self.next_cursor = None
+        self.prev_cursor = None
+        self.has_next = False
+        self.has_prev = self.page > 1
+
+    # ------------------------------------------------------------------
+    # Cursor tokens
+    # ------------------------------------------------------------------
+
+    def encode_cursor(self, values: Sequence[Any]) -> str:
+        """Encode sort key values as an opaque URL-safe token"""
+        raw = json.dumps([self.signature, list(values)], default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, token: Optional[str]) -> Optional[List[Any]]:
+        """Decode a token from encode_cursor; None if missing, malformed or for another sort"""
+        if not token:
+            return None
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            signature, values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        except (ValueError, TypeError):
+            return None
+        if signature != self.signature or not isinstance(values, list) or len(values) != len(self.keys):
+            return None
+        return values
+
+    # ------------------------------------------------------------------
+    # Query building
+    # ------------------------------------------------------------------
+
+    def _directions(self) -> List[str]:
+        """Key directions for this request (reversed when paging backward)"""
+        flip = {'ASC': 'DESC', 'DESC': 'ASC'}
+        return [flip[d.upper()] if self.backward else d.upper() for _, d in self.keys]
+
+    def order_by(self) -> str:
+        """ORDER BY clause body for this request"""
+        return ', '.join(f'{expr} {direction}' for (expr, _), direction in zip(self.keys, self._directions()))
+
+    def where(self) -> Tuple[str, Any]:
+        """
+        Predicate selecting rows past the cursor
+
+        Returns:
+            (SQL or '' without a cursor, parameters as a list, or a dict for 'named')
+        """
+        if self.cursor_values is None:
+            return '', {} if self.paramstyle == 'named' else []
+
+        placeholder = PLACEHOLDERS[self.paramstyle]
+        directions = self._directions()
+
+        if len(set(directions)) == 1:
+            # (k1, k2, ...) > (v1, v2, ...) - an index on the keys serves it as a range.
+            # The redundant k1 >= v1 lets SQLite seek expression indexes as well.
+            operator = '>' if directions[0] == 'ASC' else '<'
+            columns = ', '.join(expr for expr, _ in self.keys)
+            marks = ', '.join(placeholder(i + 1) for i in range(len(self.keys)))
+            sql = (f'({self.keys[0][0]} {operator}= {placeholder(0)} '
+                   f'AND ({columns}) {operator} ({marks}))')
+            values = [self.cursor_values[0]] + list(self.cursor_values)
+            if self.paramstyle == 'named':
+                return sql, {f'k{i}': value for i, value in enumerate(values)}
+            return sql, values
+
+        clauses, values = [], []
+        index = 0
+
+        # (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ... - handles mixed directions
+        for depth, ((expr, _), direction) in enumerate(zip(self.keys, directions)):
+            parts = []
+            for (eq_expr, _), value in zip(self.keys[:depth], self.cursor_values[:depth]):
+                parts.append(f'{eq_expr} = {placeholder(index)}')
+                values.append(value)
+                index += 1
+            operator = '>' if direction == 'ASC' else '<'
+            parts.append(f'{expr} {operator} {placeholder(index)}')
+            values.append(self.cursor_values[depth])
+            index += 1
+            clauses.append('(' + ' AND '.join(parts) + ')')
+
+        sql = '(' + ' OR '.join(clauses) + ')'
+        if self.paramstyle == 'named':
+            return sql, {f'k{i}': value for i, value in enumerate(values)}
+        return sql, values
+
+    @property
+    def limit(self) -> int:
+        """Rows to fetch (one extra shows whether another page follows)"""
+        return self.per_page + 1
+
+    @property
+    def offset(self) -> int:
+        """OFFSET for numbered page jumps (0 when paging by cursor)"""
+        return 0 if self.cursor_values is not None else (self.page - 1) * self.per_page
+
+    def key_columns(self) -> str:
+        """Select list exposing the sort key values as _k0, _k1, ..."""
+        return ', '.join(f'{expr} AS _k{i}' for i, (expr, _) in enumerate(self.keys))
+
+    def _limit_clause(self, sql: str, params: Any, where_params: Any) -> Tuple[str, Any]:
+        """Append LIMIT/OFFSET and combine the parameters (a dict for 'named')"""
+        if self.paramstyle == 'named':
+            sql += ' LIMIT :page_limit OFFSET :page_offset'
+            return sql, {**params, **where_params, 'page_limit': self.limit, 'page_offset': self.offset}
+        placeholder = PLACEHOLDERS[self.paramstyle]
+        sql += f' LIMIT {placeholder(0)} OFFSET {placeholder(1)}'
+        return sql, list(params) + list(where_params) + [self.limit, self.offset]
+
+    def wrap(self, base_sql: str, params: Any) -> Tuple[str, Any]:
+        """
+        Page a query; sort key expressions refer to its output columns
+
+        Returned rows carry the key values as trailing columns, which
+        finish() reads.
+
+        Args:
+            base_sql: Query to page
+            params: Its parameters (a dict for 'named')
+        """
+        where, where_params = self.where()
+        sql = (f'SELECT page.*, {self.key_columns()} FROM ({base_sql}) page'
+               f'{" WHERE " + where if where else ""} ORDER BY {self.order_by()}')
+        return self._limit_clause(sql, params, where_params)
+
+    def wrap_grouped(self, select_sql: str, from_sql: str, group_by: str, params: Any,
+                     aggregate_keys: bool = False) -> Tuple[str, Any]:
+        """
+        Page a GROUP BY query with the cursor predicate inside it
+
+        wrap() filters the output of the whole aggregate. Here sort key
+        expressions refer to the source columns, and the predicate goes into
+        WHERE so only the groups past the cursor are aggregated - or into
+        HAVING when a key is an aggregate. Returned rows carry the key values
+        as trailing columns, as with wrap().
+
+        Args:
+            select_sql: 'SELECT <columns>'
+            from_sql: 'FROM ... WHERE ...' (must end in a WHERE clause)
+            group_by: 'GROUP BY ...'
+            params: Parameters of from_sql (a dict for 'named')
+            aggregate_keys: True if any sort key is an aggregate
+        """
+        where, where_params = self.where()
+        sql = f'{select_sql}, {self.key_columns()} {from_sql}'
+        if where and not aggregate_keys:
+            sql += f' AND {where}'
+        sql += f' {group_by}'
+        if where and aggregate_keys:
+            sql += f' HAVING {where}'
+        sql += f' ORDER BY {self.order_by()}'
+        return self._limit_clause(sql, params, where_params)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def _row_key(self, row) -> List[Any]:
+        """Trailing _k columns of a row produced by wrap()"""
+        count = len(self.keys)
+        if isinstance(row, dict):
+            return [row[f'_k{i}'] for i in range(count)]
+        size = len(row)
+        return [row[size - count + i] for i in range(count)]
+
+    def finish(self, rows: Sequence[Any], key_getter: Optional[Callable[[Any], Sequence[Any]]] = None) -> List[Any]:
+        """
+        Trim the lookahead row, restore display order and set the cursors
+
+        Args:
+            rows: Rows fetched with limit/offset/order_by from this pager
+            key_getter: Returns a row's sort key values (default: wrap() columns)
+
+        Returns:
+            Rows of the page in display order
+        """
+        rows = list(rows)
+        more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if self.backward:
+            rows.reverse()
+            self.has_prev = more
+            self.has_next = True
+        else:
+            self.has_next = more
+            self.has_prev = self.page > 1 or self.cursor_values is not None
+
+        if rows:
+            get_key = key_getter or self._row_key
+            self.next_cursor = self.encode_cursor(get_key(rows[-1])) if self.has_next else None
+            self.prev_cursor = self.encode_cursor(get_key(rows[0])) if self.has_prev else None
+        return rows
@@ -1,13 +1,25 @@
 """
 PostgreSQL Configuration and Connection Management
 Handles database connections with connection pooling for CRS database
+
+All PostgreSQL entry points (DatabaseManager, UnifiedDatabaseManager, the CRS
+blueprint and content managers) check connections out of one process-wide
+pool per database URL via get_pooled_connection().
 """
 import os
+import threading
+import time
+from typing import Dict, Any
 from sqlalchemy import create_engine, event
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 import psycopg2
 
+# Process-wide pools, keyed by database URL
+_pool_lock = threading.Lock()
+_pooled_engines = {}
+_pool_counters = {}
+
 
 def get_database_url():
     """
@@ -28,24 +40,34 @@ def get_database_url():
         )
 
     # Fix for some hosting platforms that use postgres:// instead of postgresql://
+    return normalize_database_url(database_url)
+
+
+def normalize_database_url(database_url):
+    """Use the postgresql:// scheme SQLAlchemy expects"""
     if database_url.startswith('postgres://'):
         database_url = database_url.replace('postgres://', 'postgresql://', 1)
-
     return database_url
 
 
-def create_postgres_engine(pool_size=5, max_overflow=10):
+def create_postgres_engine(pool_size=5, max_overflow=10, database_url=None, pool_recycle=300):
     """
     Create SQLAlchemy engine with connection pooling
 
     Args:
         pool_size: Number of connections to keep in pool
         max_overflow: Max connections beyond pool_size
+        database_url: Connection URL (defaults to CRS_DATABASE_URL / DATABASE_URL)
+        pool_recycle: Seconds after which a connection is replaced on checkout
 
     Returns:
         sqlalchemy.Engine: Database engine with connection pooling
     """
-    database_url = get_database_url()
+    database_url = normalize_database_url(database_url or get_database_url())
+
+    # Pin the psycopg2 driver; SQLAlchemy 2.1 defaults postgresql:// to psycopg 3
+    if database_url.startswith('postgresql://'):
+        database_url = database_url.replace('postgresql://', 'postgresql+psycopg2://', 1)
 
     # Create engine with optimized settings for serverless
     engine = create_engine(
@@ -54,7 +76,7 @@ def create_postgres_engine(pool_size=5, max_overflow=10):
         pool_size=pool_size,
         max_overflow=max_overflow,
         pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=300,  # Recycle connections after 5 minutes
+        pool_recycle=pool_recycle,  # Recycle connections after max lifetime
         echo=False,  # Set to True for SQL query logging
         connect_args={
             'connect_timeout': 10,
@@ -75,6 +97,110 @@ def create_postgres_engine(pool_size=5, max_overflow=10):
     return engine
 
 
+def get_pooled_engine(database_url=None):
+    """
+    Get the shared engine for a database URL, creating it on first use
+
+    Connections are pinged on checkout (pool_pre_ping) and replaced once they
+    are older than DB_POOL_RECYCLE seconds.
+
+    Args:
+        database_url: Connection URL (defaults to CRS_DATABASE_URL / DATABASE_URL)
+
+    Returns:
+        sqlalchemy.Engine: Process-wide engine for that URL
+    """
+    database_url = normalize_database_url(database_url or get_database_url())
+
+    with _pool_lock:
+        engine = _pooled_engines.get(database_url)
+        if engine is None:
+            from config.settings import settings
+
+            engine = create_postgres_engine(
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_pool_max_overflow,
+                database_url=database_url,
+                pool_recycle=settings.db_pool_recycle
+            )
+            _attach_pool_counters(engine, database_url)
+            _pooled_engines[database_url] = engine
+
+    return engine
+
+
+def _attach_pool_counters(engine, database_url):
+    """Count pool events for get_pool_stats()"""
+    counters = {'connects': 0, 'checkouts': 0, 'invalidations': 0, 'created_at': time.time()}
+    _pool_counters[database_url] = counters
+
+    @event.listens_for(engine, "connect")
+    def count_connect(dbapi_conn, connection_record):
+        counters['connects'] += 1
+
+    @event.listens_for(engine, "checkout")
+    def count_checkout(dbapi_conn, connection_record, connection_proxy):
+        counters['checkouts'] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def count_invalidate(dbapi_conn, connection_record, exception):
+        counters['invalidations'] += 1
+
+
+def get_pooled_connection(database_url=None):
+    """
+    Check out a psycopg2 connection from the shared pool
+
+    The returned connection behaves like a psycopg2 connection; close()
+    returns it to the pool (rolled back) instead of disconnecting.
+
+    Args:
+        database_url: Connection URL (defaults to CRS_DATABASE_URL / DATABASE_URL)
+
+    Returns:
+        Pool-proxied psycopg2 connection
+    """
+    return get_pooled_engine(database_url).raw_connection()
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """
+    Get metrics for every pool created in this process
+
+    Returns:
+        dict: Per-pool size, checked-in/out counts, overflow and event counters,
+              keyed by host/database (credentials are never included)
+    """
+    stats = {}
+    with _pool_lock:
+        pools = list(_pooled_engines.items())
+
+    for database_url, engine in pools:
+        pool = engine.pool
+        counters = _pool_counters.get(database_url, {})
+        stats[f"{engine.url.host}/{engine.url.database}"] = {
+            'pool_size': pool.size(),
+            'checked_in': pool.checkedin(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+            'connects': counters.get('connects', 0),
+            'checkouts': counters.get('checkouts', 0),
+            'invalidations': counters.get('invalidations', 0),
+            'uptime_seconds': round(time.time() - counters.get('created_at', time.time()), 1)
+        }
+
+    return stats
+
+
+def dispose_pools():
+    """Close all pooled connections (e.g. after fork or in tests)"""
+    with _pool_lock:
+        for engine in _pooled_engines.values():
+            engine.dispose()
+        _pooled_engines.clear()
+        _pool_counters.clear()
+
+
 def get_direct_connection():
     """
     Get a direct psycopg2 connection (for migrations and admin tasks)
@@ -97,7 +223,7 @@ def get_connection():
             cursor.execute("SELECT * FROM products")
             rows = cursor.fetchall()
     """
-    conn = get_direct_connection()
+    conn = get_pooled_connection()
     try:
         yield conn
         conn.commit()
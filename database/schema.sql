@@ -227,12 +227,14 @@ CREATE TABLE witnesses (
     full_name TEXT NOT NULL,
     title TEXT,                               -- Professional title
     organization TEXT,
+    normalized_name TEXT,                     -- full_name without titles; identity key with organization
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX idx_witnesses_name ON witnesses(last_name, first_name);
 CREATE INDEX idx_witnesses_org ON witnesses(organization);
+CREATE UNIQUE INDEX idx_witnesses_identity ON witnesses(normalized_name, COALESCE(organization, ''));
 
 -- 12. witness_appearances
 -- Junction entity representing a witness appearing at a specific hearing
@@ -431,4 +433,26 @@ CREATE TABLE schedule_execution_logs (
 
 CREATE INDEX idx_schedule_exec_schedule ON schedule_execution_logs(schedule_id);
 CREATE INDEX idx_schedule_exec_time ON schedule_execution_logs(execution_time);
-CREATE INDEX idx_schedule_exec_success ON schedule_execution_logs(success);
\ No newline at end of file
+CREATE INDEX idx_schedule_exec_success ON schedule_execution_logs(success);
+-- 21. hearing_listing
+-- Denormalized browse rows: one per hearing with its resolved display committee
+-- Maintained by database/hearing_listing.py (rebuild: cli.py database build-hearing-listing)
+CREATE TABLE hearing_listing (
+    hearing_id INTEGER PRIMARY KEY,           -- Same id as hearings.hearing_id
+    event_id TEXT NOT NULL UNIQUE,
+    congress INTEGER NOT NULL,
+    chamber TEXT NOT NULL,
+    title TEXT NOT NULL,
+    hearing_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    hearing_date_only DATE NOT NULL,
+    hearing_time TIME NOT NULL,
+    committee_id INTEGER,                     -- Display committee (parent of a subcommittee)
+    committee_name TEXT,
+    subcommittee_id INTEGER,                  -- Linked subcommittee, if any
+    updated_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_hearing_listing_browse ON hearing_listing(hearing_date_only, chamber, committee_id);
+CREATE INDEX idx_hearing_listing_committee ON hearing_listing(committee_id, hearing_date_only);
+CREATE INDEX idx_hearing_listing_sort ON hearing_listing(hearing_date_only, hearing_time, updated_at, hearing_id);
@@ -0,0 +1,265 @@
+"""
+Full-text search for the congressional tables
+
+Hearing titles, committee names, member names and witness names/organizations
+are indexed so search pages no longer run leading-wildcard LIKE scans:
+
+- PostgreSQL: generated tsvector column (search_vector) with a GIN index
+- SQLite: external-content FTS5 tables (<table>_fts) kept in sync by triggers
+
+Build or refresh the index with 'python cli.py database build-search-index'.
+Until it exists, SearchIndex falls back to the previous LIKE matching so the
+pages keep working.
+"""
+import re
+import time
+from typing import Any, Dict, List, Tuple
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Indexed tables: primary key, indexed columns, PostgreSQL text search config
+# and the ordering used by the LIKE fallback
+SEARCH_TABLES: Dict[str, Dict[str, Any]] = {
+    'hearings': {'key': 'hearing_id', 'columns': ('title',), 'config': 'english',
+                 'fallback_order': 'hearing_date DESC'},
+    'committees': {'key': 'committee_id', 'columns': ('name',), 'config': 'simple',
+                   'fallback_order': 'name'},
+    'members': {'key': 'member_id', 'columns': ('full_name',), 'config': 'simple',
+                'fallback_order': 'last_name, first_name'},
+    'witnesses': {'key': 'witness_id', 'columns': ('full_name', 'organization'), 'config': 'simple',
+                  'fallback_order': 'full_name'},
+}
+
+# Words used from a query; later words add little and slow the match down
+MAX_QUERY_TERMS = 8
+
+# Seconds between re-checks while the index is missing
+AVAILABILITY_RECHECK = 300
+
+_TERM_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def query_terms(text: str) -> List[str]:
+    """Split user input into lowercase word terms (punctuation and operators dropped)"""
+    return _TERM_RE.findall((text or '').lower())[:MAX_QUERY_TERMS]
+
+
+class SearchIndex:
+    """
+    Ranked full-text search over hearings, committees, members and witnesses
+
+    Works with DatabaseManager and UnifiedDatabaseManager. Every term is
+    matched as a prefix, so results update while the user is still typing.
+    """
+
+    def __init__(self, db):
+        """
+        Initialize search index
+
+        Args:
+            db: DatabaseManager or UnifiedDatabaseManager instance
+        """
+        self.db = db
+        self.is_postgres = getattr(db, 'is_postgres', None) or getattr(db, 'db_type', 'sqlite') == 'postgres'
+        self._available = False
+        self._checked_at = 0.0
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _ddl(self) -> List[str]:
+        """Statements that create (or keep) the index structures"""
+        statements = []
+
+        for table, spec in SEARCH_TABLES.items():
+            key, columns = spec['key'], spec['columns']
+
+            if self.is_postgres:
+                document = " || ' ' || ".join(f"coalesce({c}, '')" for c in columns)
+                statements.append(
+                    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+                    f"GENERATED ALWAYS AS (to_tsvector('{spec['config']}', {document})) STORED"
+                )
+                statements.append(
+                    f"CREATE INDEX IF NOT EXISTS idx_{table}_search ON {table} USING GIN (search_vector)"
+                )
+                continue
+
+            fts = f"{table}_fts"
+            column_list = ', '.join(columns)
+            new_values = ', '.join(f"new.{c}" for c in columns)
+            old_values = ', '.join(f"old.{c}" for c in columns)
+
+            statements.append(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{column_list}, content='{table}', content_rowid='{key}', "
+                f"tokenize='unicode61 remove_diacritics 2')"
+            )
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{key}, {new_values}); END"
+            )
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values}); END"
+            )
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column_list} ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{key}, {old_values}); "
+                f"INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{key}, {new_values}); END"
+            )
+            statements.append(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+        return statements
+
+    def build(self) -> None:
+        """Create the index structures and (re)index existing rows"""
+        conn = self.db.get_connection()
+        try:
+            cursor = conn.cursor()
+            for statement in self._ddl():
+                cursor.execute(statement)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+        self._available = True
+        logger.info(f"Search index built for {', '.join(SEARCH_TABLES)}")
+
+    def is_available(self) -> bool:
+        """Check whether the index has been built (missing results are re-checked periodically)"""
+        if self._available or time.time() - self._checked_at < AVAILABILITY_RECHECK:
+            return self._available
+
+        self._checked_at = time.time()
+        try:
+            if self.is_postgres:
+                row = self.db.fetch_one(
+                    "SELECT 1 AS present FROM information_schema.columns "
+                    "WHERE table_name = 'hearings' AND column_name = 'search_vector'"
+                )
+            else:
+                row = self.db.fetch_one(
+                    "SELECT 1 AS present FROM sqlite_master WHERE type = 'table' AND name = 'hearings_fts'"
+                )
+            self._available = bool(row)
+        except Exception as e:
+            logger.warning(f"Could not check search index: {e}")
+            self._available = False
+
+        if not self._available:
+            logger.warning("Search index not built - using LIKE matching. "
+                           "Run 'python cli.py database build-search-index'")
+        return self._available
+
+    # ------------------------------------------------------------------
+    # Query building
+    # ------------------------------------------------------------------
+
+    def match_ids_sql(self, table: str, text: str) -> Tuple[str, List[Any]]:
+        """
+        Subquery selecting the keys of all rows matching a search
+
+        Args:
+            table: One of SEARCH_TABLES
+            text: User search input
+
+        Returns:
+            (SQL selecting one key column, parameters) for use in 'x IN (...)'
+        """
+        sql, params = self._top_matches(table, text, limit=None)
+        return f"SELECT id FROM ({sql}) matched_{table}", params
+
+    def _top_matches(self, table: str, text: str, limit=None) -> Tuple[str, List[Any]]:
+        """
+        Subquery of matching rows as (id, score), best first
+
+        Scores are ascending (lower is better) for every backend.
+        """
+        spec = SEARCH_TABLES[table]
+        key, columns = spec['key'], spec['columns']
+        terms = query_terms(text)
+        limit_params = [limit] if limit else []
+
+        def top(order_by):
+            # Ordering only matters when the result is cut off
+            return f" ORDER BY {order_by} LIMIT ?" if limit else ''
+
+        if not terms:
+            return f"SELECT {key} AS id, 0 AS score FROM {table} WHERE 1 = 0", []
+
+        if not self.is_available():
+            where = ' OR '.join(f"{c} LIKE ?" for c in columns)
+            params = [f"%{text}%"] * len(columns)
+            return (f"SELECT {key} AS id, 0 AS score FROM {table} WHERE {where}"
+                    f"{top(spec['fallback_order'])}", params + limit_params)
+
+        if self.is_postgres:
+            tsquery = ' & '.join(f"{term}:*" for term in terms)
+            return (f"SELECT {key} AS id, -ts_rank(search_vector, q) AS score "
+                    f"FROM {table}, to_tsquery('{spec['config']}', ?) q "
+                    f"WHERE search_vector @@ q{top('score')}", [tsquery] + limit_params)
+
+        fts = f"{table}_fts"
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return (f"SELECT rowid AS id, rank AS score FROM {fts} "
+                f"WHERE {fts} MATCH ?{top('rank')}", [match] + limit_params)
+
+    # ------------------------------------------------------------------
+    # Ranked searches for the global search page
+    # ------------------------------------------------------------------
+
+    def search_committees(self, conn, text: str, limit: int = 10) -> List[Any]:
+        """Committees as (committee_id, name, chamber, type), best match first"""
+        matches, params = self._top_matches('committees', text, limit)
+        cursor = conn.execute(f'''
+            SELECT c.committee_id, c.name, c.chamber, c.type
+            FROM ({matches}) m
+            JOIN committees c ON c.committee_id = m.id
+            ORDER BY m.score, c.name
+        ''', params)
+        return cursor.fetchall()
+
+    def search_hearings(self, conn, text: str, limit: int = 10) -> List[Any]:
+        """Hearings as (hearing_id, title, hearing_date, committee_name), best match first"""
+        matches, params = self._top_matches('hearings', text, limit)
+        cursor = conn.execute(f'''
+            SELECT h.hearing_id, h.title, h.hearing_date, c.name as committee_name
+            FROM ({matches}) m
+            JOIN hearings h ON h.hearing_id = m.id
+            LEFT JOIN hearing_committees hc ON h.hearing_id = hc.hearing_id AND hc.is_primary = TRUE
+            LEFT JOIN committees c ON hc.committee_id = c.committee_id
+            ORDER BY m.score, h.hearing_date DESC NULLS LAST
+        ''', params)
+        return cursor.fetchall()
+
+    def search_members(self, conn, text: str, limit: int = 10) -> List[Any]:
+        """Members as (member_id, full_name, party, state, district), best match first"""
+        matches, params = self._top_matches('members', text, limit)
+        cursor = conn.execute(f'''
+            SELECT mb.member_id, mb.full_name, mb.party, mb.state, mb.district
+            FROM ({matches}) m
+            JOIN members mb ON mb.member_id = m.id
+            ORDER BY m.score, mb.last_name, mb.first_name
+        ''', params)
+        return cursor.fetchall()
+
+    def search_witnesses(self, conn, text: str, limit: int = 10) -> List[Any]:
+        """Witnesses as (witness_id, full_name, organization, witness_type, hearing_count), best match first"""
+        matches, params = self._top_matches('witnesses', text, limit)
+        cursor = conn.execute(f'''
+            SELECT w.witness_id, w.full_name, w.organization, MAX(wa.witness_type) as witness_type,
+                   COUNT(DISTINCT wa.hearing_id) as hearing_count
+            FROM ({matches}) m
+            JOIN witnesses w ON w.witness_id = m.id
+            LEFT JOIN witness_appearances wa ON w.witness_id = wa.witness_id
+            GROUP BY w.witness_id, w.full_name, w.organization, m.score
+            ORDER BY m.score, w.full_name
+        ''', params)
+        return cursor.fetchall()
@@ -13,12 +13,14 @@ from pathlib import Path
 try:
     import psycopg2
     import psycopg2.extras
+    from database.postgres_config import get_pooled_connection, get_pool_stats
     POSTGRES_AVAILABLE = True
 except ImportError:
     POSTGRES_AVAILABLE = False
 
 from config.settings import settings
 from config.logging_config import get_logger
+from database.witness_identity import WitnessIdentityMixin
 
 logger = get_logger(__name__)
 
@@ -74,7 +76,7 @@ class PostgresConnectionWrapper:
         self._conn.close()
 
 
-class UnifiedDatabaseManager:
+class UnifiedDatabaseManager(WitnessIdentityMixin):
     """
     Unified database manager supporting both SQLite and PostgreSQL
 
@@ -108,6 +110,9 @@ class UnifiedDatabaseManager:
         self.db_url = db_url
         self.db_type = self._detect_database_type(db_url)
 
+        # Witness identity resolution (see WitnessIdentityMixin)
+        self._init_witness_identity()
+
         logger.info(f"Initialized {self.db_type.upper()} database manager: {self._safe_url()}")
 
         if self.db_type == 'sqlite':
@@ -115,6 +120,11 @@ class UnifiedDatabaseManager:
         elif self.db_type == 'postgres' and not POSTGRES_AVAILABLE:
             raise ImportError("psycopg2 not installed. Run: pip install psycopg2-binary")
 
+    @property
+    def is_postgres(self) -> bool:
+        """True when connected to PostgreSQL (same flag as DatabaseManager)"""
+        return self.db_type == 'postgres'
+
     def _detect_database_type(self, url: str) -> str:
         """
         Detect database type from URL
@@ -158,7 +168,8 @@ class UnifiedDatabaseManager:
             conn.execute("PRAGMA foreign_keys = ON")
             return conn
         else:  # postgres
-            raw_conn = psycopg2.connect(self.db_url)
+            # Shared process-wide pool; close() returns the connection
+            raw_conn = get_pooled_connection(self.db_url)
             return PostgresConnectionWrapper(raw_conn, self)
 
     @contextmanager
@@ -339,7 +350,7 @@ class UnifiedDatabaseManager:
             counts = self.get_table_counts()
             total_records = sum(counts.values())
 
-            return {
+            result = {
                 'status': 'healthy',
                 'database_type': self.db_type,
                 'version': version,
@@ -347,6 +358,10 @@ class UnifiedDatabaseManager:
                 'total_records': total_records,
                 'url': self._safe_url()
             }
+            if self.db_type == 'postgres':
+                result['pool'] = get_pool_stats()
+
+            return result
 
         except Exception as e:
             return {
@@ -447,146 +462,7 @@ class UnifiedDatabaseManager:
                 cursor.execute(query, params)
                 return cursor.lastrowid
 
-    # Witness operations
-    @staticmethod
-    def _normalize_witness_name(full_name: str) -> str:
-        """
-        Normalize witness name by removing titles and honorifics.
-
-        This ensures witnesses are deduplicated even when names have different prefixes
-        (e.g., "The Honorable John Smith" == "John Smith" == "Mr. John Smith")
-
-        Args:
-            full_name: Original full name from API
-
-        Returns:
-            Normalized name without titles
-        """
-        if not full_name:
-            return ''
-
-        # Remove common titles and honorifics
-        normalized = full_name
-        titles = [
-            'The Honorable ',
-            'The Hon. ',
-            'Honorable ',
-            'Hon. ',
-            'Mr. ',
-            'Ms. ',
-            'Mrs. ',
-            'Miss ',
-            'Dr. ',
-            'Prof. ',
-            'Professor ',
-            'Sen. ',
-            'Senator ',
-            'Rep. ',
-            'Representative ',
-            'Gov. ',
-            'Governor ',
-            'Lt. Gov. ',
-            'Lieutenant Governor ',
-            'Atty. Gen. ',
-            'Attorney General ',
-            'Sec. ',
-            'Secretary ',
-            'Director ',
-            'Administrator ',
-            'Commissioner ',
-            'Chief ',
-            'Gen. ',
-            'General ',
-            'Admiral ',
-            'Colonel ',
-            'Major ',
-            'Captain ',
-            'Lieutenant ',
-            'Sergeant '
-        ]
-
-        for title in titles:
-            if normalized.startswith(title):
-                normalized = normalized[len(title):]
-                break  # Only remove first matching title
-
-        return normalized.strip()
-
-    def get_or_create_witness(self, witness_data: Dict[str, Any]) -> int:
-        """
-        Get existing witness or create new one, with name normalization to prevent duplicates.
-
-        Matches witnesses by:
-        1. Normalized name + organization (primary method - handles title variations)
-        2. Exact last name + first name + organization (fallback)
-
-        This prevents duplicates like:
-        - "John Smith" vs "The Honorable John Smith"
-        - "Jane Doe" vs "Dr. Jane Doe"
-
-        Args:
-            witness_data: Witness data dictionary
-
-        Returns:
-            Witness ID
-        """
-        full_name = witness_data.get('full_name', '')
-        last_name = witness_data.get('last_name', '')
-        first_name = witness_data.get('first_name', '')
-        organization = witness_data.get('organization', '')
-
-        # Normalize the name for matching
-        normalized_name = self._normalize_witness_name(full_name)
-
-        # Try to find existing witness by normalized name and organization
-        # This query checks if any existing witness has the same normalized name
-        query = """
-        SELECT witness_id, full_name FROM witnesses
-        WHERE COALESCE(organization, '') = COALESCE(?, '')
-        """
-
-        params = [organization]
-        candidates = self.fetch_all(query, tuple(params))
-
-        # Check each candidate for normalized name match
-        for candidate in candidates:
-            candidate_normalized = self._normalize_witness_name(candidate['full_name'])
-            if candidate_normalized == normalized_name:
-                logger.debug(f"Found existing witness {candidate['witness_id']}: '{candidate['full_name']}' matches '{full_name}'")
-                return candidate['witness_id']
-
-        # Fallback: Try matching by exact last_name + first_name + organization
-        # This catches cases where the names are structured differently
-        if last_name and first_name:
-            fallback_query = """
-            SELECT witness_id FROM witnesses
-            WHERE last_name = ? AND first_name = ?
-            AND COALESCE(organization, '') = COALESCE(?, '')
-            """
-
-            existing = self.fetch_one(fallback_query, (last_name, first_name, organization))
-            if existing:
-                logger.debug(f"Found existing witness {existing['witness_id']} by last/first name match")
-                return existing['witness_id']
-
-        # No match found - create new witness
-        insert_query = """
-        INSERT INTO witnesses (first_name, last_name, full_name, title, organization)
-        VALUES (?, ?, ?, ?, ?)
-        """
-
-        params = (
-            first_name,
-            last_name,
-            full_name,  # Store original full name with titles
-            witness_data.get('title'),
-            organization
-        )
-
-        witness_id = self.execute_insert(insert_query, params, 'witness_id')
-        logger.debug(f"Created new witness {witness_id}: '{full_name}'")
-        return witness_id
-
+    # Witness operations (get_or_create_witness: see WitnessIdentityMixin)
     def create_witness_appearance(self, witness_id: int, hearing_id: int, appearance_data: Dict[str, Any]) -> int:
         """Create witness appearance record"""
         params = (
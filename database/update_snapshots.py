@@ -0,0 +1,500 @@
+"""
+Update snapshots - undo a daily update without copying the database
+
+DailyUpdater used to copy the whole SQLite file before every run and copy it
+back to roll back, which costs O(database size) each day and is unsafe while
+connections are open (and did nothing on PostgreSQL). Snapshots instead
+record what a run changes:
+
+- journal (SQLite and PostgreSQL): while a run is active, triggers on the
+  hearing tables write one snapshot_journal row per changed row (operation,
+  table, key, before-image as JSON). Creating a snapshot is one INSERT and
+  restoring it replays the first before-image of every touched row with a
+  few set-based statements per table, so both scale with the change set.
+- backup (SQLite only): a full copy taken with SQLite's online backup API,
+  consistent even while other connections write; restore copies it back the
+  same way. For runs that also change the schema.
+
+A journal snapshot also serves as checkpoints inside a run: mark() returns
+the current journal position and rollback_to() undoes only what was
+journaled after it, leaving the run active.
+
+Runs that are never committed or restored (e.g. the process crashed) are
+marked 'interrupted' by the next create(); their journal is kept and can
+still be restored ('python cli.py update restore-snapshot RUN_ID').
+Restoring a run puts back its before-images regardless of what later runs
+changed, so restore() refuses while later runs are unrestored unless
+forced. prune() applies the retention policy.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SNAPSHOT_MODES = ('journal', 'backup', 'none')
+
+# Tables an update writes, parents first, with their key columns.
+# hearing_listing is derived but journaled too, so a restore leaves it consistent.
+JOURNALED_TABLES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('hearings', ('hearing_id',)),
+    ('witnesses', ('witness_id',)),
+    ('hearing_committees', ('hearing_id', 'committee_id')),
+    ('witness_appearances', ('appearance_id',)),
+    ('hearing_transcripts', ('transcript_id',)),
+    ('witness_documents', ('document_id',)),
+    ('supporting_documents', ('document_id',)),
+    ('hearing_listing', ('hearing_id',)),
+)
+
+SQLITE_DDL = [
+    '''
+    CREATE TABLE IF NOT EXISTS snapshot_runs (
+        run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        status TEXT NOT NULL,
+        location TEXT,
+        created_at TEXT NOT NULL,
+        finished_at TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS snapshot_journal (
+        entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER NOT NULL,
+        operation TEXT NOT NULL,
+        table_name TEXT NOT NULL,
+        row_key TEXT NOT NULL,
+        before_image TEXT
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_snapshot_journal_key ON snapshot_journal(run_id, table_name, row_key, entry_id)',
+]
+
+POSTGRES_DDL = [
+    '''
+    CREATE TABLE IF NOT EXISTS snapshot_runs (
+        run_id SERIAL PRIMARY KEY,
+        kind TEXT NOT NULL,
+        status TEXT NOT NULL,
+        location TEXT,
+        created_at TEXT NOT NULL,
+        finished_at TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS snapshot_journal (
+        entry_id BIGSERIAL PRIMARY KEY,
+        run_id INTEGER NOT NULL,
+        operation TEXT NOT NULL,
+        table_name TEXT NOT NULL,
+        row_key TEXT NOT NULL,
+        before_image TEXT
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_snapshot_journal_key ON snapshot_journal(run_id, table_name, row_key, entry_id)',
+    # One function for every journaled table; key columns are the trigger arguments
+    '''
+    CREATE OR REPLACE FUNCTION snapshot_journal_row() RETURNS trigger AS $$
+    DECLARE
+        key_row JSONB := CASE WHEN TG_OP = 'INSERT' THEN to_jsonb(NEW) ELSE to_jsonb(OLD) END;
+    BEGIN
+        INSERT INTO snapshot_journal (run_id, operation, table_name, row_key, before_image)
+        SELECT r.run_id, TG_OP, TG_TABLE_NAME,
+               (SELECT string_agg(key_row ->> k.col, '|' ORDER BY k.n)
+                FROM unnest(TG_ARGV) WITH ORDINALITY AS k(col, n)),
+               CASE WHEN TG_OP = 'INSERT' THEN NULL ELSE to_jsonb(OLD)::text END
+        FROM snapshot_runs r
+        WHERE r.status = 'active' AND r.kind = 'journal';
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    ''',
+]
+
+# First journal entry per touched row of a table after a journal position:
+# the row's state at that position (params: run_id, table_name, position)
+FIRST_ENTRIES = '''
+    SELECT j.row_key, j.operation, j.before_image FROM snapshot_journal j
+    WHERE j.run_id = ? AND j.table_name = ?
+      AND j.entry_id = (SELECT MIN(k.entry_id) FROM snapshot_journal k
+                        WHERE k.run_id = j.run_id AND k.table_name = j.table_name AND k.row_key = j.row_key
+                          AND k.entry_id > ?)
+'''
+
+
+class SnapshotError(Exception):
+    """A snapshot could not be created or restored"""
+    pass
+
+
+class Snapshot:
+    """A point an update can be rolled back to"""
+
+    def __init__(self, run_id: int, kind: str, location: Optional[str] = None):
+        self.run_id = run_id
+        self.kind = kind
+        self.location = location  # backup file (kind 'backup')
+
+    def __repr__(self) -> str:
+        return f"Snapshot(run_id={self.run_id}, kind={self.kind!r})"
+
+
+class UpdateSnapshots:
+    """
+    Creates, restores and prunes update snapshots
+
+    Usage:
+        snapshots = UpdateSnapshots(db, mode='journal')
+        snapshot = snapshots.create()
+        ... apply updates ...
+        snapshots.commit(snapshot)     # or snapshots.restore(snapshot)
+        snapshots.prune(days=7)
+    """
+
+    def __init__(self, db, mode: str = 'journal', backup_dir: Optional[Path] = None):
+        """
+        Initialize snapshots
+
+        Args:
+            db: UnifiedDatabaseManager (or DatabaseManager) instance
+            mode: 'journal', 'backup' (SQLite only) or 'none'
+            backup_dir: Directory for backup snapshots (default: backups/ next to the database)
+        """
+        if mode not in SNAPSHOT_MODES:
+            raise ValueError(f"Unknown snapshot mode: {mode}")
+
+        self.db = db
+        self.is_postgres = getattr(db, 'is_postgres', None) or getattr(db, 'db_type', 'sqlite') == 'postgres'
+        if mode == 'backup' and self.is_postgres:
+            logger.warning("Backup snapshots need SQLite - journaling PostgreSQL changes instead")
+            mode = 'journal'
+        self.mode = mode
+
+        self.db_path = None if self.is_postgres else str(getattr(db, 'db_url', None) or db.db_path)
+        self.backup_dir = Path(backup_dir) if backup_dir else (
+            Path(self.db_path).parent / 'backups' if self.db_path else None
+        )
+
+    def create(self) -> Optional[Snapshot]:
+        """
+        Start a snapshot; changes from now on can be undone with restore()
+
+        Returns:
+            Snapshot, or None in mode 'none'
+        """
+        if self.mode == 'none':
+            return None
+
+        with self.db.transaction() as conn:
+            self._ensure_schema(conn)
+
+            # Only one run of a kind is active at a time; leftovers are from crashed processes
+            for (run_id,) in conn.execute(
+                    "SELECT run_id FROM snapshot_runs WHERE status = 'active' AND kind = ?", (self.mode,)).fetchall():
+                logger.warning(f"Snapshot run {run_id} was never finished - marking it interrupted "
+                               f"(it can still be restored)")
+            conn.execute("UPDATE snapshot_runs SET status = 'interrupted', finished_at = ? "
+                         "WHERE status = 'active' AND kind = ?", (self._now(), self.mode))
+
+            if self.mode == 'journal':
+                self._install_triggers(conn)
+
+        location = self._backup_path() if self.mode == 'backup' else None
+        run_id = self._insert_run(self.mode, location)
+        snapshot = Snapshot(run_id, self.mode, location)
+
+        if self.mode == 'backup':
+            try:
+                self._copy_database(self.db_path, location)
+            except Exception as e:
+                self._finish(run_id, 'failed')
+                raise SnapshotError(f"Online backup failed: {e}") from e
+            logger.info(f"✓ Database backup created at {location}")
+        else:
+            logger.info(f"✓ Change journal started (snapshot run {run_id})")
+
+        return snapshot
+
+    def commit(self, snapshot: Snapshot) -> None:
+        """Stop journaling; the snapshot stays restorable until pruned"""
+        self._finish(snapshot.run_id, 'committed')
+
+    def restore(self, snapshot: Union[Snapshot, int], force: bool = False) -> int:
+        """
+        Undo every change recorded since the snapshot
+
+        Args:
+            snapshot: Snapshot or its run id (e.g. an interrupted run)
+            force: Restore even though later runs are not restored; their
+                changes to the same rows (all changes, for a backup) are lost
+
+        Returns:
+            Number of rows restored (journal) or pages copied (backup)
+
+        Raises:
+            SnapshotError: Run not found, backup missing, or later runs exist without force
+        """
+        run_id = snapshot if isinstance(snapshot, int) else snapshot.run_id
+        row = self.db.fetch_one('SELECT kind, status, location FROM snapshot_runs WHERE run_id = ?', (run_id,))
+        if not row:
+            raise SnapshotError(f"Snapshot run {run_id} not found")
+        kind, status, location = row['kind'], row['status'], row['location']
+
+        if status == 'restored':
+            logger.info(f"Snapshot run {run_id} already restored")
+            return 0
+
+        later = self.later_runs(run_id)
+        if later:
+            described = ', '.join(f"{run['run_id']} ({run['status']})" for run in later)
+            if not force:
+                raise SnapshotError(f"Snapshot run {run_id} is followed by runs {described}; restoring it "
+                                    f"would undo their changes. Restore those first or force the restore")
+            logger.warning(f"Restoring snapshot run {run_id} over later runs {described}")
+
+        if kind == 'backup':
+            if not location or not Path(location).exists():
+                raise SnapshotError(f"Backup file for snapshot run {run_id} not found")
+            pages = self._copy_database(location, self.db_path)
+            self._finish(run_id, 'restored')
+            self._invalidate_caches()
+            logger.info(f"✓ Database restored from {location}")
+            return pages
+
+        restored = self._replay(run_id, 0, 'restored')
+        logger.info(f"✓ Restored {restored} rows from snapshot run {run_id}")
+        return restored
+
+    def later_runs(self, run_id: int) -> List[Dict[str, object]]:
+        """Runs started after run_id that are not restored (their changes sit on top of it)"""
+        rows = self.db.fetch_all(
+            "SELECT run_id, kind, status FROM snapshot_runs WHERE run_id > ? "
+            "AND status IN ('active', 'committed', 'interrupted') ORDER BY run_id", (run_id,)
+        )
+        return [dict(row) for row in rows]
+
+    def mark(self, snapshot: Snapshot) -> int:
+        """
+        Current position in a journal snapshot (a checkpoint for rollback_to)
+
+        Returns:
+            Last journal entry id of the run (0 if nothing was journaled yet)
+        """
+        row = self.db.fetch_one('SELECT COALESCE(MAX(entry_id), 0) AS position FROM snapshot_journal '
+                                'WHERE run_id = ?', (snapshot.run_id,))
+        return row['position']
+
+    def rollback_to(self, snapshot: Snapshot, position: int) -> int:
+        """
+        Undo changes journaled after a mark(); the run stays active
+
+        Args:
+            snapshot: Active journal snapshot
+            position: Value returned by mark()
+
+        Returns:
+            Number of rows restored
+        """
+        if snapshot.kind != 'journal':
+            raise SnapshotError(f"Snapshot run {snapshot.run_id} has no change journal")
+        return self._replay(snapshot.run_id, position, 'active')
+
+    def prune(self, days: int = 7) -> int:
+        """
+        Drop finished snapshots older than days, with their journal and backup files
+
+        Args:
+            days: Number of days to keep snapshots
+
+        Returns:
+            Number of snapshots removed
+        """
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self.db.transaction() as conn:
+            self._ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT run_id, location FROM snapshot_runs WHERE status <> 'active' AND created_at < ?",
+                (cutoff,)
+            ).fetchall()
+            conn.execute("DELETE FROM snapshot_journal WHERE run_id IN "
+                         "(SELECT run_id FROM snapshot_runs WHERE status <> 'active' AND created_at < ?)", (cutoff,))
+            conn.execute("DELETE FROM snapshot_runs WHERE status <> 'active' AND created_at < ?", (cutoff,))
+
+        for _, location in rows:
+            if location:
+                Path(location).unlink(missing_ok=True)
+
+        if rows:
+            logger.info(f"Pruned {len(rows)} snapshot(s) older than {days} days")
+        return len(rows)
+
+    def list_runs(self, limit: int = 20) -> List[Dict[str, object]]:
+        """Most recent snapshot runs with their status"""
+        with self.db.transaction() as conn:
+            self._ensure_schema(conn)
+        rows = self.db.fetch_all(
+            'SELECT run_id, kind, status, location, created_at, finished_at FROM snapshot_runs '
+            'ORDER BY run_id DESC LIMIT ?', (limit,)
+        )
+        return [dict(row) for row in rows]
+
+    # -------------------------------------------------------------------------
+
+    def _ensure_schema(self, conn) -> None:
+        for statement in POSTGRES_DDL if self.is_postgres else SQLITE_DDL:
+            conn.execute(statement)
+
+    def _insert_run(self, kind: str, location: Optional[str]) -> int:
+        return self.db.execute_insert(
+            "INSERT INTO snapshot_runs (kind, status, location, created_at) VALUES (?, 'active', ?, ?)",
+            (kind, location, self._now()), 'run_id'
+        )
+
+    def _replay(self, run_id: int, position: int, status: str) -> int:
+        """Replay the journal after position in one transaction, leaving the run in status"""
+        with self.db.transaction() as conn:
+            # Stops the triggers journaling the restore itself
+            conn.execute("UPDATE snapshot_runs SET status = 'restoring' WHERE run_id = ?", (run_id,))
+            if not self.is_postgres:
+                # Rows are put back table by table; check references at commit
+                conn.execute('PRAGMA defer_foreign_keys = ON')
+            restored = self._replay_journal(conn, run_id, position)
+            conn.execute('UPDATE snapshot_runs SET status = ?, finished_at = ? WHERE run_id = ?',
+                         (status, None if status == 'active' else self._now(), run_id))
+        self._invalidate_caches()
+        return restored
+
+    def _invalidate_caches(self) -> None:
+        """Drop ids the database manager cached for rows a restore may have removed"""
+        if hasattr(self.db, 'clear_witness_cache'):
+            self.db.clear_witness_cache()
+
+    def _finish(self, run_id: int, status: str) -> None:
+        with self.db.transaction() as conn:
+            conn.execute('UPDATE snapshot_runs SET status = ?, finished_at = ? WHERE run_id = ?',
+                         (status, self._now(), run_id))
+
+    def _columns(self, conn, table: str) -> List[str]:
+        """Writable columns of a table ([] if it does not exist)"""
+        if self.is_postgres:
+            rows = conn.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = ? AND is_generated = 'NEVER' "
+                "ORDER BY ordinal_position", (table,)
+            ).fetchall()
+            return [row[0] for row in rows]
+        return [row[1] for row in conn.execute(f'PRAGMA table_info({table})').fetchall()]
+
+    @staticmethod
+    def _key_expr(keys: Tuple[str, ...], prefix: str) -> str:
+        """Text key of a row, as stored in snapshot_journal.row_key"""
+        return " || '|' || ".join(f'CAST({prefix}{key} AS TEXT)' for key in keys)
+
+    def _install_triggers(self, conn) -> None:
+        """(Re)create journal triggers so they match the current columns"""
+        for table, keys in JOURNALED_TABLES:
+            columns = self._columns(conn, table)
+            if not columns:
+                continue
+
+            if self.is_postgres:
+                args = ', '.join(f"'{key}'" for key in keys)
+                conn.execute(f'DROP TRIGGER IF EXISTS snapshot_journal_{table} ON {table}')
+                conn.execute(f'CREATE TRIGGER snapshot_journal_{table} '
+                             f'AFTER INSERT OR UPDATE OR DELETE ON {table} '
+                             f'FOR EACH ROW EXECUTE FUNCTION snapshot_journal_row({args})')
+                continue
+
+            before_image = 'json_object(' + ', '.join(f"'{column}', OLD.{column}" for column in columns) + ')'
+            for operation, row, image in (('INSERT', 'NEW', 'NULL'),
+                                          ('UPDATE', 'OLD', before_image),
+                                          ('DELETE', 'OLD', before_image)):
+                name = f'snapshot_journal_{table}_{operation.lower()}'
+                conn.execute(f'DROP TRIGGER IF EXISTS {name}')
+                conn.execute(f'''
+                    CREATE TRIGGER {name} AFTER {operation} ON {table}
+                    WHEN EXISTS (SELECT 1 FROM snapshot_runs WHERE status = 'active' AND kind = 'journal')
+                    BEGIN
+                        INSERT INTO snapshot_journal (run_id, operation, table_name, row_key, before_image)
+                        SELECT run_id, '{operation}', '{table}', {self._key_expr(keys, row + '.')}, {image}
+                        FROM snapshot_runs WHERE status = 'active' AND kind = 'journal';
+                    END
+                ''')
+
+    def _before_images(self, table: str, columns: List[str]) -> str:
+        """Query of (row_key, columns...) decoded from first journal entries"""
+        if self.is_postgres:
+            selected = ', '.join(f'r.{column}' for column in columns)
+            return (f'SELECT f.row_key, {selected} FROM ({FIRST_ENTRIES}) f, '
+                    f'jsonb_populate_record(NULL::{table}, f.before_image::jsonb) r '
+                    f"WHERE f.operation <> 'INSERT'")
+        selected = ', '.join(f"json_extract(f.before_image, '$.{column}') AS {column}" for column in columns)
+        return f"SELECT f.row_key, {selected} FROM ({FIRST_ENTRIES}) f WHERE f.operation <> 'INSERT'"
+
+    def _replay_journal(self, conn, run_id: int, position: int) -> int:
+        """Put every row touched after position back to its state at position"""
+        touched = {row[0] for row in conn.execute(
+            'SELECT DISTINCT table_name FROM snapshot_journal WHERE run_id = ? AND entry_id > ?', (run_id, position)
+        ).fetchall()}
+        tables = [(table, keys, self._columns(conn, table)) for table, keys in JOURNALED_TABLES
+                  if table in touched]
+        restored = 0
+
+        # Rows deleted since position come back first (parents before children),
+        # then changed rows are reset, then rows added since are removed
+        # (children before parents)
+        for table, keys, columns in tables:
+            column_list = ', '.join(columns)
+            cursor = conn.execute(
+                f'INSERT INTO {table} ({column_list}) SELECT {column_list} '
+                f'FROM ({self._before_images(table, columns)}) b '
+                f'WHERE NOT EXISTS (SELECT 1 FROM {table} t WHERE {self._key_expr(keys, "t.")} = b.row_key)',
+                (run_id, table, position)
+            )
+            restored += max(cursor.rowcount, 0)
+
+        for table, keys, columns in tables:
+            assignments = ', '.join(f'{column} = b.{column}' for column in columns if column not in keys)
+            if not assignments:
+                continue
+            cursor = conn.execute(
+                f'UPDATE {table} SET {assignments} FROM ({self._before_images(table, columns)}) b '
+                f'WHERE {self._key_expr(keys, table + ".")} = b.row_key',
+                (run_id, table, position)
+            )
+            restored += max(cursor.rowcount, 0)
+
+        for table, keys, _ in reversed(tables):
+            cursor = conn.execute(
+                f'DELETE FROM {table} WHERE {self._key_expr(keys, "")} IN '
+                f"(SELECT f.row_key FROM ({FIRST_ENTRIES}) f WHERE f.operation = 'INSERT')",
+                (run_id, table, position)
+            )
+            restored += max(cursor.rowcount, 0)
+
+        return restored
+
+    def _backup_path(self) -> str:
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return str(self.backup_dir / f'database_backup_{timestamp}.db')
+
+    @staticmethod
+    def _copy_database(source_path: str, target_path: str) -> int:
+        """Copy a SQLite database with the online backup API (safe with open connections)"""
+        source = sqlite3.connect(source_path)
+        target = sqlite3.connect(target_path)
+        try:
+            source.backup(target, pages=1024)
+            return target.execute('PRAGMA page_count').fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+
+    @staticmethod
+    def _now() -> str:
+        return datetime.now().isoformat()
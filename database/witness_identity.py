@@ -0,0 +1,296 @@
+"""
+Witness identity helpers shared by the database managers
+
+Witnesses are identified by their title-stripped name plus organization.
+The normalized name is persisted in witnesses.normalized_name and covered by
+a unique index on (normalized_name, COALESCE(organization, '')), so
+resolving a witness is a single indexed probe. WitnessCache keeps recent
+resolutions in memory so repeat witnesses skip the database entirely.
+WitnessIdentityMixin gives both database managers the same
+get_or_create_witness on top of these helpers.
+"""
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.logging_config import get_logger
+
+try:
+    import psycopg2
+    INTEGRITY_ERRORS: Tuple[type, ...] = (sqlite3.IntegrityError, psycopg2.IntegrityError)
+except ImportError:
+    INTEGRITY_ERRORS = (sqlite3.IntegrityError,)
+
+logger = get_logger(__name__)
+
+# Leading titles stripped before matching (first match only, longest forms first)
+WITNESS_TITLES = [
+    'The Honorable ',
+    'The Hon. ',
+    'Honorable ',
+    'Hon. ',
+    'Mr. ',
+    'Ms. ',
+    'Mrs. ',
+    'Miss ',
+    'Dr. ',
+    'Prof. ',
+    'Professor ',
+    'Sen. ',
+    'Senator ',
+    'Rep. ',
+    'Representative ',
+    'Gov. ',
+    'Governor ',
+    'Lt. Gov. ',
+    'Lieutenant Governor ',
+    'Atty. Gen. ',
+    'Attorney General ',
+    'Sec. ',
+    'Secretary ',
+    'Director ',
+    'Administrator ',
+    'Commissioner ',
+    'Chief ',
+    'Gen. ',
+    'General ',
+    'Admiral ',
+    'Colonel ',
+    'Major ',
+    'Captain ',
+    'Lieutenant ',
+    'Sergeant '
+]
+
+# Index backing the identity probe; organization is COALESCEd so NULL and '' match
+WITNESS_IDENTITY_INDEX = 'idx_witnesses_identity'
+WITNESS_IDENTITY_INDEX_SQL = (
+    f"CREATE UNIQUE INDEX IF NOT EXISTS {WITNESS_IDENTITY_INDEX} "
+    f"ON witnesses(normalized_name, COALESCE(organization, ''))"
+)
+
+
+def normalize_witness_name(full_name: str) -> str:
+    """
+    Normalize witness name by removing titles and honorifics.
+
+    This ensures witnesses are deduplicated even when names have different prefixes
+    (e.g., "The Honorable John Smith" == "John Smith" == "Mr. John Smith")
+
+    Args:
+        full_name: Original full name from API
+
+    Returns:
+        Normalized name without titles
+    """
+    if not full_name:
+        return ''
+
+    normalized = full_name
+    for title in WITNESS_TITLES:
+        if normalized.startswith(title):
+            normalized = normalized[len(title):]
+            break  # Only remove first matching title
+
+    return normalized.strip()
+
+
+def witness_key(full_name: str, organization: Optional[str]) -> Tuple[str, str]:
+    """Identity key matching the unique index: (normalized name, organization or '')"""
+    return normalize_witness_name(full_name), organization or ''
+
+
+def find_witness_by_organization_scan(fetch_all: Callable[..., List[Dict[str, Any]]],
+                                      key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Legacy match for databases without normalized_name: normalize every witness of the organization
+
+    Args:
+        fetch_all: The database manager's fetch_all (query with ? placeholders, params)
+        key: Identity key from witness_key()
+
+    Returns:
+        Matching row (witness_id, full_name) or None
+    """
+    candidates = fetch_all(
+        "SELECT witness_id, full_name FROM witnesses WHERE COALESCE(organization, '') = ?",
+        (key[1],)
+    )
+    for candidate in candidates:
+        if normalize_witness_name(candidate['full_name']) == key[0]:
+            return candidate
+    return None
+
+
+class WitnessCache:
+    """Thread-safe LRU map of witness identity keys to witness IDs"""
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[int]:
+        """Get cached witness ID, marking the entry recently used"""
+        with self._lock:
+            witness_id = self._entries.get(key)
+            if witness_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return witness_id
+
+    def put(self, key: Tuple[str, str], witness_id: int) -> None:
+        """Cache a witness ID, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = witness_id
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries (e.g. after witnesses are merged or deleted)"""
+        with self._lock:
+            self._entries.clear()
+
+
+class WitnessIdentityMixin:
+    """
+    Witness resolution shared by DatabaseManager and UnifiedDatabaseManager
+
+    Hosts call _init_witness_identity() from __init__ and provide is_postgres,
+    fetch_one, fetch_all and execute_insert (? placeholders).
+    """
+
+    def _init_witness_identity(self) -> None:
+        self._witness_cache = WitnessCache()
+        self._witness_identity_available: Optional[bool] = None
+
+    def _has_witness_identity_column(self) -> bool:
+        """Check once whether witnesses.normalized_name exists (added by backfill-witness-names)"""
+        if self._witness_identity_available is None:
+            if self.is_postgres:
+                row = self.fetch_one(
+                    "SELECT 1 AS present FROM information_schema.columns "
+                    "WHERE table_name = 'witnesses' AND column_name = 'normalized_name'"
+                )
+                self._witness_identity_available = bool(row)
+            else:
+                columns = self.fetch_all("PRAGMA table_info(witnesses)")
+                self._witness_identity_available = any(c['name'] == 'normalized_name' for c in columns)
+
+            if not self._witness_identity_available:
+                logger.warning("witnesses.normalized_name missing - falling back to organization scan. "
+                               "Run 'python cli.py database backfill-witness-names'")
+
+        return self._witness_identity_available
+
+    def clear_witness_cache(self) -> None:
+        """Forget cached witness ids (after witnesses were deleted or restored outside this manager)"""
+        self._witness_cache.clear()
+
+    def _find_witness_by_identity(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """Probe idx_witnesses_identity (or scan the organization on legacy schemas)"""
+        if self._has_witness_identity_column():
+            return self.fetch_one(
+                "SELECT witness_id FROM witnesses WHERE normalized_name = ? AND COALESCE(organization, '') = ?",
+                key
+            )
+        return find_witness_by_organization_scan(self.fetch_all, key)
+
+    def get_or_create_witness(self, witness_data: Dict[str, Any]) -> int:
+        """Witness ID for witness_data, creating the witness if needed (see resolve_witness)"""
+        return self.resolve_witness(witness_data)[0]
+
+    def resolve_witness(self, witness_data: Dict[str, Any]) -> Tuple[int, bool]:
+        """
+        Get existing witness or create new one, with name normalization to prevent duplicates.
+
+        Matches witnesses by:
+        1. Normalized name + organization (primary method - handles title variations)
+        2. Exact last name + first name + organization (fallback)
+
+        The primary match is an in-process LRU cache backed by one probe of the
+        (normalized_name, organization) unique index. A concurrent writer that
+        inserts the same identity first makes our insert hit that index; the
+        row it created is returned instead.
+
+        This prevents duplicates like:
+        - "John Smith" vs "The Honorable John Smith"
+        - "Jane Doe" vs "Dr. Jane Doe"
+
+        Args:
+            witness_data: Witness data dictionary
+
+        Returns:
+            (witness ID, True if this call created the witness)
+        """
+        full_name = witness_data.get('full_name', '')
+        last_name = witness_data.get('last_name', '')
+        first_name = witness_data.get('first_name', '')
+        organization = witness_data.get('organization', '')
+
+        key = witness_key(full_name, organization)
+        witness_id = self._witness_cache.get(key)
+        if witness_id is not None:
+            return witness_id, False
+
+        existing = self._find_witness_by_identity(key)
+
+        # Fallback: Try matching by exact last_name + first_name + organization
+        # This catches cases where the names are structured differently
+        if not existing and last_name and first_name:
+            fallback_query = """
+            SELECT witness_id FROM witnesses
+            WHERE last_name = ? AND first_name = ?
+            AND COALESCE(organization, '') = COALESCE(?, '')
+            """
+
+            existing = self.fetch_one(fallback_query, (last_name, first_name, organization))
+            if existing:
+                logger.debug(f"Found existing witness {existing['witness_id']} by last/first name match")
+
+        if existing:
+            self._witness_cache.put(key, existing['witness_id'])
+            return existing['witness_id'], False
+
+        # No match found - create new witness
+        params = (
+            first_name,
+            last_name,
+            full_name,  # Store original full name with titles
+            witness_data.get('title'),
+            organization
+        )
+
+        if self._has_witness_identity_column():
+            insert_query = """
+            INSERT INTO witnesses (first_name, last_name, full_name, title, organization, normalized_name)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """
+            params = params + (key[0],)
+        else:
+            insert_query = """
+            INSERT INTO witnesses (first_name, last_name, full_name, title, organization)
+            VALUES (?, ?, ?, ?, ?)
+            """
+
+        created = True
+        try:
+            witness_id = self.execute_insert(insert_query, params, 'witness_id')
+        except INTEGRITY_ERRORS:
+            # Lost the race to another writer; its row holds the identity now
+            existing = self._find_witness_by_identity(key)
+            if not existing:
+                raise
+            witness_id, created = existing['witness_id'], False
+            logger.debug(f"Witness '{full_name}' was created concurrently as {witness_id}")
+        else:
+            logger.debug(f"Created new witness {witness_id}: '{full_name}'")
+
+        self._witness_cache.put(key, witness_id)
+        return witness_id, created
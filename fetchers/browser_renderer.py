@@ -0,0 +1,284 @@
+"""
+Page Renderer - Reusable page rendering for browser-backed fetches
+
+CRS content fetches and the think-tank ingesters used to start Playwright,
+launch Chromium and build a context for every URL, then sleep a fixed 2-3
+seconds for dynamic content. PlaywrightRenderer keeps one browser per
+process instead:
+
+- the browser runs on a dedicated event loop thread (Playwright objects are
+  not thread-safe) and is relaunched if it dies
+- a pool of pages, each in its own context, bounds concurrent renders;
+  callers from any thread block until their page is done
+- readiness is event driven: DOM loaded, optional selector, then network
+  idle (bounded), instead of fixed sleeps
+- images, fonts, media and analytics requests are aborted
+
+Renderers share one interface (render/close), so HTTPRenderer or a fake can
+be swapped in wherever a browser is not needed.
+"""
+import asyncio
+import atexit
+import threading
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from config.logging_config import get_logger
+from config.settings import settings
+
+logger = get_logger(__name__)
+
+BROWSER_USER_AGENT = ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 '
+                      '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox'
+]
+
+# Requests the renderer never needs for HTML
+BLOCKED_RESOURCE_TYPES = ('image', 'font', 'media')
+BLOCKED_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'facebook.net',
+    'hotjar.com', 'segment.io', 'chartbeat.com', 'scorecardresearch.com', 'quantserve.com',
+    'newrelic.com', 'nr-data.net'
+)
+
+# Seconds to wait for a content selector / network idle before using the page as is
+SELECTOR_TIMEOUT = 15
+NETWORK_IDLE_TIMEOUT = 10
+
+
+class RenderError(Exception):
+    """A page could not be rendered"""
+    pass
+
+
+class Renderer(ABC):
+    """Turns a URL into its HTML"""
+
+    @abstractmethod
+    def render(self, url: str, wait_for: Optional[str] = None, timeout: float = 60,
+               scroll: bool = False) -> str:
+        """
+        Render a page
+
+        Args:
+            url: URL to render
+            wait_for: CSS selector that marks the content as loaded (best effort)
+            timeout: Navigation timeout in seconds
+            scroll: Scroll to the bottom to trigger lazy-loaded content
+
+        Returns:
+            HTML content
+
+        Raises:
+            RenderError: If the page could not be loaded
+        """
+
+    def close(self):
+        """Release resources"""
+        pass
+
+
+class HTTPRenderer(Renderer):
+    """Plain HTTP GET, for sites that do not need JavaScript"""
+
+    def __init__(self, session: Optional[requests.Session] = None, user_agent: str = BROWSER_USER_AGENT):
+        self.session = session or requests.Session()
+        self.session.headers.setdefault('User-Agent', user_agent)
+
+    def render(self, url: str, wait_for: Optional[str] = None, timeout: float = 60,
+               scroll: bool = False) -> str:
+        try:
+            response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise RenderError(f"HTTP fetch failed for {url}: {e}") from e
+        return response.text
+
+    def close(self):
+        self.session.close()
+
+
+class PlaywrightRenderer(Renderer):
+    """Long-lived headless Chromium with a pool of pages"""
+
+    def __init__(self, pool_size: int = 4, headless: bool = True,
+                 block_resource_types: Iterable[str] = BLOCKED_RESOURCE_TYPES,
+                 block_hosts: Iterable[str] = BLOCKED_HOSTS):
+        """
+        Initialize renderer (the browser starts on first render)
+
+        Args:
+            pool_size: Pages rendering at once
+            headless: Run browser in headless mode
+            block_resource_types: Playwright resource types to abort
+            block_hosts: Hosts (and their subdomains) whose requests are aborted
+        """
+        self.pool_size = max(1, pool_size)
+        self.headless = headless
+        self.block_resource_types = frozenset(block_resource_types)
+        self.block_hosts = tuple(block_hosts)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # Owned by the event loop thread
+        self._playwright = None
+        self._browser = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._pages: Optional[asyncio.Queue] = None
+
+    def render(self, url: str, wait_for: Optional[str] = None, timeout: float = 60,
+               scroll: bool = False) -> str:
+        self._start()
+        future = asyncio.run_coroutine_threadsafe(self._render(url, wait_for, timeout, scroll), self._loop)
+        return future.result()
+
+    def _start(self):
+        """Start the event loop thread and Playwright once"""
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='browser-renderer', daemon=True)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(self._start_playwright(), loop).result()
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                raise
+            self._thread = thread
+            self._loop = loop
+
+    async def _start_playwright(self):
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        self._browser_lock = asyncio.Lock()
+        # Pages are created on first use; None marks a free slot without a page
+        self._pages = asyncio.Queue()
+        for _ in range(self.pool_size):
+            self._pages.put_nowait(None)
+
+    async def _ensure_browser(self):
+        """Launch the browser, or relaunch it after a crash"""
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                logger.info(f"Launching headless browser ({self.pool_size} pages)")
+                self._browser = await self._playwright.chromium.launch(headless=self.headless,
+                                                                       args=BROWSER_LAUNCH_ARGS)
+            return self._browser
+
+    async def _new_page(self):
+        browser = await self._ensure_browser()
+        context = await browser.new_context(
+            user_agent=BROWSER_USER_AGENT,
+            viewport={'width': 1920, 'height': 1080},
+            locale='en-US',
+            timezone_id='America/New_York'
+        )
+        await context.route('**/*', self._route)
+        return await context.new_page()
+
+    async def _route(self, route):
+        """Abort requests that do not contribute to the HTML"""
+        request = route.request
+        host = urlparse(request.url).hostname or ''
+        if request.resource_type in self.block_resource_types or \
+                any(host == blocked or host.endswith('.' + blocked) for blocked in self.block_hosts):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _render(self, url: str, wait_for: Optional[str], timeout: float, scroll: bool) -> str:
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        page = await self._pages.get()
+        try:
+            if page is None:
+                page = await self._new_page()
+
+            try:
+                await page.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            except Exception as e:
+                raise RenderError(f"Navigation failed for {url}: {e}") from e
+
+            if wait_for:
+                try:
+                    await page.wait_for_selector(wait_for, timeout=SELECTOR_TIMEOUT * 1000)
+                except PlaywrightTimeoutError:
+                    logger.warning(f"Timeout waiting for content selectors on {url}, proceeding anyway")
+
+            if scroll:
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+            # Let scripts (and any Cloudflare challenge) finish
+            try:
+                await page.wait_for_load_state('networkidle', timeout=NETWORK_IDLE_TIMEOUT * 1000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Network not idle after {NETWORK_IDLE_TIMEOUT}s on {url}, using page as is")
+
+            return await page.content()
+
+        except Exception:
+            # Start the next render on a fresh page
+            if page is not None:
+                try:
+                    await page.context.close()
+                except Exception:
+                    pass
+                page = None
+            raise
+
+        finally:
+            self._pages.put_nowait(page)
+
+    def close(self):
+        """Close the browser and stop the event loop thread"""
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+            if loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout=30)
+            except Exception as e:
+                logger.warning(f"Error closing browser: {e}")
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join()
+            loop.close()
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        await self._playwright.stop()
+
+
+_renderer = None
+_renderer_lock = threading.Lock()
+
+
+def get_renderer() -> Renderer:
+    """Process-wide renderer configured from settings (closed at exit)"""
+    global _renderer
+    if _renderer is None:
+        with _renderer_lock:
+            if _renderer is None:
+                if settings.browser_renderer == 'http':
+                    renderer = HTTPRenderer()
+                else:
+                    renderer = PlaywrightRenderer(pool_size=settings.browser_pool_size)
+                atexit.register(renderer.close)
+                _renderer = renderer
+    return _renderer
@@ -1,39 +1,63 @@
 """
 CRS Content Fetcher - Fetches HTML content from congress.gov CRS report pages
 """
+import hashlib
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from playwright.sync_api import sync_playwright, Page, Browser
+from requests.adapters import HTTPAdapter
+from api.rate_limiter import HostRateLimiter
 from config.logging_config import get_logger
+from fetchers.browser_renderer import Renderer, get_renderer
 
 logger = get_logger(__name__)
 
 
+def source_fingerprint(html_content: str) -> str:
+    """SHA256 of raw fetched HTML, compared before parsing to skip unchanged pages"""
+    return hashlib.sha256(html_content.encode('utf-8')).hexdigest()
+
+
 class CRSContentFetcher:
     """
     Fetches HTML content for CRS reports from congress.gov
 
     Note: This fetcher downloads HTML pages directly, not API JSON.
     It implements rate limiting to be respectful to congress.gov servers.
+
+    Safe to share between threads: requests to the same host stay
+    rate_limit_delay apart whichever thread makes them.
     """
 
-    def __init__(self, rate_limit_delay: float = 0.5, timeout: int = 30, max_retries: int = 3):
+    def __init__(self, rate_limit_delay: float = 0.5, timeout: int = 30, max_retries: int = 3,
+                 renderer: Optional[Renderer] = None):
         """
         Initialize CRS content fetcher
 
         Args:
-            rate_limit_delay: Delay between requests in seconds (default: 0.5s = 2 req/sec)
+            rate_limit_delay: Delay between requests to the same host in seconds (default: 0.5s = 2 req/sec)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts for failed requests
+            renderer: Renderer for browser fetches (default: shared process-wide browser)
         """
         self.rate_limit_delay = rate_limit_delay
+        self._renderer = renderer
         self.timeout = timeout
         self.max_retries = max_retries
-        self.last_request_time = 0
         self.session = requests.Session()
 
+        # Sized for concurrent fetch workers (see fetch_batch / CRSContentPipeline)
+        adapter = HTTPAdapter(pool_maxsize=16)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Spaces request starts per host across fetch threads; the lock guards stats
+        self._host_limiter = HostRateLimiter(rate_limit_delay)
+        self._lock = threading.Lock()
+
         # Set user agent to identify our scraper
         self.session.headers.update({
             'User-Agent': 'Congressional-Hearing-Database-Bot/1.0 (Educational/Research)',
@@ -50,14 +74,20 @@ class CRSContentFetcher:
             'total_time': 0.0
         }
 
-    def _rate_limit(self):
-        """Enforce rate limiting between requests"""
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+    def _rate_limit(self, url: Optional[str] = None):
+        """Enforce rate limiting between requests to the same host (see HostRateLimiter)"""
+        self._host_limiter.wait(url)
+
+    def _record(self, success: bool, size_bytes: int = 0, fetch_time: float = 0.0):
+        """Update statistics for one request"""
+        with self._lock:
+            self.stats['requests_made'] += 1
+            if success:
+                self.stats['successful_fetches'] += 1
+                self.stats['total_bytes'] += size_bytes
+                self.stats['total_time'] += fetch_time
+            else:
+                self.stats['failed_fetches'] += 1
 
     def fetch_html(self, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
@@ -68,12 +98,12 @@ class CRSContentFetcher:
 
         Returns:
             Tuple of (html_content, metadata) or None if fetch failed
-            metadata includes: status_code, size_bytes, fetch_time_ms
+            metadata includes: status_code, size_bytes, fetch_time_ms, source_hash
         """
         for attempt in range(1, self.max_retries + 1):
             try:
                 # Rate limiting
-                self._rate_limit()
+                self._rate_limit(url)
 
                 # Make request
                 start_time = time.time()
@@ -87,25 +117,22 @@ class CRSContentFetcher:
                 size_bytes = len(response.content)
 
                 # Update statistics
-                self.stats['requests_made'] += 1
-                self.stats['successful_fetches'] += 1
-                self.stats['total_bytes'] += size_bytes
-                self.stats['total_time'] += fetch_time
+                self._record(True, size_bytes, fetch_time)
 
                 metadata = {
                     'status_code': response.status_code,
                     'size_bytes': size_bytes,
                     'fetch_time_ms': round(fetch_time, 2),
                     'content_type': response.headers.get('Content-Type', ''),
-                    'fetched_at': datetime.now().isoformat()
+                    'fetched_at': datetime.now().isoformat(),
+                    'source_hash': source_fingerprint(response.text)
                 }
 
                 logger.info(f"✓ Fetched {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
                 return response.text, metadata
 
             except requests.exceptions.HTTPError as e:
-                self.stats['requests_made'] += 1
-                self.stats['failed_fetches'] += 1
+                self._record(False)
 
                 if e.response.status_code == 403:
                     logger.error(f"✗ 403 Forbidden: {url} - May need authentication or different headers")
@@ -121,8 +148,7 @@ class CRSContentFetcher:
                     logger.error(f"✗ Failed after {self.max_retries} attempts: {url} ({e})")
 
             except requests.exceptions.Timeout:
-                self.stats['requests_made'] += 1
-                self.stats['failed_fetches'] += 1
+                self._record(False)
 
                 if attempt < self.max_retries:
                     logger.warning(f"✗ Timeout fetching {url}, retrying...")
@@ -131,8 +157,7 @@ class CRSContentFetcher:
                     logger.error(f"✗ Timeout after {self.max_retries} attempts: {url}")
 
             except requests.exceptions.RequestException as e:
-                self.stats['requests_made'] += 1
-                self.stats['failed_fetches'] += 1
+                self._record(False)
 
                 if attempt < self.max_retries:
                     logger.warning(f"✗ Request error fetching {url}: {e}, retrying...")
@@ -142,13 +167,19 @@ class CRSContentFetcher:
 
         return None
 
-    def fetch_html_with_browser(self, url: str, headless: bool = True, wait_for_selector: str = 'body') -> Optional[Tuple[str, Dict[str, Any]]]:
+    @property
+    def renderer(self) -> Renderer:
+        """Renderer used by fetch_html_with_browser"""
+        if self._renderer is None:
+            self._renderer = get_renderer()
+        return self._renderer
+
+    def fetch_html_with_browser(self, url: str, wait_for_selector: str = 'body') -> Optional[Tuple[str, Dict[str, Any]]]:
         """
-        Fetch HTML content using Playwright headless browser (bypasses Cloudflare)
+        Fetch HTML content using the headless browser renderer (bypasses Cloudflare)
 
         Args:
             url: URL to fetch
-            headless: Run browser in headless mode
             wait_for_selector: CSS selector to wait for before extracting HTML
 
         Returns:
@@ -156,44 +187,19 @@ class CRSContentFetcher:
         """
         try:
             # Rate limiting
-            self._rate_limit()
+            self._rate_limit(url)
 
             start_time = time.time()
             logger.debug(f"Fetching with browser: {url}")
 
-            with sync_playwright() as playwright:
-                # Launch browser
-                browser = playwright.chromium.launch(headless=headless)
-                context = browser.new_context(
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
-                page = context.new_page()
-
-                # Navigate to page
-                page.goto(url, wait_until='networkidle', timeout=self.timeout * 1000)
-
-                # Wait for content to load
-                page.wait_for_selector(wait_for_selector, timeout=10000)
-
-                # Additional wait for any dynamic content (Cloudflare challenge)
-                time.sleep(2)
-
-                # Get HTML content
-                html_content = page.content()
-                size_bytes = len(html_content.encode('utf-8'))
-
-                # Close browser
-                browser.close()
+            html_content = self.renderer.render(url, wait_for=wait_for_selector, timeout=self.timeout)
+            size_bytes = len(html_content.encode('utf-8'))
 
             # Calculate metrics
             fetch_time = (time.time() - start_time) * 1000  # Convert to ms
 
             # Update statistics
-            self.stats['requests_made'] += 1
-            self.stats['successful_fetches'] += 1
-            self.stats['total_bytes'] += size_bytes
-            self.stats['total_time'] += fetch_time
+            self._record(True, size_bytes, fetch_time)
 
             metadata = {
                 'status_code': 200,  # Browser fetch doesn't have HTTP status
@@ -201,27 +207,50 @@ class CRSContentFetcher:
                 'fetch_time_ms': round(fetch_time, 2),
                 'content_type': 'text/html',
                 'fetched_at': datetime.now().isoformat(),
-                'method': 'browser'
+                'method': 'browser',
+                'source_hash': source_fingerprint(html_content)
             }
 
             logger.info(f"✓ Fetched with browser: {url} ({size_bytes:,} bytes, {fetch_time:.0f}ms)")
             return html_content, metadata
 
         except Exception as e:
-            self.stats['requests_made'] += 1
-            self.stats['failed_fetches'] += 1
+            self._record(False)
             logger.error(f"✗ Browser fetch failed for {url}: {e}")
             return None
 
-    def fetch_batch(self, urls: List[str], progress_callback: Optional[callable] = None, use_browser: bool = False) -> Dict[str, Optional[Tuple[str, Dict]]]:
+    def fetch(self, url: str, use_browser: bool = False) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Fetch a URL over HTTP, falling back to the browser if that fails
+
+        Args:
+            url: URL to fetch
+            use_browser: Use browser fetch only
+
+        Returns:
+            Tuple of (html_content, metadata) or None if fetch failed
         """
-        Fetch multiple URLs with progress tracking
+        if use_browser:
+            return self.fetch_html_with_browser(url)
+
+        result = self.fetch_html(url)
+        # If HTTP failed (e.g. 403 from Cloudflare), try browser
+        if result is None:
+            logger.info(f"HTTP fetch failed for {url}, trying browser...")
+            result = self.fetch_html_with_browser(url)
+        return result
+
+    def fetch_batch(self, urls: List[str], progress_callback: Optional[callable] = None, use_browser: bool = False,
+                    workers: int = 4) -> Dict[str, Optional[Tuple[str, Dict]]]:
+        """
+        Fetch multiple URLs concurrently with progress tracking
 
         Args:
             urls: List of URLs to fetch
-            progress_callback: Optional callback function called after each fetch
+            progress_callback: Optional callback function called after each fetch (in completion order)
                               Signature: callback(current, total, url, success)
             use_browser: Use browser fetch instead of HTTP
+            workers: Concurrent fetches (per-host rate limiting still applies)
 
         Returns:
             Dictionary mapping URL to (html_content, metadata) or None
@@ -229,24 +258,18 @@ class CRSContentFetcher:
         results = {}
         total = len(urls)
 
-        logger.info(f"Fetching batch of {total} URLs (method: {'browser' if use_browser else 'HTTP'})")
-
-        for i, url in enumerate(urls, 1):
-            # Try HTTP first, fallback to browser if it fails with 403
-            if use_browser:
-                result = self.fetch_html_with_browser(url)
-            else:
-                result = self.fetch_html(url)
-                # If HTTP failed with 403, try browser
-                if result is None:
-                    logger.info(f"HTTP fetch failed for {url}, trying browser...")
-                    result = self.fetch_html_with_browser(url)
+        logger.info(f"Fetching batch of {total} URLs (method: {'browser' if use_browser else 'HTTP'}, "
+                    f"{workers} workers)")
 
-            results[url] = result
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='crs-fetch') as pool:
+            futures = {pool.submit(self.fetch, url, use_browser): url for url in urls}
+            for i, future in enumerate(as_completed(futures), 1):
+                url = futures[future]
+                results[url] = future.result()
 
-            # Call progress callback
-            if progress_callback:
-                progress_callback(i, total, url, result is not None)
+                # Call progress callback
+                if progress_callback:
+                    progress_callback(i, total, url, results[url] is not None)
 
         return results
 
@@ -336,14 +359,15 @@ class CRSContentFetcher:
 
     def reset_stats(self):
         """Reset statistics counters"""
-        self.stats = {
-            'requests_made': 0,
-            'successful_fetches': 0,
-            'failed_fetches': 0,
-            'total_bytes': 0,
-            'total_time': 0.0
-        }
+        with self._lock:
+            self.stats = {
+                'requests_made': 0,
+                'successful_fetches': 0,
+                'failed_fetches': 0,
+                'total_bytes': 0,
+                'total_time': 0.0
+            }
 
     def close(self):
-        """Close the session and cleanup"""
+        """Close the session and cleanup (the shared browser stays up for other fetchers)"""
         self.session.close()
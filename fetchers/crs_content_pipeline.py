@@ -0,0 +1,260 @@
+"""
+CRS Content Pipeline - Staged fetch/parse/upload/store for CRS report HTML
+
+Runs products through the stages of a content backfill concurrently instead
+of one product at a time:
+
+- fetch: thread pool sharing one CRSContentFetcher; requests to the same host
+  stay rate_limit_delay apart, so the workers only overlap network latency
+- parse: process pool running CRSHTMLParser (parsing is CPU bound), or
+  threads when parse_processes is 0
+- upload: thread pool sending parsed HTML to R2 (manager.upload_content)
+- store: the coordinating thread is the single database writer and upserts
+  versions in batches, one transaction per batch with a savepoint per product;
+  FTS rows are queued and written once per batch (manager.fts_indexer)
+
+At most max_in_flight products are between fetch and store at any time, so a
+slow stage holds back new fetches instead of piling up HTML in memory.
+
+Unchanged products stop early: the stored fingerprints of every product are
+loaded up front, a page whose raw HTML matches its source_hash is never
+parsed, and one whose parsed content_hash matches is never uploaded or
+re-indexed (only its new source_hash is recorded).
+"""
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.logging_config import get_logger
+from database.postgres_config import get_connection
+from fetchers.crs_content_fetcher import source_fingerprint
+from parsers.crs_html_parser import CRSHTMLParser
+
+logger = get_logger(__name__)
+
+# Parser used by parse worker processes (set by _init_parse_worker)
+_worker_parser = None
+
+
+def _init_parse_worker() -> None:
+    """Process pool initializer: one parser per worker"""
+    global _worker_parser
+    _worker_parser = CRSHTMLParser()
+
+
+def _parse_in_worker(html_content: str, product_id: str):
+    """Parse fetched HTML in a worker process"""
+    return _worker_parser.parse(html_content, product_id)
+
+
+def upsert_parsed_version(manager, conn, product: Dict[str, Any], parsed, blob_url: Optional[str]):
+    """Default store step: CRSContentManager (PostgreSQL) upsert_version"""
+    return manager.upsert_version(
+        product_id=product['product_id'],
+        version_number=product['version_number'],
+        parsed_content=parsed,
+        html_url=product['html_url'],
+        blob_url=blob_url,
+        conn=conn,
+        source_hash=product.get('source_hash'),
+        defer_fts=True
+    )
+
+
+class CRSContentPipeline:
+    """
+    Fetches, parses, uploads and stores CRS product content concurrently
+
+    Usage:
+        pipeline = CRSContentPipeline(fetcher, manager)
+        counts = pipeline.run(products, on_result=callback)
+
+    where products are dicts with product_id, version_number and html_url,
+    and callback(product, status, detail) is called once per product with
+    status 'stored' (detail: (store step's return value, ParsedContent)),
+    'unchanged' (detail: None) or one of 'fetch_error', 'parse_error',
+    'upload_error', 'storage_error' (detail: error message). The product
+    passed back carries the fetched page's 'source_hash'.
+    """
+
+    def __init__(self, fetcher, manager, store: Optional[Callable] = None, use_browser: bool = False,
+                 fetch_workers: int = 4, parse_processes: int = 2, upload_workers: int = 4,
+                 batch_size: int = 25, connect: Callable = get_connection):
+        """
+        Initialize pipeline
+
+        Args:
+            fetcher: CRSContentFetcher (shared by fetch threads)
+            manager: CRS content manager providing upload_content,
+                get_version_hashes, record_source_hash and fts_indexer
+            store: store(manager, conn, product, parsed, blob_url) writing one
+                version on conn, passing product['source_hash'] along and
+                deferring its FTS row (default: upsert_parsed_version)
+            use_browser: Fetch with the headless browser only (no HTTP attempt)
+            fetch_workers: Concurrent fetch threads
+            parse_processes: Parse worker processes (0 parses in threads)
+            upload_workers: Concurrent R2 uploads
+            batch_size: Versions written per transaction
+            connect: Context manager yielding a database connection
+        """
+        self.fetcher = fetcher
+        self.manager = manager
+        self.store = store or upsert_parsed_version
+        self.use_browser = use_browser
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_processes = max(0, parse_processes)
+        self.upload_workers = max(1, upload_workers)
+        self.batch_size = max(1, batch_size)
+        self.connect = connect
+
+        # Enough queued work to keep every stage busy while bounding memory
+        self.max_in_flight = self.fetch_workers * 2 + self.parse_processes + self.upload_workers
+
+    def _create_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Process pool for parsing, or None to parse in threads"""
+        if not self.parse_processes:
+            return None
+        # spawn: fetch threads are already running, and fork would copy their locks
+        return ProcessPoolExecutor(
+            max_workers=self.parse_processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_parse_worker
+        )
+
+    def run(self, products: Iterable[Dict[str, Any]],
+            on_result: Optional[Callable[[Dict[str, Any], str, Any], None]] = None) -> Dict[str, int]:
+        """
+        Process products until each is stored or has failed
+
+        Args:
+            products: Products to process (product_id, version_number, html_url)
+            on_result: Optional callback(product, status, detail) per product
+
+        Returns:
+            Count of products per status
+        """
+        products = list(products)
+        counts: Dict[str, int] = {}
+        remaining = iter(products)
+        pending: Dict[Any, Tuple[str, Dict[str, Any], Any]] = {}
+        batch: List[Tuple[Dict[str, Any], Any, Optional[str], bool]] = []
+
+        # Fingerprints of the versions already stored
+        stored = self.manager.get_version_hashes(
+            [(product['product_id'], product['version_number']) for product in products]
+        )
+
+        def report(product, status, detail=None):
+            counts[status] = counts.get(status, 0) + 1
+            if on_result:
+                on_result(product, status, detail)
+
+        fetch_pool = ThreadPoolExecutor(max_workers=self.fetch_workers, thread_name_prefix='crs-fetch')
+        upload_pool = ThreadPoolExecutor(max_workers=self.upload_workers, thread_name_prefix='crs-upload')
+        parse_pool = self._create_parse_pool()
+        thread_parser = CRSHTMLParser() if parse_pool is None else None
+
+        def submit_parse(product, html_content):
+            if parse_pool is not None:
+                return parse_pool.submit(_parse_in_worker, html_content, product['product_id'])
+            return fetch_pool.submit(thread_parser.parse, html_content, product['product_id'])
+
+        def top_up():
+            while len(pending) < self.max_in_flight:
+                product = next(remaining, None)
+                if product is None:
+                    return
+                future = fetch_pool.submit(self.fetcher.fetch, product['html_url'], self.use_browser)
+                pending[future] = ('fetch', product, None)
+
+        try:
+            top_up()
+            while pending:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, product, parsed = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"✗ {stage.capitalize()} error for {product['product_id']}: {e}")
+                        report(product, f'{stage}_error', str(e))
+                        continue
+
+                    previous = stored.get((product['product_id'], product['version_number']))
+
+                    if stage == 'fetch':
+                        if not result:
+                            report(product, 'fetch_error', 'Failed to fetch HTML')
+                            continue
+                        html_content, metadata = result
+                        source_hash = metadata.get('source_hash') or source_fingerprint(html_content)
+                        product = dict(product, source_hash=source_hash)
+                        if previous and previous['source_hash'] == source_hash:
+                            # Same page as last time: nothing to parse, upload or index
+                            report(product, 'unchanged')
+                            continue
+                        pending[submit_parse(product, html_content)] = ('parse', product, None)
+                    elif stage == 'parse':
+                        if not result:
+                            report(product, 'parse_error', 'Failed to parse HTML')
+                            continue
+                        if previous and previous['content_hash'] == result.content_hash:
+                            # Page changed around the report only: record the new fingerprint
+                            batch.append((product, result, None, False))
+                            continue
+                        future = upload_pool.submit(self.manager.upload_content, product['product_id'],
+                                                    product['version_number'], result.html_content)
+                        pending[future] = ('upload', product, result)
+                    else:
+                        batch.append((product, parsed, result, True))
+
+                # Queue more fetches before writing so the network stays busy
+                top_up()
+                while len(batch) >= self.batch_size or (batch and not pending):
+                    self._write(batch[:self.batch_size], stored, report)
+                    batch = batch[self.batch_size:]
+        finally:
+            fetch_pool.shutdown(wait=True, cancel_futures=True)
+            upload_pool.shutdown(wait=True, cancel_futures=True)
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=True, cancel_futures=True)
+
+        return counts
+
+    def _write(self, batch: List[Tuple[Dict[str, Any], Any, Optional[str], bool]],
+               stored: Dict[Tuple[str, int], Dict[str, Any]], report) -> None:
+        """Store a batch of versions in one transaction; failures only roll back their own product"""
+        results = []
+        indexer = self.manager.fts_indexer
+        try:
+            with self.connect() as conn:
+                cursor = conn.cursor()
+                for product, parsed, blob_url, changed in batch:
+                    cursor.execute('SAVEPOINT crs_version')
+                    mark = indexer.mark()
+                    try:
+                        if changed:
+                            result = self.store(self.manager, conn, product, parsed, blob_url)
+                            results.append((product, 'stored', (result, parsed)))
+                        else:
+                            previous = stored[(product['product_id'], product['version_number'])]
+                            self.manager.record_source_hash(previous['version_id'], product['source_hash'],
+                                                            conn=conn)
+                            results.append((product, 'unchanged', None))
+                        cursor.execute('RELEASE SAVEPOINT crs_version')
+                    except Exception as e:
+                        cursor.execute('ROLLBACK TO SAVEPOINT crs_version')
+                        indexer.rollback_to(mark)
+                        logger.error(f"✗ Database error for {product['product_id']}: {e}")
+                        results.append((product, 'storage_error', str(e)))
+
+                # One FTS write for the whole batch
+                indexer.flush(conn)
+        except Exception as e:
+            indexer.discard()
+            logger.error(f"✗ Error storing batch of {len(batch)} versions: {e}")
+            results = [(product, 'storage_error', str(e)) for product, _, _, _ in batch]
+
+        # Reported after commit so callers only count what is really stored
+        for product, status, detail in results:
+            report(product, status, detail)
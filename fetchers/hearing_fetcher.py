@@ -1,7 +1,7 @@
 """
 Hearing data fetcher for Congress.gov API
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 from fetchers.base_fetcher import BaseFetcher
 from config.logging_config import get_logger
@@ -94,17 +94,62 @@ class HearingFetcher(BaseFetcher):
             logger.error(f"Error fetching details for hearing {event_id}: {e}")
             return None
 
-    def fetch_all_with_details(self, congress: int) -> List[Dict[str, Any]]:
+    def fetch_hearing_details_batch(self, congress: int, hearings: List[Tuple[str, str]],
+                                    max_workers: Optional[int] = None,
+                                    progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch detailed hearing information for many hearings concurrently
+
+        Args:
+            congress: Congress number
+            hearings: List of (chamber, event_id) pairs
+            max_workers: Concurrent requests (defaults to settings.detail_fetch_concurrency)
+            progress_callback: Optional callable(completed, total)
+
+        Returns:
+            Detailed hearing information in input order (None where a fetch failed)
+        """
+        responses = self.api_client.get_hearing_details_many(
+            congress,
+            [(chamber.lower(), event_id) for chamber, event_id in hearings],
+            max_workers=max_workers,
+            progress_callback=progress_callback
+        )
+
+        details = []
+        for (chamber, event_id), response in zip(hearings, responses):
+            if isinstance(response, Exception):
+                logger.error(f"Error fetching details for hearing {event_id}: {response}")
+                details.append(None)
+            else:
+                details.append(response)
+
+        return details
+
+    def fetch_all_with_details(self, congress: int, max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Fetch all hearings with detailed information
 
         Args:
             congress: Congress number
+            max_workers: Concurrent detail requests (defaults to settings.detail_fetch_concurrency)
 
         Returns:
             List of hearings with detailed information
         """
         basic_hearings = self.fetch_hearings(congress)
+
+        # Fetch details for every hearing that can be addressed, preserving order
+        targets = []
+        for hearing in basic_hearings:
+            event_id = self.safe_get(hearing, 'eventId')
+            chamber = self.safe_get(hearing, 'chamber', '').lower()
+            if event_id and chamber:
+                targets.append((chamber, event_id))
+
+        logger.info(f"Fetching details for {len(targets)} hearings")
+        details = iter(self.fetch_hearing_details_batch(congress, targets, max_workers=max_workers))
+
         detailed_hearings = []
 
         for hearing in basic_hearings:
@@ -112,7 +157,7 @@ class HearingFetcher(BaseFetcher):
             chamber = self.safe_get(hearing, 'chamber', '').lower()
 
             if event_id and chamber:
-                detailed = self.fetch_hearing_details(congress, chamber, event_id)
+                detailed = next(details)
                 if detailed and 'committeeMeeting' in detailed:
                     # Merge basic info with detailed info
                     detailed_hearing = detailed['committeeMeeting']
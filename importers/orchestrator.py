@@ -5,6 +5,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from database.manager import DatabaseManager
+from database.hearing_listing import HearingListing
 from api.client import CongressAPIClient
 from fetchers.committee_fetcher import CommitteeFetcher
 from fetchers.member_fetcher import MemberFetcher
@@ -33,6 +34,7 @@ class ImportOrchestrator:
         """
         self.db_manager = db_manager
         self.api_client = api_client
+        self.hearing_listing = HearingListing(db_manager)
 
         # Initialize fetchers
         self.committee_fetcher = CommitteeFetcher(api_client)
@@ -143,6 +145,14 @@ class ImportOrchestrator:
                     stats['errors'] += 1
 
             logger.info(f"Committee import: {stats['imported']}/{stats['processed']} successful")
+
+            # Committee names and parents are denormalized into the listing
+            if not validation_mode and stats['imported']:
+                try:
+                    self.hearing_listing.refresh_all_if_available()
+                except Exception as e:
+                    logger.warning(f"Could not rebuild hearing listing: {e}")
+
             return stats
 
         except Exception as e:
@@ -460,50 +470,114 @@ class ImportOrchestrator:
             raise
 
     def _process_hearing_batch(self, hearings: List[Dict[str, Any]], congress: int, validation_mode: bool) -> Dict[str, int]:
-        """Process a batch of hearings"""
+        """
+        Process a batch of hearings
+
+        Parsed hearings and their committee, bill and witness links are written
+        with a single bulk_upsert_hearings call. If the bulk write fails, the
+        batch is retried row by row so one bad record only costs itself.
+        """
         batch_stats = {'imported': 0, 'errors': 0}
+        records = []
 
         for hearing_data in hearings:
             try:
                 # Parse hearing data (now includes video extraction)
                 hearing = self.hearing_parser.parse(hearing_data)
-                if hearing:
-                    if not validation_mode:
-                        # Import hearing
-                        hearing_dict = hearing.dict()
-                        hearing_dict['congress'] = congress
-
-                        hearing_id = self.db_manager.upsert_hearing(hearing_dict)
-
-                        # Link to committees
-                        committees = self.hearing_parser.extract_committee_references(hearing_data)
-                        for committee_ref in committees:
-                            committee = self.db_manager.get_committee_by_system_code(committee_ref['system_code'])
-                            if committee:
-                                self.db_manager.link_hearing_committee(
-                                    hearing_id, committee['committee_id'], committee_ref['is_primary']
-                                )
+                if not hearing:
+                    batch_stats['errors'] += 1
+                    continue
 
-                        # Link to bills
-                        bills = self.hearing_parser.extract_bill_references(hearing_data)
-                        for bill_ref in bills:
-                            if bill_ref.get('congress') and bill_ref.get('bill_type') and bill_ref.get('bill_number'):
-                                # Create or get bill
-                                bill_id = self.db_manager.upsert_bill(bill_ref)
-                                self.db_manager.link_hearing_bill(
-                                    hearing_id, bill_id, bill_ref.get('relationship_type', 'mentioned')
-                                )
+                hearing_dict = hearing.dict()
+                hearing_dict['congress'] = congress
 
-                    batch_stats['imported'] += 1
-                else:
-                    batch_stats['errors'] += 1
+                records.append({
+                    'hearing': hearing_dict,
+                    'committees': self.hearing_parser.extract_committee_references(hearing_data),
+                    'bills': self.hearing_parser.extract_bill_references(hearing_data),
+                    'witnesses': self._parse_hearing_witnesses(hearing_data)
+                })
 
             except Exception as e:
                 logger.error(f"Error processing hearing {hearing_data.get('eventId', 'unknown')}: {e}")
                 batch_stats['errors'] += 1
 
+        if validation_mode or not records:
+            batch_stats['imported'] += len(records)
+            return batch_stats
+
+        written = []
+        try:
+            self.db_manager.bulk_upsert_hearings(records)
+            batch_stats['imported'] += len(records)
+            written = records
+        except Exception as e:
+            logger.warning(f"Bulk hearing write failed ({e}), retrying {len(records)} hearings individually")
+            for record in records:
+                try:
+                    self._write_hearing_record(record)
+                    batch_stats['imported'] += 1
+                    written.append(record)
+                except Exception as row_error:
+                    logger.error(f"Error processing hearing {record['hearing'].get('event_id', 'unknown')}: {row_error}")
+                    batch_stats['errors'] += 1
+
+        self._refresh_hearing_listing([record['hearing'].get('event_id') for record in written])
         return batch_stats
 
+    def _refresh_hearing_listing(self, event_ids: List[str]) -> None:
+        """Refresh listing rows for written hearings; a failure leaves them for the next rebuild"""
+        try:
+            self.hearing_listing.refresh(event_ids)
+        except Exception as e:
+            logger.warning(f"Could not refresh hearing listing for {len(event_ids)} hearings: {e}. "
+                           f"Run 'python cli.py database build-hearing-listing'")
+
+    def _parse_hearing_witnesses(self, hearing_data: Dict[str, Any]) -> List[tuple]:
+        """Parse embedded witnesses into (witness_data, appearance_data) pairs"""
+        witnesses = []
+        for i, witness_raw in enumerate(hearing_data.get('witnesses') or [], 1):
+            parsed = self.witness_parser.parse({
+                'name': witness_raw.get('name'),
+                'firstName': witness_raw.get('firstName'),
+                'lastName': witness_raw.get('lastName'),
+                'position': witness_raw.get('position'),
+                'organization': witness_raw.get('organization')
+            })
+            if parsed:
+                witnesses.append((parsed.dict(), {
+                    'position': parsed.title,
+                    'witness_type': None,
+                    'appearance_order': i
+                }))
+        return witnesses
+
+    def _write_hearing_record(self, record: Dict[str, Any]) -> None:
+        """Write one hearing and its links with the row-by-row API"""
+        hearing_id = self.db_manager.upsert_hearing(record['hearing'])
+
+        # Link to committees
+        for committee_ref in record['committees']:
+            committee = self.db_manager.get_committee_by_system_code(committee_ref['system_code'])
+            if committee:
+                self.db_manager.link_hearing_committee(
+                    hearing_id, committee['committee_id'], committee_ref['is_primary']
+                )
+
+        # Link to bills
+        for bill_ref in record['bills']:
+            if bill_ref.get('congress') and bill_ref.get('bill_type') and bill_ref.get('bill_number'):
+                # Create or get bill
+                bill_id = self.db_manager.upsert_bill(bill_ref)
+                self.db_manager.link_hearing_bill(
+                    hearing_id, bill_id, bill_ref.get('relationship_type', 'mentioned')
+                )
+
+        # Link to witnesses
+        for witness_data, appearance_data in record['witnesses']:
+            witness_id = self.db_manager.get_or_create_witness(witness_data)
+            self.db_manager.create_witness_appearance(witness_id, hearing_id, appearance_data)
+
     def _import_committee_roster(self, roster: List[Dict[str, Any]], committee_id: int, congress: int):
         """Import committee roster memberships"""
         for member_info in roster:
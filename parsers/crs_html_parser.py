@@ -1,15 +1,60 @@
 """
 CRS HTML Parser - Extracts and structures content from CRS report HTML pages
+
+Two engines produce the same structure, text and content_hash:
+
+- 'bs4': BeautifulSoup with html.parser; structure, cleanup and text
+  extraction each walk the tree
+- 'lxml': libxml2 parsing and a single iterwalk pass collecting headings,
+  text and empty blocks together (several times faster on long reports)
+
+Cleaned HTML is equivalent but not byte-identical (lxml writes <br> where
+BeautifulSoup writes <br/>). libxml2 reads CDATA sections as comments, so a
+comment literally written as <!--[CDATA[...]]--> counts as text with lxml
+only.
 """
 import hashlib
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from bs4 import BeautifulSoup, Tag, NavigableString
+from lxml import etree
+from lxml import html as lxml_html
 from config.logging_config import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
+ENGINES = ('bs4', 'lxml')
+
+# CDATA section as read by libxml2's HTML parser (a comment '[CDATA[...]]')
+_CDATA_RE = re.compile(r'^\[CDATA\[(.*)\]\]$', re.DOTALL)
+
+# Simple CSS selectors used by the parser: tag, .class, #id, tag.class,
+# tag#id and tag[attr="value"]
+_SELECTOR_RE = re.compile(r'^(?P<tag>[a-z0-9]*)(?:\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)|'
+                          r'\[(?P<attr>[\w-]+)="(?P<value>[^"]*)"\])?$')
+
+
+def css_to_xpath(selector: str) -> str:
+    """
+    Translate one of the parser's simple CSS selectors to XPath
+
+    Raises:
+        ValueError: For selectors outside the supported subset
+    """
+    match = _SELECTOR_RE.match(selector.strip())
+    if not match or not selector.strip():
+        raise ValueError(f"Unsupported selector: {selector}")
+    xpath = f"//{match.group('tag') or '*'}"
+    if match.group('cls'):
+        xpath += f"[contains(concat(' ', normalize-space(@class), ' '), ' {match.group('cls')} ')]"
+    elif match.group('id'):
+        xpath += f"[@id='{match.group('id')}']"
+    elif match.group('attr'):
+        xpath += f"[@{match.group('attr')}='{match.group('value')}']"
+    return xpath
+
 
 @dataclass
 class ParsedContent:
@@ -76,9 +121,19 @@ class CRSHTMLParser:
     # Heading tags that indicate document structure
     HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
 
-    def __init__(self):
-        """Initialize parser"""
-        pass
+    def __init__(self, engine: Optional[str] = None):
+        """
+        Initialize parser
+
+        Args:
+            engine: 'lxml' or 'bs4' (default: CRS_PARSER_ENGINE setting)
+        """
+        self.engine = engine or settings.crs_parser_engine
+        if self.engine not in ENGINES:
+            raise ValueError(f"Unknown parser engine {self.engine!r}, expected one of {ENGINES}")
+
+        self._remove_xpath = ' | '.join(css_to_xpath(selector) for selector in self.REMOVE_SELECTORS)
+        self._content_xpaths = [(selector, css_to_xpath(selector)) for selector in self.CONTENT_SELECTORS]
 
     def parse(self, html: str, product_id: str) -> Optional[ParsedContent]:
         """
@@ -91,6 +146,12 @@ class CRSHTMLParser:
         Returns:
             ParsedContent object or None if parsing failed
         """
+        if self.engine == 'lxml':
+            return self._parse_lxml(html, product_id)
+        return self._parse_bs4(html, product_id)
+
+    def _parse_bs4(self, html: str, product_id: str) -> Optional[ParsedContent]:
+        """Parse with BeautifulSoup (html.parser)"""
         try:
             # Parse HTML
             soup = BeautifulSoup(html, 'html.parser')
@@ -131,6 +192,156 @@ class CRSHTMLParser:
             logger.error(f"Error parsing HTML for {product_id}: {e}")
             return None
 
+    def _parse_lxml(self, html: str, product_id: str) -> Optional[ParsedContent]:
+        """Parse with lxml in a single pass over the content area"""
+        try:
+            document = lxml_html.document_fromstring(html)
+
+            # Remove chrome/navigation (drop_tree keeps the text that follows each element)
+            for element in document.xpath(self._remove_xpath):
+                element.drop_tree()
+
+            content = self._lxml_content_area(document)
+            if content is None:
+                logger.error(f"Could not extract content area for {product_id}")
+                return None
+
+            structure, text_content, empty_blocks = self._lxml_walk(content)
+
+            # Remove empty paragraphs and divs
+            for element in empty_blocks:
+                element.drop_tree()
+
+            html_string = lxml_html.tostring(content, encoding='unicode', with_tail=False)
+            clean_html = self._clean_html_string(html_string)
+
+            # Calculate metrics
+            content_hash = hashlib.sha256(text_content.encode('utf-8')).hexdigest()
+            word_count = len(text_content.split())
+
+            logger.info(f"✓ Parsed {product_id}: {word_count} words, {len(structure['headings'])} headings")
+
+            return ParsedContent(
+                html_content=clean_html,
+                text_content=text_content,
+                structure_json=structure,
+                content_hash=content_hash,
+                word_count=word_count
+            )
+
+        except Exception as e:
+            logger.error(f"Error parsing HTML for {product_id}: {e}")
+            return None
+
+    def _lxml_content_area(self, document):
+        """Main content element (same selector order as extract_content_area)"""
+        for selector, xpath in self._content_xpaths:
+            matches = document.xpath(xpath)
+            if matches:
+                logger.debug(f"Found content using selector: {selector}")
+                return matches[0]
+
+        body = document.find('body')
+        if body is not None:
+            logger.warning("Using full body as content (no specific content selector matched)")
+            return body
+
+        logger.warning("Could not find body tag, using entire document")
+        return document
+
+    def _lxml_walk(self, content) -> Tuple[Dict[str, Any], str, List[Any]]:
+        """
+        Collect structure, plain text and empty blocks in one traversal
+
+        Mirrors the bs4 engine: heading titles join their stripped text
+        pieces without separator, plain text joins every stripped piece with
+        newlines, and a <p>/<div> is empty when no text piece falls inside it.
+        Like BeautifulSoup's get_text, <template> content is skipped and
+        CDATA sections count as text (libxml2 reads them as comments).
+        Relative image paths are rewritten on the way.
+
+        Returns:
+            (structure, text_content, empty <p>/<div> elements)
+        """
+        pieces: List[str] = []
+        headings: List[Optional[Tuple[int, str]]] = []  # per heading in document order
+        open_headings: List[Tuple[int, List[str]]] = []  # (slot, pieces) of headings being read
+        open_blocks: List[int] = []  # piece count when each open <p>/<div> started
+        empty_blocks = []
+        template_depth = 0  # open <template> elements
+
+        def add_text(text: Optional[str]):
+            if text and not template_depth:
+                text = text.strip()
+                if text:
+                    pieces.append(text)
+                    for _, heading_pieces in open_headings:
+                        heading_pieces.append(text)
+
+        for event, element in etree.iterwalk(content, events=('start', 'end', 'comment', 'pi')):
+            if event in ('comment', 'pi'):
+                # No text of their own (except CDATA sections), but the text after them counts
+                cdata = _CDATA_RE.match(element.text or '') if event == 'comment' else None
+                if cdata:
+                    add_text(cdata.group(1))
+                add_text(element.tail)
+                continue
+
+            tag = element.tag
+            if event == 'start':
+                if tag == 'template':
+                    template_depth += 1
+                elif tag in self.HEADING_TAGS:
+                    open_headings.append((len(headings), []))
+                    headings.append(None)
+                elif tag in ('p', 'div'):
+                    open_blocks.append(len(pieces))
+                elif tag == 'img':
+                    self._fix_image(element)
+                add_text(element.text)
+                continue
+
+            if tag == 'template':
+                template_depth -= 1
+            elif tag in self.HEADING_TAGS:
+                slot, heading_pieces = open_headings.pop()
+                headings[slot] = (int(tag[1]), ''.join(heading_pieces))
+            elif tag in ('p', 'div'):
+                if open_blocks.pop() == len(pieces):
+                    empty_blocks.append(element)
+
+            if element is not content:
+                add_text(element.tail)
+
+        toc = []
+        headings_text = []
+        for order, (level, title) in enumerate(headings):
+            if not title:
+                continue
+            toc.append({
+                'level': level,
+                'title': title,
+                'anchor': self._create_anchor(title, order),
+                'order': order
+            })
+            headings_text.append(title)
+
+        structure = {
+            'toc': toc,
+            'sections': list(toc),
+            'headings': headings_text
+        }
+        return structure, self._clean_text('\n'.join(pieces)), empty_blocks
+
+    @staticmethod
+    def _fix_image(img) -> None:
+        """Point relative image paths at congress.gov (see clean_html)"""
+        src = img.get('src', '')
+        if src and not src.startswith(('http://', 'https://', 'data:')):
+            img.set('data-original-src', src)
+            img.set('src', f"https://www.congress.gov/crs_external_products/{src}")
+            img.set('title', "Image from original CRS report (may not load due to access restrictions)")
+
     def extract_content_area(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
         """
         Extract main content area from page, removing chrome/navigation
@@ -252,8 +463,11 @@ class CRSHTMLParser:
                 img['title'] = "Image from original CRS report (may not load due to access restrictions)"
 
         # Get HTML string
-        html = str(soup)
+        return self._clean_html_string(str(soup))
 
+    @staticmethod
+    def _clean_html_string(html: str) -> str:
+        """Strip server-side tags and excess whitespace from serialized HTML"""
         # Remove ASP.NET server tags and other server-side code
         html = re.sub(r'<%@?\s*.*?%>', '', html, flags=re.DOTALL)  # Remove <%...%> tags
         html = re.sub(r'<\?.*?\?>', '', html, flags=re.DOTALL)      # Remove <?...?> tags
@@ -278,9 +492,11 @@ class CRSHTMLParser:
             Plain text string
         """
         # Get text, preserving some structure
-        text = soup.get_text(separator='\n', strip=True)
+        return self._clean_text(soup.get_text(separator='\n', strip=True))
 
-        # Clean up excessive whitespace
+    @staticmethod
+    def _clean_text(text: str) -> str:
+        """Collapse excess whitespace in extracted text"""
         text = re.sub(r'\n\s*\n', '\n\n', text)  # Multiple newlines -> double newline
         text = re.sub(r'[ \t]+', ' ', text)      # Multiple spaces/tabs -> single space
 
@@ -170,9 +170,20 @@ CREATE TABLE IF NOT EXISTS ingestion_errors (
     FOREIGN KEY (log_id) REFERENCES ingestion_logs(log_id) ON DELETE CASCADE
 );
 
+-- Sync State Table (high-water marks of incremental syncs, e.g. CRS products)
+CREATE TABLE IF NOT EXISTS sync_state (
+    sync_name VARCHAR(50) PRIMARY KEY,
+    watermark_at TIMESTAMP,
+    watermark_key VARCHAR(100),
+    watermark_version INTEGER,
+    rows_synced INTEGER DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_documents_source ON documents(source_id);
 CREATE INDEX IF NOT EXISTS idx_documents_publication_date ON documents(publication_date);
+CREATE INDEX IF NOT EXISTS idx_documents_browse ON documents((COALESCE(publication_date, '0001-01-01')), document_id);
 CREATE INDEX IF NOT EXISTS idx_documents_type ON documents(document_type);
 CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status);
 CREATE INDEX IF NOT EXISTS idx_authors_organization ON authors(organization_id);
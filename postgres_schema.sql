@@ -219,12 +219,14 @@ CREATE TABLE IF NOT EXISTS witnesses (
     full_name TEXT NOT NULL,
     title TEXT,
     organization TEXT,
+    normalized_name TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 CREATE INDEX IF NOT EXISTS idx_witnesses_name ON witnesses(last_name, first_name);
 CREATE INDEX IF NOT EXISTS idx_witnesses_org ON witnesses(organization);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_witnesses_identity ON witnesses(normalized_name, COALESCE(organization, ''));
 
 -- Witness Appearances Table
 CREATE TABLE IF NOT EXISTS witness_appearances (
@@ -415,3 +417,24 @@ CREATE TABLE IF NOT EXISTS schedule_execution_logs (
 CREATE INDEX IF NOT EXISTS idx_schedule_exec_schedule ON schedule_execution_logs(schedule_id);
 CREATE INDEX IF NOT EXISTS idx_schedule_exec_time ON schedule_execution_logs(execution_time);
 CREATE INDEX IF NOT EXISTS idx_schedule_exec_success ON schedule_execution_logs(success);
+
+-- Hearing Listing Table (denormalized browse rows, see database/hearing_listing.py)
+CREATE TABLE IF NOT EXISTS hearing_listing (
+    hearing_id INTEGER PRIMARY KEY,
+    event_id TEXT NOT NULL UNIQUE,
+    congress INTEGER NOT NULL,
+    chamber TEXT NOT NULL,
+    title TEXT NOT NULL,
+    hearing_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    hearing_date_only DATE NOT NULL,
+    hearing_time TIME NOT NULL,
+    committee_id INTEGER,
+    committee_name TEXT,
+    subcommittee_id INTEGER,
+    updated_at TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_hearing_listing_browse ON hearing_listing(hearing_date_only, chamber, committee_id);
+CREATE INDEX IF NOT EXISTS idx_hearing_listing_committee ON hearing_listing(committee_id, hearing_date_only);
+CREATE INDEX IF NOT EXISTS idx_hearing_listing_sort ON hearing_listing(hearing_date_only, hearing_time, updated_at, hearing_id);
@@ -172,82 +172,60 @@ class WitnessImporter:
             'duplicates_found': 0
         }
 
+        # Resolve witnesses first: get_or_create_witness matches title variants through the
+        # identity index and commits each new witness on its own
+        appearances = []
+        for order, witness_data in enumerate(witnesses, 1):
+            try:
+                # Extract and normalize witness information
+                normalized_witness = self.witness_fetcher.extract_witness_info(witness_data)
+
+                # Create raw data dict for parser (parser expects different field names)
+                raw_witness_data = {
+                    'name': normalized_witness.get('full_name'),
+                    'firstName': normalized_witness.get('first_name'),
+                    'lastName': normalized_witness.get('last_name'),
+                    'position': normalized_witness.get('title'),
+                    'organization': normalized_witness.get('organization')
+                }
+
+                # Parse witness data using the parser
+                witness_model = self.witness_parser.parse(raw_witness_data)
+
+                if not witness_model:
+                    logger.warning(f"Failed to parse witness data for hearing {event_id}")
+                    continue
+
+                witness_dict = witness_model.model_dump()
+                witness_id, created = self.db.resolve_witness(witness_dict)
+
+                if created:
+                    stats['witnesses_imported'] += 1
+                else:
+                    stats['duplicates_found'] += 1
+                    logger.debug(f"Found duplicate witness: {witness_dict['full_name']}")
+
+                appearances.append((
+                    witness_id,
+                    hearing_id,
+                    normalized_witness.get('title'),
+                    self.witness_fetcher.infer_witness_type(witness_data),
+                    order
+                ))
+
+            except Exception as e:
+                logger.error(f"Error importing witness for hearing {event_id}: {e}")
+
         try:
             with self.db.transaction() as conn:
-                # Get existing witnesses for deduplication
-                cursor = conn.execute('SELECT witness_id, full_name, organization FROM witnesses')
-                existing_witnesses = cursor.fetchall()
-
-                for order, witness_data in enumerate(witnesses, 1):
-                    try:
-                        # Extract and normalize witness information
-                        normalized_witness = self.witness_fetcher.extract_witness_info(witness_data)
-
-                        # Create raw data dict for parser (parser expects different field names)
-                        raw_witness_data = {
-                            'name': normalized_witness.get('full_name'),
-                            'firstName': normalized_witness.get('first_name'),
-                            'lastName': normalized_witness.get('last_name'),
-                            'position': normalized_witness.get('title'),
-                            'organization': normalized_witness.get('organization')
-                        }
-
-                        # Parse witness data using the parser
-                        witness_model = self.witness_parser.parse(raw_witness_data)
-
-                        if not witness_model:
-                            logger.warning(f"Failed to parse witness data for hearing {event_id}")
-                            continue
-
-                        # Check for duplicate witness
-                        witness_dict = witness_model.model_dump()
-                        existing_witness_id = self.witness_parser.deduplicate_witness(
-                            witness_dict,
-                            [{'witness_id': w[0], 'full_name': w[1], 'organization': w[2]} for w in existing_witnesses]
-                        )
-
-                        if existing_witness_id:
-                            witness_id = existing_witness_id
-                            stats['duplicates_found'] += 1
-                            logger.debug(f"Found duplicate witness: {witness_dict['full_name']}")
-                        else:
-                            # Insert new witness
-                            witness_insert = '''
-                                INSERT INTO witnesses (full_name, first_name, last_name, title, organization)
-                                VALUES (?, ?, ?, ?, ?)
-                            '''
-                            cursor = conn.execute(witness_insert, (
-                                witness_dict['full_name'],
-                                witness_dict['first_name'],
-                                witness_dict['last_name'],
-                                witness_dict['title'],
-                                witness_dict['organization']
-                            ))
-                            witness_id = cursor.lastrowid
-                            stats['witnesses_imported'] += 1
-
-                            # Add to existing list for future deduplication in this batch
-                            existing_witnesses.append((witness_id, witness_dict['full_name'], witness_dict['organization']))
-
-                        # Create witness appearance
-                        witness_type = self.witness_fetcher.infer_witness_type(witness_data)
-
-                        appearance_insert = '''
-                            INSERT INTO witness_appearances
-                            (witness_id, hearing_id, position, witness_type, appearance_order)
-                            VALUES (?, ?, ?, ?, ?)
-                        '''
-                        conn.execute(appearance_insert, (
-                            witness_id,
-                            hearing_id,
-                            normalized_witness.get('title'),
-                            witness_type,
-                            order
-                        ))
-                        stats['appearances_created'] += 1
-
-                    except Exception as e:
-                        logger.error(f"Error importing witness for hearing {event_id}: {e}")
+                appearance_insert = '''
+                    INSERT INTO witness_appearances
+                    (witness_id, hearing_id, position, witness_type, appearance_order)
+                    VALUES (?, ?, ?, ?, ?)
+                '''
+                for appearance in appearances:
+                    conn.execute(appearance_insert, appearance)
+                    stats['appearances_created'] += 1
 
         except Exception as e:
             logger.error(f"Error in database transaction for hearing {event_id}: {e}")
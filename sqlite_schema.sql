@@ -181,11 +181,13 @@ CREATE TABLE witnesses (
     full_name TEXT NOT NULL,
     title TEXT,                               -- Professional title
     organization TEXT,
+    normalized_name TEXT,                     -- full_name without titles; identity key with organization
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 CREATE INDEX idx_witnesses_name ON witnesses(last_name, first_name);
 CREATE INDEX idx_witnesses_org ON witnesses(organization);
+CREATE UNIQUE INDEX idx_witnesses_identity ON witnesses(normalized_name, COALESCE(organization, ''));
 CREATE TABLE witness_appearances (
     appearance_id INTEGER PRIMARY KEY AUTOINCREMENT,
     witness_id INTEGER NOT NULL,
@@ -342,3 +344,21 @@ CREATE TABLE schedule_execution_logs (
 CREATE INDEX idx_schedule_exec_schedule ON schedule_execution_logs(schedule_id);
 CREATE INDEX idx_schedule_exec_time ON schedule_execution_logs(execution_time);
 CREATE INDEX idx_schedule_exec_success ON schedule_execution_logs(success);
+CREATE TABLE hearing_listing (
+    hearing_id INTEGER PRIMARY KEY,           -- Same id as hearings.hearing_id
+    event_id TEXT NOT NULL UNIQUE,
+    congress INTEGER NOT NULL,
+    chamber TEXT NOT NULL,
+    title TEXT NOT NULL,
+    hearing_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    hearing_date_only DATE NOT NULL,
+    hearing_time TIME NOT NULL,
+    committee_id INTEGER,                     -- Display committee (parent of a subcommittee)
+    committee_name TEXT,
+    subcommittee_id INTEGER,                  -- Linked subcommittee, if any
+    updated_at TIMESTAMP NOT NULL
+);
+CREATE INDEX idx_hearing_listing_browse ON hearing_listing(hearing_date_only, chamber, committee_id);
+CREATE INDEX idx_hearing_listing_committee ON hearing_listing(committee_id, hearing_date_only);
+CREATE INDEX idx_hearing_listing_sort ON hearing_listing(hearing_date_only, hearing_time, updated_at, hearing_id);
@@ -0,0 +1,3 @@
+"""
+Tests for Congress.gov API client functionality
+"""
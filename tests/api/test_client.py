@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CongressAPIClient concurrent fetching
+"""
+import unittest
+import sys
+import os
+import time
+import random
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.client import CongressAPIClient
+from fetchers.hearing_fetcher import HearingFetcher
+
+
+class TestConcurrentFetching(unittest.TestCase):
+    """Test get_many and batched hearing detail fetching"""
+
+    def setUp(self):
+        """Set up client with a stubbed transport"""
+        self.api_client = CongressAPIClient(api_key='x' * 40)
+
+        def fake_get(endpoint, params=None):
+            # Finish out of order to exercise result ordering
+            time.sleep(random.uniform(0, 0.01))
+            if endpoint.endswith('/bad'):
+                raise ValueError('boom')
+            return {'committeeMeeting': {'eventId': endpoint.rsplit('/', 1)[-1]}}
+
+        self.api_client.get = fake_get
+
+    def test_get_many_preserves_input_order(self):
+        """Results come back in input order regardless of completion order"""
+        endpoints = [f"committee-meeting/119/house/{i}" for i in range(25)]
+        results = self.api_client.get_many(endpoints, max_workers=8)
+
+        self.assertEqual(
+            [r['committeeMeeting']['eventId'] for r in results],
+            [str(i) for i in range(25)]
+        )
+
+    def test_get_many_returns_exceptions_in_place(self):
+        """Failed requests are returned as exceptions at their index"""
+        endpoints = ['committee-meeting/119/house/1', 'committee-meeting/119/house/bad']
+        results = self.api_client.get_many(endpoints, max_workers=2)
+
+        self.assertIsInstance(results[0], dict)
+        self.assertIsInstance(results[1], ValueError)
+
+    def test_get_many_reports_progress(self):
+        """Progress callback is invoked once per completed request"""
+        calls = []
+        self.api_client.get_many(
+            [f"committee-meeting/119/senate/{i}" for i in range(5)],
+            max_workers=3,
+            progress_callback=lambda done, total: calls.append((done, total))
+        )
+
+        self.assertEqual(calls[-1], (5, 5))
+        self.assertEqual(len(calls), 5)
+
+    def test_fetch_hearing_details_batch_maps_failures_to_none(self):
+        """HearingFetcher returns None for hearings whose detail fetch failed"""
+        fetcher = HearingFetcher(self.api_client)
+        details = fetcher.fetch_hearing_details_batch(
+            119, [('House', '1'), ('Senate', 'bad'), ('House', '3')], max_workers=3
+        )
+
+        self.assertEqual(details[0]['committeeMeeting']['eventId'], '1')
+        self.assertIsNone(details[1])
+        self.assertEqual(details[2]['committeeMeeting']['eventId'], '3')
+
+
+if __name__ == '__main__':
+    unittest.main()
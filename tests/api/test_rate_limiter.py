@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the sliding-window rate limiters
+"""
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.rate_limiter import HostRateLimiter, RateLimiter, SharedRateLimiter, create_rate_limiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test the in-process deque limiter"""
+
+    def test_remaining_requests_counts_window(self):
+        """Each request consumes one slot of the window"""
+        limiter = RateLimiter(max_requests=5, time_window=60)
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+        self.assertEqual(limiter.get_remaining_requests(), 2)
+
+    def test_waits_only_for_oldest_request(self):
+        """A full window waits until the oldest request expires, not a full reset"""
+        limiter = RateLimiter(max_requests=2, time_window=0.4)
+        limiter.wait_if_needed()
+        time.sleep(0.2)
+        limiter.wait_if_needed()
+
+        start = time.time()
+        limiter.wait_if_needed()
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 0.35)
+        # Second request is still inside the window, so the slot is not lost
+        self.assertEqual(limiter.get_remaining_requests(), 0)
+
+    def test_thread_safe_accounting(self):
+        """Concurrent callers never lose or double-count requests"""
+        limiter = RateLimiter(max_requests=1000, time_window=60)
+        threads = [threading.Thread(target=lambda: [limiter.wait_if_needed() for _ in range(50)])
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(limiter.get_remaining_requests(), 600)
+
+
+class TestSharedRateLimiter(unittest.TestCase):
+    """Test the SQLite-backed shared limiter"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.state_path = os.path.join(self.tmpdir.name, 'rate_limit.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_instances_share_one_budget(self):
+        """Two limiters on the same state file draw from one quota"""
+        first = SharedRateLimiter(self.state_path, max_requests=4, time_window=60)
+        second = SharedRateLimiter(self.state_path, max_requests=4, time_window=60)
+
+        first.wait_if_needed()
+        second.wait_if_needed()
+        second.wait_if_needed()
+
+        self.assertEqual(first.get_remaining_requests(), 1)
+        self.assertEqual(second.get_remaining_requests(), 1)
+        first.close()
+        second.close()
+
+    def test_full_ring_waits_for_oldest_slot(self):
+        """A full ring blocks until the oldest slot leaves the window"""
+        limiter = SharedRateLimiter(self.state_path, max_requests=2, time_window=0.2)
+        limiter.wait_if_needed()
+        limiter.wait_if_needed()
+
+        start = time.time()
+        limiter.wait_if_needed()
+
+        self.assertGreaterEqual(time.time() - start, 0.15)
+        limiter.close()
+
+    def test_factory_selects_backend(self):
+        """create_rate_limiter picks the shared backend only when a path is given"""
+        self.assertIsInstance(create_rate_limiter(10, 60), RateLimiter)
+        shared = create_rate_limiter(10, 60, state_path=self.state_path)
+        self.assertIsInstance(shared, SharedRateLimiter)
+        shared.close()
+
+        # State directory cannot be created (its parent is a file)
+        blocker = os.path.join(self.tmpdir.name, 'blocker')
+        open(blocker, 'w').close()
+        fallback = create_rate_limiter(10, 60, state_path=os.path.join(blocker, 'state', 'rate_limit.db'))
+        self.assertNotIsInstance(fallback, SharedRateLimiter)
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    """Per-host spacing of request starts"""
+
+    def test_same_host_waits_other_host_does_not(self):
+        limiter = HostRateLimiter(0.2)
+        limiter.wait('https://a.example.com/1')
+
+        start = time.monotonic()
+        limiter.wait('https://b.example.com/1')
+        self.assertLess(time.monotonic() - start, 0.1)
+
+        limiter.wait('https://a.example.com/2')
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the on-disk API response cache
+"""
+import unittest
+import sys
+import os
+import tempfile
+from unittest.mock import MagicMock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from api.response_cache import ResponseCache
+from api.client import CongressAPIClient
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test ResponseCache storage, TTLs and eviction"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_ignores_api_key(self):
+        """Requests differing only by api_key share one cache entry"""
+        self.assertEqual(
+            ResponseCache.make_key('member/A000001', {'api_key': 'one', 'format': 'json'}),
+            ResponseCache.make_key('/member/A000001', {'api_key': 'two'})
+        )
+        self.assertNotEqual(
+            ResponseCache.make_key('committee-meeting/119/house', {'offset': 0}),
+            ResponseCache.make_key('committee-meeting/119/house', {'offset': 250})
+        )
+
+    def test_per_endpoint_ttls(self):
+        """Detail and list endpoints get different TTLs"""
+        cache = ResponseCache(self.path)
+        self.assertEqual(cache.ttl_for('committee-meeting/119/house/115538'), 6 * 3600)
+        self.assertEqual(cache.ttl_for('committee-meeting/119/house'), 15 * 60)
+        self.assertEqual(cache.ttl_for('something/else'), cache.default_ttl)
+        cache.close()
+
+    def test_store_and_lookup_round_trip(self):
+        """Stored responses come back fresh with their validators"""
+        cache = ResponseCache(self.path)
+        cache.store('member/A000001', None, {'member': {'name': 'A'}}, etag='"abc"')
+
+        entry = cache.lookup('member/A000001')
+        self.assertTrue(entry['fresh'])
+        self.assertEqual(entry['data'], {'member': {'name': 'A'}})
+        self.assertEqual(entry['etag'], '"abc"')
+        self.assertIsNone(cache.lookup('member/B000002'))
+        cache.close()
+
+    def test_lru_eviction_respects_budget(self):
+        """Least recently used entries are evicted once over budget"""
+        cache = ResponseCache(self.path)
+        payload = {'data': os.urandom(600).hex()}
+        cache.store('bill/119/hr/0', None, payload)
+        # Budget fits three entries but not four
+        cache.max_bytes = int(cache.get_stats()['size_bytes'] * 3.5)
+        for i in range(1, 3):
+            cache.store(f'bill/119/hr/{i}', None, payload)
+        # Touch the oldest entry so it survives eviction
+        cache.lookup('bill/119/hr/0')
+        cache.store('bill/119/hr/3', None, payload)
+
+        self.assertIsNotNone(cache.lookup('bill/119/hr/0'))
+        self.assertIsNone(cache.lookup('bill/119/hr/1'))
+        self.assertLessEqual(cache.get_stats()['size_bytes'], cache.max_bytes)
+        self.assertGreater(cache.get_stats()['evictions'], 0)
+        cache.close()
+
+
+class TestClientCaching(unittest.TestCase):
+    """Test CongressAPIClient integration with the cache"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.tmpdir.name, 'cache.db'), ttl_rules=[], default_ttl=0)
+        self.api_client = CongressAPIClient(api_key='x' * 40, response_cache=self.cache)
+        self.api_client.circuit_breaker = None
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def _response(self, status, data=None, headers=None):
+        response = MagicMock()
+        response.status_code = status
+        response.json.return_value = data
+        response.headers = headers or {}
+        response.raw.retries = None
+        return response
+
+    def test_stale_entry_revalidated_with_etag(self):
+        """A 304 serves the cached body and counts as a revalidation"""
+        self.api_client.session.get = MagicMock(side_effect=[
+            self._response(200, {'bill': 1}, {'ETag': '"v1"'}),
+            self._response(304),
+        ])
+
+        first = self.api_client.get('bill/119/hr/1')
+        second = self.api_client.get('bill/119/hr/1')
+
+        self.assertEqual(first, second)
+        conditional_headers = self.api_client.session.get.call_args_list[1].kwargs['headers']
+        self.assertEqual(conditional_headers['If-None-Match'], '"v1"')
+
+        stats = self.api_client.get_retry_stats()
+        self.assertEqual(stats['cache_misses'], 1)
+        self.assertEqual(stats['cache_revalidations'], 1)
+
+    def test_fresh_entry_skips_network(self):
+        """Fresh entries are served without an HTTP request"""
+        self.cache.default_ttl = 3600
+        self.api_client.session.get = MagicMock(return_value=self._response(200, {'bill': 1}))
+
+        self.api_client.get('bill/119/hr/2')
+        self.api_client.get('bill/119/hr/2')
+
+        self.assertEqual(self.api_client.session.get.call_count, 1)
+        self.assertEqual(self.api_client.get_retry_stats()['cache_hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
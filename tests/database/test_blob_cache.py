@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BlobContentCache
+"""
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.blob_cache import BlobContentCache
+
+URL = 'https://blob.example/crs-R1-v1.html'
+
+
+class FakeResponse:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """Records requests and answers from a queue"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers or {})
+        return self.responses.pop(0)
+
+
+class TestBlobContentCache(unittest.TestCase):
+    """Memory/disk tiers, content-hash pinning and stale-while-revalidate"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'blobs.db')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_hashed_blob_fetched_once_and_shared_through_disk(self):
+        """A known content hash is served from memory, then from disk in a new process"""
+        session = FakeSession(FakeResponse(200, '<p>report</p>'))
+        cache = BlobContentCache(path=self.path, session=session)
+
+        self.assertEqual(cache.get(URL, 'abc'), '<p>report</p>')
+        self.assertEqual(cache.get(URL, 'abc'), '<p>report</p>')
+        self.assertEqual(len(session.requests), 1)
+        self.assertEqual(cache.get_stats()['memory_hits'], 1)
+
+        restarted = BlobContentCache(path=self.path, session=FakeSession())
+        self.assertEqual(restarted.get(URL, 'abc'), '<p>report</p>')
+        self.assertEqual(restarted.get_stats()['disk_hits'], 1)
+
+    def test_stale_entry_served_while_revalidating(self):
+        """Expired entries are returned at once and refreshed with a conditional GET"""
+        session = FakeSession(FakeResponse(200, 'v1', {'ETag': '"e1"'}), FakeResponse(304))
+        cache = BlobContentCache(session=session, ttl=-1)
+
+        self.assertEqual(cache.get(URL), 'v1')
+        self.assertEqual(cache.get(URL), 'v1')
+        cache._revalidator.shutdown(wait=True)
+
+        self.assertEqual(session.requests[1], {'If-None-Match': '"e1"'})
+        stats = cache.get_stats()
+        self.assertEqual((stats['stale_served'], stats['revalidated']), (1, 1))
+
+    def test_failed_fetch_returns_none(self):
+        """Errors are not cached"""
+        session = FakeSession(FakeResponse(404), FakeResponse(200, 'ok'))
+        cache = BlobContentCache(session=session)
+
+        self.assertIsNone(cache.get(URL))
+        self.assertEqual(cache.get(URL), 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DatabaseManager.bulk_upsert_hearings
+"""
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.manager import DatabaseManager
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def create_sqlite_schema(db_path: str) -> None:
+    """Create the production SQLite schema in a fresh file"""
+    with open(os.path.join(PROJECT_ROOT, 'sqlite_schema.sql')) as f:
+        schema_sql = f.read().replace('CREATE TABLE sqlite_sequence(name,seq);', '')
+    conn = sqlite3.connect(db_path)
+    conn.executescript(schema_sql)
+    conn.close()
+
+
+class TestBulkUpsertHearings(unittest.TestCase):
+    """Test batched hearing writes on SQLite"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'hearings.db')
+        create_sqlite_schema(db_path)
+        self.db = DatabaseManager(db_path=db_path)
+        self.committee_id = self.db.upsert_committee({
+            'system_code': 'hsju00', 'name': 'Judiciary', 'chamber': 'House', 'type': 'Standing', 'congress': 119
+        })
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _record(self, event_id, title='Oversight hearing', witnesses=None):
+        return {
+            'hearing': {
+                'event_id': event_id, 'congress': 119, 'chamber': 'House', 'title': title,
+                'hearing_type': 'Hearing', 'status': 'Scheduled', 'hearing_date': '2025-03-01T14:00:00Z'
+            },
+            'committees': [{'system_code': 'hsju00', 'is_primary': True}, {'system_code': 'missing', 'is_primary': False}],
+            'bills': [{'congress': 119, 'bill_type': 'HR', 'bill_number': 1, 'relationship_type': 'mentioned'}],
+            'witnesses': witnesses or []
+        }
+
+    def _witness(self, full_name, organization='GAO', order=1):
+        first, last = full_name.split()[-2:]
+        return ({'full_name': full_name, 'first_name': first, 'last_name': last, 'organization': organization},
+                {'position': 'Director', 'witness_type': None, 'appearance_order': order})
+
+    def test_writes_hearings_and_links(self):
+        """Hearings, committee, bill and witness links are written and IDs returned"""
+        ids = self.db.bulk_upsert_hearings([
+            self._record('E1', witnesses=[self._witness('Dr. Jane Doe'), self._witness('John Roe', order=2)]),
+            self._record('E2', witnesses=[self._witness('Jane Doe')])
+        ])
+
+        self.assertEqual(set(ids), {'E1', 'E2'})
+        hearing = self.db.get_hearing_by_event_id('E1')
+        self.assertEqual(hearing['hearing_id'], ids['E1'])
+        self.assertEqual(hearing['hearing_date_only'], '2025-03-01')
+
+        counts = self.db.get_table_counts()
+        self.assertEqual(counts['hearing_committees'], 2)
+        self.assertEqual(counts['bills'], 1)
+        self.assertEqual(counts['hearing_bills'], 2)
+        # "Dr. Jane Doe" and "Jane Doe" at the same organization are one witness
+        self.assertEqual(counts['witnesses'], 2)
+        self.assertEqual(counts['witness_appearances'], 3)
+
+    def test_rerun_updates_in_place(self):
+        """A second batch updates existing rows without duplicating links"""
+        first = self.db.bulk_upsert_hearings([self._record('E1', witnesses=[self._witness('Jane Doe')])])
+        second = self.db.bulk_upsert_hearings([
+            self._record('E1', title='Renamed', witnesses=[self._witness('Jane Doe')])
+        ])
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.db.get_hearing_by_event_id('E1')['title'], 'Renamed')
+        counts = self.db.get_table_counts()
+        self.assertEqual(counts['hearings'], 1)
+        self.assertEqual(counts['witnesses'], 1)
+        self.assertEqual(counts['witness_appearances'], 1)
+
+    def test_matches_witness_created_by_row_api(self):
+        """Existing witnesses are reused with get_or_create_witness matching rules"""
+        witness_id = self.db.get_or_create_witness(
+            {'full_name': 'The Honorable Jane Doe', 'first_name': 'Jane', 'last_name': 'Doe', 'organization': 'GAO'}
+        )
+        self.db.bulk_upsert_hearings([self._record('E1', witnesses=[self._witness('Jane Doe')])])
+
+        row = self.db.fetch_one('SELECT witness_id FROM witness_appearances')
+        self.assertEqual(row['witness_id'], witness_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CRSFTSIndexer queueing
+"""
+import unittest
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.crs_fts_indexer import CRSFTSIndexer
+
+
+class TestCRSFTSIndexer(unittest.TestCase):
+    """Queue, savepoint rollback and de-duplication"""
+
+    def test_take_keeps_latest_entry_per_version(self):
+        indexer = CRSFTSIndexer()
+        indexer.queue(1, 'R1', 'Old', 'old text')
+        indexer.queue(2, 'R2', 'Summary', 'text')
+        indexer.queue(1, 'R1', 'New', 'new text')
+
+        self.assertEqual(sorted(indexer.take()), [(1, 'R1', 'New', 'new text'), (2, 'R2', 'Summary', 'text')])
+        self.assertEqual(indexer.take(), [])
+
+    def test_rollback_to_mark(self):
+        indexer = CRSFTSIndexer()
+        indexer.queue(1, 'R1', '', 'kept')
+        mark = indexer.mark()
+        indexer.queue(2, 'R2', '', 'rolled back')
+        indexer.rollback_to(mark)
+
+        self.assertEqual(indexer.take(), [(1, 'R1', '', 'kept')])
+
+    def test_flush_without_entries_skips_database(self):
+        self.assertEqual(CRSFTSIndexer().flush(conn=None), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Unit tests for streaming exports
+"""
+import unittest
+import sys
+import os
+import csv
+import gzip
+import io
+import json
+from datetime import date
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database import export_stream as es
+
+COLUMNS = ['id', 'title', 'published']
+ROWS = [(1, 'First, with comma', date(2024, 1, 2)), (2, 'Second "quoted"', None)]
+
+
+class TestExportStream(unittest.TestCase):
+    """CSV/NDJSON encoding, gzip and early error surfacing"""
+
+    def test_csv_round_trip(self):
+        """Header then rows; many rows are split into several pieces"""
+        original = es.FLUSH_BYTES
+        es.FLUSH_BYTES = 64
+        try:
+            pieces = list(es.export_stream(COLUMNS, ROWS * 10, 'csv'))
+        finally:
+            es.FLUSH_BYTES = original
+
+        self.assertGreater(len(pieces), 1)
+        parsed = list(csv.reader(io.StringIO(b''.join(pieces).decode('utf-8'))))
+        self.assertEqual(parsed[0], COLUMNS)
+        self.assertEqual(parsed[1], ['1', 'First, with comma', '2024-01-02'])
+        self.assertEqual(len(parsed), 21)
+
+    def test_ndjson_gzip(self):
+        """Gzipped NDJSON decompresses to one JSON object per row"""
+        body = b''.join(es.export_stream(COLUMNS, iter(ROWS), 'ndjson', compress=True))
+        lines = gzip.decompress(body).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines], [
+            {'id': 1, 'title': 'First, with comma', 'published': '2024-01-02'},
+            {'id': 2, 'title': 'Second "quoted"', 'published': None},
+        ])
+
+    def test_start_stream_raises_before_response(self):
+        """Query errors raise up front and the source is closed with the stream"""
+        def failing_rows():
+            raise RuntimeError('connection refused')
+            yield
+
+        with self.assertRaises(RuntimeError):
+            es.start_stream(es.export_stream(COLUMNS, failing_rows()))
+
+        closed = []
+
+        def rows():
+            try:
+                yield from ROWS
+            finally:
+                closed.append(True)
+
+        original = es.FLUSH_BYTES
+        es.FLUSH_BYTES = 1
+        try:
+            stream = es.start_stream(es.export_stream(COLUMNS, rows()))
+            next(stream)
+            stream.close()
+        finally:
+            es.FLUSH_BYTES = original
+        self.assertEqual(closed, [True])
+
+    def test_request_args(self):
+        """Unknown formats fall back to CSV; limits must be positive"""
+        self.assertEqual(es.export_format({'format': 'NDJSON', 'gzip': '1'}), ('ndjson', True))
+        self.assertEqual(es.export_format({'format': 'xlsx'}), ('csv', False))
+        self.assertIsNone(es.limit_arg({'limit': 'abc'}))
+        self.assertIsNone(es.limit_arg({}))
+        self.assertEqual(es.limit_arg({'limit': '50'}), 50)
+
+        mimetype, headers = es.export_response_headers('crs_products', 'csv', True)
+        self.assertEqual(mimetype, 'application/gzip')
+        self.assertIn('crs_products.csv.gz', headers['Content-Disposition'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the denormalized hearing_listing table
+"""
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.manager import DatabaseManager
+from database.hearing_listing import HearingListing, SORT_INDEX
+from database.pagination import KeysetPager, NULL_DATE
+from tests.database.test_bulk_upsert import create_sqlite_schema
+
+
+class TestHearingListing(unittest.TestCase):
+    """Test committee resolution, incremental refresh and the subquery fallback"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'listing.db')
+        create_sqlite_schema(db_path)
+        self.db = DatabaseManager(db_path=db_path)
+
+        self.full = self.db.upsert_committee({'system_code': 'hsju00', 'name': 'Judiciary',
+                                              'chamber': 'House', 'type': 'Standing', 'congress': 119})
+        self.sub = self.db.upsert_committee({'system_code': 'hsju05', 'name': 'Subcommittee on Crime',
+                                             'chamber': 'House', 'type': 'Subcommittee', 'congress': 119,
+                                             'parent_committee_id': self.full})
+        self.other = self.db.upsert_committee({'system_code': 'hsag00', 'name': 'Agriculture',
+                                               'chamber': 'House', 'type': 'Standing', 'congress': 119})
+
+        self.hearing_ids = {}
+        for event_id, date in [('1', '2025-03-01'), ('2', '2025-03-02'), ('3', '2025-03-03')]:
+            self.hearing_ids[event_id] = self.db.upsert_hearing({
+                'event_id': event_id, 'congress': 119, 'chamber': 'House', 'title': f'Hearing {event_id}',
+                'hearing_type': 'Hearing', 'status': 'Scheduled', 'hearing_date': date
+            })
+
+        # 1: primary subcommittee plus a participating committee; 2: no primary; 3: no links
+        self.db.link_hearing_committee(self.hearing_ids['1'], self.other, False)
+        self.db.link_hearing_committee(self.hearing_ids['1'], self.sub, True)
+        self.db.link_hearing_committee(self.hearing_ids['2'], self.other, False)
+
+        self.listing = HearingListing(self.db)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _rows(self):
+        rows = self.db.fetch_all(
+            'SELECT event_id, committee_id, committee_name, subcommittee_id, title '
+            'FROM hearing_listing ORDER BY event_id'
+        )
+        return {row['event_id']: row for row in rows}
+
+    def test_build_resolves_display_committee(self):
+        """Primary link wins, subcommittees show under their parent"""
+        self.assertEqual(self.listing.build(), 3)
+        rows = self._rows()
+
+        self.assertEqual(rows['1']['committee_id'], self.full)
+        self.assertEqual(rows['1']['committee_name'], 'Judiciary')
+        self.assertEqual(rows['1']['subcommittee_id'], self.sub)
+        self.assertEqual(rows['2']['committee_name'], 'Agriculture')
+        self.assertIsNone(rows['2']['subcommittee_id'])
+        self.assertIsNone(rows['3']['committee_id'])
+
+    def test_refresh_follows_link_and_title_changes(self):
+        """Refresh by event id picks up relinks, edits and deleted hearings"""
+        self.listing.build()
+
+        self.db.delete_hearing_committee_links(self.hearing_ids['1'])
+        self.db.link_hearing_committee(self.hearing_ids['1'], self.other, True)
+        self.db.execute('UPDATE hearings SET title = ? WHERE event_id = ?', ('Renamed', '1'))
+        self.db.execute('DELETE FROM hearings WHERE event_id = ?', ('3',))
+
+        self.assertEqual(self.listing.refresh(['1', '3']), 2)
+        rows = self._rows()
+
+        self.assertEqual(rows['1']['committee_name'], 'Agriculture')
+        self.assertEqual(rows['1']['title'], 'Renamed')
+        self.assertNotIn('3', rows)
+
+    def test_source_falls_back_to_subquery(self):
+        """Before the table exists, source() resolves committees inline"""
+        self.db.execute('DROP TABLE hearing_listing')
+        self.assertEqual(self.listing.refresh(['1']), 0)
+
+        source = self.listing.source()
+        self.assertNotEqual(source, 'hearing_listing')
+        rows = self.db.fetch_all(
+            f'SELECT h.event_id, h.committee_name FROM {source} h WHERE h.committee_id = ? ORDER BY h.event_id',
+            (self.full,)
+        )
+        self.assertEqual([(r['event_id'], r['committee_name']) for r in rows], [('1', 'Judiciary')])
+
+    def test_default_order_pages_through_sort_index(self):
+        """Undated hearings store NULL_DATE, so cursor pages are an index range on raw columns"""
+        self.db.upsert_hearing({'event_id': '4', 'congress': 119, 'chamber': 'House', 'title': 'Undated',
+                                'hearing_type': 'Hearing', 'status': 'Scheduled'})
+        self.listing.build()
+
+        keys = [(column, 'DESC') for column in ('hearing_date_only', 'hearing_time', 'updated_at', 'hearing_id')]
+        query = 'SELECT h.event_id, h.hearing_date_only, h.hearing_time, h.updated_at, h.hearing_id ' \
+                'FROM hearing_listing h WHERE h.chamber = ?'
+        first = KeysetPager(keys, 2, {})
+        rows = first.finish(self.db.fetch_all(*first.wrap(query, ['House'])))
+        self.assertEqual([row['event_id'] for row in rows], ['3', '2'])
+
+        second = KeysetPager(keys, 2, {'page': 2, 'after': first.next_cursor})
+        sql, params = second.wrap(query, ['House'])
+        rows = second.finish(self.db.fetch_all(sql, params))
+        self.assertEqual([(row['event_id'], row['hearing_date_only']) for row in rows],
+                         [('1', '2025-03-01'), ('4', NULL_DATE)])
+
+        plan = ' '.join(row['detail'] for row in self.db.fetch_all(f'EXPLAIN QUERY PLAN {sql}', params))
+        self.assertIn(f'SEARCH h USING INDEX {SORT_INDEX}', plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
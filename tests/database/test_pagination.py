@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for keyset pagination and cached counts
+"""
+import unittest
+import sys
+import os
+import sqlite3
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.pagination import KeysetPager, CountCache, cached_count, NULL_DATE
+
+BASE_QUERY = 'SELECT item_id, name, day FROM items WHERE item_id > ?'
+
+
+class TestKeysetPager(unittest.TestCase):
+    """Test cursor paging against OFFSET paging on SQLite"""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute('CREATE TABLE items (item_id INTEGER PRIMARY KEY, name TEXT, day TEXT)')
+        # Repeated names and missing days exercise the tie-breaker and the NULL sentinel
+        rows = [(i, f'name{i % 4}', None if i % 5 == 0 else f'2025-01-{i % 9 + 1:02d}') for i in range(1, 24)]
+        self.conn.executemany('INSERT INTO items VALUES (?, ?, ?)', rows)
+
+        self.keys = [('name', 'ASC'), (f"COALESCE(day, '{NULL_DATE}')", 'DESC'), ('item_id', 'ASC')]
+        order = 'name ASC, day IS NULL, day DESC, item_id ASC'
+        self.expected = [r[0] for r in self.conn.execute(f'{BASE_QUERY} ORDER BY {order}', (0,))]
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _fetch(self, args):
+        pager = KeysetPager(self.keys, 5, args, signature='name:ASC')
+        sql, params = pager.wrap(BASE_QUERY, [0])
+        rows = pager.finish(self.conn.execute(sql, params).fetchall())
+        return pager, [row[0] for row in rows]
+
+    def test_forward_and_backward_match_offset_order(self):
+        """Following Next then Previous cursors visits the same rows as OFFSET"""
+        pages = []
+        args = {'page': 1}
+        while True:
+            pager, ids = self._fetch(args)
+            pages.append(ids)
+            if not pager.has_next:
+                break
+            args = {'page': pager.page + 1, 'after': pager.next_cursor}
+
+        self.assertEqual([i for page in pages for i in page], self.expected)
+        self.assertEqual(len(pages[-1]), 3)
+
+        # Walk back from the last page
+        for number in range(len(pages) - 1, 0, -1):
+            args = {'page': number, 'before': pager.prev_cursor}
+            pager, ids = self._fetch(args)
+            self.assertEqual(ids, pages[number - 1])
+        self.assertFalse(pager.has_prev)
+
+    def test_numbered_page_uses_offset(self):
+        """A page number without a cursor falls back to OFFSET"""
+        pager, ids = self._fetch({'page': 3})
+        self.assertEqual(ids, self.expected[10:15])
+        self.assertTrue(pager.has_prev)
+
+    def test_cursor_from_other_sort_is_ignored(self):
+        """Cursors are bound to the sort they were issued for"""
+        pager, _ = self._fetch({'page': 1})
+        other = KeysetPager(self.keys, 5, {'after': pager.next_cursor}, signature='name:DESC')
+        self.assertIsNone(other.cursor_values)
+        self.assertIsNone(other.decode_cursor('not a cursor'))
+
+    def test_named_paramstyle(self):
+        """Named parameters keep LIMIT/OFFSET apart from the cursor values"""
+        pager, _ = self._fetch({'page': 1})
+        named = KeysetPager(self.keys, 5, {'page': 2, 'after': pager.next_cursor}, signature='name:ASC',
+                            paramstyle='named')
+        sql, params = named.wrap('SELECT item_id, name, day FROM items WHERE item_id > :start', {'start': 0})
+        rows = named.finish(self.conn.execute(sql, params).fetchall())
+        self.assertEqual(params['start'], 0)
+        self.assertEqual([row[0] for row in rows], self.expected[5:10])
+
+    def test_grouped_query_pages_like_offset(self):
+        """wrap_grouped applies the cursor inside the aggregate, in WHERE or HAVING"""
+        self.conn.execute('CREATE TABLE tags (item_id INTEGER, tag TEXT)')
+        self.conn.executemany('INSERT INTO tags VALUES (?, ?)', [(i, f't{j}') for i in range(1, 24)
+                                                                 for j in range(i % 3)])
+        select = 'SELECT i.item_id, i.name, COUNT(t.tag) AS tag_count'
+        query_from = 'FROM items i LEFT JOIN tags t ON t.item_id = i.item_id WHERE i.item_id > ?'
+        group_by = 'GROUP BY i.item_id, i.name'
+
+        for keys, aggregate_keys, order in (
+                ([('i.name', 'DESC'), ('i.item_id', 'ASC')], False, 'i.name DESC, i.item_id'),
+                ([('COUNT(t.tag)', 'DESC'), ('i.item_id', 'ASC')], True, 'tag_count DESC, i.item_id')):
+            with self.subTest(aggregate_keys=aggregate_keys):
+                expected = [r[0] for r in self.conn.execute(
+                    f'{select} {query_from} {group_by} ORDER BY {order}', (3,))]
+                seen, args = [], {'page': 1}
+                while True:
+                    pager = KeysetPager(keys, 4, args, signature='grouped')
+                    sql, params = pager.wrap_grouped(select, query_from, group_by, [3], aggregate_keys)
+                    seen.extend(row[0] for row in pager.finish(self.conn.execute(sql, params).fetchall()))
+                    if not pager.has_next:
+                        break
+                    args = {'page': pager.page + 1, 'after': pager.next_cursor}
+                self.assertEqual(seen, expected)
+
+
+class TestCountCache(unittest.TestCase):
+    """Test count reuse per filter key"""
+
+    def test_counts_are_reused_until_expiry(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (x INTEGER)')
+        conn.executemany('INSERT INTO t VALUES (?)', [(i,) for i in range(10)])
+        queries = []
+        conn.set_trace_callback(queries.append)
+
+        self.assertEqual(cached_count(conn, ('t', 5), 'SELECT COUNT(*) FROM t WHERE x < ?', [5]), 5)
+        self.assertEqual(cached_count(conn, ('t', 5), 'SELECT COUNT(*) FROM t WHERE x < ?', [5]), 5)
+        self.assertEqual(len(queries), 1)
+
+        cache = CountCache(ttl=0)
+        self.assertEqual(cache.get_or_compute('k', lambda: 1), 1)
+        self.assertEqual(cache.get_or_compute('k', lambda: 2), 2)
+        conn.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
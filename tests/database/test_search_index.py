@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the full-text SearchIndex (SQLite FTS5 backend)
+"""
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.manager import DatabaseManager
+from database.search_index import SearchIndex, query_terms
+from tests.database.test_bulk_upsert import create_sqlite_schema
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test index build, trigger sync, ranking and LIKE fallback"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'search.db')
+        create_sqlite_schema(db_path)
+        self.db = DatabaseManager(db_path=db_path)
+
+        self.db.upsert_committee({'system_code': 'hsju00', 'name': 'Committee on the Judiciary',
+                                  'chamber': 'House', 'type': 'Standing', 'congress': 119})
+        for event_id, title, date in [
+            ('1', 'Oversight of the Federal Bureau of Investigation', '2025-02-01'),
+            ('2', 'Artificial Intelligence and Criminal Exploitation', '2025-03-01'),
+            ('3', 'Artificial Intelligence in Health Care: Artificial Intelligence Oversight', '2025-01-01'),
+        ]:
+            self.db.upsert_hearing({'event_id': event_id, 'congress': 119, 'chamber': 'House', 'title': title,
+                                    'hearing_type': 'Hearing', 'status': 'Scheduled', 'hearing_date': date})
+        self.db.execute("INSERT INTO witnesses (full_name, organization) VALUES (?, ?)",
+                        ('Dr. Jane Doe', 'Government Accountability Office'))
+
+        self.index = SearchIndex(self.db)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _titles(self, rows):
+        return [row[1] for row in rows]
+
+    def test_query_terms_drop_operators(self):
+        """Quotes and FTS operators in user input cannot break the MATCH syntax"""
+        self.assertEqual(query_terms('"AI" OR -health*'), ['ai', 'or', 'health'])
+        self.assertEqual(query_terms('!!!'), [])
+
+    def test_like_fallback_before_build(self):
+        """Without the index, searches use LIKE matching"""
+        with self.db.transaction() as conn:
+            rows = self.index.search_hearings(conn, 'Artificial')
+        self.assertEqual(len(rows), 2)
+
+    def test_ranked_prefix_search(self):
+        """Built index ranks better matches first and matches word prefixes"""
+        self.index.build()
+
+        with self.db.transaction() as conn:
+            rows = self.index.search_hearings(conn, 'artificial intel')
+            self.assertEqual(self._titles(rows)[0],
+                             'Artificial Intelligence in Health Care: Artificial Intelligence Oversight')
+            self.assertEqual(len(rows), 2)
+
+            witnesses = self.index.search_witnesses(conn, 'accountab')
+            self.assertEqual(witnesses[0][1], 'Dr. Jane Doe')
+            self.assertEqual(witnesses[0][4], 0)
+
+            committees = self.index.search_committees(conn, 'judic')
+            self.assertEqual(committees[0][1], 'Committee on the Judiciary')
+
+    def test_triggers_keep_index_in_sync(self):
+        """Inserts and title updates after the build are searchable"""
+        self.index.build()
+        self.db.upsert_hearing({'event_id': '1', 'congress': 119, 'chamber': 'House',
+                                'title': 'Quantum Computing Readiness', 'hearing_type': 'Hearing',
+                                'status': 'Scheduled'})
+        self.db.upsert_hearing({'event_id': '4', 'congress': 119, 'chamber': 'House',
+                                'title': 'Quantum Networks', 'hearing_type': 'Hearing', 'status': 'Scheduled'})
+
+        with self.db.transaction() as conn:
+            self.assertEqual(len(self.index.search_hearings(conn, 'quantum')), 2)
+            self.assertEqual(self.index.search_hearings(conn, 'bureau'), [])
+
+            sql, params = self.index.match_ids_sql('hearings', 'quantum net')
+            rows = conn.execute(f"SELECT event_id FROM hearings WHERE hearing_id IN ({sql})", params).fetchall()
+            self.assertEqual([r[0] for r in rows], ['4'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for UpdateSnapshots journal and backup snapshots
+"""
+import unittest
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.unified_manager import UnifiedDatabaseManager
+from database.update_snapshots import SnapshotError, UpdateSnapshots
+from tests.database.test_bulk_upsert import create_sqlite_schema
+
+
+class TestUpdateSnapshots(unittest.TestCase):
+    """Test restoring hearings, links and witnesses changed after a snapshot"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'hearings.db')
+        create_sqlite_schema(db_path)
+        self.db = UnifiedDatabaseManager(db_url=db_path, prefer_postgres=False)
+
+        with self.db.transaction() as conn:
+            conn.execute("INSERT INTO committees (committee_id, system_code, name, chamber, type, congress) "
+                         "VALUES (1, 'hsju00', 'Judiciary', 'House', 'Standing', 119)")
+            conn.execute("INSERT INTO committees (committee_id, system_code, name, chamber, type, congress) "
+                         "VALUES (2, 'hsag00', 'Agriculture', 'House', 'Standing', 119)")
+            for hearing_id in (1, 2):
+                conn.execute("INSERT INTO hearings (hearing_id, event_id, congress, chamber, title, hearing_type, status) "
+                             "VALUES (?, ?, 119, 'House', ?, 'Hearing', 'Scheduled')",
+                             (hearing_id, str(hearing_id), f'Hearing {hearing_id}'))
+            conn.execute('INSERT INTO hearing_committees (hearing_id, committee_id, is_primary) VALUES (1, 1, 1)')
+            conn.execute('INSERT INTO hearing_committees (hearing_id, committee_id, is_primary) VALUES (2, 2, 1)')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _state(self):
+        return {table: [tuple(row) for row in self.db.fetch_all(f'SELECT * FROM {table} ORDER BY 1, 2')]
+                for table in ('hearings', 'hearing_committees', 'witnesses')}
+
+    def _apply_update(self):
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE hearings SET title = 'Renamed', status = 'Canceled' WHERE hearing_id = 1")
+            conn.execute("INSERT INTO hearings (hearing_id, event_id, congress, chamber, title, hearing_type, status) "
+                         "VALUES (3, '3', 119, 'House', 'New hearing', 'Hearing', 'Scheduled')")
+            conn.execute("INSERT INTO witnesses (first_name, last_name, full_name) VALUES ('A', 'B', 'A B')")
+            # Links are replaced, not updated
+            conn.execute('DELETE FROM hearing_committees WHERE hearing_id = 1')
+            conn.execute('INSERT INTO hearing_committees (hearing_id, committee_id, is_primary) VALUES (1, 2, 1)')
+            conn.execute('INSERT INTO hearing_committees (hearing_id, committee_id, is_primary) VALUES (3, 1, 1)')
+            conn.execute('UPDATE hearing_committees SET is_primary = 0 WHERE hearing_id = 2')
+            conn.execute('DELETE FROM hearing_committees WHERE hearing_id = 2')
+
+    def test_journal_restore(self):
+        """Only changed rows are journaled and all of them are put back"""
+        before = self._state()
+        snapshots = UpdateSnapshots(self.db, mode='journal')
+        snapshot = snapshots.create()
+
+        self._apply_update()
+        self.assertNotEqual(self._state(), before)
+        journaled = self.db.fetch_one('SELECT COUNT(*) AS n FROM snapshot_journal')['n']
+        self.assertEqual(journaled, 8)
+
+        self.assertGreater(snapshots.restore(snapshot), 0)
+        self.assertEqual(self._state(), before)
+        # Restoring is not journaled and a second restore is a no-op
+        self.assertEqual(self.db.fetch_one('SELECT COUNT(*) AS n FROM snapshot_journal')['n'], journaled)
+        self.assertEqual(snapshots.restore(snapshot), 0)
+
+    def test_committed_run_stops_journaling_and_interrupted_run_restores(self):
+        """Writes after commit are not journaled; a crashed run can be restored later, over later runs only if forced"""
+        snapshots = UpdateSnapshots(self.db, mode='journal')
+        snapshots.commit(snapshots.create())
+        self._apply_update()
+        self.assertEqual(self.db.fetch_one('SELECT COUNT(*) AS n FROM snapshot_journal')['n'], 0)
+
+        before = self._state()
+        crashed = snapshots.create()
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE hearings SET title = 'Half done' WHERE hearing_id = 2")
+
+        # The next run finds the crashed one
+        next_run = snapshots.create()
+        snapshots.commit(next_run)
+        runs = {run['run_id']: run['status'] for run in snapshots.list_runs()}
+        self.assertEqual(runs[crashed.run_id], 'interrupted')
+
+        with self.assertRaises(SnapshotError):
+            snapshots.restore(crashed.run_id)
+        self.assertEqual(self.db.fetch_one("SELECT title FROM hearings WHERE hearing_id = 2")['title'], 'Half done')
+
+        snapshots.restore(crashed.run_id, force=True)
+        self.assertEqual(self._state(), before)
+
+    def test_backup_restore_and_prune(self):
+        """Backup snapshots use the online backup API and are pruned with their file"""
+        before = self._state()
+        snapshots = UpdateSnapshots(self.db, mode='backup')
+        snapshot = snapshots.create()
+        self.assertTrue(os.path.exists(snapshot.location))
+
+        # A connection stays open across the restore
+        conn = self.db.get_connection()
+        self._apply_update()
+        self.assertGreater(snapshots.restore(snapshot), 0)
+        self.assertEqual(conn.execute("SELECT title FROM hearings WHERE hearing_id = 1").fetchone()[0], 'Hearing 1')
+        conn.close()
+        self.assertEqual(self._state(), before)
+
+        self.assertEqual(snapshots.prune(days=7), 0)
+        self.assertEqual(snapshots.prune(days=-1), 1)
+        self.assertFalse(os.path.exists(snapshot.location))
+        self.assertEqual(snapshots.list_runs(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for indexed witness identity resolution
+"""
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.manager import DatabaseManager
+from database.unified_manager import UnifiedDatabaseManager
+
+LEGACY_WITNESSES = '''
+CREATE TABLE witnesses (
+    witness_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    first_name TEXT,
+    last_name TEXT,
+    full_name TEXT NOT NULL,
+    title TEXT,
+    organization TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+'''
+
+
+class TestWitnessIdentity(unittest.TestCase):
+    """Test normalized_name backfill and indexed lookups"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'witnesses.db')
+
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(LEGACY_WITNESSES)
+        conn.executemany(
+            'INSERT INTO witnesses (first_name, last_name, full_name, organization) VALUES (?, ?, ?, ?)',
+            [
+                ('Jane', 'Doe', 'Dr. Jane Doe', 'GAO'),
+                ('Jane', 'Doe', 'Jane Doe', 'GAO'),        # duplicate identity of row 1
+                ('John', 'Roe', 'The Honorable John Roe', None),
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+        self.db = DatabaseManager(db_path=self.db_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_legacy_schema_still_resolves(self):
+        """Without the column, lookups fall back to the organization scan"""
+        witness_id = self.db.get_or_create_witness({'full_name': 'Mr. John Roe', 'organization': ''})
+        self.assertEqual(witness_id, 3)
+
+    def test_backfill_populates_and_indexes(self):
+        """Backfill keeps the oldest row per identity and builds the unique index"""
+        result = self.db.backfill_witness_normalized_names()
+        self.assertEqual(result, {'total': 3, 'updated': 2, 'duplicates': 1})
+
+        rows = self.db.fetch_all('SELECT witness_id, normalized_name FROM witnesses ORDER BY witness_id')
+        self.assertEqual([r['normalized_name'] for r in rows], ['Jane Doe', None, 'John Roe'])
+
+        # Re-running is a no-op
+        self.assertEqual(self.db.backfill_witness_normalized_names()['updated'], 0)
+
+        plan = self.db.fetch_all(
+            "EXPLAIN QUERY PLAN SELECT witness_id FROM witnesses "
+            "WHERE normalized_name = ? AND COALESCE(organization, '') = ?",
+            ('Jane Doe', 'GAO')
+        )
+        self.assertIn('idx_witnesses_identity', ' '.join(r['detail'] for r in plan))
+
+    def test_lookup_uses_index_and_cache(self):
+        """Resolved witnesses are served from the cache on repeat lookups"""
+        self.db.backfill_witness_normalized_names()
+
+        self.assertEqual(self.db.get_or_create_witness({'full_name': 'Ms. Jane Doe', 'organization': 'GAO'}), 1)
+        self.assertEqual(self.db.get_or_create_witness({'full_name': 'Jane Doe', 'organization': 'GAO'}), 1)
+        self.assertEqual(self.db._witness_cache.hits, 1)
+
+        new_id = self.db.get_or_create_witness({'full_name': 'Dr. Ann Lee', 'first_name': 'Ann',
+                                                'last_name': 'Lee', 'organization': 'CBO'})
+        row = self.db.fetch_one('SELECT normalized_name FROM witnesses WHERE witness_id = ?', (new_id,))
+        self.assertEqual(row['normalized_name'], 'Ann Lee')
+
+        # A second manager (e.g. the daily updater) finds it through the index
+        unified = UnifiedDatabaseManager(db_url=self.db_path, prefer_postgres=False)
+        self.assertEqual(unified.get_or_create_witness({'full_name': 'Ann Lee', 'organization': 'CBO'}), new_id)
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.execute(
+                "INSERT INTO witnesses (full_name, organization, normalized_name) VALUES (?, ?, ?)",
+                ('Ann Lee', 'CBO', 'Ann Lee')
+            )
+
+    def test_concurrent_insert_returns_existing_row(self):
+        """Losing the insert race to another writer resolves to that writer's row"""
+        self.db.backfill_witness_normalized_names()
+        probe = self.db._find_witness_by_identity
+
+        # Another writer committed 'Jane Doe' (GAO) after our probe missed it
+        with mock.patch.object(self.db, '_find_witness_by_identity', side_effect=[None, probe(('Jane Doe', 'GAO'))]):
+            result = self.db.resolve_witness({'full_name': 'Dr. Jane Doe', 'organization': 'GAO'})
+
+        self.assertEqual(result, (1, False))
+        self.assertEqual(self.db.get_or_create_witness({'full_name': 'Jane Doe', 'organization': 'GAO'}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DocumentBatchWriter
+"""
+import unittest
+import sys
+import os
+import tempfile
+from sqlalchemy import text
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.models import (
+    Author, DocumentAuthor, DocumentSubject, Source, Subject, get_session, init_database
+)
+from brookings_ingester.storage.batch_writer import DocumentBatchWriter
+
+
+def make_document(identifier, checksum, authors=(), subjects=()):
+    return {'document_identifier': identifier, 'title': identifier.title(), 'checksum': checksum,
+            'authors': list(authors), 'subjects': list(subjects)}
+
+
+class TestDocumentBatchWriter(unittest.TestCase):
+    """Set-based document, author and subject writes on SQLite"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        init_database(f"sqlite:///{os.path.join(self.tmpdir.name, 'library.db')}")
+
+        self.session = get_session()
+        source = Source(source_code='FAKE', name='Fake Source')
+        self.session.add(source)
+        self.session.add(Author(full_name='Ada Lovelace', first_name='Ada', last_name='Lovelace'))
+        self.session.commit()
+        self.source_id = source.source_id
+
+    def tearDown(self):
+        self.session.close()
+        self.tmpdir.cleanup()
+
+    def write(self, documents):
+        results = DocumentBatchWriter(self.session, self.source_id).write(documents)
+        self.session.commit()
+        return results
+
+    def test_creates_documents_and_reuses_names(self):
+        """Known authors are reused, new names are created once, links keep order"""
+        results = self.write([
+            make_document('one', 'a', authors=['Ada Lovelace', {'name': 'Alan Turing'}], subjects=['Computing']),
+            make_document('two', 'b', authors=['Alan Turing', 'Alan Turing'], subjects=['Computing', 'Logic']),
+        ])
+
+        self.assertEqual([action for _, action in results], ['created', 'created'])
+        self.assertEqual(self.session.query(Author).count(), 2)
+        self.assertEqual(sorted(s.name for s in self.session.query(Subject)), ['Computing', 'Logic'])
+
+        turing = self.session.query(Author).filter_by(full_name='Alan Turing').one()
+        self.assertEqual((turing.first_name, turing.last_name), ('Alan', 'Turing'))
+
+        one_id = results[0][0]
+        links = self.session.query(DocumentAuthor).filter_by(document_id=one_id).order_by(DocumentAuthor.author_order)
+        self.assertEqual([link.author.full_name for link in links], ['Ada Lovelace', 'Alan Turing'])
+        self.assertEqual(self.session.query(DocumentAuthor).filter_by(document_id=results[1][0]).count(), 1)
+
+    def test_rewrite_updates_only_changed_documents(self):
+        """Same checksum is unchanged; a new checksum updates in place and relinks"""
+        first = self.write([make_document('one', 'a', subjects=['Computing']),
+                            make_document('two', 'b', subjects=['Computing'])])
+
+        second = self.write([make_document('one', 'a', subjects=['Computing']),
+                             make_document('two', 'c', subjects=['Logic']),
+                             make_document('three', 'd')])
+
+        self.assertEqual([action for _, action in second], ['unchanged', 'updated', 'created'])
+        self.assertEqual([doc_id for doc_id, _ in second[:2]], [doc_id for doc_id, _ in first])
+
+        subjects = self.session.query(Subject.name).join(
+            DocumentSubject, DocumentSubject.subject_id == Subject.subject_id
+        ).filter(DocumentSubject.document_id == second[1][0]).all()
+        self.assertEqual([name for name, in subjects], ['Logic'])
+
+    def test_author_metadata_fills_empty_columns(self):
+        """With the author metadata migration applied, dict fields are written like store() does"""
+        for column in ('job_title', 'affiliation_text', 'profile_url', 'linkedin_url'):
+            self.session.execute(text(f'ALTER TABLE authors ADD COLUMN {column} VARCHAR(500)'))
+        self.session.execute(text("UPDATE authors SET job_title = 'Countess' WHERE full_name = 'Ada Lovelace'"))
+        self.session.commit()
+
+        self.write([make_document('one', 'a', authors=[
+            {'name': 'Ada Lovelace', 'title': 'Analyst', 'affiliation': 'Analytical Engine'},
+            {'name': 'Alan Turing', 'title': 'Fellow', 'profile_url': 'https://example.org/turing'},
+        ])])
+
+        rows = self.session.execute(text(
+            'SELECT full_name, job_title, affiliation_text, profile_url FROM authors ORDER BY full_name'
+        )).all()
+        self.assertEqual([tuple(row) for row in rows], [
+            ('Ada Lovelace', 'Countess', 'Analytical Engine', None),
+            ('Alan Turing', 'Fellow', None, 'https://example.org/turing'),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
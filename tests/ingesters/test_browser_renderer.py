@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pluggable page renderers
+"""
+import unittest
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fetchers.browser_renderer import PlaywrightRenderer, RenderError, Renderer
+from fetchers.crs_content_fetcher import CRSContentFetcher, source_fingerprint
+
+
+class FakeRenderer(Renderer):
+    """Serves fixed HTML per URL; unknown URLs fail"""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def render(self, url, wait_for=None, timeout=60, scroll=False):
+        self.calls.append((url, wait_for))
+        if url not in self.pages:
+            raise RenderError(f"No page for {url}")
+        return self.pages[url]
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    async def abort(self):
+        self.outcome = 'abort'
+
+    async def continue_(self):
+        self.outcome = 'continue'
+
+
+class TestRenderers(unittest.TestCase):
+    """Renderer swapping and request blocking"""
+
+    def test_crs_browser_fetch_uses_renderer(self):
+        html = '<html><body><p>Report</p></body></html>'
+        renderer = FakeRenderer({'https://congress.gov/R1': html})
+        fetcher = CRSContentFetcher(rate_limit_delay=0, renderer=renderer)
+
+        content, metadata = fetcher.fetch('https://congress.gov/R1', use_browser=True)
+        self.assertEqual(content, html)
+        self.assertEqual(metadata['source_hash'], source_fingerprint(html))
+        self.assertEqual(renderer.calls, [('https://congress.gov/R1', 'body')])
+
+        self.assertIsNone(fetcher.fetch('https://congress.gov/missing', use_browser=True))
+        self.assertEqual(fetcher.get_stats()['failed_fetches'], 1)
+
+    def test_blocks_assets_and_analytics(self):
+        renderer = PlaywrightRenderer()
+        cases = [
+            ('https://www.congress.gov/crs-product/R1', 'document', 'continue'),
+            ('https://www.congress.gov/app.js', 'script', 'continue'),
+            ('https://www.congress.gov/logo.png', 'image', 'abort'),
+            ('https://fonts.example.com/a.woff2', 'font', 'abort'),
+            ('https://www.google-analytics.com/collect', 'xhr', 'abort'),
+            ('https://notgoogle-analytics.com/x.js', 'script', 'continue'),
+        ]
+        for url, resource_type, expected in cases:
+            route = FakeRoute(url, resource_type)
+            asyncio.run(renderer._route(route))
+            self.assertEqual(route.outcome, expected, url)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental CRS -> Policy Library sync
+"""
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.crs_sync import CRSPolicyLibrarySync, EPOCH
+from brookings_ingester.models import Document, get_session
+
+
+def make_product(product_id, changed_at):
+    return {'product_id': product_id, 'title': f'Report {product_id}', 'product_type': 'Report',
+            'status': 'Active', 'summary': None, 'authors': ['Jane Doe'], 'topics': ['Budget'],
+            'changed_at': changed_at, 'version_number': 1}
+
+
+class StubbedSync(CRSPolicyLibrarySync):
+    """Serves changed products from memory instead of the CRS database"""
+
+    def __init__(self, policy_db_url, chunks):
+        super().__init__(crs_db_url='postgresql://crs.invalid/crs', policy_db_url=policy_db_url)
+        self.chunks = chunks
+        self.requested = []
+
+    def iter_changed_products(self, since, after_key='', chunk_size=200):
+        self.requested.append((since, after_key))
+        for chunk in self.chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Watermark advances per committed chunk"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_url = f"sqlite:///{os.path.join(self.tmpdir.name, 'library.db')}"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_resumes_after_last_committed_chunk(self):
+        """A failure keeps earlier chunks and the watermark of the last one"""
+        first = [make_product('R1', datetime(2025, 5, 1)), make_product('R2', datetime(2025, 5, 2))]
+        sync = StubbedSync(self.db_url, [first, RuntimeError('connection lost')])
+
+        stats = sync.sync_incremental()
+
+        self.assertEqual(sync.requested, [(EPOCH, '')])
+        self.assertEqual(stats['documents_created'], 2)
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(sync.get_watermark()['at'], datetime(2025, 5, 2))
+        self.assertEqual(sync.get_watermark()['key'], 'R2')
+
+        resumed = StubbedSync(self.db_url, [[make_product('R3', datetime(2025, 5, 3))]])
+        resumed.sync_incremental()
+
+        self.assertEqual(resumed.requested, [(datetime(2025, 5, 2), 'R2')])
+        self.assertEqual(resumed.get_watermark()['key'], 'R3')
+
+        session = get_session()
+        try:
+            self.assertEqual(session.query(Document).count(), 3)
+        finally:
+            session.close()
+
+    def test_watermark_stops_before_failed_product(self):
+        """A product that fails is rolled back alone and retried by the next run"""
+        products = [make_product('R1', datetime(2025, 5, 1)), make_product('R2', datetime(2025, 5, 2)),
+                    make_product('R3', datetime(2025, 5, 3))]
+        products[1]['title'] = None  # violates documents.title NOT NULL
+        sync = StubbedSync(self.db_url, [products, [make_product('R4', datetime(2025, 5, 4))]])
+
+        stats = sync.sync_incremental()
+
+        self.assertEqual(stats['errors'], 1)
+        self.assertEqual(stats['documents_created'], 2)
+        self.assertEqual(sync.get_watermark()['key'], 'R1')
+
+        session = get_session()
+        try:
+            identifiers = {doc.document_identifier for doc in session.query(Document)}
+        finally:
+            session.close()
+        self.assertEqual(identifiers, {'R1', 'R3'})
+
+        products[1]['title'] = 'Report R2'
+        resumed = StubbedSync(self.db_url, [products[1:]])
+        resumed.sync_incremental()
+
+        self.assertEqual(resumed.requested, [(datetime(2025, 5, 1), 'R1')])
+        self.assertEqual(resumed.get_watermark()['key'], 'R3')
+
+    def test_overlap_rereads_keep_watermark(self):
+        """Products re-read from the overlap window are skipped and never move the watermark back"""
+        sync = StubbedSync(self.db_url, [[make_product('R1', datetime(2025, 5, 1)),
+                                          make_product('R2', datetime(2025, 5, 2))]])
+        sync.sync_incremental()
+
+        # A late commit stamped before the watermark, re-read together with an unchanged product
+        late = StubbedSync(self.db_url, [[make_product('R0', datetime(2025, 5, 1, 12)),
+                                          make_product('R1', datetime(2025, 5, 1, 12))]])
+        stats = late.sync_incremental()
+
+        self.assertEqual((stats['documents_created'], stats['documents_skipped']), (1, 1))
+        self.assertEqual(late.get_watermark()['at'], datetime(2025, 5, 2))
+        self.assertEqual(late.get_watermark()['key'], 'R2')
+
+    def test_full_sync_resets_watermark(self):
+        sync = StubbedSync(self.db_url, [[make_product('R1', datetime(2025, 5, 1))]])
+        sync.sync_incremental()
+
+        sync.sync_incremental(full=True)
+
+        self.assertEqual(sync.requested[-1], (EPOCH, ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
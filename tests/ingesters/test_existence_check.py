@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Unit tests for BaseIngester.classify_documents
+"""
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.ingesters import base
+from brookings_ingester.models import Document, Source, get_session, init_database
+from tests.ingesters.test_pipeline import FakeIngester
+
+
+class TestClassifyDocuments(unittest.TestCase):
+    """Discovered documents are checked against the database in bulk"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        init_database(f"sqlite:///{os.path.join(self.tmpdir.name, 'library.db')}")
+
+        session = get_session()
+        source = Source(source_code='FAKE', name='Fake Source')
+        session.add(source)
+        session.flush()
+        for identifier in ('stale', 'current'):
+            session.add(Document(source_id=source.source_id, document_identifier=identifier,
+                                 title=identifier, updated_at=datetime(2025, 3, 1, 12, 0)))
+        session.commit()
+        source_id = source.source_id
+        session.close()
+
+        self.ingester = FakeIngester()
+        self.ingester.source = Source(source_id=source_id, source_code='FAKE', name='Fake Source')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_splits_new_changed_and_unchanged(self):
+        """lastmod after the stored copy marks a document as changed"""
+        documents = [
+            {'document_identifier': 'fresh', 'lastmod': '2025-04-01'},
+            {'document_identifier': 'stale', 'lastmod': '2025-03-15'},
+            {'document_identifier': 'current', 'lastmod': '2025-03-01'},
+            {'document_identifier': 'fresh'},
+        ]
+
+        classified = self.ingester.classify_documents(documents)
+
+        self.assertEqual([d['document_identifier'] for d in classified['new']], ['fresh'])
+        self.assertEqual([d['document_identifier'] for d in classified['changed']], ['stale'])
+        self.assertEqual([d['document_identifier'] for d in classified['unchanged']], ['current'])
+
+    def test_queries_in_chunks(self):
+        """Identifiers beyond one chunk are still matched"""
+        original = base.EXISTENCE_CHUNK_SIZE
+        base.EXISTENCE_CHUNK_SIZE = 2
+        try:
+            documents = [{'document_identifier': f'new-{i}'} for i in range(5)]
+            documents.append({'document_identifier': 'current'})
+            classified = self.ingester.classify_documents(documents)
+        finally:
+            base.EXISTENCE_CHUNK_SIZE = original
+
+        self.assertEqual(len(classified['new']), 5)
+        self.assertEqual([d['document_identifier'] for d in classified['unchanged']], ['current'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for FileManager's content-addressed store (dedup, compression, migration)
+"""
+import unittest
+import sys
+import os
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.storage import FileManager
+
+
+class TestFileManager(unittest.TestCase):
+    """Test hard-linked object storage"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base_path = Path(self.tmp.name) / 'data'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def objects(self):
+        return [p for p in (self.base_path / 'objects').glob('*/*/*')]
+
+    def test_identical_content_is_stored_once(self):
+        """Two documents with the same PDF share one object"""
+        file_manager = FileManager(base_path=self.base_path, compression='none')
+
+        first = file_manager.save_pdf('report-a', b'%PDF-1.4 same bytes')
+        second = file_manager.save_pdf('report-b', iter([b'%PDF-1.4 ', b'same bytes']))
+
+        self.assertFalse(first['deduplicated'])
+        self.assertTrue(second['deduplicated'])
+        self.assertEqual(first['checksum'], second['checksum'])
+        self.assertEqual(first['file_path'], os.path.join('data', 'pdfs', 'brookings', 'report-a.pdf'))
+
+        path_a = file_manager.get_file_path('PDF', 'report-a')
+        path_b = file_manager.get_file_path('PDF', 'report-b')
+        self.assertTrue(os.path.samefile(path_a, path_b))
+        self.assertEqual(len(self.objects()), 1)
+        self.assertEqual(file_manager.get_stats()['bytes_deduplicated'], len(b'%PDF-1.4 same bytes'))
+
+    def test_gzip_text_round_trip(self):
+        """Compressed text keeps the file_exists/get_file_path API"""
+        file_manager = FileManager(base_path=self.base_path, compression='gzip')
+        text = 'Page one\n\nPage two ✓'
+
+        info = file_manager.save_text('report-a', (chunk for chunk in ['Page one\n\n', 'Page two ✓']))
+
+        self.assertEqual(info['file_size'], len(text.encode('utf-8')))
+        self.assertTrue(file_manager.file_exists('TEXT', 'report-a'))
+        self.assertEqual(file_manager.get_file_path('TEXT', 'report-a').name, 'report-a.txt.gz')
+        self.assertEqual(file_manager.read_file('TEXT', 'report-a').decode('utf-8'), text)
+
+        # Saving uncompressed replaces the compressed variant
+        plain = FileManager(base_path=self.base_path, compression='none')
+        plain.save_text('report-a', text)
+        self.assertEqual(plain.get_file_path('TEXT', 'report-a').name, 'report-a.txt')
+        self.assertEqual(plain.read_file('TEXT', 'report-a').decode('utf-8'), text)
+
+    def test_migrate_existing_and_collect_garbage(self):
+        """Plain files written before the store are adopted and deduplicated"""
+        file_manager = FileManager(base_path=self.base_path, compression='none')
+        (file_manager.html_dir / 'report-a.html').write_text('<p>same</p>')
+        (file_manager.html_dir / 'report-b.html').write_text('<p>same</p>')
+
+        self.assertEqual(file_manager.migrate_existing(dry_run=True)['files_migrated'], 2)
+        result = file_manager.migrate_existing()
+        self.assertEqual(result['files_migrated'], 2)
+        self.assertEqual(result['files_deduplicated'], 1)
+        self.assertEqual(len(self.objects()), 1)
+        self.assertEqual(file_manager.migrate_existing()['files_migrated'], 0)
+
+        # Object survives while one document still links to it
+        file_manager.delete_file('HTML', 'report-a')
+        self.assertEqual(file_manager.collect_garbage()['objects_removed'], 0)
+        self.assertEqual(file_manager.read_file('HTML', 'report-b'), b'<p>same</p>')
+
+        file_manager.delete_file('HTML', 'report-b')
+        self.assertEqual(file_manager.collect_garbage()['objects_removed'], 1)
+        self.assertFalse(file_manager.file_exists('HTML', 'report-b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
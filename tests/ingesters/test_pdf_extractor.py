@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PDFExtractor page-range extraction, scan detection and caching
+"""
+import unittest
+import sys
+import os
+import hashlib
+import tempfile
+from pathlib import Path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.storage import FileManager, PDFExtractor
+
+
+def make_pdf(page_texts):
+    """Minimal PDF with one line of Helvetica text per page ('' = image-only page without fonts)"""
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None,
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for text in page_texts:
+        stream = f'BT /F1 12 Tf 72 720 Td ({text}) Tj ET'.encode('latin-1') if text else b''
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        resources = b'/Font << /F1 3 0 R >>' if text else b''
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << %s >> /Contents %d 0 R >>' % (resources, len(objects)))
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [' + b' '.join(kids) + b'] /Count %d >>' % len(kids)
+
+    pdf = b'%PDF-1.4\n'
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return pdf
+
+
+PAGES = [f'Page {i} of the report discusses appropriations and oversight in detail.' for i in range(30)]
+
+
+class TestPDFExtractor(unittest.TestCase):
+    """Parallel extraction matches serial, scanned PDFs skip the text pass, the cache is bounded"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parallel_matches_serial_and_caches(self):
+        pdf_bytes = make_pdf(PAGES)
+        serial = PDFExtractor(processes=0, cache_path='').extract_from_bytes(pdf_bytes)
+
+        with PDFExtractor(processes=2, cache_path=self.path / 'cache', pages_per_task=4) as extractor:
+            parallel = extractor.extract_from_bytes(pdf_bytes)
+        self.assertIsNone(extractor._pool)
+
+        self.assertEqual(parallel['text'], serial['text'])
+        self.assertEqual(parallel['page_count'], 30)
+        self.assertIn('Page 29 of the report', parallel['text'])
+        self.assertFalse(parallel['scanned'])
+
+        # Same bytes again come from the checksum cache
+        cached = extractor.extract_from_bytes(pdf_bytes)
+        self.assertEqual(cached, parallel)
+        self.assertEqual(extractor.get_stats()['cache_hits'], 1)
+
+    def test_scanned_pdf_skips_text_pass(self):
+        pdf_path = self.path / 'scan.pdf'
+        pdf_path.write_bytes(make_pdf([''] * 8))
+        extractor = PDFExtractor(processes=0, cache_path='')
+
+        self.assertTrue(extractor.is_scanned_pdf(pdf_path))
+        result = extractor.extract_from_file(pdf_path)
+        self.assertTrue(result['scanned'])
+        self.assertEqual(result['text'], '')
+        self.assertEqual(result['page_count'], 8)
+        self.assertEqual(extractor.get_stats()['scanned_skipped'], 1)
+
+    def test_text_after_image_pages_is_kept(self):
+        """Cover pages without text do not make the PDF count as scanned"""
+        pdf_path = self.path / 'covers.pdf'
+        pdf_path.write_bytes(make_pdf([''] * 3 + PAGES[:5]))
+        extractor = PDFExtractor(processes=0, cache_path='')
+
+        self.assertFalse(extractor.is_scanned_pdf(pdf_path))
+        result = extractor.extract_from_file(pdf_path)
+        self.assertFalse(result['scanned'])
+        self.assertEqual(result['text'], '\n\n'.join(PAGES[:5]))
+
+    def test_truncated_text_is_cached_per_limit(self):
+        pdf_path = self.path / 'report.pdf'
+        pdf_path.write_bytes(make_pdf(PAGES[:6]))
+        cache = self.path / 'cache'
+
+        capped = PDFExtractor(processes=0, cache_path=cache, max_text_chars=200).extract_from_file(pdf_path)
+        self.assertTrue(capped['truncated'])
+        self.assertEqual(len(capped['text']), 200)
+
+        full = PDFExtractor(processes=0, cache_path=cache).extract_from_file(pdf_path)
+        self.assertFalse(full['truncated'])
+        self.assertEqual(full['text'], '\n\n'.join(PAGES[:6]))
+
+        # The complete result serves smaller limits only while it fits them
+        extractor = PDFExtractor(processes=0, cache_path=cache, max_text_chars=200)
+        self.assertTrue(extractor.extract_from_file(pdf_path)['truncated'])
+        self.assertEqual(extractor.get_stats()['cache_hits'], 0)
+
+    def test_cache_evicts_least_recently_used(self):
+        extractor = PDFExtractor(processes=0, cache_path=self.path / 'cache')
+        documents = [make_pdf(PAGES[index:index + 2]) for index in range(3)]
+        for pdf_bytes in documents:
+            extractor.extract_from_bytes(pdf_bytes)
+        entries = [extractor._cache_file(hashlib.sha256(pdf_bytes).hexdigest()) for pdf_bytes in documents]
+        for age, path in enumerate(entries):
+            os.utime(path, (1000 + age, 1000 + age))
+
+        # Reading the oldest entry marks it recently used
+        extractor.extract_from_bytes(documents[0])
+
+        entry_size = max(path.stat().st_size for path in entries)
+        self.assertEqual(extractor.prune_cache(max_bytes=2 * entry_size), 1)
+        self.assertEqual([path.exists() for path in entries], [True, False, True])
+
+    def test_pages_stream_to_text_file(self):
+        """extract_to_text_file feeds save_text page by page, uncapped; iter_pages yields pages in order"""
+        pdf_path = self.path / 'report.pdf'
+        pdf_path.write_bytes(make_pdf(PAGES))
+
+        with PDFExtractor(processes=2, cache_path='', max_text_chars=200, pages_per_task=4) as extractor:
+            self.assertEqual(list(extractor.iter_pages(pdf_path)), PAGES)
+            file_manager = FileManager(base_path=self.path / 'data')
+            result = extractor.extract_to_text_file(pdf_path, file_manager, 'report')
+
+        saved = (self.path / result['text_file']['file_path']).read_text(encoding='utf-8')
+        self.assertEqual(saved, '\n\n'.join(PAGES))
+        self.assertEqual(result['word_count'], len(saved.split()))
+        self.assertFalse(result['scanned'])
+
+
+if __name__ == '__main__':
+    unittest.main()
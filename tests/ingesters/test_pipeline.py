@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pipelined ingestion runner
+"""
+import unittest
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from brookings_ingester.ingesters.base import BaseIngester
+from api.rate_limiter import HostRateLimiter
+from brookings_ingester.ingesters.pipeline import IngestionPipeline
+from brookings_ingester.storage import PDFExtractor
+
+
+class FakeIngester(BaseIngester):
+    """Ingester with in-memory fetch/store (module level so parse processes can import it)"""
+
+    def __init__(self, fetch_failures=()):
+        # BaseIngester.__init__ looks up the source in the database
+        self.source_code = 'FAKE'
+        self.rate_limit_delay = 0
+        self.last_request_time = 0
+        self._host_limiter = HostRateLimiter(0)
+        self.session = self._create_session()
+        self.pdf_extractor = PDFExtractor(processes=0, cache_path='')
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+        self.fetch_failures = set(fetch_failures)
+        self.batches = []
+        self.errors = []
+
+    def discover(self, limit=None, **kwargs):
+        return []
+
+    def fetch(self, document_meta):
+        self._rate_limit(document_meta['url'])
+        if document_meta['document_identifier'] in self.fetch_failures:
+            return None
+        return {'html_content': f"<p>{document_meta['document_identifier']}</p>"}
+
+    def parse(self, document_meta, fetched_content):
+        self.pdf_extractor._count('files_processed')
+        return {'document_identifier': document_meta['document_identifier'],
+                'html_content': fetched_content['html_content'],
+                'parsed_by': os.getpid()}
+
+    def store_batch(self, parsed_list):
+        self.batches.append(parsed_list)
+        return [index + 1 for index, _ in enumerate(parsed_list)]
+
+    def _log_error(self, log_id, doc_meta, error_type, error_message):
+        self._count('errors_count')
+        self.errors.append((doc_meta['document_identifier'], error_type))
+
+
+class Progress:
+    """Counts tqdm-style updates"""
+
+    def __init__(self):
+        self.n = 0
+
+    def update(self, n):
+        self.n += n
+
+
+def make_documents(count):
+    return [{'document_identifier': f'doc-{i}', 'url': f'https://site{i % 3}.example.com/doc-{i}'}
+            for i in range(count)]
+
+
+class TestIngestionPipeline(unittest.TestCase):
+    """Fetch, parse and store stages overlap but keep per-document accounting"""
+
+    def test_threaded_run_accounts_for_every_document(self):
+        """Stored and failed documents are each counted once"""
+        ingester = FakeIngester(fetch_failures={'doc-4'})
+        documents = make_documents(12)
+        progress = Progress()
+
+        IngestionPipeline(ingester, log_id=1, fetch_workers=4, parse_processes=0, batch_size=5).run(
+            documents, progress=progress)
+
+        stored = sorted(p['document_identifier'] for batch in ingester.batches for p in batch)
+        self.assertEqual(stored, sorted(f'doc-{i}' for i in range(12) if i != 4))
+        self.assertTrue(all(len(batch) <= 5 for batch in ingester.batches))
+        self.assertEqual(ingester.errors, [('doc-4', 'fetch_error')])
+        self.assertEqual(progress.n, len(documents))
+
+    def test_parses_in_worker_processes(self):
+        """Parsing runs outside the coordinating process when processes are configured"""
+        ingester = FakeIngester()
+
+        IngestionPipeline(ingester, log_id=1, fetch_workers=2, parse_processes=1, batch_size=10).run(
+            make_documents(4))
+
+        parsed = [p for batch in ingester.batches for p in batch]
+        self.assertEqual(len(parsed), 4)
+        self.assertTrue(all(p['parsed_by'] != os.getpid() for p in parsed))
+
+    def test_parse_stats_reach_the_ingester(self):
+        """Counters updated by parse() are kept in both parse modes"""
+        for parse_processes in (0, 1):
+            with self.subTest(parse_processes=parse_processes):
+                ingester = FakeIngester()
+
+                IngestionPipeline(ingester, log_id=1, fetch_workers=3, parse_processes=parse_processes,
+                                  batch_size=10).run(make_documents(6))
+
+                self.assertEqual(ingester.pdf_extractor.get_stats()['files_processed'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
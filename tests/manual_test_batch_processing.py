@@ -66,23 +66,19 @@ def test_checkpoint_class():
     print("\nTest: Checkpoint creation")
     checkpoint = Checkpoint(batch_number=1)
     assert checkpoint.batch_number == 1
+    assert checkpoint.snapshot is None
+    assert checkpoint.journal_position == 0
     assert checkpoint.hearings_to_update == []
     assert checkpoint.hearings_to_add == []
-    assert checkpoint.witnesses_to_add == []
-    assert checkpoint.documents_to_add == []
     print(f"✅ PASS: Checkpoint created for batch {checkpoint.batch_number}")
 
     # Test tracking
     print("\nTest: Checkpoint tracking")
-    checkpoint.track_update("HEARING-001", {"title": "Test"})
+    checkpoint.track_update("HEARING-001")
     checkpoint.track_addition("HEARING-002")
-    checkpoint.track_witness_addition("WITNESS-001")
-    checkpoint.track_document_addition("DOC-001")
     assert "HEARING-001" in checkpoint.hearings_to_update
     assert "HEARING-002" in checkpoint.hearings_to_add
-    assert "WITNESS-001" in checkpoint.witnesses_to_add
-    assert "DOC-001" in checkpoint.documents_to_add
-    print(f"✅ PASS: Checkpoint tracked 4 items across all types")
+    print(f"✅ PASS: Checkpoint tracked updated and added hearings")
 
 def test_batch_result_class():
     """Test the BatchResult class"""
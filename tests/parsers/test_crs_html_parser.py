@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the CRSHTMLParser lxml and bs4 engines
+"""
+import unittest
+import sys
+import os
+import glob
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from bs4 import BeautifulSoup
+
+from parsers.crs_html_parser import CRSHTMLParser
+
+FIXTURES = sorted(glob.glob(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                         'fixtures', '*.html')))
+
+# Markup the two parsers build different trees for
+MALFORMED = [
+    '<main><p>one<p>two<div>three</div>four</p></main>',
+    '<main><h2>A <b>bold</h2> tail<p>x</main>',
+    '<main><table><tr><td>a<td>b</table><p>&amp;&lt;tag&gt; &#8212; &copy;</p></main>',
+    '<html><body><p>no selector</p><nav>n</nav> tail text</body></html>',
+    '<main><div><p></p>text after</div><h2><!-- c -->Com<!-- d -->ment</h2></main>',
+    '<main><h2>Summary</h2><p>Before</p><template><p>Hidden template text</p></template><p>After</p></main>',
+    '<main><h2>Sum<template>X</template>mary</h2><p>Before <![CDATA[raw cdata]]> after</p></main>',
+]
+
+
+def tag_sequence(html):
+    """Elements and attributes in document order (ignores serialization details)"""
+    return [(tag.name, sorted(tag.attrs.items())) for tag in BeautifulSoup(html, 'html.parser').find_all()]
+
+
+class TestParserEngineParity(unittest.TestCase):
+    """The lxml engine must not change stored text, structure or content hashes"""
+
+    def setUp(self):
+        self.bs4 = CRSHTMLParser(engine='bs4')
+        self.lxml = CRSHTMLParser(engine='lxml')
+
+    def assertParity(self, html, label):
+        expected = self.bs4.parse(html, label)
+        actual = self.lxml.parse(html, label)
+        self.assertIsNotNone(actual, label)
+        self.assertEqual(actual.text_content, expected.text_content, label)
+        self.assertEqual(actual.content_hash, expected.content_hash, label)
+        self.assertEqual(actual.word_count, expected.word_count, label)
+        self.assertEqual(actual.structure_json, expected.structure_json, label)
+        self.assertEqual(tag_sequence(actual.html_content), tag_sequence(expected.html_content), label)
+
+    def test_fixtures(self):
+        """Every HTML fixture parses identically"""
+        self.assertTrue(any(path.endswith('crs_report.html') for path in FIXTURES))
+        for path in FIXTURES:
+            with open(path, encoding='utf-8') as f:
+                self.assertParity(f.read(), os.path.basename(path))
+
+    def test_malformed_markup(self):
+        """Unclosed tags, comments, templates, CDATA and fallbacks to <body>"""
+        for html in MALFORMED:
+            self.assertParity(html, html)
+
+    def test_cleanup(self):
+        """Chrome, empty blocks and relative images are handled in the single pass"""
+        with open(os.path.join(os.path.dirname(FIXTURES[0]), 'crs_report.html'), encoding='utf-8') as f:
+            parsed = self.lxml.parse(f.read(), 'R45000')
+
+        self.assertNotIn('Skip to main content', parsed.text_content)
+        self.assertNotIn('Advertisement', parsed.text_content)
+        self.assertNotIn('<p></p>', parsed.html_content)
+        self.assertNotIn('<%@', parsed.html_content)
+        self.assertIn('src="https://www.congress.gov/crs_external_products/R45000_files/image001.png"',
+                      parsed.html_content)
+        self.assertEqual(parsed.structure_json['headings'][1], 'Summary')
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            CRSHTMLParser(engine='html5lib')
+
+
+if __name__ == '__main__':
+    unittest.main()
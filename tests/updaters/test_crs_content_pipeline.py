@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CRSContentPipeline
+"""
+import unittest
+import sys
+import os
+import threading
+from contextlib import contextmanager
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.crs_content_manager_postgres import CRSContentManager
+from database.crs_fts_indexer import CRSFTSIndexer
+from fetchers.crs_content_fetcher import source_fingerprint
+from fetchers.crs_content_pipeline import CRSContentPipeline
+from parsers.crs_html_parser import CRSHTMLParser
+
+HTML = '<html><body><main><h2>Summary</h2><p>Report {} text.</p></main></body></html>'
+
+
+class FakeFetcher:
+    """Serves HTML per URL; URLs containing 'missing' fail"""
+
+    def fetch(self, url, use_browser=False):
+        if 'missing' in url:
+            return None
+        return HTML.format(url), {}
+
+
+class RecordingIndexer(CRSFTSIndexer):
+    """Keeps flushed FTS rows instead of writing them"""
+
+    def __init__(self):
+        super().__init__()
+        self.written = []
+
+    def write(self, conn, entries):
+        self.written.append(sorted(entry[1] for entry in entries))
+        return len(entries)
+
+
+class FakeManager:
+    def __init__(self, fail_upload=(), fail_store=(), hashes=None):
+        self.fail_upload = set(fail_upload)
+        self.fail_store = set(fail_store)
+        self.hashes = hashes or {}
+        self.stored = []
+        self.uploaded = []
+        self.recorded = []
+        self.fts_indexer = RecordingIndexer()
+        self.lock = threading.Lock()
+
+    def get_version_hashes(self, keys):
+        return {key: self.hashes[key] for key in keys if key in self.hashes}
+
+    def record_source_hash(self, version_id, source_hash, conn=None):
+        self.recorded.append((version_id, source_hash))
+
+    def upload_content(self, product_id, version_number, html_content):
+        if product_id in self.fail_upload:
+            raise Exception('R2 upload failed')
+        with self.lock:
+            self.uploaded.append(product_id)
+        return f'https://blob.example/{product_id}-v{version_number}.html'
+
+
+class FakeCursor:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, sql, params=None):
+        self.log.append(sql)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.log = []
+
+    def cursor(self):
+        return FakeCursor(self.log)
+
+
+class VersionCursor(FakeCursor):
+    """Answers upsert_version's lookups: no stored version, then new version ids"""
+
+    def __init__(self, log):
+        super().__init__(log)
+        self.last = ''
+
+    def execute(self, sql, params=None):
+        super().execute(sql, params)
+        self.last = sql
+
+    def fetchone(self):
+        if 'RETURNING version_id' in self.last:
+            return {'version_id': len(self.log)}
+        return None
+
+
+class VersionConnection(FakeConnection):
+    def cursor(self, cursor_factory=None):
+        return VersionCursor(self.log)
+
+
+class StubbedContentManager(CRSContentManager):
+    """The PostgreSQL manager with R2 disabled and nothing stored yet"""
+
+    def __init__(self):
+        with mock.patch.dict(os.environ, {'R2_ACCESS_KEY_ID': ''}):
+            super().__init__()
+        self.fts_indexer = RecordingIndexer()
+
+    def get_version_hashes(self, keys):
+        return {}
+
+
+def store(manager, conn, product, parsed, blob_url):
+    manager.fts_indexer.queue(len(manager.stored), product['product_id'], '', parsed.text_content)
+    if product['product_id'] in manager.fail_store:
+        raise Exception('constraint violation')
+    manager.stored.append((product['product_id'], blob_url, parsed.content_hash))
+    return True
+
+
+class TestCRSContentPipeline(unittest.TestCase):
+    """Stage hand-off, per-product errors and batched writes"""
+
+    def run_pipeline(self, products, manager, batch_size=2):
+        connections = []
+
+        @contextmanager
+        def connect():
+            conn = FakeConnection()
+            connections.append(conn)
+            yield conn
+
+        results = []
+        pipeline = CRSContentPipeline(FakeFetcher(), manager, store=store, fetch_workers=3,
+                                      parse_processes=0, upload_workers=2, batch_size=batch_size,
+                                      connect=connect)
+        counts = pipeline.run(products, on_result=lambda p, status, detail: results.append((p['product_id'], status)))
+        return counts, dict(results), connections
+
+    def test_every_product_reported_once(self):
+        """Failures stay with their product; the rest are stored in batches"""
+        products = [{'product_id': f'R{i}', 'version_number': 1, 'html_url': f'https://congress.gov/R{i}'}
+                    for i in range(7)]
+        products.append({'product_id': 'R99', 'version_number': 1, 'html_url': 'https://congress.gov/missing'})
+        manager = FakeManager(fail_upload={'R1'}, fail_store={'R2'})
+
+        counts, results, connections = self.run_pipeline(products, manager)
+
+        self.assertEqual(counts, {'stored': 5, 'fetch_error': 1, 'upload_error': 1, 'storage_error': 1})
+        self.assertEqual((results['R99'], results['R1'], results['R2']),
+                         ('fetch_error', 'upload_error', 'storage_error'))
+        self.assertEqual(sorted(pid for pid, _, _ in manager.stored), ['R0', 'R3', 'R4', 'R5', 'R6'])
+        self.assertTrue(all(blob.endswith('-v1.html') for _, blob, _ in manager.stored))
+
+        # 6 uploaded products in batches of 2, failed store rolled back to its savepoint
+        self.assertEqual(len(connections), 3)
+        log = [sql for conn in connections for sql in conn.log]
+        self.assertEqual(log.count('SAVEPOINT crs_version'), 6)
+        self.assertEqual(log.count('ROLLBACK TO SAVEPOINT crs_version'), 1)
+
+        # One FTS write per batch, without the rolled back product
+        self.assertEqual(len(manager.fts_indexer.written), 3)
+        self.assertEqual(sorted(pid for rows in manager.fts_indexer.written for pid in rows),
+                         ['R0', 'R3', 'R4', 'R5', 'R6'])
+
+    def test_unchanged_content_skips_upload_and_store(self):
+        """Matching source or content hash stops before parsing or uploading"""
+        urls = {pid: f'https://congress.gov/{pid}' for pid in ('R0', 'R1', 'R2')}
+        products = [{'product_id': pid, 'version_number': 1, 'html_url': url} for pid, url in urls.items()]
+        parsed_hash = CRSHTMLParser().parse(HTML.format(urls['R1']), 'R1').content_hash
+        manager = FakeManager(hashes={
+            # Same raw page as last time
+            ('R0', 1): {'version_id': 10, 'source_hash': source_fingerprint(HTML.format(urls['R0'])),
+                        'content_hash': 'old'},
+            # Page changed, parsed content did not
+            ('R1', 1): {'version_id': 11, 'source_hash': 'old', 'content_hash': parsed_hash},
+            # Content changed
+            ('R2', 1): {'version_id': 12, 'source_hash': 'old', 'content_hash': 'old'},
+        })
+
+        counts, results, _ = self.run_pipeline(products, manager)
+
+        self.assertEqual(counts, {'unchanged': 2, 'stored': 1})
+        self.assertEqual(results['R2'], 'stored')
+        self.assertEqual(manager.uploaded, ['R2'])
+        self.assertEqual(manager.recorded, [(11, source_fingerprint(HTML.format(urls['R1'])))])
+
+    def test_default_store_step_with_content_manager(self):
+        """upsert_parsed_version drives the real upsert_version with deferred FTS rows"""
+        products = [{'product_id': f'R{i}', 'version_number': 1, 'html_url': f'https://congress.gov/R{i}'}
+                    for i in range(3)]
+        manager = StubbedContentManager()
+        results = []
+
+        @contextmanager
+        def connect():
+            yield VersionConnection()
+
+        pipeline = CRSContentPipeline(FakeFetcher(), manager, fetch_workers=2, parse_processes=0,
+                                      upload_workers=1, batch_size=2, connect=connect)
+        counts = pipeline.run(products, on_result=lambda p, status, detail: results.append(detail))
+
+        self.assertEqual(counts, {'stored': 3})
+        self.assertTrue(all(is_new for is_new, _ in results))
+        self.assertEqual(sorted(pid for rows in manager.fts_indexer.written for pid in rows),
+                         ['R0', 'R1', 'R2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CRSUpdater product selection
+"""
+import unittest
+import sys
+import os
+from datetime import datetime
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from updaters.crs_updater import CRSUpdater, UpdateMetrics
+
+
+class FakeManager:
+    def __init__(self, hashes):
+        self.hashes = hashes
+
+    def get_version_hashes(self, keys):
+        return {key: self.hashes[key] for key in keys if key in self.hashes}
+
+
+class RecordingPipeline:
+    queued = []
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self, work, on_result=None):
+        RecordingPipeline.queued = [item['product_id'] for item in work]
+        for item in work:
+            on_result(item, 'unchanged', None)
+
+
+class TestProcessProducts(unittest.TestCase):
+    """Existing versions updated upstream reach the source-hash check"""
+
+    def test_queues_new_and_upstream_updated_versions(self):
+        ingested = datetime(2025, 5, 10)
+        updater = CRSUpdater.__new__(CRSUpdater)
+        updater.fetcher = None
+        updater.metrics = UpdateMetrics()
+        updater.content_manager = FakeManager({
+            ('R1', 1): {'version_id': 1, 'source_hash': 'a', 'content_hash': 'b', 'ingested_at': ingested},
+            ('R2', 1): {'version_id': 2, 'source_hash': 'c', 'content_hash': 'd', 'ingested_at': ingested},
+        })
+        products = [
+            {'product_id': 'R1', 'version': 1, 'html_url': 'u1', 'update_date': datetime(2025, 5, 12)},
+            {'product_id': 'R2', 'version': 1, 'html_url': 'u2', 'update_date': datetime(2025, 5, 1)},
+            {'product_id': 'R3', 'version': 1, 'html_url': 'u3', 'update_date': datetime(2025, 5, 1)},
+        ]
+
+        with mock.patch('updaters.crs_updater.CRSContentPipeline', RecordingPipeline):
+            updater._process_products(products)
+
+        self.assertEqual(RecordingPipeline.queued, ['R1', 'R3'])
+        self.assertEqual(updater.metrics.products_skipped, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
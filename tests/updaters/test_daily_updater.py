@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DailyUpdater change detection
+"""
+import unittest
+import sys
+import os
+import tempfile
+import sqlite3
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from database.unified_manager import UnifiedDatabaseManager
+from database.update_snapshots import UpdateSnapshots
+from tests.database.test_bulk_upsert import create_sqlite_schema
+from updaters import daily_updater
+from updaters.daily_updater import Checkpoint, DailyUpdater
+
+
+class TestIdentifyChanges(unittest.TestCase):
+    """Test set-based diffing of API hearings against the database"""
+
+    def setUp(self):
+        """Create a small hearings table and an updater without network clients"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'hearings.db')
+
+        conn = sqlite3.connect(db_path)
+        conn.execute('''
+            CREATE TABLE hearings (
+                hearing_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                event_id TEXT NOT NULL UNIQUE,
+                congress INTEGER NOT NULL,
+                chamber TEXT NOT NULL,
+                title TEXT NOT NULL,
+                hearing_type TEXT NOT NULL,
+                status TEXT NOT NULL,
+                location TEXT,
+                jacket_number TEXT,
+                hearing_date_only DATE,
+                hearing_time TIME,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        rows = [(str(i), 119, 'House', f'Hearing {i}', 'Hearing', 'Scheduled', 'Room 1', '2025-03-01')
+                for i in range(1200)]
+        rows.append(('other', 118, 'House', 'Old hearing', 'Hearing', 'Scheduled', None, None))
+        conn.executemany('''
+            INSERT INTO hearings (event_id, congress, chamber, title, hearing_type, status, location, hearing_date_only)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+        conn.commit()
+        conn.close()
+
+        self.updater = DailyUpdater.__new__(DailyUpdater)
+        self.updater.congress = 119
+        self.updater.db = UnifiedDatabaseManager(db_url=db_path, prefer_postgres=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _api_hearing(self, event_id, **overrides):
+        hearing = {
+            'eventId': event_id,
+            'title': f'Hearing {event_id}',
+            'date': '2025-03-01T14:00:00Z',
+            'status': 'Scheduled',
+            'location': 'Room 1'
+        }
+        hearing.update(overrides)
+        return hearing
+
+    def test_classifies_updates_and_additions(self):
+        """Unchanged rows are skipped, changed rows updated, unknown rows added"""
+        api_hearings = [self._api_hearing(str(i)) for i in range(1200)]
+        api_hearings[5] = self._api_hearing('5', status='Canceled')
+        api_hearings[1100] = self._api_hearing('1100', date='2025-03-02T10:00:00Z')
+        api_hearings.append(self._api_hearing('new-1'))
+        # Same event ID in another congress is not a match
+        api_hearings.append(self._api_hearing('other'))
+
+        changes = self.updater._identify_changes(api_hearings)
+
+        self.assertEqual(
+            sorted(u['new_data']['eventId'] for u in changes['updates']),
+            ['1100', '5']
+        )
+        self.assertEqual([a['eventId'] for a in changes['additions']], ['new-1', 'other'])
+
+        existing = changes['updates'][0]['existing']
+        self.assertEqual(existing['event_id'], '5')
+        self.assertEqual(existing['status'], 'Scheduled')
+
+    def test_lookups_are_chunked(self):
+        """Existing rows are loaded with one query per chunk of event IDs"""
+        statements = []
+        original_transaction = self.updater.db.transaction
+
+        def tracing_transaction():
+            ctx = original_transaction()
+            conn = ctx.__enter__()
+            conn.set_trace_callback(statements.append)
+            return _Wrapped(ctx, conn)
+
+        self.updater.db.transaction = tracing_transaction
+        self.updater._identify_changes([self._api_hearing(str(i)) for i in range(1200)])
+
+        selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+        expected = -(-1200 // daily_updater.DIFF_CHUNK_SIZE)
+        self.assertEqual(len(selects), expected)
+
+
+class TestCheckpointRollback(unittest.TestCase):
+    """Test journal-based rollback of a failed batch"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.tmpdir.name, 'hearings.db')
+        create_sqlite_schema(db_path)
+
+        self.updater = DailyUpdater.__new__(DailyUpdater)
+        self.updater.db = UnifiedDatabaseManager(db_url=db_path, prefer_postgres=False)
+        self.updater.snapshots = UpdateSnapshots(self.updater.db, mode='journal')
+        self.updater.snapshot = None
+        self._add_hearing(1)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _add_hearing(self, hearing_id):
+        with self.updater.db.transaction() as conn:
+            conn.execute("INSERT INTO hearings (hearing_id, event_id, congress, chamber, title, hearing_type, status) "
+                         "VALUES (?, ?, 119, 'House', ?, 'Hearing', 'Scheduled')",
+                         (hearing_id, str(hearing_id), f'Hearing {hearing_id}'))
+
+    def _titles(self):
+        return {row['hearing_id']: row['title'] for row in
+                self.updater.db.fetch_all('SELECT hearing_id, title FROM hearings')}
+
+    def test_rollback_undoes_only_the_failed_batch(self):
+        """Batch 1 stays applied, batch 2's update and addition are reverted"""
+        journal, own_journal = self.updater._batch_journal()
+        self.assertTrue(own_journal)
+        snapshots = self.updater.snapshots
+
+        # Batch 1 succeeds
+        self.updater.db.execute("UPDATE hearings SET title = 'Batch 1' WHERE hearing_id = 1")
+
+        # Batch 2 changes the same hearing again, adds one and fails
+        checkpoint = Checkpoint(2, journal, snapshots.mark(journal))
+        self.updater.db.execute("UPDATE hearings SET title = 'Batch 2' WHERE hearing_id = 1")
+        self._add_hearing(2)
+
+        self.assertTrue(self.updater._rollback_checkpoint(checkpoint))
+        self.assertEqual(self._titles(), {1: 'Batch 1'})
+
+        # The run keeps journaling and can still be undone as a whole
+        self._add_hearing(3)
+        snapshots.restore(journal)
+        self.assertEqual(self._titles(), {1: 'Hearing 1'})
+
+    def test_rollback_forgets_cached_witness_ids(self):
+        """Witnesses deleted by a rollback are created again, not served from the cache"""
+        db = self.updater.db
+        journal, _ = self.updater._batch_journal()
+        witness = {'full_name': 'Jane Doe', 'first_name': 'Jane', 'last_name': 'Doe', 'organization': 'GAO'}
+
+        checkpoint = Checkpoint(1, journal, self.updater.snapshots.mark(journal))
+        db.get_or_create_witness(witness)
+        self.assertTrue(self.updater._rollback_checkpoint(checkpoint))
+
+        witness_id = db.get_or_create_witness(witness)
+        self.assertIsNotNone(db.fetch_one('SELECT witness_id FROM witnesses WHERE witness_id = ?', (witness_id,)))
+
+    def test_rollback_without_journal_fails(self):
+        """A checkpoint without a journal cannot be rolled back"""
+        self.assertFalse(self.updater._rollback_checkpoint(Checkpoint(1)))
+
+    def test_snapshot_mode_none_starts_no_journal(self):
+        """SNAPSHOT_MODE=none journals nothing, not even for batches"""
+        self.updater.snapshots = UpdateSnapshots(self.updater.db, mode='none')
+        self.assertEqual(self.updater._batch_journal(), (None, False))
+        self.assertEqual(self.updater.snapshots.list_runs(), [])
+
+
+class _Wrapped:
+    """Context manager that hands back an already-entered connection"""
+
+    def __init__(self, ctx, conn):
+        self._ctx = ctx
+        self._conn = conn
+
+    def __enter__(self):
+        return self._conn
+
+    def __exit__(self, *args):
+        return self._ctx.__exit__(*args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,9 +18,11 @@ import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fetchers.crs_content_fetcher import CRSContentFetcher
+from fetchers.crs_content_pipeline import CRSContentPipeline
 from parsers.crs_html_parser import CRSHTMLParser
 from database.crs_content_manager_postgres import CRSContentManager
 from config.logging_config import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -126,16 +128,9 @@ class CRSUpdater:
                 products_checked=len(products_to_update)
             )
 
-            # Step 3: Process each product
+            # Step 3: Fetch, parse, upload and store concurrently
             logger.info("Fetching and processing product content...")
-            for idx, product in enumerate(products_to_update, 1):
-                try:
-                    self._process_product(product, idx, len(products_to_update))
-                except Exception as e:
-                    error_msg = f"Error processing product {product['product_id']}: {e}"
-                    logger.error(error_msg)
-                    self.metrics.errors.append(error_msg)
-                    continue
+            self._process_products(products_to_update)
 
             # Step 4: Get fetcher stats
             fetcher_stats = self.fetcher.get_stats()
@@ -213,87 +208,89 @@ class CRSUpdater:
 
         return products
 
-    def _process_product(self, product: Dict[str, Any], current: int, total: int):
+    def _process_products(self, products: List[Dict[str, Any]]):
         """
-        Process a single CRS product: fetch, parse, and store
+        Fetch, parse and store the products that need new content
 
         Args:
-            product: Product dictionary with product_id, html_url, version, etc.
-            current: Current product number (for logging)
-            total: Total products to process (for logging)
+            products: Product dictionaries with product_id, html_url, version, etc.
         """
-        product_id = product['product_id']
-        html_url = product['html_url']
-        version_number = product.get('version', 1)
-
-        logger.info(f"[{current}/{total}] Processing {product_id} v{version_number}")
-
-        # Check if we need to update this version
-        if not self.content_manager.needs_update(product_id, version_number):
-            logger.info(f"  Skipping {product_id} v{version_number} (already have current version)")
-            self.metrics.products_skipped += 1
+        # One lookup for every stored version; existing versions changed upstream since they
+        # were ingested are queued too, and the pipeline's source-hash check skips unchanged pages
+        stored = self.content_manager.get_version_hashes(
+            [(product['product_id'], product.get('version', 1)) for product in products])
+
+        work = []
+        for product in products:
+            product_id = product['product_id']
+            version_number = product.get('version', 1)
+
+            previous = stored.get((product_id, version_number))
+            if previous and not self._updated_since_ingest(product, previous):
+                logger.info(f"  Skipping {product_id} v{version_number} (already have current version)")
+                self.metrics.products_skipped += 1
+                continue
+
+            work.append({'product_id': product_id, 'version_number': version_number,
+                         'html_url': product['html_url']})
+
+        if not work:
             return
 
-        # Fetch HTML content
-        logger.debug(f"  Fetching content from {html_url}")
-        result = self.fetcher.fetch_html(html_url)
-
-        if not result:
-            # Try with browser if HTTP fetch failed
-            logger.warning(f"  HTTP fetch failed for {product_id}, trying browser...")
-            result = self.fetcher.fetch_html_with_browser(html_url)
-
-        if not result:
-            error_msg = f"Failed to fetch content for {product_id}"
-            logger.error(f"  {error_msg}")
-            self.metrics.errors.append(error_msg)
-            return
+        done = 0
 
-        html_content, fetch_metadata = result
+        def on_result(item, status, detail):
+            nonlocal done
+            done += 1
+            product_id, version_number = item['product_id'], item['version_number']
 
-        # Parse HTML content
-        logger.debug(f"  Parsing HTML content...")
-        try:
-            parsed_content = self.parser.parse(html_content, html_url)
+            if status == 'unchanged':
+                self.metrics.products_skipped += 1
+                logger.info(f"  [{done}/{len(work)}] Skipping {product_id} v{version_number} (content unchanged)")
+                return
 
-            if not parsed_content:
-                error_msg = f"Failed to parse content for {product_id}"
-                logger.error(f"  {error_msg}")
+            if status != 'stored':
+                error_msg = f"{status.replace('_', ' ').capitalize()} for {product_id}: {detail}"
+                logger.error(f"  [{done}/{len(work)}] {error_msg}")
                 self.metrics.errors.append(error_msg)
                 return
 
-        except Exception as e:
-            error_msg = f"Parse error for {product_id}: {e}"
-            logger.error(f"  {error_msg}")
-            self.metrics.errors.append(error_msg)
-            return
-
-        # Store content in database
-        logger.debug(f"  Storing content in database...")
-        try:
-            is_new = self.content_manager.upsert_version(
-                product_id=product_id,
-                version_number=version_number,
-                parsed_content=parsed_content,
-                html_url=html_url
-            )
-
+            is_new, parsed_content = detail
             if is_new:
                 self.metrics.products_added += 1
-                logger.info(f"  ✓ Added new version: {product_id} v{version_number} ({parsed_content.word_count:,} words)")
+                logger.info(f"  [{done}/{len(work)}] ✓ Added new version: {product_id} v{version_number} "
+                            f"({parsed_content.word_count:,} words)")
             else:
                 # Count as updated even if content was the same (skipped internally)
-                if parsed_content:
-                    self.metrics.products_updated += 1
-                    logger.info(f"  ✓ Updated version: {product_id} v{version_number} ({parsed_content.word_count:,} words)")
-                else:
-                    self.metrics.products_skipped += 1
-
-        except Exception as e:
-            error_msg = f"Database error for {product_id}: {e}"
-            logger.error(f"  {error_msg}")
-            self.metrics.errors.append(error_msg)
-            return
+                self.metrics.products_updated += 1
+                logger.info(f"  [{done}/{len(work)}] ✓ Updated version: {product_id} v{version_number} "
+                            f"({parsed_content.word_count:,} words)")
+
+        pipeline = CRSContentPipeline(
+            self.fetcher,
+            self.content_manager,
+            fetch_workers=settings.crs_fetch_workers,
+            parse_processes=settings.crs_parse_processes,
+            upload_workers=settings.crs_upload_workers,
+            batch_size=settings.crs_write_batch_size
+        )
+        pipeline.run(work, on_result=on_result)
+
+    @staticmethod
+    def _updated_since_ingest(product: Dict[str, Any], stored: Dict[str, Any]) -> bool:
+        """True if the product changed after its stored version was ingested (or either date is unknown)"""
+        update_date, ingested_at = product.get('update_date'), stored.get('ingested_at')
+        if not update_date or not ingested_at:
+            return True
+
+        def as_naive_datetime(value):
+            if isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, datetime):
+                value = datetime.combine(value, datetime.min.time())
+            return value.replace(tzinfo=None)
+
+        return as_naive_datetime(update_date) > as_naive_datetime(ingested_at)
 
 
 def main():
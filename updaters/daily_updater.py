@@ -13,8 +13,6 @@ from typing import Dict, List, Any, Optional, Tuple
 import logging
 import json
 import time
-import shutil
-from pathlib import Path
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +20,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from api.client import CongressAPIClient
 from database.manager import DatabaseManager
 from database.unified_manager import UnifiedDatabaseManager
+from database.hearing_listing import HearingListing
+from database.update_snapshots import Snapshot, UpdateSnapshots
 from fetchers.hearing_fetcher import HearingFetcher
 from fetchers.committee_fetcher import CommitteeFetcher
 from fetchers.witness_fetcher import WitnessFetcher
@@ -47,6 +47,24 @@ except ImportError:
     logger.warning("HistoricalValidator not available - historical validation disabled")
     HistoricalValidator = None
 
+# Hearing columns loaded for change detection and rollback tracking
+HEARING_DIFF_COLUMNS = (
+    'hearing_id', 'event_id', 'congress', 'chamber', 'title',
+    'hearing_date_only', 'hearing_time', 'location', 'jacket_number',
+    'hearing_type', 'status', 'created_at', 'updated_at'
+)
+
+# API fields compared during change detection, mapped to database columns
+HEARING_DIFF_FIELDS = {
+    'title': 'title',
+    'date': 'hearing_date_only',
+    'status': 'status',
+    'location': 'location'
+}
+
+# Event IDs per IN (...) lookup; stays under SQLite's default 999-variable limit
+DIFF_CHUNK_SIZE = 500
+
 
 class UpdateMetrics:
     """Track update operation metrics"""
@@ -124,35 +142,36 @@ class UpdateMetrics:
 
 class Checkpoint:
     """
-    Tracks database changes for potential rollback.
-
-    Used in batch processing to track what each batch modifies,
-    enabling independent rollback without affecting other batches.
+    Position in the update's change journal, for potential rollback.
+
+    Used in batch processing. The journal triggers record every row a batch
+    writes (operation, table, key and before-image) in snapshot_journal as
+    part of the batch's own statements, so rolling back restores what was
+    journaled after this position without affecting other batches. The
+    journal is persistent: a run whose process crashed can still be
+    reverted afterward.
     """
 
-    def __init__(self, batch_number: int):
+    def __init__(self, batch_number: int, snapshot: Optional[Snapshot] = None, journal_position: int = 0):
         self.batch_number = batch_number
         self.timestamp = datetime.now()
 
-        # Track IDs of records to be modified
+        # Journal snapshot of the run and its position when the batch started
+        self.snapshot = snapshot
+        self.journal_position = journal_position
+
+        # Event IDs in the batch (for logging)
         self.hearings_to_update = []
         self.hearings_to_add = []
-        self.witnesses_to_add = []
-        self.documents_to_add = []
-
-        # Track pre-modification state for updates
-        self.original_hearing_data = {}
 
-    def track_update(self, hearing_id: str, original_data: dict):
+    def track_update(self, hearing_id: str):
         """
         Track a hearing that will be updated.
 
         Args:
             hearing_id: ID of hearing being updated
-            original_data: Original hearing data for rollback
         """
         self.hearings_to_update.append(hearing_id)
-        self.original_hearing_data[hearing_id] = original_data
 
     def track_addition(self, hearing_id: str):
         """
@@ -163,24 +182,6 @@ class Checkpoint:
         """
         self.hearings_to_add.append(hearing_id)
 
-    def track_witness_addition(self, witness_id: str):
-        """
-        Track a witness that will be added.
-
-        Args:
-            witness_id: ID of new witness
-        """
-        self.witnesses_to_add.append(witness_id)
-
-    def track_document_addition(self, document_id: str):
-        """
-        Track a document that will be added.
-
-        Args:
-            document_id: ID of new document
-        """
-        self.documents_to_add.append(document_id)
-
 
 class BatchResult:
     """
@@ -215,15 +216,20 @@ class DailyUpdater:
     - Adding new hearings and related data
     """
 
-    def __init__(self, congress: int = 119, lookback_days: int = 7, update_mode: str = 'incremental', components: Optional[List[str]] = None):
+    def __init__(self, congress: int = 119, lookback_days: int = 7, update_mode: str = 'incremental',
+                 components: Optional[List[str]] = None, detail_concurrency: Optional[int] = None):
         self.settings = Settings()
         self.congress = congress
         self.lookback_days = lookback_days
         self.update_mode = update_mode  # 'incremental' or 'full'
 
+        # Number of concurrent committee-meeting detail requests
+        self.detail_concurrency = detail_concurrency or self.settings.detail_fetch_concurrency
+
         # Use UnifiedDatabaseManager for PostgreSQL compatibility
         # This auto-detects PostgreSQL from environment variables
         self.db = UnifiedDatabaseManager(prefer_postgres=True)
+        self.hearing_listing = HearingListing(self.db)
 
         # Component selection (default: all hearing-related components)
         # Note: 'hearings' always includes videos (same API response)
@@ -251,11 +257,13 @@ class DailyUpdater:
         # Initialize notification manager
         self.notifier = get_notifier()
 
-        # Track backup path for rollback capability
-        self.backup_path = None
+        # Snapshot of the current run for rollback capability
+        self.snapshots = UpdateSnapshots(self.db, mode=self.settings.snapshot_mode)
+        self.snapshot = None
 
         logger.info(f"DailyUpdater initialized for Congress {congress}, {lookback_days} day lookback, mode={update_mode}")
         logger.info(f"Enabled components: {', '.join(self.enabled_components)}")
+        logger.info(f"Detail fetch concurrency: {self.detail_concurrency}")
 
     def run_daily_update(self, dry_run: bool = False, progress_callback=None) -> Dict[str, Any]:
         """
@@ -302,10 +310,10 @@ class DailyUpdater:
                 self.metrics.hearings_updated = len(changes['updates'])
                 self.metrics.hearings_added = len(changes['additions'])
             else:
-                # Step 2.5: Create database backup before modifications
-                self.backup_path = self._create_database_backup()
-                if not self.backup_path:
-                    logger.warning("Failed to create database backup - proceeding without backup")
+                # Step 2.5: Snapshot the database before modifications
+                self.snapshot = self._create_snapshot()
+                if not self.snapshot:
+                    logger.warning("No database snapshot - proceeding without rollback capability")
 
                 try:
                     # Step 3: Apply updates to database
@@ -320,6 +328,9 @@ class DailyUpdater:
                     # Step 4: Update related data (committees, witnesses)
                     self._update_related_data(changes)
 
+                    # Step 4.5: Refresh denormalized listing rows for touched hearings
+                    self._refresh_hearing_listing(changes)
+
                     # Step 5: Run post-update validation
                     if not dry_run:
                         self._run_post_update_validation()
@@ -337,12 +348,14 @@ class DailyUpdater:
                     # Step 6: Record update metrics
                     self._record_update_metrics()
 
-                    # Step 7: Cleanup old backups (keep last 7 days)
-                    self._cleanup_old_backups(days=7)
+                    # Step 7: Close the snapshot and apply the retention policy
+                    if self.snapshot:
+                        self.snapshots.commit(self.snapshot)
+                    self._prune_snapshots()
 
                 except Exception as e:
-                    # On any error during update, attempt rollback if backup exists
-                    if self.backup_path:
+                    # On any error during update, attempt rollback if a snapshot exists
+                    if self.snapshot:
                         logger.error(f"Update failed, attempting rollback: {e}")
                         self._rollback_database()
                     raise
@@ -429,10 +442,11 @@ class DailyUpdater:
             if self.update_mode == 'full':
                 # Full sync mode - fetch all hearings with details
                 logger.info(f"Running FULL sync - fetching all hearings for Congress {self.congress}")
-                logger.info("This will take 20-30 minutes. Use 'incremental' mode for faster updates.")
+                logger.info(f"Fetching details with {self.detail_concurrency} workers (bounded by the API rate limit). Use 'incremental' mode for faster updates.")
 
                 api_hearings = self.hearing_fetcher.fetch_all_with_details(
-                    congress=self.congress
+                    congress=self.congress,
+                    max_workers=self.detail_concurrency
                 )
 
                 self.metrics.api_requests += 1
@@ -482,27 +496,10 @@ class DailyUpdater:
 
                 # **OPTIMIZATION**: Filter by updateDate BEFORE fetching full details
                 # This dramatically reduces API calls from ~900 to just those recently updated
-                filtered_by_date = []
-                for hearing in all_recent:
-                    updated_at = hearing.get('updateDate')
-                    if updated_at:
-                        try:
-                            update_date = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                            if update_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                filtered_by_date.append(hearing)
-                        except (ValueError, TypeError):
-                            # Can't parse date, include it to be safe
-                            filtered_by_date.append(hearing)
-                    else:
-                        # No updateDate - check hearing date as fallback
-                        hearing_date = hearing.get('date')
-                        if hearing_date:
-                            try:
-                                h_date = datetime.fromisoformat(hearing_date.replace('Z', '+00:00'))
-                                if h_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                    filtered_by_date.append(hearing)
-                            except (ValueError, TypeError):
-                                filtered_by_date.append(hearing)
+                filtered_by_date = [
+                    hearing for hearing in all_recent
+                    if self._updated_since(hearing, cutoff_date)
+                ]
 
                 logger.info(f"Filtered to {len(filtered_by_date)} hearings updated in last {self.lookback_days} days")
                 logger.info(f"Optimization: Reduced API calls from {len(all_recent)} to {len(filtered_by_date)} (saved {len(all_recent) - len(filtered_by_date)} calls)")
@@ -517,179 +514,67 @@ class DailyUpdater:
                         'percent': 0
                     })
 
-                # Step 2: Fetch details for filtered hearings only
-                # Import ThreadPoolExecutor once at the beginning
-                from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+                # Step 2: Fetch details for filtered hearings only, using the
+                # concurrent worker pool (all workers share one rate limiter)
+                fetchable = [
+                    hearing for hearing in filtered_by_date
+                    if hearing.get('eventId') and hearing.get('chamber')
+                ]
+                targets = [(hearing['chamber'].lower(), hearing['eventId']) for hearing in fetchable]
+                logger.info(f"Fetching details for {len(targets)} hearings with {self.detail_concurrency} workers")
+
+                def report_detail_progress(completed: int, total: int) -> None:
+                    # Progress reporting every 10 hearings
+                    if completed % 10 == 0 or completed == total:
+                        logger.info(f"Checked {completed}/{total} hearings")
+                        if progress_callback:
+                            progress_callback({
+                                'hearings_checked': completed,
+                                'total_hearings': total,
+                                'percent': int(completed / total * 100)
+                            })
+
+                details = self.hearing_fetcher.fetch_hearing_details_batch(
+                    self.congress,
+                    targets,
+                    max_workers=self.detail_concurrency,
+                    progress_callback=report_detail_progress
+                )
+                self.metrics.api_requests += len(targets)
 
-                # Create executor outside loop to avoid blocking on context manager
-                # This allows us to abandon hung threads without blocking the entire update
-                executor = ThreadPoolExecutor(max_workers=1)
+                # Step 3: Retry failed fetches once in the same run
+                retry_indexes = [i for i, detailed in enumerate(details) if detailed is None]
+                if retry_indexes:
+                    logger.info(f"Processing retry queue: {len(retry_indexes)} hearings failed in initial pass")
 
-                recent_hearings = []
-                retry_queue = []  # Track hearings that timed out for retry
-
-                for i, hearing in enumerate(filtered_by_date):
-                    event_id = hearing.get('eventId')
-                    chamber = hearing.get('chamber', '').lower()
-
-                    if event_id and chamber:
-                        try:
-                            # Fetch hearing details with explicit timeout handling using ThreadPoolExecutor
-                            # This is more reliable than signal.alarm() which doesn't work well on macOS
-                            def fetch_with_timeout():
-                                # CRITICAL: Enforce socket timeout in worker thread
-                                # This ensures the thread created by ThreadPoolExecutor has the timeout
-                                import socket
-                                socket.setdefaulttimeout(20)  # Match global timeout from api/client.py
-
-                                logger.debug(f"[TIMEOUT DEBUG] Fetching {event_id} in thread (timeout=20s)")
-                                return self.hearing_fetcher.fetch_hearing_details(
-                                    congress=self.congress,
-                                    chamber=chamber,
-                                    event_id=event_id
-                                )
-
-                            # Execute with 25-second timeout (5s connect + 15s read + 5s buffer)
-                            # Reduced from 45s to match new HTTP timeout settings
-                            # Note: Not using 'with' context manager to avoid blocking on hung threads
-                            future = executor.submit(fetch_with_timeout)
-                            try:
-                                logger.debug(f"[TIMEOUT DEBUG] Waiting for result from {event_id} (max 25s)")
-                                detailed = future.result(timeout=25)
-                                logger.debug(f"[TIMEOUT DEBUG] Successfully received result from {event_id}")
-                            except FuturesTimeoutError:
-                                logger.warning(f"[TIMEOUT DEBUG] ThreadPoolExecutor timeout after 25 seconds for {event_id} - adding to retry queue")
-                                # Add to retry queue instead of just continuing
-                                retry_queue.append({'hearing': hearing, 'index': i})
-                                continue  # Skip to next hearing
-
-                            if detailed and 'committeeMeeting' in detailed:
-                                detailed_hearing = detailed['committeeMeeting']
-                                detailed_hearing['chamber'] = chamber.title()
-
-                                # Filter by updateDate (when hearing was last modified)
-                                updated_at = detailed_hearing.get('updateDate')
-                                if updated_at:
-                                    try:
-                                        update_date = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                                        if update_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                            recent_hearings.append(detailed_hearing)
-                                    except (ValueError, TypeError):
-                                        # Can't parse date, include it to be safe
-                                        recent_hearings.append(detailed_hearing)
-                                else:
-                                    # No updateDate, check hearing date as fallback
-                                    hearing_date = detailed_hearing.get('date')
-                                    if hearing_date:
-                                        try:
-                                            h_date = datetime.fromisoformat(hearing_date.replace('Z', '+00:00'))
-                                            if h_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                                recent_hearings.append(detailed_hearing)
-                                        except (ValueError, TypeError):
-                                            recent_hearings.append(detailed_hearing)
-                            else:
-                                # Fall back to basic info
-                                recent_hearings.append(hearing)
-
-                            self.metrics.api_requests += 1
-
-                            # Progress reporting every 10 hearings (increased frequency for better UX)
-                            if (i + 1) % 10 == 0 or (i + 1) == len(filtered_by_date):
-                                logger.info(f"Checked {i + 1}/{len(filtered_by_date)} hearings, found {len(recent_hearings)} updates")
-
-                                # Call progress callback if provided
-                                if progress_callback:
-                                    progress_callback({
-                                        'hearings_checked': i + 1,
-                                        'total_hearings': len(filtered_by_date),
-                                        'hearings_found': len(recent_hearings),
-                                        'percent': int((i + 1) / len(filtered_by_date) * 100)
-                                    })
-
-                        except Exception as e:
-                            logger.warning(f"Could not fetch details for {event_id}: {e}")
-
-                # Step 3: Process retry queue (Option 2: Retry Later in Same Run)
-                if retry_queue:
-                    logger.info(f"Processing retry queue: {len(retry_queue)} hearings timed out in initial pass")
-
-                    for retry_item in retry_queue:
-                        hearing = retry_item['hearing']
-                        original_index = retry_item['index']
-                        event_id = hearing.get('eventId')
-                        chamber = hearing.get('chamber', '').lower()
-
-                        if not event_id or not chamber:
-                            continue
+                    retried = self.hearing_fetcher.fetch_hearing_details_batch(
+                        self.congress,
+                        [targets[i] for i in retry_indexes],
+                        max_workers=self.detail_concurrency
+                    )
+                    self.metrics.api_requests += len(retry_indexes)
 
-                        logger.info(f"Retrying hearing {event_id} (originally #{original_index + 1})")
-
-                        try:
-                            def fetch_with_timeout_retry():
-                                # CRITICAL: Enforce socket timeout in worker thread
-                                import socket
-                                socket.setdefaulttimeout(20)  # Match global timeout
-
-                                logger.debug(f"[TIMEOUT DEBUG] RETRY fetching {event_id} in thread (timeout=20s)")
-                                return self.hearing_fetcher.fetch_hearing_details(
-                                    congress=self.congress,
-                                    chamber=chamber,
-                                    event_id=event_id
-                                )
-
-                            # Retry with same 25-second timeout
-                            future = executor.submit(fetch_with_timeout_retry)
-                            try:
-                                logger.debug(f"[TIMEOUT DEBUG] RETRY waiting for result from {event_id} (max 25s)")
-                                detailed = future.result(timeout=25)
-                                logger.debug(f"[TIMEOUT DEBUG] RETRY successfully received result from {event_id}")
-
-                                # Process successful retry same as main loop
-                                if detailed and 'committeeMeeting' in detailed:
-                                    detailed_hearing = detailed['committeeMeeting']
-                                    detailed_hearing['chamber'] = chamber.title()
-
-                                    # Filter by updateDate
-                                    updated_at = detailed_hearing.get('updateDate')
-                                    if updated_at:
-                                        try:
-                                            update_date = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
-                                            if update_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                                recent_hearings.append(detailed_hearing)
-                                                logger.info(f"✓ Retry successful for {event_id}")
-                                        except (ValueError, TypeError):
-                                            recent_hearings.append(detailed_hearing)
-                                            logger.info(f"✓ Retry successful for {event_id} (no valid updateDate)")
-                                    else:
-                                        # Check hearing date as fallback
-                                        hearing_date = detailed_hearing.get('date')
-                                        if hearing_date:
-                                            try:
-                                                h_date = datetime.fromisoformat(hearing_date.replace('Z', '+00:00'))
-                                                if h_date >= cutoff_date.replace(tzinfo=timezone.utc):
-                                                    recent_hearings.append(detailed_hearing)
-                                                    logger.info(f"✓ Retry successful for {event_id}")
-                                            except (ValueError, TypeError):
-                                                recent_hearings.append(detailed_hearing)
-                                                logger.info(f"✓ Retry successful for {event_id} (no valid date)")
-                                else:
-                                    # Fall back to basic info
-                                    recent_hearings.append(hearing)
-                                    logger.info(f"✓ Retry successful for {event_id} (basic info only)")
-
-                                self.metrics.api_requests += 1
-
-                            except FuturesTimeoutError:
-                                logger.warning(f"[TIMEOUT DEBUG] ✗ RETRY ThreadPoolExecutor timeout after 25 seconds for {event_id} - skipping permanently")
-                                # Permanently skip this hearing - it's failed twice
-
-                        except Exception as e:
-                            logger.warning(f"✗ Retry failed for {event_id}: {e}")
+                    for i, detailed in zip(retry_indexes, retried):
+                        if detailed is not None:
+                            logger.info(f"✓ Retry successful for {targets[i][1]}")
+                            details[i] = detailed
+                        else:
+                            logger.warning(f"✗ Retry failed for {targets[i][1]} - using basic info")
 
                     logger.info(f"Retry queue processing complete")
 
-                # Shutdown executor (don't wait for hung threads)
-                executor.shutdown(wait=False)
+                recent_hearings = []
+                for hearing, detailed in zip(fetchable, details):
+                    if detailed and 'committeeMeeting' in detailed:
+                        detailed_hearing = detailed['committeeMeeting']
+                        detailed_hearing['chamber'] = hearing['chamber'].lower().title()
+
+                        # Filter by updateDate (when hearing was last modified)
+                        if self._updated_since(detailed_hearing, cutoff_date):
+                            recent_hearings.append(detailed_hearing)
+                    else:
+                        # Fall back to basic info
+                        recent_hearings.append(hearing)
 
                 self.metrics.hearings_checked = len(filtered_by_date)
                 logger.info(f"Found {len(recent_hearings)} hearings updated in last {self.lookback_days} days")
@@ -700,10 +585,39 @@ class DailyUpdater:
             self.metrics.errors.append(f"Fetch error: {e}")
             raise
 
+    def _updated_since(self, hearing: Dict[str, Any], cutoff_date: datetime) -> bool:
+        """
+        Check whether a hearing was modified (or held) on or after the cutoff.
+
+        Uses updateDate when present and falls back to the hearing date.
+        Hearings with unparseable dates are included to be safe.
+
+        Args:
+            hearing: Hearing data from the API (list or detail response)
+            cutoff_date: Naive local cutoff datetime
+
+        Returns:
+            True if the hearing falls inside the lookback window
+        """
+        timestamp = hearing.get('updateDate') or hearing.get('date')
+        if not timestamp:
+            return False
+
+        try:
+            parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            return parsed >= cutoff_date.replace(tzinfo=timezone.utc)
+        except (ValueError, TypeError):
+            # Can't parse date, include it to be safe
+            return True
+
     def _identify_changes(self, api_hearings: List[Dict[str, Any]]) -> Dict[str, List]:
         """
         Compare API hearings with database records to identify changes.
 
+        Existing rows are loaded in chunked IN (...) queries and diffed in
+        memory, so the number of round trips grows with the window size
+        divided by DIFF_CHUNK_SIZE rather than one query per hearing.
+
         Args:
             api_hearings: List of hearing data from API
 
@@ -715,68 +629,77 @@ class DailyUpdater:
             'additions': []
         }
 
-        with self.db.transaction() as conn:
-            for hearing in api_hearings:
-                event_id = hearing.get('eventId')
-                if not event_id:
-                    continue
+        event_ids = [h.get('eventId') for h in api_hearings if h.get('eventId')]
+        existing_by_event = self._load_existing_hearings(event_ids)
+
+        for hearing in api_hearings:
+            event_id = hearing.get('eventId')
+            if not event_id:
+                continue
+
+            existing = existing_by_event.get(str(event_id))
+
+            if existing:
+                # Check if update is needed
+                if self._hearing_needs_update(existing, hearing):
+                    changes['updates'].append({
+                        'existing': existing,
+                        'new_data': hearing
+                    })
+            else:
+                # New hearing
+                changes['additions'].append(hearing)
+
+        logger.debug(f"Diffed {len(event_ids)} API hearings against {len(existing_by_event)} existing rows")
+        return changes
+
+    def _load_existing_hearings(self, event_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load existing hearing rows for a set of event IDs.
 
-                # Check if hearing exists in database
+        Args:
+            event_ids: API event IDs to look up
+
+        Returns:
+            Dictionary mapping event_id to a row dict keyed by HEARING_DIFF_COLUMNS
+        """
+        unique_ids = list(dict.fromkeys(str(e) for e in event_ids))
+        existing: Dict[str, Dict[str, Any]] = {}
+        if not unique_ids:
+            return existing
+
+        columns = ', '.join(HEARING_DIFF_COLUMNS)
+
+        with self.db.transaction() as conn:
+            for start in range(0, len(unique_ids), DIFF_CHUNK_SIZE):
+                chunk = unique_ids[start:start + DIFF_CHUNK_SIZE]
+                placeholders = ', '.join('?' for _ in chunk)
                 cursor = conn.execute(
-                    'SELECT * FROM hearings WHERE event_id = ? AND congress = ?',
-                    (event_id, self.congress)
+                    f'SELECT {columns} FROM hearings WHERE congress = ? AND event_id IN ({placeholders})',
+                    [self.congress] + chunk
                 )
-                existing = cursor.fetchone()
-
-                if existing:
-                    # Check if update is needed
-                    if self._hearing_needs_update(existing, hearing):
-                        changes['updates'].append({
-                            'existing': existing,
-                            'new_data': hearing
-                        })
-                else:
-                    # New hearing
-                    changes['additions'].append(hearing)
+                for row in cursor.fetchall():
+                    record = dict(zip(HEARING_DIFF_COLUMNS, tuple(row)))
+                    existing[str(record['event_id'])] = record
 
-        return changes
+        return existing
 
-    def _hearing_needs_update(self, db_record: tuple, api_data: Dict[str, Any]) -> bool:
+    def _hearing_needs_update(self, db_record: Dict[str, Any], api_data: Dict[str, Any]) -> bool:
         """
         Compare database record with API data to determine if update is needed.
 
         Args:
-            db_record: Database row tuple
+            db_record: Existing hearing row keyed by column name
             api_data: API response data
 
         Returns:
             True if update is needed
         """
-        # Map database columns to API fields
-        # This would need to match your actual database schema
-        db_cols = [
-            'hearing_id', 'event_id', 'congress', 'chamber', 'title',
-            'hearing_date_only', 'hearing_time', 'location', 'jacket_number',
-            'hearing_type', 'status', 'created_at', 'updated_at'
-        ]
+        db_data = db_record or {}
 
-        # Convert database record to dict
-        db_data = dict(zip(db_cols, db_record)) if db_record else {}
-
-        # Compare key fields that might change
-        fields_to_check = ['title', 'date', 'status', 'location']
-
-        for field in fields_to_check:
+        # Compare key fields that might change (API field -> database column)
+        for field, db_field in HEARING_DIFF_FIELDS.items():
             api_value = api_data.get(field)
-
-            # Map API field to database column
-            db_field = {
-                'title': 'title',
-                'date': 'hearing_date_only',
-                'status': 'status',
-                'location': 'location'
-            }.get(field, field)
-
             db_value = db_data.get(db_field)
 
             # Handle date formatting
@@ -865,9 +788,46 @@ class DailyUpdater:
 
         logger.info(f"Divided into {len(batches)} batches of up to {batch_size} changes each")
 
-        # Process each batch
+        journal, own_journal = self._batch_journal()
+        try:
+            self._process_batches(batches, journal)
+        finally:
+            if own_journal:
+                self.snapshots.commit(journal)
+
+    def _batch_journal(self) -> Tuple[Optional[Snapshot], bool]:
+        """
+        Journal snapshot that batch checkpoints roll back into.
+
+        The run's snapshot when it is a journal; in backup mode a journal is
+        started for the batch phase only. SNAPSHOT_MODE=none journals
+        nothing, so failed batches keep their partial changes.
+
+        Returns:
+            Tuple of (journal snapshot or None, whether it was started here)
+        """
+        if self.snapshot and self.snapshot.kind == 'journal':
+            return self.snapshot, False
+        if self.snapshots.mode == 'none':
+            logger.info("SNAPSHOT_MODE=none: failed batches are not rolled back")
+            return None, False
+        try:
+            return UpdateSnapshots(self.db, mode='journal').create(), True
+        except Exception as e:
+            logger.error(f"Could not start change journal - failed batches cannot be rolled back: {e}")
+            return None, False
+
+    def _process_batches(self, batches: List[List[Dict[str, Any]]], journal: Optional[Snapshot]) -> None:
+        """
+        Validate, process and (on failure) roll back each batch.
+
+        Args:
+            batches: Batches of hearing changes
+            journal: Journal snapshot for checkpoints
+        """
         for batch_num, batch in enumerate(batches, 1):
-            checkpoint = Checkpoint(batch_num)
+            position = self.snapshots.mark(journal) if journal else 0
+            checkpoint = Checkpoint(batch_num, journal, position)
 
             try:
                 # Step 1: Validate batch
@@ -952,7 +912,7 @@ class DailyUpdater:
         logger.info(f"  Hearings added: {self.metrics.hearings_added}")
         logger.info("=" * 60)
 
-    def _update_hearing_record(self, conn, existing_record: tuple, new_data: Dict[str, Any]) -> None:
+    def _update_hearing_record(self, conn, existing_record: Dict[str, Any], new_data: Dict[str, Any]) -> None:
         """Update an existing hearing record with new data using parser pipeline."""
         # Parse the new data using HearingParser
         hearing = self.hearing_parser.parse(new_data)
@@ -1026,6 +986,28 @@ class DailyUpdater:
                 logger.error(error_msg)
                 self.metrics.errors.append(error_msg)
 
+    def _refresh_hearing_listing(self, changes: Dict[str, List]) -> None:
+        """
+        Refresh hearing_listing rows for every added or updated hearing.
+
+        Titles, dates and committee links of these hearings may have changed.
+        A failure is logged and left for the next full rebuild.
+
+        Args:
+            changes: Dictionary with updates and additions
+        """
+        event_ids = [addition.get('eventId') for addition in changes['additions']]
+        event_ids += [update['new_data'].get('eventId') for update in changes['updates']]
+
+        try:
+            refreshed = self.hearing_listing.refresh(event_ids)
+            if refreshed:
+                logger.info(f"Refreshed hearing listing for {refreshed} hearings")
+        except Exception as e:
+            error_msg = f"Could not refresh hearing listing: {e}"
+            logger.warning(error_msg)
+            self.metrics.errors.append(error_msg)
+
     def _update_hearing_committees(self, hearing_data: Dict[str, Any]) -> None:
         """Update committee associations for a hearing."""
         # This would use your existing committee association logic
@@ -1602,165 +1584,71 @@ class DailyUpdater:
                 'confidence': 0
             })
 
-    def _create_database_backup(self) -> Optional[str]:
+    def _create_snapshot(self):
         """
-        Create a backup of the database before modifications.
+        Snapshot the database before modifications.
 
         Returns:
-            Path to backup file, or None if backup failed
+            Snapshot to roll back to, or None if disabled or snapshot failed
         """
         try:
-            # Create backups directory if it doesn't exist
-            backups_dir = Path(self.settings.database_path).parent / 'backups'
-            backups_dir.mkdir(parents=True, exist_ok=True)
-
-            # Generate backup filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_filename = f"database_backup_{timestamp}.db"
-            backup_path = backups_dir / backup_filename
-
-            # Copy database file
-            logger.info(f"Creating database backup at {backup_path}")
-            shutil.copy2(self.settings.database_path, backup_path)
-
-            # Verify backup was created and has reasonable size
-            if backup_path.exists():
-                backup_size = backup_path.stat().st_size
-                original_size = Path(self.settings.database_path).stat().st_size
-
-                if backup_size == original_size:
-                    logger.info(f"✓ Database backup created successfully ({backup_size / 1024 / 1024:.2f} MB)")
-                    return str(backup_path)
-                else:
-                    logger.error(f"Backup size mismatch: original={original_size}, backup={backup_size}")
-                    return None
-            else:
-                logger.error("Backup file not found after copy")
-                return None
-
+            return self.snapshots.create()
         except Exception as e:
-            logger.error(f"Failed to create database backup: {e}")
+            logger.error(f"Failed to create database snapshot: {e}")
             return None
 
     def _rollback_database(self) -> bool:
         """
-        Restore database from backup.
+        Undo this run's changes from its snapshot.
+
+        Only rows changed since the snapshot are restored (or, for backup
+        snapshots, the copy is restored with SQLite's online backup API), so
+        open connections stay valid.
 
         Returns:
             True if rollback successful, False otherwise
         """
-        if not self.backup_path or not Path(self.backup_path).exists():
-            logger.error("Cannot rollback: backup file not found")
+        if not self.snapshot:
+            logger.error("Cannot rollback: no snapshot for this run")
             return False
 
+        snapshot, self.snapshot = self.snapshot, None
         try:
-            logger.warning(f"Rolling back database from backup: {self.backup_path}")
-
-            # Close any open database connections
-            self.db.close()
-
-            # Restore backup
-            shutil.copy2(self.backup_path, self.settings.database_path)
-
-            # Verify restore
-            restored_size = Path(self.settings.database_path).stat().st_size
-            backup_size = Path(self.backup_path).stat().st_size
-
-            if restored_size == backup_size:
-                logger.info(f"✓ Database rolled back successfully")
-
-                # Reinitialize database connection
-                self.db = UnifiedDatabaseManager(prefer_postgres=True)
-
-                # Send notification about rollback
-                self.notifier.send(
-                    title="Database Rollback Performed",
-                    message=f"Database was rolled back due to update validation failures",
-                    severity="warning",
-                    metadata={
-                        'backup_path': self.backup_path,
-                        'validation_issues': self.metrics.validation_issues[:3]
-                    }
-                )
+            logger.warning(f"Rolling back database to snapshot run {snapshot.run_id}")
+            # Later runs are this run's own batch journal (backup mode)
+            restored = self.snapshots.restore(snapshot, force=True)
+            logger.info(f"✓ Database rolled back successfully ({restored} rows restored)")
+
+            # Send notification about rollback
+            self.notifier.send(
+                title="Database Rollback Performed",
+                message=f"Database was rolled back due to update validation failures",
+                severity="warning",
+                metadata={
+                    'snapshot_run_id': snapshot.run_id,
+                    'snapshot_kind': snapshot.kind,
+                    'rows_restored': restored,
+                    'validation_issues': self.metrics.validation_issues[:3]
+                }
+            )
 
-                return True
-            else:
-                logger.error(f"Rollback verification failed: sizes don't match")
-                return False
+            return True
 
         except Exception as e:
             logger.error(f"Failed to rollback database: {e}")
             return False
 
-    def _cleanup_old_backups(self, days: int = 7) -> None:
-        """
-        Remove database backups older than specified days.
-
-        Args:
-            days: Number of days to keep backups (default: 7)
-        """
+    def _prune_snapshots(self) -> None:
+        """Remove snapshots older than the retention period (settings.snapshot_retention_days)."""
         try:
-            backups_dir = Path(self.settings.database_path).parent / 'backups'
-
-            if not backups_dir.exists():
-                return
-
-            cutoff_time = datetime.now() - timedelta(days=days)
-            removed_count = 0
-
-            for backup_file in backups_dir.glob('database_backup_*.db'):
-                # Check file modification time
-                file_mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
-
-                if file_mtime < cutoff_time:
-                    logger.debug(f"Removing old backup: {backup_file.name}")
-                    backup_file.unlink()
-                    removed_count += 1
-
-            if removed_count > 0:
-                logger.info(f"Cleaned up {removed_count} old backup(s) older than {days} days")
-
+            self.snapshots.prune(days=self.settings.snapshot_retention_days)
         except Exception as e:
-            logger.warning(f"Failed to cleanup old backups: {e}")
+            logger.warning(f"Failed to prune old snapshots: {e}")
 
     # =========================================================================
     # Batch Processing Methods (Phase 2.3.1)
     # =========================================================================
 
-    def _extract_original_data(self, db_record: tuple) -> dict:
-        """
-        Extract fields from database record for rollback tracking.
-
-        This method extracts key hearing fields that may be modified during
-        an update, allowing us to restore them if the batch needs to be rolled back.
-
-        Args:
-            db_record: Database row tuple from hearings table
-
-        Returns:
-            Dictionary containing original field values for rollback
-        """
-        # Map database columns to indices
-        db_cols = [
-            'hearing_id', 'event_id', 'congress', 'chamber', 'title',
-            'hearing_date_only', 'hearing_time', 'location', 'jacket_number',
-            'hearing_type', 'status', 'created_at', 'updated_at'
-        ]
-
-        # Convert tuple to dict
-        db_data = dict(zip(db_cols, db_record)) if db_record else {}
-
-        # Extract fields we want to track for rollback
-        # These are fields that are most likely to change during an update
-        original_data = {
-            'title': db_data.get('title'),
-            'hearing_date_only': db_data.get('hearing_date_only'),
-            'status': db_data.get('status'),
-            'location': db_data.get('location')
-        }
-
-        return original_data
-
     def _divide_into_batches(self, hearings: List, batch_size: int = None) -> List[List]:
         """
         Divide hearings into batches for processing.
@@ -1815,11 +1703,8 @@ class DailyUpdater:
                             existing = item['existing']
                             new_data = item['new_data']
 
-                            # Extract original data BEFORE applying update
-                            original_data = self._extract_original_data(existing)
-
-                            # Track this update in checkpoint
-                            checkpoint.track_update(event_id, original_data)
+                            # Track this update in checkpoint (rows are journaled as they change)
+                            checkpoint.track_update(event_id)
 
                             # Apply the update using existing method
                             self._update_hearing_record(conn, existing, new_data)
@@ -1993,132 +1878,36 @@ class DailyUpdater:
 
     def _rollback_checkpoint(self, checkpoint: Checkpoint) -> bool:
         """
-        Rollback changes tracked in a checkpoint.
+        Rollback changes made since a checkpoint.
 
-        This allows independent batch rollback without affecting other batches:
-        - DELETE hearings that were added
-        - RESTORE hearings that were updated (using original data)
-        - DELETE witnesses that were added
-        - DELETE documents that were added
+        Replays the change journal written after the checkpoint's position
+        with a few set-based statements per table, in one transaction:
+        deleted rows are re-inserted, updated rows get their before-image
+        back and added rows (hearings, committee links, witnesses,
+        appearances, documents) are deleted. Other batches are unaffected.
 
         Args:
-            checkpoint: Checkpoint containing changes to rollback
+            checkpoint: Checkpoint to roll back to
 
         Returns:
             True if rollback successful, False otherwise
         """
         logger.info(f"Rolling back checkpoint for batch {checkpoint.batch_number}")
 
-        try:
-            with self.db.transaction() as conn:
-                rollback_count = 0
-
-                # Step 1: Rollback hearings that were added (DELETE)
-                for hearing_id in checkpoint.hearings_to_add:
-                    try:
-                        cursor = conn.execute(
-                            'DELETE FROM hearings WHERE event_id = ? AND congress = ?',
-                            (hearing_id, self.congress)
-                        )
-                        if cursor.rowcount > 0:
-                            rollback_count += 1
-                            logger.debug(f"Deleted added hearing: {hearing_id}")
-                        else:
-                            logger.warning(f"Hearing {hearing_id} not found for deletion")
-                    except Exception as e:
-                        logger.error(f"Failed to delete hearing {hearing_id}: {e}")
-                        raise
-
-                # Step 2: Rollback hearings that were updated (RESTORE original data)
-                for hearing_id, original_data in checkpoint.original_hearing_data.items():
-                    try:
-                        # Get the hearing_id from database using event_id
-                        cursor = conn.execute(
-                            'SELECT hearing_id FROM hearings WHERE event_id = ? AND congress = ?',
-                            (hearing_id, self.congress)
-                        )
-                        row = cursor.fetchone()
-
-                        if not row:
-                            logger.warning(f"Hearing {hearing_id} not found for restore")
-                            continue
-
-                        db_hearing_id = row[0]
-
-                        # Build UPDATE query dynamically from original_data
-                        # We need to restore the fields that were tracked
-                        if original_data:
-                            set_clauses = []
-                            values = []
-
-                            for field, value in original_data.items():
-                                set_clauses.append(f"{field} = ?")
-                                values.append(value)
-
-                            if set_clauses:
-                                values.append(db_hearing_id)
-                                update_query = f"UPDATE hearings SET {', '.join(set_clauses)} WHERE hearing_id = ?"
-                                cursor = conn.execute(update_query, tuple(values))
-
-                                if cursor.rowcount > 0:
-                                    rollback_count += 1
-                                    logger.debug(f"Restored hearing {hearing_id} to original state")
-                                else:
-                                    logger.warning(f"No rows updated for hearing {hearing_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to restore hearing {hearing_id}: {e}")
-                        raise
-
-                # Step 3: Rollback witnesses that were added (DELETE)
-                # Note: This will cascade delete from witness_appearances and witness_documents
-                # if foreign keys are properly configured with ON DELETE CASCADE
-                for witness_id in checkpoint.witnesses_to_add:
-                    try:
-                        cursor = conn.execute(
-                            'DELETE FROM witnesses WHERE witness_id = ?',
-                            (witness_id,)
-                        )
-                        if cursor.rowcount > 0:
-                            rollback_count += 1
-                            logger.debug(f"Deleted added witness: {witness_id}")
-                        else:
-                            logger.warning(f"Witness {witness_id} not found for deletion")
-                    except Exception as e:
-                        logger.error(f"Failed to delete witness {witness_id}: {e}")
-                        raise
+        if not checkpoint.snapshot:
+            logger.error(f"Cannot rollback batch {checkpoint.batch_number}: no change journal")
+            return False
 
-                # Step 4: Rollback documents that were added (DELETE)
-                for document_id in checkpoint.documents_to_add:
-                    try:
-                        cursor = conn.execute(
-                            'DELETE FROM witness_documents WHERE document_id = ?',
-                            (document_id,)
-                        )
-                        if cursor.rowcount > 0:
-                            rollback_count += 1
-                            logger.debug(f"Deleted added document: {document_id}")
-                        else:
-                            logger.warning(f"Document {document_id} not found for deletion")
-                    except Exception as e:
-                        logger.error(f"Failed to delete document {document_id}: {e}")
-                        raise
+        try:
+            restored = self.snapshots.rollback_to(checkpoint.snapshot, checkpoint.journal_position)
 
-            # Success - log summary
             logger.info(
                 f"✓ Checkpoint rollback complete for batch {checkpoint.batch_number}: "
-                f"{rollback_count} operations reversed"
-            )
-            logger.info(
-                f"  - Deleted {len(checkpoint.hearings_to_add)} added hearings"
-            )
-            logger.info(
-                f"  - Restored {len(checkpoint.original_hearing_data)} updated hearings"
-            )
-            logger.info(
-                f"  - Deleted {len(checkpoint.witnesses_to_add)} added witnesses"
+                f"{restored} rows restored"
             )
             logger.info(
-                f"  - Deleted {len(checkpoint.documents_to_add)} added documents"
+                f"  - Batch had {len(checkpoint.hearings_to_update)} updated and "
+                f"{len(checkpoint.hearings_to_add)} added hearings"
             )
 
             return True
@@ -11,6 +11,7 @@ States:
 """
 
 import time
+import threading
 from enum import Enum
 from typing import Callable, Any, Optional
 from datetime import datetime
@@ -74,6 +75,9 @@ class CircuitBreaker:
         self.total_successes = 0
         self.times_opened = 0
 
+        # Guards state transitions when shared by concurrent worker threads
+        self._lock = threading.RLock()
+
         logger.info(
             f"Circuit breaker '{name}' initialized: "
             f"failure_threshold={failure_threshold}, "
@@ -137,25 +141,28 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Exception: Any exception raised by the function
         """
-        self.total_calls += 1
+        with self._lock:
+            self.total_calls += 1
 
-        # Check if circuit is open
-        if self.state == CircuitState.OPEN:
-            raise CircuitBreakerError(
-                f"Circuit breaker '{self.name}' is OPEN. "
-                f"Will retry in {self._get_recovery_time_remaining():.0f}s"
-            )
+            # Check if circuit is open
+            if self.state == CircuitState.OPEN:
+                raise CircuitBreakerError(
+                    f"Circuit breaker '{self.name}' is OPEN. "
+                    f"Will retry in {self._get_recovery_time_remaining():.0f}s"
+                )
 
         try:
             # Execute the function
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
-
         except Exception as e:
-            self._on_failure()
+            with self._lock:
+                self._on_failure()
             raise
 
+        with self._lock:
+            self._on_success()
+        return result
+
     def _on_success(self) -> None:
         """Handle successful call"""
         self.total_successes += 1
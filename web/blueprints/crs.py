@@ -1,21 +1,23 @@
 """
 CRS Products blueprint - browse and search CRS products
 """
-from flask import Blueprint, render_template, request, Response
+from flask import Blueprint, render_template, request, Response, stream_with_context
 import psycopg2
 import psycopg2.extras
-import csv
-import io
 import os
 import sys
-import requests
 import json
 from datetime import datetime
 from contextlib import contextmanager
 
 # Add parent directory to path for database imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-from database.postgres_config import get_connection
+from database.postgres_config import get_connection, get_pooled_connection
+from database.pagination import KeysetPager, cached_count, NULL_TIMESTAMP
+from database.blob_cache import get_blob_cache
+from database.export_stream import (
+    export_format, export_response_headers, export_stream, iter_named_cursor, limit_arg, start_stream
+)
 
 crs_bp = Blueprint('crs', __name__, url_prefix='/crs')
 
@@ -36,8 +38,8 @@ def get_crs_db():
     if not crs_url:
         raise ValueError("Neither CRS_DATABASE_URL nor DATABASE_URL environment variable is set")
 
-    # Create direct connection
-    conn = psycopg2.connect(crs_url)
+    # Check out from the shared pool; close() returns the connection
+    conn = get_pooled_connection(crs_url)
     try:
         yield conn
         conn.commit()
@@ -48,27 +50,18 @@ def get_crs_db():
         conn.close()
 
 
-def fetch_content_from_blob(blob_url, timeout=10):
+def fetch_content_from_blob(blob_url, content_hash=None):
     """
-    Fetch HTML content from Vercel Blob storage
+    Fetch HTML content from Vercel Blob storage, through the shared blob cache
 
     Args:
         blob_url: URL to the blob
-        timeout: Request timeout in seconds
+        content_hash: Hash of the stored version, if known (cached without revalidation)
 
     Returns:
         HTML content string, or None if fetch fails
     """
-    try:
-        response = requests.get(blob_url, timeout=timeout)
-        if response.status_code == 200:
-            return response.text
-        else:
-            print(f"Error fetching blob: {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"Error fetching blob from {blob_url}: {e}")
-        return None
+    return get_blob_cache().get(blob_url, content_hash)
 
 
 @crs_bp.route('/')
@@ -84,9 +77,21 @@ def index():
         date_to = request.args.get('date_to', '')
         sort_by = request.args.get('sort', 'date')
         sort_order = request.args.get('order', 'desc')
-        page = int(request.args.get('page', 1))
         limit = 50
-        offset = (page - 1) * limit
+
+        # Sort keys (over products columns), ending with the unique product_id;
+        # products without a publication date sort last for DESC, first for ASC
+        sort_columns = {
+            'title': 'title',
+            'date': f"COALESCE(publication_date, '{NULL_TIMESTAMP}')",
+            'type': 'product_type'
+        }
+        if sort_by not in sort_columns:
+            sort_by = 'date'
+        sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        pager = KeysetPager([(sort_columns[sort_by], sort_direction), ('product_id', sort_direction)],
+                            limit, request.args, signature=f'{sort_by}:{sort_direction}', paramstyle='format')
+        page = pager.page
 
         with get_crs_db() as conn:
             cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
@@ -123,30 +128,15 @@ def index():
 
             # Get total count
             count_query = f"SELECT COUNT(*) FROM ({query}) AS count_subquery"
-            cursor.execute(count_query, params)
-            total = cursor.fetchone()['count']
-
-            # Add sorting
-            sort_columns = {
-                'title': 'title',
-                'date': 'publication_date',
-                'type': 'product_type'
-            }
-
-            sort_column = sort_columns.get(sort_by, 'publication_date')
-            sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
-
-            # Handle NULL values for publication_date
-            if sort_by == 'date':
-                query += f' ORDER BY {sort_column} {sort_direction} NULLS LAST'
-            else:
-                query += f' ORDER BY {sort_column} {sort_direction}'
+            unfiltered = not (status or product_type or topic or author or date_from or date_to)
+            total = cached_count(cursor, ('crs', status, product_type, topic, author, date_from, date_to),
+                                 count_query, params, estimate_table='products' if unfiltered else None,
+                                 paramstyle='format')
 
             # Get paginated results
-            query += ' LIMIT %s OFFSET %s'
-            params.extend([limit, offset])
-            cursor.execute(query, params)
-            products = cursor.fetchall()
+            page_query, page_params = pager.wrap(query, params)
+            cursor.execute(page_query, page_params)
+            products = pager.finish(cursor.fetchall())
 
             # Get filter options
             cursor.execute('SELECT DISTINCT product_type FROM products WHERE product_type IS NOT NULL ORDER BY product_type')
@@ -178,7 +168,8 @@ def index():
             if author and author not in authors:
                 authors.insert(0, author)
 
-        total_pages = (total + limit - 1) // limit
+        # Counts may be cached or estimated, so never hide a page the cursor can reach
+        total_pages = max((total + limit - 1) // limit, page + 1 if pager.has_next else page)
 
         return render_template('crs_index.html',
                              products=products,
@@ -194,6 +185,8 @@ def index():
                              sort_by=sort_by,
                              sort_order=sort_order,
                              page=page,
+                             prev_cursor=pager.prev_cursor,
+                             next_cursor=pager.next_cursor,
                              total=total,
                              total_pages=total_pages,
                              limit=limit)
@@ -582,7 +575,7 @@ def product_detail(product_id):
             try:
                 cursor.execute('''
                     SELECT version_id, version_number,
-                           structure_json, word_count, ingested_at, blob_url
+                           structure_json, word_count, ingested_at, blob_url, content_hash
                     FROM product_versions
                     WHERE product_id = %s AND is_current = TRUE
                 ''', (product_id,))
@@ -594,7 +587,8 @@ def product_detail(product_id):
 
                     # If blob_url exists, fetch content from blob storage
                     if content_version.get('blob_url'):
-                        blob_html = fetch_content_from_blob(content_version['blob_url'])
+                        blob_html = fetch_content_from_blob(content_version['blob_url'],
+                                                             content_version.get('content_hash'))
                         if blob_html:
                             # Use blob content
                             content_version['html_content'] = blob_html
@@ -615,9 +609,17 @@ def product_detail(product_id):
         return f"Error: {e}", 500
 
 
+EXPORT_COLUMNS = ['product_id', 'title', 'product_type', 'status', 'publication_date',
+                  'authors', 'topics', 'url_html', 'url_pdf']
+
+
 @crs_bp.route('/api/export')
 def export_csv():
-    """Export products as CSV"""
+    """
+    Export products as CSV, streamed
+
+    Optional: format=ndjson, gzip=1, limit=N (default: every matching product)
+    """
     try:
         # Get filter parameters
         product_ids = request.args.get('ids', '')
@@ -625,82 +627,72 @@ def export_csv():
         product_type = request.args.get('product_type', '')
         status = request.args.get('status', 'Active')
         topic = request.args.get('topic', '')
+        fmt, compress = export_format(request.args)
+        limit = limit_arg(request.args)
+
+        select = f"SELECT {', '.join('p.' + column for column in EXPORT_COLUMNS)} FROM products p"
+
+        # Build query based on parameters
+        if product_ids:
+            # Export specific products
+            ids = product_ids.split(',')
+            placeholders = ','.join(['%s'] * len(ids))
+            sql_query = f'{select} WHERE p.product_id IN ({placeholders})'
+            params = ids
+        elif original_query:
+            # Export search results - expand query for better results
+            query = expand_search_query(original_query)
+            sql_query = f'''
+                {select}
+                WHERE p.search_vector @@ websearch_to_tsquery('english', %s)
+                ORDER BY ts_rank(p.search_vector, websearch_to_tsquery('english', %s)) DESC
+            '''
+            params = [query, query]
+        else:
+            # Export filtered browse results
+            sql_query = f'{select} WHERE 1=1'
+            params = []
 
-        with get_crs_db() as conn:
-            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            if status:
+                sql_query += ' AND p.status = %s'
+                params.append(status)
+            if product_type:
+                sql_query += ' AND p.product_type = %s'
+                params.append(product_type)
+            if topic:
+                # PostgreSQL JSONB: use @> operator
+                sql_query += ' AND p.topics @> %s'
+                params.append(json.dumps([topic]))
 
-            # Build query based on parameters
-            if product_ids:
-                # Export specific products
-                ids = product_ids.split(',')
-                placeholders = ','.join(['%s'] * len(ids))
-                sql_query = f'SELECT * FROM products WHERE product_id IN ({placeholders})'
-                cursor.execute(sql_query, ids)
-                products = cursor.fetchall()
-            elif original_query:
-                # Export search results - expand query for better results
-                query = expand_search_query(original_query)
-                search_query = '''
-                    SELECT p.*
-                    FROM products p
-                    WHERE p.search_vector @@ websearch_to_tsquery('english', %s)
-                    ORDER BY ts_rank(p.search_vector, websearch_to_tsquery('english', %s)) DESC
-                '''
-                cursor.execute(search_query, (query, query))
-                products = cursor.fetchall()
-            else:
-                # Export filtered browse results
-                sql_query = 'SELECT * FROM products WHERE 1=1'
-                params = []
-
-                if status:
-                    sql_query += ' AND status = %s'
-                    params.append(status)
-                if product_type:
-                    sql_query += ' AND product_type = %s'
-                    params.append(product_type)
-                if topic:
-                    # PostgreSQL JSONB: use @> operator
-                    sql_query += ' AND topics @> %s'
-                    params.append(json.dumps([topic]))
-
-                sql_query += ' ORDER BY publication_date DESC LIMIT 1000'
-                cursor.execute(sql_query, params)
-                products = cursor.fetchall()
-
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(['product_id', 'title', 'product_type', 'status', 'publication_date',
-                        'authors', 'topics', 'url_html', 'url_pdf'])
-
-        # Write rows
-        for product in products:
-            # JSONB fields are already Python objects (lists), no need to json.loads
-            authors = product['authors'] if product['authors'] else []
-            topics = product['topics'] if product['topics'] else []
-
-            writer.writerow([
-                product['product_id'],
-                product['title'],
-                product['product_type'],
-                product['status'],
-                product['publication_date'],
-                '; '.join(authors),
-                '; '.join(topics),
-                product['url_html'] or '',
-                product['url_pdf'] or ''
-            ])
-
-        # Return as CSV download
-        output.seek(0)
-        return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment; filename=crs_products_{datetime.now().strftime("%Y%m%d")}.csv'}
+            sql_query += ' ORDER BY p.publication_date DESC'
+
+        if limit:
+            sql_query += ' LIMIT %s'
+            params.append(limit)
+
+        def rows():
+            # Server-side cursor: rows arrive in batches, never all at once
+            with get_crs_db() as conn:
+                for (product_id, title, product_type, status, publication_date,
+                     authors, topics, url_html, url_pdf) in iter_named_cursor(conn, sql_query, params):
+                    # JSONB fields are already Python objects (lists), no need to json.loads
+                    yield [
+                        product_id,
+                        title,
+                        product_type,
+                        status,
+                        publication_date,
+                        '; '.join(authors or []),
+                        '; '.join(topics or []),
+                        url_html or '',
+                        url_pdf or ''
+                    ]
+
+        body = start_stream(export_stream(EXPORT_COLUMNS, rows(), fmt, compress))
+        mimetype, headers = export_response_headers(
+            f'crs_products_{datetime.now().strftime("%Y%m%d")}', fmt, compress
         )
+        return Response(stream_with_context(body), mimetype=mimetype, headers=headers)
 
     except Exception as e:
         return f"Error: {e}", 500
@@ -3,12 +3,17 @@ Hearing-related routes blueprint
 """
 from flask import Blueprint, render_template, request
 from database.unified_manager import UnifiedDatabaseManager
+from database.search_index import SearchIndex
+from database.hearing_listing import HearingListing
+from database.pagination import KeysetPager, cached_count, NULL_DATE, NULL_TIME, NULL_TIMESTAMP, NULL_TEXT
 from datetime import datetime, timedelta, date
 
 hearings_bp = Blueprint('hearings', __name__)
 
 # Initialize database manager (auto-detects Postgres if POSTGRES_URL is set)
 db = UnifiedDatabaseManager()
+search_index = SearchIndex(db)
+hearing_listing = HearingListing(db)
 
 
 @hearings_bp.route('/hearings')
@@ -31,89 +36,91 @@ def hearings():
         date_to = request.args.get('date_to', sunday.strftime('%Y-%m-%d'))
         sort_by = request.args.get('sort', 'date')
         sort_order = request.args.get('order', 'desc')
-        page = int(request.args.get('page', 1))
         per_page = 20
-        offset = (page - 1) * per_page
-
-        # Build query - show all hearings, with committee info when available
-        # Show parent committee if the associated committee is a subcommittee
-        # Prefer primary committee, but fall back to any committee if no primary exists
-        query = '''
-            SELECT h.hearing_id, h.title, h.hearing_date_only, h.hearing_time, h.chamber, h.status, h.hearing_type,
-                   COALESCE(parent_primary.name, c_primary.name, parent_any.name, c_any.name) as committee_name,
-                   COALESCE(parent_primary.committee_id, c_primary.committee_id, parent_any.committee_id, c_any.committee_id) as committee_id,
-                   h.updated_at, h.event_id
-            FROM hearings h
-            LEFT JOIN hearing_committees hc_primary ON h.hearing_id = hc_primary.hearing_id AND hc_primary.is_primary = TRUE
-            LEFT JOIN committees c_primary ON hc_primary.committee_id = c_primary.committee_id
-            LEFT JOIN committees parent_primary ON c_primary.parent_committee_id = parent_primary.committee_id
-            LEFT JOIN hearing_committees hc_any ON h.hearing_id = hc_any.hearing_id
-                AND NOT EXISTS (SELECT 1 FROM hearing_committees WHERE hearing_id = h.hearing_id AND is_primary = TRUE)
-            LEFT JOIN committees c_any ON hc_any.committee_id = c_any.committee_id
-            LEFT JOIN committees parent_any ON c_any.parent_committee_id = parent_any.committee_id
-            WHERE 1=1
-        '''
+
+        # Committee display (primary committee preferred, subcommittees shown under
+        # their parent) is precomputed per hearing in hearing_listing
+        where = ' WHERE 1=1'
         params = []
 
         if search:
-            query += ''' AND (h.title LIKE ?
-                         OR c_primary.name LIKE ? OR parent_primary.name LIKE ?
-                         OR c_any.name LIKE ? OR parent_any.name LIKE ?)'''
-            search_term = f'%{search}%'
-            params.extend([search_term, search_term, search_term, search_term, search_term])
+            # Full-text matches on the hearing title or the linked committee name
+            hearing_matches, hearing_params = search_index.match_ids_sql('hearings', search)
+            committee_matches, committee_params = search_index.match_ids_sql('committees', search)
+            where += f''' AND (h.hearing_id IN ({hearing_matches})
+                         OR h.committee_id IN ({committee_matches})
+                         OR h.subcommittee_id IN ({committee_matches}))'''
+            params.extend(hearing_params + committee_params * 2)
 
         if chamber:
-            query += ' AND h.chamber = ?'
+            where += ' AND h.chamber = ?'
             params.append(chamber)
 
         if committee_id:
-            query += ''' AND (c_primary.committee_id = ? OR parent_primary.committee_id = ?
-                          OR c_any.committee_id = ? OR parent_any.committee_id = ?)'''
-            params.extend([committee_id, committee_id, committee_id, committee_id])
+            where += ' AND (h.committee_id = ? OR h.subcommittee_id = ?)'
+            params.extend([committee_id, committee_id])
 
         if date_from:
-            query += ' AND h.hearing_date_only >= ?'
+            where += ' AND h.hearing_date_only >= ?'
             params.append(date_from)
 
         if date_to:
-            query += ' AND h.hearing_date_only <= ?'
+            where += ' AND h.hearing_date_only <= ?'
             params.append(date_to)
+            if not date_from:
+                # Undated hearings hold NULL_DATE
+                where += ' AND h.hearing_date_only > ?'
+                params.append(NULL_DATE)
 
-        # Count total for pagination
-        count_query = f"SELECT COUNT(*) FROM ({query}) as count_query"
+        source = f'{hearing_listing.source()} h'
 
-        with db.transaction() as conn:
-            cursor = conn.execute(count_query, params)
-            row = cursor.fetchone()
-            total = list(row.values())[0] if hasattr(row, 'keys') else row[0]
+        # Count total for pagination
+        count_query = f'SELECT COUNT(*) FROM {source}{where}'
+        count_key = ('hearings', search, chamber, committee_id, date_from, date_to)
+        unfiltered = not (search or chamber or committee_id or date_from or date_to)
+
+        # hearing_listing stores missing dates and times as sentinels: they are shown as
+        # NULL, and the raw sort_* columns are the keys idx_hearing_listing_sort serves
+        query = f'''
+            SELECT h.hearing_id, h.title, NULLIF(h.hearing_date_only, '{NULL_DATE}') AS hearing_date_only,
+                   NULLIF(h.hearing_time, '{NULL_TIME}') AS hearing_time, h.chamber, h.status, h.hearing_type,
+                   h.committee_name, h.committee_id, NULLIF(h.updated_at, '{NULL_TIMESTAMP}') AS updated_at,
+                   h.event_id, h.hearing_date_only AS sort_date, h.hearing_time AS sort_time,
+                   h.updated_at AS sort_updated_at
+            FROM {source}{where}
+        '''
 
-            # Add sorting
+        # Sort keys (over the query's output columns), ending with the unique hearing_id
+        sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        if sort_by not in ('title', 'committee', 'chamber', 'status'):
+            # Missing dates and times sort last for DESC, first for ASC
+            sort_by = 'date'
+            keys = [('sort_date', sort_direction),
+                    ('sort_time', sort_direction),
+                    ('sort_updated_at', sort_direction),
+                    ('hearing_id', sort_direction)]
+        else:
             sort_columns = {
-                'title': 'h.title',
-                'committee': 'COALESCE(parent_primary.name, c_primary.name, parent_any.name, c_any.name)',
-                'date': 'h.hearing_date_only',
-                'chamber': 'h.chamber',
-                'status': 'h.status'
+                'title': 'title',
+                'committee': f"COALESCE(committee_name, '{NULL_TEXT}')",
+                'chamber': 'chamber',
+                'status': 'status'
             }
+            keys = [(sort_columns[sort_by], sort_direction),
+                    ('sort_date', 'DESC'),
+                    ('hearing_id', 'DESC')]
 
-            sort_column = sort_columns.get(sort_by, 'h.hearing_date_only')
-            sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        pager = KeysetPager(keys, per_page, request.args, signature=f'{sort_by}:{sort_direction}')
+        page = pager.page
 
-            # Special handling for date sorting (nulls last for DESC, nulls first for ASC)
-            if sort_by == 'date':
-                if sort_order == 'desc':
-                    query += f' ORDER BY {sort_column} DESC NULLS LAST, h.hearing_time DESC NULLS LAST, h.updated_at DESC'
-                else:
-                    query += f' ORDER BY {sort_column} ASC NULLS FIRST, h.hearing_time ASC NULLS FIRST, h.updated_at ASC'
-            else:
-                query += f' ORDER BY {sort_column} {sort_direction}, h.hearing_date_only DESC NULLS LAST'
+        with db.transaction() as conn:
+            total = cached_count(conn, count_key, count_query, params,
+                                 estimate_table='hearings' if unfiltered and db.db_type == 'postgres' else None)
 
             # Get page of results
-            query += ' LIMIT ? OFFSET ?'
-            params.extend([per_page, offset])
-
-            cursor = conn.execute(query, params)
-            hearings_data = cursor.fetchall()
+            page_query, page_params = pager.wrap(query, params)
+            cursor = conn.execute(page_query, page_params)
+            hearings_data = pager.finish(cursor.fetchall())
 
             # Get filter options
             cursor = conn.execute('SELECT DISTINCT chamber FROM hearings ORDER BY chamber')
@@ -132,9 +139,8 @@ def hearings():
             committees_with_hearings = cursor.fetchall()
 
         # Pagination info
-        total_pages = (total + per_page - 1) // per_page
-        has_prev = page > 1
-        has_next = page < total_pages
+        # Counts may be cached or estimated, so never hide a page the cursor can reach
+        total_pages = max((total + per_page - 1) // per_page, page + 1 if pager.has_next else page)
 
         # Determine active filter based on date range
         active_filter = 'all'
@@ -171,8 +177,10 @@ def hearings():
                              sort_order=sort_order,
                              page=page,
                              total_pages=total_pages,
-                             has_prev=has_prev,
-                             has_next=has_next,
+                             has_prev=pager.has_prev,
+                             has_next=pager.has_next,
+                             prev_cursor=pager.prev_cursor,
+                             next_cursor=pager.next_cursor,
                              total=total,
                              active_filter=active_filter)
     except Exception as e:
@@ -3,11 +3,14 @@ Main pages blueprint - members, witnesses, and search
 """
 from flask import Blueprint, render_template, request
 from database.manager import DatabaseManager
+from database.search_index import SearchIndex
+from database.pagination import KeysetPager, cached_count, NULL_DATE, NULL_TEXT
 
 main_pages_bp = Blueprint('main_pages', __name__)
 
 # Initialize database manager
 db = DatabaseManager()
+search_index = SearchIndex(db)
 
 
 @main_pages_bp.route('/members')
@@ -19,17 +22,15 @@ def members():
         chamber = request.args.get('chamber', '')
         sort_by = request.args.get('sort', 'name')
         sort_order = request.args.get('order', 'asc')
-        page = int(request.args.get('page', 1))
         per_page = 20
-        offset = (page - 1) * per_page
 
-        query = '''
+        chamber_expr = "CASE WHEN m.district IS NULL THEN 'Senate' ELSE 'House' END"
+        select = f'''
             SELECT DISTINCT m.member_id, m.full_name, m.party, m.state, m.district,
                    COUNT(DISTINCT cm.committee_id) as committee_count,
-                   CASE
-                       WHEN m.district IS NULL THEN 'Senate'
-                       ELSE 'House'
-                   END as chamber
+                   {chamber_expr} as chamber
+        '''
+        query_from = '''
             FROM members m
             LEFT JOIN committee_memberships cm ON m.member_id = cm.member_id AND cm.is_active = TRUE
             WHERE 1=1
@@ -37,49 +38,50 @@ def members():
         params = []
 
         if party:
-            query += ' AND m.party = ?'
+            query_from += ' AND m.party = ?'
             params.append(party)
 
         if state:
-            query += ' AND m.state = ?'
+            query_from += ' AND m.state = ?'
             params.append(state)
 
         if chamber:
             if chamber == 'House':
-                query += ' AND m.district IS NOT NULL'
+                query_from += ' AND m.district IS NOT NULL'
             elif chamber == 'Senate':
-                query += ' AND m.district IS NULL'
+                query_from += ' AND m.district IS NULL'
 
-        query += ' GROUP BY m.member_id, m.full_name, m.party, m.state, m.district'
+        group_by = 'GROUP BY m.member_id, m.full_name, m.party, m.state, m.district'
 
         # Count total for pagination
-        count_query = f"SELECT COUNT(*) FROM ({query}) as count_query"
-
-        with db.transaction() as conn:
-            cursor = conn.execute(count_query, params)
-            row = cursor.fetchone()
-            total = list(row.values())[0] if hasattr(row, 'keys') else row[0]
-
-            # Add sorting
-            sort_columns = {
-                'name': 'm.full_name',
-                'party': 'm.party',
-                'state': 'm.state',
-                'chamber': 'chamber',
-                'committees': 'committee_count'
-            }
-
-            sort_column = sort_columns.get(sort_by, 'm.full_name')
-            sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        count_query = f"SELECT COUNT(*) FROM ({select} {query_from} {group_by}) as count_query"
+        count_key = ('members', party, state, chamber)
+
+        # Sort keys (over the source columns), ending with the unique member_id
+        sort_columns = {
+            'name': 'm.full_name',
+            'party': 'm.party',
+            'state': 'm.state',
+            'chamber': chamber_expr,
+            'committees': 'COUNT(DISTINCT cm.committee_id)'
+        }
+        if sort_by not in sort_columns:
+            sort_by = 'name'
+        sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        keys = [(sort_columns[sort_by], sort_direction), ('m.member_id', 'ASC')]
 
-            query += f' ORDER BY {sort_column} {sort_direction}'
+        pager = KeysetPager(keys, per_page, request.args, signature=f'{sort_by}:{sort_direction}')
+        page = pager.page
 
-            # Get page of results
-            query += ' LIMIT ? OFFSET ?'
-            params.extend([per_page, offset])
+        with db.transaction() as conn:
+            total = cached_count(conn, count_key, count_query, params,
+                                 estimate_table='members' if not (party or state or chamber) and db.is_postgres else None)
 
-            cursor = conn.execute(query, params)
-            members_data = cursor.fetchall()
+            # Get page of results (only members past the cursor are aggregated)
+            page_query, page_params = pager.wrap_grouped(select, query_from, group_by, params,
+                                                         aggregate_keys=sort_by == 'committees')
+            cursor = conn.execute(page_query, page_params)
+            members_data = pager.finish(cursor.fetchall())
 
             # Get filter options
             cursor = conn.execute('SELECT DISTINCT party FROM members WHERE party IS NOT NULL ORDER BY party')
@@ -93,9 +95,8 @@ def members():
             chambers = ['House', 'Senate']
 
         # Pagination info
-        total_pages = (total + per_page - 1) // per_page
-        has_prev = page > 1
-        has_next = page < total_pages
+        # Counts may be cached or estimated, so never hide a page the cursor can reach
+        total_pages = max((total + per_page - 1) // per_page, page + 1 if pager.has_next else page)
 
         return render_template('members.html',
                              members=members_data,
@@ -109,8 +110,10 @@ def members():
                              sort_order=sort_order,
                              page=page,
                              total_pages=total_pages,
-                             has_prev=has_prev,
-                             has_next=has_next,
+                             has_prev=pager.has_prev,
+                             has_next=pager.has_next,
+                             prev_cursor=pager.prev_cursor,
+                             next_cursor=pager.next_cursor,
                              total=total)
     except Exception as e:
         return f"Error: {e}", 500
@@ -124,16 +127,16 @@ def witnesses():
         witness_type = request.args.get('type', '')
         sort_by = request.args.get('sort', 'recent')
         sort_order = request.args.get('order', 'desc')
-        page = int(request.args.get('page', 1))
         per_page = 20
-        offset = (page - 1) * per_page
 
         # Build query for witnesses with hearing information
-        query = '''
+        select = '''
             SELECT w.witness_id, w.full_name, w.first_name, w.last_name, w.title, w.organization,
                    MAX(wa.witness_type) as witness_type,
                    COUNT(DISTINCT wa.hearing_id) as hearing_count,
                    MAX(h.hearing_date) as latest_appearance
+        '''
+        query_from = '''
             FROM witnesses w
             LEFT JOIN witness_appearances wa ON w.witness_id = wa.witness_id
             LEFT JOIN hearings h ON wa.hearing_id = h.hearing_id
@@ -142,49 +145,50 @@ def witnesses():
         params = []
 
         if search:
-            query += ' AND (w.full_name LIKE ? OR w.organization LIKE ?)'
+            query_from += ' AND (w.full_name LIKE ? OR w.organization LIKE ?)'
             search_term = f'%{search}%'
             params.extend([search_term, search_term])
 
         if witness_type:
-            query += ' AND wa.witness_type = ?'
+            query_from += ' AND wa.witness_type = ?'
             params.append(witness_type)
 
-        query += ' GROUP BY w.witness_id, w.full_name, w.first_name, w.last_name, w.title, w.organization'
+        group_by = 'GROUP BY w.witness_id, w.full_name, w.first_name, w.last_name, w.title, w.organization'
 
         # Count total for pagination
-        count_query = f"SELECT COUNT(*) FROM ({query}) as count_query"
+        count_query = f"SELECT COUNT(*) FROM ({select} {query_from} {group_by}) as count_query"
+        count_key = ('witnesses', search, witness_type)
+
+        # Sort keys (over the source columns), ending with the unique witness_id
+        sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
+        aggregate_keys = sort_by in ('hearings', 'recent')
+        if sort_by == 'organization':
+            # Witnesses without an organization always sort last
+            keys = [('CASE WHEN w.organization IS NULL THEN 1 ELSE 0 END', 'ASC'),
+                    (f"COALESCE(w.organization, '{NULL_TEXT}')", sort_direction)]
+        elif sort_by == 'hearings':
+            keys = [('COUNT(DISTINCT wa.hearing_id)', sort_direction)]
+        elif sort_by == 'name':
+            keys = [('w.full_name', sort_direction)]
+        else:
+            # Most recent appearance first, witnesses without hearings last
+            sort_by, sort_direction, aggregate_keys = 'recent', 'DESC', True
+            keys = [(f"COALESCE(MAX(h.hearing_date), '{NULL_DATE}')", 'DESC')]
+        keys.append(('w.witness_id', 'ASC'))
+
+        pager = KeysetPager(keys, per_page, request.args, signature=f'{sort_by}:{sort_direction}')
+        page = pager.page
 
         with db.transaction() as conn:
-            cursor = conn.execute(count_query, params)
-            row = cursor.fetchone()
-            total = list(row.values())[0] if hasattr(row, 'keys') else row[0]
-
-            # Add sorting
-            sort_columns = {
-                'name': 'w.full_name',
-                'organization': 'w.organization',
-                'hearings': 'hearing_count',
-                'recent': 'latest_appearance'
-            }
-
-            sort_column = sort_columns.get(sort_by, 'w.full_name')
-            sort_direction = 'ASC' if sort_order == 'asc' else 'DESC'
-
-            # Handle NULL values for organization and latest_appearance
-            if sort_by == 'organization':
-                query += f' ORDER BY {sort_column} IS NULL, {sort_column} {sort_direction}'
-            elif sort_by == 'recent':
-                query += f' ORDER BY {sort_column} DESC NULLS LAST'
-            else:
-                query += f' ORDER BY {sort_column} {sort_direction}'
-
-            # Get page of results
-            query += ' LIMIT ? OFFSET ?'
-            params.extend([per_page, offset])
-
-            cursor = conn.execute(query, params)
-            witnesses_data = cursor.fetchall()
+            total = cached_count(conn, count_key, count_query, params,
+                                 estimate_table='witnesses' if not (search or witness_type) and db.is_postgres else None)
+
+            # Get page of results (with name/organization sorts only witnesses
+            # past the cursor are aggregated)
+            page_query, page_params = pager.wrap_grouped(select, query_from, group_by, params,
+                                                         aggregate_keys=aggregate_keys)
+            cursor = conn.execute(page_query, page_params)
+            witnesses_data = pager.finish(cursor.fetchall())
 
             # Get filter options
             cursor = conn.execute('SELECT DISTINCT witness_type FROM witness_appearances WHERE witness_type IS NOT NULL ORDER BY witness_type')
@@ -192,9 +196,8 @@ def witnesses():
             witness_types = [list(row.values())[0] if hasattr(row, 'keys') else row[0] for row in rows]
 
         # Pagination info
-        total_pages = (total + per_page - 1) // per_page
-        has_prev = page > 1
-        has_next = page < total_pages
+        # Counts may be cached or estimated, so never hide a page the cursor can reach
+        total_pages = max((total + per_page - 1) // per_page, page + 1 if pager.has_next else page)
 
         return render_template('witnesses.html',
                              witnesses=witnesses_data,
@@ -205,8 +208,10 @@ def witnesses():
                              sort_order=sort_order,
                              page=page,
                              total_pages=total_pages,
-                             has_prev=has_prev,
-                             has_next=has_next,
+                             has_prev=pager.has_prev,
+                             has_next=pager.has_next,
+                             prev_cursor=pager.prev_cursor,
+                             next_cursor=pager.next_cursor,
                              total=total)
     except Exception as e:
         return f"Error: {e}", 500
@@ -399,53 +404,12 @@ def search():
             'witnesses': []
         }
 
-        search_term = f'%{query}%'
-
+        # Ranked full-text matches (falls back to LIKE until the index is built)
         with db.transaction() as conn:
-            # Search committees
-            cursor = conn.execute('''
-                SELECT committee_id, name, chamber, type
-                FROM committees
-                WHERE name LIKE ?
-                ORDER BY name
-                LIMIT 10
-            ''', (search_term,))
-            results['committees'] = cursor.fetchall()
-
-            # Search hearings
-            cursor = conn.execute('''
-                SELECT h.hearing_id, h.title, h.hearing_date, c.name as committee_name
-                FROM hearings h
-                LEFT JOIN hearing_committees hc ON h.hearing_id = hc.hearing_id AND hc.is_primary = 1
-                LEFT JOIN committees c ON hc.committee_id = c.committee_id
-                WHERE h.title LIKE ?
-                ORDER BY h.hearing_date DESC NULLS LAST
-                LIMIT 10
-            ''', (search_term,))
-            results['hearings'] = cursor.fetchall()
-
-            # Search members
-            cursor = conn.execute('''
-                SELECT member_id, full_name, party, state, district
-                FROM members
-                WHERE full_name LIKE ?
-                ORDER BY last_name, first_name
-                LIMIT 10
-            ''', (search_term,))
-            results['members'] = cursor.fetchall()
-
-            # Search witnesses
-            cursor = conn.execute('''
-                SELECT w.witness_id, w.full_name, w.organization, MAX(wa.witness_type) as witness_type,
-                       COUNT(DISTINCT wa.hearing_id) as hearing_count
-                FROM witnesses w
-                LEFT JOIN witness_appearances wa ON w.witness_id = wa.witness_id
-                WHERE w.full_name LIKE ? OR w.organization LIKE ?
-                GROUP BY w.witness_id, w.full_name, w.organization
-                ORDER BY w.full_name
-                LIMIT 10
-            ''', (search_term, search_term))
-            results['witnesses'] = cursor.fetchall()
+            results['committees'] = search_index.search_committees(conn, query)
+            results['hearings'] = search_index.search_hearings(conn, query)
+            results['members'] = search_index.search_members(conn, query)
+            results['witnesses'] = search_index.search_witnesses(conn, query)
 
         return render_template('search.html', query=query, results=results)
     except Exception as e:
@@ -1,12 +1,10 @@
 """
 Policy Library blueprint - browse and search multi-source policy research
 """
-from flask import Blueprint, render_template, request, Response, jsonify
-from sqlalchemy import func, desc
+from flask import Blueprint, render_template, request, Response, jsonify, stream_with_context
+from sqlalchemy import func, desc, text
 from sqlalchemy.orm import joinedload
 import json
-import csv
-import io
 import re
 import sys
 import os
@@ -18,9 +16,13 @@ if project_root not in sys.path:
 
 from brookings_ingester.models import get_session, Document, Author, Subject, Source, DocumentAuthor, DocumentSubject
 from brookings_ingester.models.document import DocumentVersion
+from database.pagination import KeysetPager, count_cache, NULL_DATE
+from database.blob_cache import get_blob_cache
+from database.export_stream import (
+    FETCH_SIZE, export_format, export_response_headers, export_stream, limit_arg, start_stream
+)
 from datetime import datetime
 from markupsafe import Markup, escape
-import requests
 
 policy_library_bp = Blueprint('policy_library', __name__, url_prefix='/library')
 
@@ -195,27 +197,18 @@ def format_transcript_text(text):
 policy_library_bp.add_app_template_filter(format_transcript_text, 'format_transcript')
 
 
-def fetch_content_from_blob(blob_url, timeout=10):
+def fetch_content_from_blob(blob_url, content_hash=None):
     """
-    Fetch HTML content from R2/Blob storage
+    Fetch HTML content from R2/Blob storage, through the shared blob cache
 
     Args:
         blob_url: URL to the blob
-        timeout: Request timeout in seconds
+        content_hash: Hash of the stored version, if known (cached without revalidation)
 
     Returns:
         HTML content string, or None if fetch fails
     """
-    try:
-        response = requests.get(blob_url, timeout=timeout)
-        if response.status_code == 200:
-            return response.text
-        else:
-            print(f"Error fetching blob: {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"Error fetching blob from {blob_url}: {e}")
-        return None
+    return get_blob_cache().get(blob_url, content_hash)
 
 
 def get_brookings_source_id():
@@ -239,9 +232,13 @@ def index():
         date_from = request.args.get('date_from', '')
         date_to = request.args.get('date_to', '')
         source_filter = request.args.get('source', '')  # New: source filter
-        page = int(request.args.get('page', 1))
         limit = 50
-        offset = (page - 1) * limit
+
+        # Newest first; undated documents last, ties broken by the unique document_id
+        pager = KeysetPager([(f"COALESCE(documents.publication_date, '{NULL_DATE}')", 'DESC'),
+                             ('documents.document_id', 'DESC')],
+                            limit, request.args, signature='date:DESC', paramstyle='named')
+        page = pager.page
 
         session = get_session()
 
@@ -271,12 +268,20 @@ def index():
         if date_to:
             query = query.filter(Document.publication_date <= date_to)
 
-        # Get total count
-        total = query.count()
+        # Get total count (reused for COUNT_TTL seconds per filter combination)
+        total = count_cache.get_or_compute(
+            ('policy_library', search_query, date_from, date_to, source_filter), query.count
+        )
 
         # Get paginated results with eagerly loaded source relationship
-        documents = query.options(joinedload(Document.source))\
-            .order_by(desc(Document.publication_date)).limit(limit).offset(offset).all()
+        page_query = query.options(joinedload(Document.source))
+        keyset, keyset_params = pager.where()
+        if keyset:
+            page_query = page_query.filter(text(keyset).bindparams(**keyset_params))
+        documents = pager.finish(
+            page_query.order_by(text(pager.order_by())).limit(pager.limit).offset(pager.offset).all(),
+            key_getter=lambda document: (document.publication_date or NULL_DATE, document.document_id)
+        )
 
         # Get only sources that have documents in the current filtered view (excluding source filter itself)
         # Build a base query without the source filter
@@ -307,7 +312,8 @@ def index():
 
         session.close()
 
-        total_pages = (total + limit - 1) // limit
+        # Counts may be cached, so never hide a page the cursor can reach
+        total_pages = max((total + limit - 1) // limit, page + 1 if pager.has_next else page)
 
         return render_template('policy_library_index.html',
                              documents=documents,
@@ -317,6 +323,8 @@ def index():
                              source_filter=source_filter,
                              all_sources=all_sources,
                              page=page,
+                             prev_cursor=pager.prev_cursor,
+                             next_cursor=pager.next_cursor,
                              total=total,
                              total_pages=total_pages,
                              limit=limit)
@@ -477,7 +485,7 @@ def document_detail(document_id):
                     # Fetch HTML content from blob storage if blob_url exists
                     blob_url = structure_data.get('blob_url')
                     if blob_url:
-                        html_content = fetch_content_from_blob(blob_url)
+                        html_content = fetch_content_from_blob(blob_url, version.content_hash)
                         if html_content:
                             # Strip invalid <body> tags that break DOM structure
                             html_content = re.sub(r'<body[^>]*>', '', html_content, flags=re.IGNORECASE)
@@ -556,73 +564,88 @@ def test_update_page():
     return render_template('test_update.html')
 
 
+EXPORT_COLUMNS = ['document_id', 'identifier', 'title', 'document_type', 'publication_date',
+                  'summary', 'word_count', 'url', 'pdf_url']
+
+
 @policy_library_bp.route('/api/export')
 def export_csv():
-    """Export documents as CSV"""
+    """
+    Export documents as CSV, streamed
+
+    Optional: format=ndjson, gzip=1, limit=N (default: every matching document)
+    """
     try:
         # Get filter parameters
         document_ids = request.args.get('ids', '')
         query_text = request.args.get('q', '')
+        fmt, compress = export_format(request.args)
+        limit = limit_arg(request.args)
 
         source_id = get_brookings_source_id()
         if not source_id:
             return "Brookings source not found", 500
 
-        session = get_session()
-
-        # Build query based on parameters
-        if document_ids:
-            # Export specific documents
-            ids = [int(id.strip()) for id in document_ids.split(',')]
-            documents = session.query(Document).filter(Document.document_id.in_(ids)).all()
-        elif query_text:
-            # Export search results - exclude "Page not Found" articles
-            search_pattern = f"%{query_text}%"
-            documents = session.query(Document).filter_by(source_id=source_id)\
-                .filter(~Document.title.like('%Page not Found%'))\
-                .filter(~Document.title.like('%404%'))\
-                .filter(
-                    (Document.title.like(search_pattern)) |
-                    (Document.summary.like(search_pattern))
-                ).order_by(desc(Document.publication_date)).limit(1000).all()
-        else:
-            # Export all (limited to 1000) - exclude "Page not Found" articles
-            documents = session.query(Document).filter_by(source_id=source_id)\
-                .filter(~Document.title.like('%Page not Found%'))\
-                .filter(~Document.title.like('%404%'))\
-                .order_by(desc(Document.publication_date)).limit(1000).all()
+        ids = [int(id.strip()) for id in document_ids.split(',')] if document_ids else []
 
-        session.close()
-
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        writer.writerow(['document_id', 'identifier', 'title', 'document_type', 'publication_date',
-                        'summary', 'word_count', 'url', 'pdf_url'])
-
-        # Write rows
-        for doc in documents:
-            writer.writerow([
-                doc.document_id,
-                doc.document_identifier,
-                doc.title,
-                doc.document_type or '',
-                doc.publication_date or '',
-                (doc.summary or '')[:200],  # Truncate summary
-                doc.word_count or 0,
-                doc.url or '',
-                doc.pdf_url or ''
-            ])
-
-        # Return as CSV download
-        output.seek(0)
-        return Response(
-            output.getvalue(),
-            mimetype='text/csv',
-            headers={'Content-Disposition': f'attachment; filename=brookings_{datetime.now().strftime("%Y%m%d")}.csv'}
+        def rows():
+            # Session lives as long as the stream; yield_per keeps one batch in memory
+            session = get_session()
+            try:
+                # Only the exported columns - never full_text
+                query = session.query(
+                    Document.document_id,
+                    Document.document_identifier,
+                    Document.title,
+                    Document.document_type,
+                    Document.publication_date,
+                    func.substr(Document.summary, 1, 200),  # Truncate summary
+                    Document.word_count,
+                    Document.url,
+                    Document.pdf_url
+                )
+
+                # Build query based on parameters
+                if ids:
+                    # Export specific documents
+                    query = query.filter(Document.document_id.in_(ids))
+                else:
+                    # Export search results or everything - exclude "Page not Found" articles
+                    query = query.filter(Document.source_id == source_id)\
+                        .filter(~Document.title.like('%Page not Found%'))\
+                        .filter(~Document.title.like('%404%'))
+                    if query_text:
+                        search_pattern = f"%{query_text}%"
+                        query = query.filter(
+                            (Document.title.like(search_pattern)) |
+                            (Document.summary.like(search_pattern))
+                        )
+                    query = query.order_by(desc(Document.publication_date))
+
+                if limit:
+                    query = query.limit(limit)
+
+                for (document_id, identifier, title, document_type, publication_date,
+                     summary, word_count, url, pdf_url) in query.yield_per(FETCH_SIZE):
+                    yield [
+                        document_id,
+                        identifier,
+                        title,
+                        document_type or '',
+                        publication_date or '',
+                        summary or '',
+                        word_count or 0,
+                        url or '',
+                        pdf_url or ''
+                    ]
+            finally:
+                session.close()
+
+        body = start_stream(export_stream(EXPORT_COLUMNS, rows(), fmt, compress))
+        mimetype, headers = export_response_headers(
+            f'brookings_{datetime.now().strftime("%Y%m%d")}', fmt, compress
         )
+        return Response(stream_with_context(body), mimetype=mimetype, headers=headers)
 
     except Exception as e:
         return f"Error: {e}", 500